@@ -1,25 +1,26 @@
-import os
-from configparser import ConfigParser
-from dotenv import load_dotenv
+from src.core.config_engine import get_config_engine
 
-load_dotenv()
+# The shared engine loads .env and the INI files once per process
+_engine = get_config_engine()
 
 # Determine the environment (default to 'dev')
-ENV = os.getenv("ENV", "dev").lower()
+ENV = _engine.env
 
-CONFIG_FILE = os.path.join(os.path.dirname(__file__), f"{ENV}.ini")
+CONFIG_FILE = _engine.ini_file
 
-if not os.path.exists(CONFIG_FILE):
-    raise FileNotFoundError(f"Configuration file not found: {CONFIG_FILE}")
+# INI layers (config/base.ini, then config/<ENV>.ini); a missing file is logged
+# by the engine instead of failing the import
+config = _engine.ini_parser
 
-config = ConfigParser()
-config.read(CONFIG_FILE)
+# Every layer (INI, structured files, environment) resolved into one view
+resolved = _engine.resolve()
 
 
 # Usage
 # DEBUG = config.getboolean('DEFAULT', 'DEBUG', fallback=False)
 # DATABASE_URL = config.get('DEFAULT', 'DATABASE_URL', fallback='sqlite:///:memory:')
 # API_KEY = config.get('DEFAULT', 'API_KEY', fallback='default_api_key')
+# DEBUG = resolved.get("DEBUG", bool, False)  # typed, environment wins over INI
 
 # Debugging logs
 # print(f"Environment: {ENV}")
@@ -4,33 +4,55 @@ from datetime import datetime
 
 import pytest
 
+from src.utils.logger import LOG_BASE_NAME, LOG_DIR, LOG_FILE
+from src.utils.logger import configure_logging as configure_log_handlers
+from src.utils.metrics.request_metrics import REQUEST_METRICS
+from src.utils.tracing import TRACER
+from src.utils.worker import (
+    allocate_port,
+    close_shared_resources,
+    is_worker,
+    merge_worker_logs,
+    release_port,
+    remove_run_temp_dirs,
+    run_id,
+    shared_resource,
+)
 
-def pytest_configure(config):
-    # Define the log directory relative to the root of the project
-    BASE_DIR = os.path.abspath(os.path.dirname(__file__))
-    LOG_DIR = os.path.join(BASE_DIR, "logs")
+# Test profiling (--profile-tests), HTTP cassettes (--cassette-mode), the run
+# history store (--results-db), the merge of xdist worker metrics and spans, and
+# the database isolation fixtures next to BaseTest
+pytest_plugins = [
+    "src.plugins.profiling",
+    "src.plugins.cassettes",
+    "src.plugins.results",
+    "src.plugins.worker_output",
+    "src.tests.database_fixtures",
+]
 
-    # Create logs directory if it doesn't exist
-    if not os.path.exists(LOG_DIR):
-        os.makedirs(LOG_DIR)
 
-    # Set up log file path with dynamic date
-    log_file_path = os.path.join(
-        LOG_DIR, f"automation_{datetime.now().strftime('%Y-%m-%d')}.log"
+def pytest_addoption(parser):
+    parser.addoption(
+        "--tracing",
+        action="store_true",
+        default=False,
+        help="Trace tests and client calls and write a Chrome trace to "
+        "reports/traces (also enabled by TRACING_ENABLED=true).",
     )
 
-    # Set up logging configuration
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.FileHandler(log_file_path, mode="a"),  # Append mode
-            logging.StreamHandler(),  # Output to console
-        ],
-    )
+
+def pytest_configure(config):
+    # Create the run id before xdist spawns workers so that they inherit it
+    run_id()
+
+    if config.getoption("tracing"):
+        TRACER.enabled = True
+
+    # Set up logging configuration; each xdist worker writes its own log file
+    configure_log_handlers()
 
     # Debug statement to confirm log file path
-    print(f"Logging to file: {log_file_path}")
+    print(f"Logging to file: {LOG_FILE}")
 
     # Configure root logger to ensure all messages are logged
     root_logger = logging.getLogger()
@@ -39,16 +61,86 @@ def pytest_configure(config):
         if isinstance(handler, logging.FileHandler):
             handler.setLevel(logging.DEBUG)
 
-    # Adding a separate handler to ensure compatibility with pytest's capturing
-    if not any(
-        isinstance(handler, logging.FileHandler) for handler in root_logger.handlers
-    ):
-        file_handler = logging.FileHandler(log_file_path, mode="a")
-        file_handler.setLevel(logging.DEBUG)
-        root_logger.addHandler(file_handler)
-
 
 @pytest.fixture(scope="session", autouse=True)
 def configure_logging():
     """Fixture for logging, useful when running manually or outside pytest."""
     pass  # The actual configuration is done in pytest_configure hook
+
+
+@pytest.fixture(scope="session")
+def shared_api_client():
+    """
+    APIClient created once per worker process, so every test class of the
+    worker reuses one connection pool.
+    """
+    from src.core.api_client import APIClient
+    from src.utils.config.config_loader import ConfigLoader
+
+    return shared_resource(
+        "api_client",
+        lambda: APIClient(
+            ConfigLoader.get_config_value("API_BASE_URL", "http://localhost:5000")
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_api_server():
+    """
+    In-process mock /users and /products API, one per worker, so tests can
+    exercise the real transport without external services.
+    """
+    from src.mock_server import MockAPIServer
+
+    server = MockAPIServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def worker_udp_port():
+    """UDP port from this worker's block, released after the test."""
+    port = allocate_port()
+    yield port
+    release_port(port)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Trace each test, including its fixtures, as the root span of its calls."""
+    with TRACER.span(item.nodeid, "test"):
+        yield
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Export the request metrics, and with --tracing the trace, collected during
+    the session.
+
+    Under pytest-xdist the workers ship theirs to the controller (see
+    src.plugins.worker_output), which writes one merged export, merges the
+    per-worker logs and removes the per-worker temp directories.
+    """
+    close_shared_resources()
+    if is_worker():
+        return
+    reports_dir = os.path.join(os.path.abspath(os.path.dirname(__file__)), "reports")
+    if REQUEST_METRICS:
+        json_path, prometheus_path = REQUEST_METRICS.export(
+            os.path.join(reports_dir, "metrics")
+        )
+        logging.getLogger(__name__).info(
+            f"API metrics written to {json_path} and {prometheus_path}"
+        )
+    if session.config.getoption("tracing"):
+        trace_path = TRACER.export_chrome_trace(
+            os.path.join(
+                reports_dir,
+                "traces",
+                f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            )
+        )
+        logging.getLogger(__name__).info(f"Trace written to {trace_path}")
+    merge_worker_logs(LOG_DIR, LOG_BASE_NAME)
+    remove_run_temp_dirs()
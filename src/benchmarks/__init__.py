@@ -0,0 +1,21 @@
+from .runner import (
+    BENCHMARKS,
+    Benchmark,
+    BenchmarkEnvironment,
+    BenchmarkResult,
+    benchmark,
+    compare_results,
+    measure,
+    run_benchmarks,
+)
+
+__all__ = [
+    "BENCHMARKS",
+    "Benchmark",
+    "BenchmarkEnvironment",
+    "BenchmarkResult",
+    "benchmark",
+    "compare_results",
+    "measure",
+    "run_benchmarks",
+]
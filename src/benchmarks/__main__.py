@@ -0,0 +1,86 @@
+import argparse
+import json
+import logging
+import sys
+from datetime import datetime
+
+from src.benchmarks.runner import (
+    compare_results,
+    format_results,
+    run_benchmarks,
+    save_results,
+)
+from src.utils.logger import configure_logging
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.benchmarks",
+        description="Benchmark the framework's hot paths against local stand-ins.",
+    )
+    parser.add_argument(
+        "--filter",
+        action="append",
+        default=[],
+        help="Run only benchmarks whose name contains this text (repeatable)",
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=0.5, help="Measured seconds per benchmark"
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="Only the smallest parameter set"
+    )
+    parser.add_argument(
+        "--json",
+        dest="json_path",
+        default=f"reports/benchmarks/benchmarks_{datetime.now():%Y%m%d_%H%M%S}.json",
+        help="Where to write the results",
+    )
+    parser.add_argument("--baseline", help="Earlier results JSON to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Tolerated relative throughput drop (0.1 = 10%%)",
+    )
+    parser.add_argument(
+        "--thresholds",
+        help="JSON file mapping benchmark names to their own tolerated drop",
+    )
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    # Per-request INFO logs would flood the output; logger.record measures
+    # the logging cost on its own logger. Configure first so later get_logger
+    # calls from the code under test do not reset the level. The runner's own
+    # progress lines stay at INFO.
+    configure_logging()
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger("src.benchmarks.runner").setLevel(logging.INFO)
+    document = run_benchmarks(args.filter, min_time=args.min_time, quick=args.quick)
+    print(format_results(document))
+    print(f"Results written to {save_results(document, args.json_path)}")
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, "r") as file:
+        baseline = json.load(file)
+    thresholds = {}
+    if args.thresholds:
+        with open(args.thresholds, "r") as file:
+            thresholds = json.load(file)
+    comparison = compare_results(baseline, document, args.threshold, thresholds)
+    for entry in comparison["regressions"]:
+        print(
+            f"REGRESSION {entry['name']}: {entry['before']:,.0f} -> "
+            f"{entry['after']:,.0f} ops/s ({entry['change']:+.1%})"
+        )
+    for name in comparison["missing"]:
+        print(f"MISSING {name}")
+    return 1 if comparison["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
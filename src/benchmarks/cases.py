@@ -0,0 +1,373 @@
+import json
+import logging
+import os
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from src.benchmarks.runner import BenchmarkEnvironment, Operation, benchmark
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+FILE_SIZES = [{"rows": 100}, {"rows": 10_000}]
+
+# Calls batched into one timed operation for sub-microsecond work
+LOG_BATCH = 100
+
+
+def _rows(count: int) -> List[dict]:
+    return [
+        {
+            "id": str(index),
+            "name": f"user {index}",
+            "email": f"user{index}@example.com",
+            "city": "Gwenborough",
+        }
+        for index in range(count)
+    ]
+
+
+@benchmark("http.raw_session", unit="requests")
+@contextmanager
+def raw_session_request(environment: BenchmarkEnvironment) -> Iterator[Operation]:
+    """
+    Plain requests.Session GET, the floor APIClient overhead is measured against.
+    """
+    import requests
+
+    session = requests.Session()
+    url = f"{environment.http_url}/users/1"
+    yield (lambda: session.get(url, timeout=10).content), 1
+    session.close()
+
+
+@benchmark("api_client.make_request", unit="requests")
+@contextmanager
+def api_client_request(environment: BenchmarkEnvironment) -> Iterator[Operation]:
+    from src.core.api_client import APIClient
+
+    client = APIClient(environment.http_url)
+    yield (lambda: client.get("/users/1")), 1
+    client.close()
+
+
+@benchmark(
+    "service.user",
+    unit="calls",
+    params=[{"method": "get_user"}, {"method": "create_user"}],
+)
+@contextmanager
+def user_service_call(
+    environment: BenchmarkEnvironment, method: str
+) -> Iterator[Operation]:
+    from src.benchmarks.stubs import STUB_USER
+    from src.core.api_client import APIClient
+    from src.services.user_service import UserService
+
+    client = APIClient(environment.http_url)
+    service = UserService(client)
+    if method == "get_user":
+        yield (lambda: service.get_user(1)), 1
+    else:
+        yield (lambda: service.create_user(STUB_USER)), 1
+    client.close()
+
+
+@benchmark(
+    "schema.validate",
+    unit="documents",
+    params=[{"validator": "jsonschema"}, {"validator": "compiled"}],
+)
+@contextmanager
+def schema_validation(
+    environment: BenchmarkEnvironment, validator: str
+) -> Iterator[Operation]:
+    from jsonschema import validate
+
+    from src.benchmarks.stubs import STUB_USER
+    from src.utils.schema_validator import SchemaValidator
+
+    with open(os.path.join(BASE_DIR, "schemas", "user_schema.json")) as file:
+        schema = json.load(file)
+    if validator == "jsonschema":
+        yield (lambda: validate(instance=STUB_USER, schema=schema)), 1
+    else:
+        compiled = SchemaValidator(schema)
+        yield (lambda: compiled.validate(STUB_USER)), 1
+
+
+@benchmark(
+    "data.generate",
+    unit="records",
+    params=[{"schema": "user"}, {"schema": "product"}],
+)
+@contextmanager
+def data_generate(
+    environment: BenchmarkEnvironment, schema: str
+) -> Iterator[Operation]:
+    """
+    One chunk of schema-driven synthetic records, generated column-wise.
+    """
+    from src.utils.data_factory import DataFactory
+
+    factory = DataFactory(schema, chunk_size=10_000)
+    yield (lambda: factory.render(0, 1, 10_000)), 10_000
+
+
+@benchmark("json.diff", unit="records")
+@contextmanager
+def json_diff(environment: BenchmarkEnvironment) -> Iterator[Operation]:
+    """
+    Keyed diff of two 10k-product responses that differ in one price.
+    """
+    import copy
+
+    from src.utils.data_factory import DataFactory
+    from src.utils.json_diff import JsonDiff
+
+    expected = list(DataFactory("product", chunk_size=10_000).generate(10_000))
+    actual = copy.deepcopy(expected)
+    actual[5_000]["price"] += 1
+    differ = JsonDiff(tolerance={"*.price": 0.01})
+    yield (lambda: differ.compare(expected, actual)), 10_000
+
+
+@benchmark("db.seed", unit="rows")
+@contextmanager
+def db_seed(environment: BenchmarkEnvironment) -> Iterator[Operation]:
+    """
+    CSV rows streamed, validated and bulk inserted by the seeding pipeline.
+    """
+    from src.utils.databases import Database, SeedingPipeline, sqlite_pool
+    from src.utils.file.csv_file_manager import CsvFileManager
+
+    rows = 10_000
+    path = environment.path("seed.csv")
+    data = [
+        {
+            "id": str(index),
+            "name": f"user {index}",
+            "email": "u@example.com",
+            "age": "30",
+        }
+        for index in range(rows)
+    ]
+    CsvFileManager.save_csv_data(path, data, list(data[0]))
+    pool = sqlite_pool(environment.path("seed.db"))
+    pipeline = SeedingPipeline(Database(pool), "users", schema="user")
+    pipeline.create_table()
+
+    def seed() -> None:
+        pipeline.database.execute('DELETE FROM "users"')
+        pipeline.run(path)
+
+    yield seed, rows
+    pool.close()
+
+
+@benchmark("csv.load", unit="rows", params=FILE_SIZES)
+@contextmanager
+def csv_load(environment: BenchmarkEnvironment, rows: int) -> Iterator[Operation]:
+    from src.utils.file.csv_file_manager import CsvFileManager
+
+    path = environment.path(f"load_{rows}.csv")
+    data = _rows(rows)
+    CsvFileManager.save_csv_data(path, data, list(data[0]))
+    yield (lambda: CsvFileManager.load_csv_data(path)), rows
+
+
+@benchmark("csv.save", unit="rows", params=FILE_SIZES)
+@contextmanager
+def csv_save(environment: BenchmarkEnvironment, rows: int) -> Iterator[Operation]:
+    from src.utils.file.csv_file_manager import CsvFileManager
+
+    path = environment.path(f"save_{rows}.csv")
+    data = _rows(rows)
+    fieldnames = list(data[0])
+    yield (lambda: CsvFileManager.save_csv_data(path, data, fieldnames)), rows
+
+
+@benchmark("json.load", unit="rows", params=FILE_SIZES)
+@contextmanager
+def json_load(environment: BenchmarkEnvironment, rows: int) -> Iterator[Operation]:
+    from src.utils.file.json_file_manager import JsonFileManager
+
+    path = environment.path(f"load_{rows}.json")
+    JsonFileManager.save_json_data(path, _rows(rows))
+    yield (lambda: JsonFileManager.load_json_data(path)), rows
+
+
+@benchmark("json.save", unit="rows", params=FILE_SIZES)
+@contextmanager
+def json_save(environment: BenchmarkEnvironment, rows: int) -> Iterator[Operation]:
+    from src.utils.file.json_file_manager import JsonFileManager
+
+    path = environment.path(f"save_{rows}.json")
+    data = _rows(rows)
+    yield (lambda: JsonFileManager.save_json_data(path, data)), rows
+
+
+@benchmark("udp.send", unit="packets", params=[{"batch": 1}, {"batch": 64}])
+@contextmanager
+def udp_send(environment: BenchmarkEnvironment, batch: int) -> Iterator[Operation]:
+    from src.utils.network.udp_utils import UDPListener, UDPSender
+
+    # A bound listener keeps the kernel from answering "port unreachable";
+    # it is never read, the benchmark measures the sending path only
+    listener = UDPListener("127.0.0.1", 0)
+    sender = UDPSender("127.0.0.1", listener.sock.getsockname()[1])
+    payload = b"x" * 64
+    if batch == 1:
+        yield (lambda: sender.send(payload)), 1
+    else:
+        payloads = [payload] * batch
+        yield (lambda: sender.send_many(payloads)), batch
+    sender.close()
+    listener.close()
+
+
+@benchmark("udp.round_trip", unit="packets")
+@contextmanager
+def udp_round_trip(environment: BenchmarkEnvironment) -> Iterator[Operation]:
+    from src.utils.network.udp_utils import UDPListener, UDPSender
+
+    listener = UDPListener("127.0.0.1", 0)
+    sender = UDPSender("127.0.0.1", listener.sock.getsockname()[1])
+    payload = b"x" * 64
+
+    def round_trip() -> None:
+        sender.send(payload)
+        listener.receive(timeout=1.0)
+
+    yield round_trip, 1
+    sender.close()
+    listener.close()
+
+
+@benchmark(
+    "logger.record",
+    unit="records",
+    params=[{"level": "enabled"}, {"level": "disabled"}],
+)
+@contextmanager
+def logger_record(environment: BenchmarkEnvironment, level: str) -> Iterator[Operation]:
+    """
+    Cost of one record through a file handler with the framework's format,
+    or of a call filtered out by the level.
+    """
+    from src.utils.logger import LOG_FORMAT
+
+    logger = logging.getLogger("benchmarks.logger")
+    logger.propagate = False
+    handler = logging.FileHandler(environment.path(f"{level}.log"))
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    log = logger.info if level == "enabled" else logger.debug
+
+    def emit() -> None:
+        for index in range(LOG_BATCH):
+            log("Request to %s succeeded with status code %s", "/users/1", index)
+
+    yield emit, LOG_BATCH
+    logger.removeHandler(handler)
+    handler.close()
+
+
+@benchmark(
+    "db.fetch_one",
+    unit="queries",
+    params=[{"connection": "pooled"}, {"connection": "new"}],
+)
+@contextmanager
+def db_fetch_one(
+    environment: BenchmarkEnvironment, connection: str
+) -> Iterator[Operation]:
+    """
+    A backend check through the pool, next to opening a connection per check.
+    """
+    import sqlite3
+
+    from src.utils.databases import Database, sqlite_pool
+
+    path = environment.path("bench.db")
+    pool = sqlite_pool(path)
+    database = Database(pool)
+    database.execute(
+        "CREATE TABLE IF NOT EXISTS users (id INTEGER PRIMARY KEY, name TEXT)"
+    )
+    database.executemany(
+        "INSERT INTO users (name) VALUES (?)", ((f"user {i}",) for i in range(1000))
+    )
+    query = "SELECT * FROM users WHERE id = ?"
+    if connection == "pooled":
+        yield (lambda: database.fetch_one(query, (500,))), 1
+    else:
+
+        def fetch_with_new_connection() -> None:
+            with sqlite3.connect(path) as new_connection:
+                new_connection.execute(query, (500,)).fetchone()
+            new_connection.close()
+
+        yield fetch_with_new_connection, 1
+    pool.close()
+
+
+@benchmark("db.snapshot_restore", unit="restores")
+@contextmanager
+def db_snapshot_restore(environment: BenchmarkEnvironment) -> Iterator[Operation]:
+    """
+    Rolling a SQLite database back to its snapshot after a test's writes.
+    """
+    from src.utils.databases import Database, SQLiteSnapshot, sqlite_pool
+
+    pool = sqlite_pool(environment.path("snapshot.db"))
+    database = Database(pool)
+    database.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+    database.executemany(
+        "INSERT INTO users (name) VALUES (?)", ((f"user {i}",) for i in range(1000))
+    )
+    snapshot = SQLiteSnapshot(pool)
+    snapshot.take()
+
+    def write_and_restore() -> None:
+        database.execute("INSERT INTO users (name) VALUES ('from test')")
+        snapshot.restore()
+
+    yield write_and_restore, 1
+    snapshot.close()
+    pool.close()
+
+
+@benchmark("import.src_utils", unit="imports")
+@contextmanager
+def import_src_utils(environment: BenchmarkEnvironment) -> Iterator[Operation]:
+    """
+    Fresh interpreter importing src.utils, including interpreter start-up.
+    """
+    import subprocess
+    import sys
+
+    command = [sys.executable, "-c", "import src.utils"]
+    env = {**os.environ, "PYTHONPATH": BASE_DIR}
+    yield (lambda: subprocess.run(command, cwd=BASE_DIR, env=env, check=True)), 1
+
+
+@benchmark("ssh.execute_command", unit="commands")
+@contextmanager
+def ssh_execute(environment: BenchmarkEnvironment) -> Iterator[Operation]:
+    from src.utils.network.ssh_utils import SSHClient
+
+    host, port = environment.ssh_address
+    client = SSHClient(host, "bench", password="bench", port=port)
+    client.connect()
+    yield (lambda: client.execute_command("echo ok")), 1
+    client.close()
+
+
+# Example usage
+# python -m src.benchmarks --filter csv --json reports/benchmarks/csv.json
+# Adding a benchmark:
+# @benchmark("my.path", unit="calls")
+# @contextmanager
+# def my_path(environment):
+#     yield (lambda: do_work()), 1
@@ -0,0 +1,304 @@
+import json
+import logging
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import AbstractContextManager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.utils.metrics.histogram import LatencyHistogram
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+# An operation to time and the number of items (rows, packets...) it handles
+Operation = Tuple[Callable[[], Any], int]
+BenchmarkFactory = Callable[..., AbstractContextManager]
+
+
+class BenchmarkEnvironment:
+    """
+    Local stand-ins shared by the benchmarks, started on first use.
+    """
+
+    def __init__(self) -> None:
+        self.temp_dir = tempfile.mkdtemp(prefix="benchmarks_")
+        self._http_stub = None
+        self._ssh_stub = None
+
+    @property
+    def http_url(self) -> str:
+        if self._http_stub is None:
+            from src.benchmarks.stubs import HTTPStubServer
+
+            self._http_stub = HTTPStubServer().start()
+        return self._http_stub.url
+
+    @property
+    def ssh_address(self) -> Tuple[str, int]:
+        if self._ssh_stub is None:
+            from src.benchmarks.stubs import SSHStubServer
+
+            self._ssh_stub = SSHStubServer().start()
+        return self._ssh_stub.address
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.temp_dir, name)
+
+    def close(self) -> None:
+        for stub in (self._http_stub, self._ssh_stub):
+            if stub is not None:
+                stub.stop()
+        self._http_stub = self._ssh_stub = None
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+
+@dataclass
+class Benchmark:
+    """
+    A registered benchmark: a factory yielding the operation to time.
+
+    The factory is a context manager taking the environment and the params;
+    setup happens before the yield and cleanup after it, outside the timing.
+    """
+
+    name: str
+    factory: BenchmarkFactory
+    unit: str = "items"
+    params: List[Dict[str, Any]] = field(default_factory=lambda: [{}])
+
+    def instance_names(self) -> List[Tuple[str, Dict[str, Any]]]:
+        return [
+            (
+                f"{self.name}[{','.join(f'{k}={v}' for k, v in params.items())}]"
+                if params
+                else self.name,
+                params,
+            )
+            for params in self.params
+        ]
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    unit: str
+    operations: int
+    items: int
+    seconds: float
+    latency: LatencyHistogram
+
+    @property
+    def ops_per_sec(self) -> float:
+        return self.operations / self.seconds if self.seconds else 0.0
+
+    @property
+    def items_per_sec(self) -> float:
+        return self.items / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        summary = self.latency.summary()
+        return {
+            "unit": self.unit,
+            "operations": self.operations,
+            "items": self.items,
+            "seconds": round(self.seconds, 6),
+            "ops_per_sec": round(self.ops_per_sec, 2),
+            "items_per_sec": round(self.items_per_sec, 2),
+            "mean_us": round(self.latency.mean_us, 3),
+            "p50_us": round(summary["p50_ms"] * 1000, 3),
+            "p99_us": round(summary["p99_ms"] * 1000, 3),
+        }
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str, unit: str = "items", params: Optional[List[Dict[str, Any]]] = None
+) -> Callable[[BenchmarkFactory], BenchmarkFactory]:
+    """
+    Register a benchmark factory.
+
+    :param name: Benchmark name, e.g. "api_client.make_request".
+    :param unit: What the items handled per operation are (requests, rows...).
+    :param params: Parameter sets; the benchmark runs once per set.
+    """
+
+    def decorator(factory: BenchmarkFactory) -> BenchmarkFactory:
+        BENCHMARKS[name] = Benchmark(name, factory, unit, params or [{}])
+        return factory
+
+    return decorator
+
+
+def measure(
+    name: str,
+    unit: str,
+    operation: Callable[[], Any],
+    items_per_op: int = 1,
+    min_time: float = 0.5,
+    warmup: float = 0.05,
+    max_operations: Optional[int] = None,
+) -> BenchmarkResult:
+    """
+    Time an operation repeatedly for at least min_time seconds.
+
+    :param name: Result name.
+    :param unit: Unit of the items.
+    :param operation: Callable timed per call.
+    :param items_per_op: Items handled by one call.
+    :param min_time: Minimum measured seconds.
+    :param warmup: Seconds of untimed calls first (caches, connections).
+    :param max_operations: Optional cap on the number of timed calls.
+    :return: The BenchmarkResult.
+    """
+    clock = time.perf_counter_ns
+    deadline = clock() + int(warmup * 1e9)
+    while clock() < deadline:
+        operation()
+
+    latency = LatencyHistogram()
+    record_us = latency.record_us
+    operations = 0
+    elapsed_ns = 0
+    limit_ns = int(min_time * 1e9)
+    while elapsed_ns < limit_ns and (
+        max_operations is None or operations < max_operations
+    ):
+        started = clock()
+        operation()
+        duration = clock() - started
+        elapsed_ns += duration
+        # Round up so sub-microsecond operations still count in the histogram
+        record_us((duration + 999) // 1000)
+        operations += 1
+    return BenchmarkResult(
+        name, unit, operations, operations * items_per_op, elapsed_ns / 1e9, latency
+    )
+
+
+def run_benchmarks(
+    selected: Optional[Iterable[str]] = None,
+    min_time: float = 0.5,
+    max_operations: Optional[int] = None,
+    quick: bool = False,
+) -> Dict[str, Any]:
+    """
+    Run the registered benchmarks against local stand-ins.
+
+    :param selected: Substrings of benchmark names to run (default: all).
+    :param min_time: Minimum measured seconds per benchmark.
+    :param max_operations: Optional cap on timed calls per benchmark.
+    :param quick: Run only the first parameter set of each benchmark.
+    :return: JSON-compatible results document.
+    """
+    # Registers the benchmarks
+    import src.benchmarks.cases  # noqa: F401
+    from src.utils.metrics.request_metrics import REQUEST_METRICS
+    from src.utils.tracing import TRACER
+
+    filters = list(selected or [])
+    results: Dict[str, Dict[str, Any]] = {}
+    environment = BenchmarkEnvironment()
+    try:
+        for bench in BENCHMARKS.values():
+            instances = bench.instance_names()[: 1 if quick else None]
+            for name, params in instances:
+                if filters and not any(text in name for text in filters):
+                    continue
+                # Keep the collectors from growing across benchmarks without
+                # losing what the caller (e.g. a pytest session) recorded
+                with REQUEST_METRICS.isolated(), TRACER.isolated():
+                    with bench.factory(environment, **params) as (operation, items):
+                        result = measure(
+                            name,
+                            bench.unit,
+                            operation,
+                            items,
+                            min_time=min_time,
+                            max_operations=max_operations,
+                        )
+                results[name] = result.to_dict()
+                logger.info(
+                    f"{name}: {result.ops_per_sec:,.0f} ops/s, "
+                    f"{result.items_per_sec:,.0f} {bench.unit}/s"
+                )
+    finally:
+        environment.close()
+
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = 0.1,
+    thresholds: Optional[Dict[str, float]] = None,
+) -> Dict[str, Any]:
+    """
+    Compare throughput with a baseline results document.
+
+    :param baseline: Earlier results document.
+    :param current: Results document to check.
+    :param threshold: Default tolerated relative throughput drop (0.1 = 10%).
+    :param thresholds: Per-benchmark tolerated drops, overriding the default.
+    :return: Dictionary with "regressions", "improvements" and "missing" lists.
+    """
+    thresholds = thresholds or {}
+    comparison: Dict[str, List[Any]] = {
+        "regressions": [],
+        "improvements": [],
+        "missing": [],
+    }
+    for name, before in baseline["results"].items():
+        after = current["results"].get(name)
+        if after is None:
+            comparison["missing"].append(name)
+            continue
+        if not before["ops_per_sec"]:
+            continue
+        change = after["ops_per_sec"] / before["ops_per_sec"] - 1
+        entry = {
+            "name": name,
+            "before": before["ops_per_sec"],
+            "after": after["ops_per_sec"],
+            "change": round(change, 4),
+        }
+        limit = thresholds.get(name, threshold)
+        if change < -limit:
+            comparison["regressions"].append(entry)
+        elif change > limit:
+            comparison["improvements"].append(entry)
+    return comparison
+
+
+def format_results(document: Dict[str, Any]) -> str:
+    lines = [
+        f"{'benchmark':<44} {'ops/s':>12} {'items/s':>14} {'p50 us':>9} {'p99 us':>9}"
+    ]
+    for name, result in document["results"].items():
+        lines.append(
+            f"{name:<44} {result['ops_per_sec']:>12,.0f} "
+            f"{result['items_per_sec']:>14,.0f} {result['p50_us']:>9.1f} "
+            f"{result['p99_us']:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+def save_results(document: Dict[str, Any], file_path: str) -> str:
+    directory = os.path.dirname(os.path.abspath(file_path))
+    os.makedirs(directory, exist_ok=True)
+    with open(file_path, "w") as file:
+        json.dump(document, file, indent=2)
+    return file_path
@@ -0,0 +1,189 @@
+import json
+import logging
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+# Matches schemas/user_schema.json
+STUB_USER: Dict[str, Any] = {
+    "id": 1,
+    "name": "John Doe",
+    "email": "john.doe@example.com",
+    "age": 30,
+}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """
+    Answers every request with a canned JSON body over keep-alive connections.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; avoid Nagle/delayed-ACK stalls
+    disable_nagle_algorithm = True
+
+    def _respond(self, status: int) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        body = self.server.body
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        self._respond(200)
+
+    def do_POST(self) -> None:
+        self._respond(201)
+
+    def do_PUT(self) -> None:
+        self._respond(200)
+
+    def do_DELETE(self) -> None:
+        self._respond(200)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class HTTPStubServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, body: Any = None):
+        """
+        Initialize a local HTTP server returning the same JSON body for every
+        request, so client-side overhead can be measured without a network.
+
+        :param host: Address to bind.
+        :param port: Port to bind (0 picks a free port).
+        :param body: JSON-serializable response body (defaults to STUB_USER).
+        """
+        self.server = ThreadingHTTPServer((host, port), _StubHandler)
+        self.server.daemon_threads = True
+        self.server.body = json.dumps(STUB_USER if body is None else body).encode()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "HTTPStubServer":
+        self._thread = threading.Thread(
+            target=self.server.serve_forever, name="http-stub", daemon=True
+        )
+        self._thread.start()
+        logger.debug(f"HTTP stub listening on {self.url}")
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> "HTTPStubServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+class SSHStubServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """
+        Initialize an in-process SSH server accepting any password and echoing
+        the command of every exec request back on stdout.
+
+        :param host: Address to bind.
+        :param port: Port to bind (0 picks a free port).
+        """
+        import paramiko
+
+        self._paramiko = paramiko
+        # ECDSA keys generate in milliseconds, unlike RSA
+        self.host_key = paramiko.ECDSAKey.generate()
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind((host, port))
+        self.sock.listen(16)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._transports: list = []
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self.sock.getsockname()[:2]
+
+    def start(self) -> "SSHStubServer":
+        self._thread = threading.Thread(
+            target=self._accept_loop, name="ssh-stub", daemon=True
+        )
+        self._thread.start()
+        logger.debug(f"SSH stub listening on {self.address}")
+        return self
+
+    def _accept_loop(self) -> None:
+        paramiko = self._paramiko
+        interface = _build_server_interface(paramiko)
+        while not self._stop.is_set():
+            try:
+                connection, _ = self.sock.accept()
+            except OSError:
+                return
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            transport = paramiko.Transport(connection)
+            transport.set_log_channel(f"{__name__}.ssh")
+            transport.add_server_key(self.host_key)
+            transport.start_server(server=interface())
+            self._transports.append(transport)
+
+    def stop(self) -> None:
+        self._stop.set()
+        self.sock.close()
+        for transport in self._transports:
+            transport.close()
+
+    def __enter__(self) -> "SSHStubServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+def _build_server_interface(paramiko: Any) -> type:
+    class _EchoServer(paramiko.ServerInterface):
+        def check_auth_password(self, username: str, password: str) -> int:
+            return paramiko.AUTH_SUCCESSFUL
+
+        def get_allowed_auths(self, username: str) -> str:
+            return "password"
+
+        def check_channel_request(self, kind: str, chanid: int) -> int:
+            if kind == "session":
+                return paramiko.OPEN_SUCCEEDED
+            return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+        def check_channel_exec_request(self, channel: Any, command: bytes) -> bool:
+            # Runs before paramiko acknowledges the request, so only signal EOF
+            # here; closing could beat the acknowledgement and the client
+            # closes the channel itself once it has read the output
+            def reply() -> None:
+                channel.sendall(command + b"\n")
+                channel.send_exit_status(0)
+                channel.shutdown_write()
+
+            threading.Thread(target=reply, daemon=True).start()
+            return True
+
+    return _EchoServer
+
+
+# Example usage
+# with HTTPStubServer() as http_stub:
+#     APIClient(http_stub.url).get("/users/1")
+# with SSHStubServer() as ssh_stub:
+#     host, port = ssh_stub.address
@@ -1,30 +1,129 @@
-from typing import Any, Dict, Optional
+import asyncio
+import copy
+import os
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+from urllib.parse import urlencode
 
 import requests
 from requests import Response
 from requests.exceptions import HTTPError, RequestException, Timeout
-from tenacity import retry, stop_after_attempt, wait_fixed
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_not_exception_type,
+    stop_after_attempt,
+    wait_fixed,
+)
 
+from src.core.cassette import Cassette, CassetteAdapter
 from src.core.exceptions.api_exceptions import (
     APIClientError,
     APIRequestError,
     APITimeoutError,
+    CassetteMissError,
+)
+from src.core.streaming import (
+    CHUNK_SIZE,
+    BodySource,
+    BodyStream,
+    FileSpec,
+    MultipartEncoder,
+    body_stream,
 )
+from src.core.single_flight import SingleFlight
+from src.core.timing_adapter import TimingHTTPAdapter, collect_timings
 from src.utils.logger import get_logger
+from src.utils.metrics.request_metrics import REQUEST_METRICS, endpoint_template
+from src.utils.tracing import TRACER
 
 # Get a logger instance
 logger = get_logger(__name__)
 
 
+def _record_retry(retry_state: RetryCallState) -> None:
+    """
+    Count a make_request retry in the request metrics.
+    """
+    args = retry_state.args[1:3]
+    method = args[0] if args else retry_state.kwargs.get("method", "")
+    endpoint = args[1] if len(args) > 1 else retry_state.kwargs.get("endpoint", "")
+    REQUEST_METRICS.record_retry(method, endpoint)
+
+
+def _body_size(body: Any) -> int:
+    """
+    Size of a sent request body; streamed bodies count what they sent.
+    """
+    if isinstance(body, BodyStream):
+        return body.sent
+    if isinstance(body, (bytes, str)):
+        return len(body)
+    return 0
+
+
+def _copy_response(response: Response) -> Response:
+    """
+    Copy a shared response so one caller's changes do not leak to the others.
+    """
+    clone = copy.copy(response)
+    clone.headers = response.headers.copy()
+    clone.history = list(response.history)
+    return clone
+
+
 class APIClient:
-    def __init__(self, base_url: str) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        cassette: Optional[Cassette] = None,
+        single_flight: Optional[SingleFlight] = None,
+    ) -> None:
+        """
+        Initialize the client with a pooled session.
+
+        :param base_url: Base URL prepended to every endpoint
+        :param cassette: Optional cassette to record to or replay from
+        :param single_flight: Optional coalescer; identical GETs issued while
+            one is in flight, from threads or coroutines, then share its
+            response. It may be shared by several clients.
+        """
         self.base_url: str = base_url
         self.headers: Dict[str, str] = {
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
+        # Pooled connections whose DNS/connect phases are timed
+        self.session = requests.Session()
+        self.single_flight = single_flight
+        self.use_cassette(cassette)
+
+    def use_cassette(self, cassette: Optional[Cassette]) -> None:
+        """
+        Record to or replay from a cassette, or go back to the network.
 
-    @retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
+        :param cassette: The cassette, or None for live requests
+        """
+        adapter = TimingHTTPAdapter() if cassette is None else CassetteAdapter(cassette)
+        for prefix in ("http://", "https://"):
+            previous = self.session.adapters.get(prefix)
+            self.session.mount(prefix, adapter)
+            if previous is not None:
+                previous.close()
+
+    def close(self) -> None:
+        """
+        Close the underlying session and its pooled connections.
+        """
+        self.session.close()
+
+    # A cassette miss will not be recorded by retrying, so it fails at once
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_fixed(2),
+        retry=retry_if_not_exception_type(CassetteMissError),
+        before_sleep=_record_retry,
+    )
     def make_request(
         self,
         method: str,
@@ -36,6 +135,10 @@ class APIClient:
         """
         Make an HTTP request with retry logic.
 
+        Every attempt is recorded in REQUEST_METRICS with its DNS, connect,
+        time-to-first-byte and total timings, status and body sizes, and is
+        traced as an "http" span whose traceparent header is sent along.
+
         :param method: HTTP method (e.g., 'GET', 'POST')
         :param endpoint: API endpoint
         :param params: Query parameters
@@ -45,41 +148,220 @@ class APIClient:
         :raises APIRequestError: If the API request fails
         :raises APITimeoutError: If the API request times out
         :raises APIClientError: For other types of request failures
+        :raises CassetteMissError: If a replayed cassette lacks the request
+        """
+        return self._send(method, endpoint, params=params, headers=headers, json=data)
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        consume: Optional[Callable[[Response], int]] = None,
+        **request_kwargs: Any,
+    ) -> Response:
+        """
+        Send one request with timings, metrics and tracing.
+
+        :param method: HTTP method
+        :param endpoint: API endpoint
+        :param params: Query parameters
+        :param headers: Custom headers
+        :param consume: Optional callback reading a streamed response body and
+            returning its size; without it the body is loaded into memory
+        :param request_kwargs: Further arguments for requests (json, data)
+        :return: Response object
         """
         url = f"{self.base_url}{endpoint}"
-        request_headers = headers if headers else self.headers
+        status = "error"
+        bytes_sent = 0
+        bytes_received = 0
+        started = time.perf_counter()
 
-        try:
-            logger.info(
-                f"Making {method} request to {url} with params={params} and data={data}"
-            )
-            response = requests.request(
-                method,
-                url,
-                params=params,
-                json=data,
-                headers=request_headers,
-                timeout=10,
+        with (
+            TRACER.span(
+                f"{method} {endpoint_template(endpoint)}", "http", url=url
+            ) as span,
+            collect_timings() as timings,
+        ):
+            request_headers = TRACER.inject_headers(
+                headers if headers else self.headers
             )
-            response.raise_for_status()
-            logger.info(
-                f"Request to {url} succeeded with status code {response.status_code}"
-            )
-            return response
+            response: Optional[Response] = None
+            try:
+                logger.info(
+                    f"Making {method} request to {url} with params={params} "
+                    f"and data={request_kwargs.get('json')}"
+                )
+                response = self.session.request(
+                    method,
+                    url,
+                    params=params,
+                    headers=request_headers,
+                    timeout=10,
+                    stream=consume is not None,
+                    **request_kwargs,
+                )
+                timings.ttfb = response.elapsed.total_seconds()
+                status = str(response.status_code)
+                bytes_sent = _body_size(response.request.body)
+                if consume is None:
+                    bytes_received = len(response.content)
+                response.raise_for_status()
+                if consume is not None:
+                    bytes_received = consume(response)
+                logger.info(
+                    f"Request to {url} succeeded with status code {response.status_code}"
+                )
+                return response
+
+            except HTTPError as http_err:
+                logger.error(f"HTTP error occurred: {http_err} - URL: {url}")
+                raise APIRequestError(response.status_code, str(http_err)) from http_err
+
+            except Timeout as timeout_err:
+                status = "timeout"
+                logger.error(f"Request timed out: {timeout_err} - URL: {url}")
+                raise APITimeoutError(10) from timeout_err
+
+            except RequestException as req_err:
+                status = type(req_err).__name__
+                logger.error(
+                    f"An error occurred with the request: {req_err} - URL: {url}"
+                )
+                raise APIClientError(
+                    f"An error occurred with the request: {req_err}"
+                ) from req_err
+
+            finally:
+                if consume is not None and response is not None:
+                    response.close()
+                timings.total = time.perf_counter() - started
+                if span is not None:
+                    span.set_attribute("status", status)
+                REQUEST_METRICS.record(
+                    method,
+                    endpoint,
+                    status,
+                    {
+                        "dns": timings.dns,
+                        "connect": timings.connect,
+                        "ttfb": timings.ttfb,
+                        "total": timings.total,
+                    },
+                    bytes_sent=bytes_sent,
+                    bytes_received=bytes_received,
+                )
+
+    def upload(
+        self,
+        endpoint: str,
+        source: BodySource,
+        method: str = "POST",
+        content_type: str = "application/octet-stream",
+        compress: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> Response:
+        """
+        Stream a request body from a file, file object or generator without
+        loading it into memory.
+
+        Streamed requests are not retried, since their body cannot be
+        replayed.
 
-        except HTTPError as http_err:
-            logger.error(f"HTTP error occurred: {http_err} - URL: {url}")
-            raise APIRequestError(response.status_code, str(http_err)) from http_err
+        :param endpoint: API endpoint
+        :param source: File path, bytes, binary file object or iterable of bytes
+        :param method: HTTP method
+        :param content_type: Content-Type of the body
+        :param compress: Optional Content-Encoding: "gzip", or "zstd" with the
+            optional zstandard package
+        :param params: Query parameters
+        :param chunk_size: Bytes read per chunk from files
+        :return: Response object
+        """
+        headers = {**self.headers, "Content-Type": content_type}
+        if compress:
+            headers["Content-Encoding"] = compress
+        body = body_stream(source, compress, chunk_size)
+        return self._send(method, endpoint, params=params, headers=headers, data=body)
+
+    def upload_multipart(
+        self,
+        endpoint: str,
+        files: Dict[str, FileSpec],
+        fields: Optional[Dict[str, str]] = None,
+        method: str = "POST",
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Response:
+        """
+        Upload files as multipart/form-data, streaming them from disk.
 
-        except Timeout as timeout_err:
-            logger.error(f"Request timed out: {timeout_err} - URL: {url}")
-            raise APITimeoutError(10) from timeout_err
+        Streamed requests are not retried, since their body cannot be
+        replayed.
 
-        except RequestException as req_err:
-            logger.error(f"An error occurred with the request: {req_err} - URL: {url}")
-            raise APIClientError(
-                f"An error occurred with the request: {req_err}"
-            ) from req_err
+        :param endpoint: API endpoint
+        :param files: Field name to a file path, (filename, path or file
+            object) or (filename, path or file object, content type)
+        :param fields: Plain form fields
+        :param method: HTTP method
+        :param params: Query parameters
+        :return: Response object
+        """
+        encoder = MultipartEncoder(files, fields)
+        headers = {**self.headers, "Content-Type": encoder.content_type}
+        body = BodyStream(encoder, encoder.length)
+        return self._send(method, endpoint, params=params, headers=headers, data=body)
+
+    def download(
+        self,
+        endpoint: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 1024 * 1024,
+        decode: bool = True,
+    ) -> int:
+        """
+        Stream a response body to a file in chunks, so memory use does not
+        grow with the download size. The file is written next to its target
+        and moved into place once complete.
+
+        :param endpoint: API endpoint
+        :param path: Destination file
+        :param params: Query parameters
+        :param chunk_size: Bytes read per chunk
+        :param decode: Undo a gzip/deflate (or zstd/br, with their optional
+            packages) Content-Encoding; False keeps the bytes as sent
+        :return: Number of bytes written
+        """
+        temp_path = f"{path}.part"
+
+        def write(response: Response) -> int:
+            written = 0
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Replayed cassette responses have no raw stream, only content
+            if decode or response.raw is None:
+                chunks = response.iter_content(chunk_size)
+            else:
+                chunks = response.raw.stream(chunk_size, decode_content=False)
+            with open(temp_path, "wb") as file:
+                for chunk in chunks:
+                    file.write(chunk)
+                    written += len(chunk)
+            os.replace(temp_path, path)
+            return written
+
+        try:
+            self._send("GET", endpoint, params=params, consume=write)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        size = os.path.getsize(path)
+        logger.info(f"Downloaded {size:,} bytes to {path}")
+        return size
 
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Response:
         """
@@ -89,7 +371,55 @@ class APIClient:
         :param params: Query parameters
         :return: Response object
         """
-        return self.make_request("GET", endpoint, params=params)
+        if self.single_flight is None:
+            return self.make_request("GET", endpoint, params=params)
+        return self.single_flight.do(
+            self._flight_key(endpoint, params),
+            lambda: self.make_request("GET", endpoint, params=params),
+            copy=_copy_response,
+            on_shared=lambda: REQUEST_METRICS.record_deduplicated("GET", endpoint),
+        )
+
+    async def get_async(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> Response:
+        """
+        Make a GET request from a coroutine, running it in a worker thread.
+
+        With a single_flight, identical GETs awaited concurrently in the event
+        loop share one request.
+
+        :param endpoint: API endpoint
+        :param params: Query parameters
+        :return: Response object
+        """
+        if self.single_flight is None:
+            return await asyncio.to_thread(self.get, endpoint, params)
+        return await self.single_flight.async_flight.do(
+            self._flight_key(endpoint, params),
+            lambda: asyncio.to_thread(self.get, endpoint, params),
+            copy=_copy_response,
+            on_shared=lambda: REQUEST_METRICS.record_deduplicated("GET", endpoint),
+        )
+
+    def _flight_key(self, endpoint: str, params: Optional[Dict[str, Any]]) -> Hashable:
+        query = urlencode(sorted(params.items()), doseq=True) if params else ""
+        # Clients sharing a coalescer only share responses when they would send
+        # the same credentials, e.g. the same Authorization header
+        headers = tuple(
+            sorted(
+                (name.lower(), str(value))
+                for name, value in {**self.session.headers, **self.headers}.items()
+            )
+        )
+        auth = self.session.auth
+        return (
+            "GET",
+            f"{self.base_url}{endpoint}",
+            query,
+            headers,
+            auth if isinstance(auth, Hashable) else id(auth),
+        )
 
     def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Response:
         """
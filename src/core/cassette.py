@@ -0,0 +1,367 @@
+import base64
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from requests import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from src.core.exceptions.api_exceptions import CassetteMissError
+from src.core.timing_adapter import TimingHTTPAdapter
+from src.utils.logger import get_logger
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+MODES = ("record", "replay", "once")
+TIMINGS = ("none", "recorded")
+
+# Streamed bodies larger than this are not kept in memory for recording
+MAX_STREAM_RECORD_BYTES: int = 32 * 1024 * 1024
+
+# Not meaningful once the body has been decoded and stored
+DROPPED_RESPONSE_HEADERS = {
+    "connection",
+    "content-encoding",
+    "content-length",
+    "keep-alive",
+    "transfer-encoding",
+}
+
+
+def normalize_request(
+    method: str,
+    url: str,
+    body: Any = None,
+    ignore_params: Iterable[str] = (),
+) -> str:
+    """
+    Build the lookup key of a request: method, lower-cased origin, path,
+    sorted query parameters and a canonical form of a JSON body. Headers are
+    left out, so per-request values such as traceparent do not break replay.
+
+    :param method: HTTP method.
+    :param url: Full request URL.
+    :param body: Request body (bytes, str or None); streamed bodies are left out.
+    :param ignore_params: Query parameters left out of the key (e.g. cache busters).
+    :return: Hex digest identifying the request.
+    """
+    parts = urlsplit(url)
+    ignored = set(ignore_params)
+    query = urlencode(
+        sorted(
+            (name, value)
+            for name, value in parse_qsl(parts.query, keep_blank_values=True)
+            if name not in ignored
+        )
+    )
+    if isinstance(body, str):
+        body = body.encode()
+    elif not isinstance(body, (bytes, bytearray)):
+        # Streamed bodies (files, generators) cannot be read without sending them
+        body = None
+    if body:
+        try:
+            body = json.dumps(
+                json.loads(body), sort_keys=True, separators=(",", ":")
+            ).encode()
+        except ValueError:
+            pass
+    digest = hashlib.sha256()
+    digest.update(
+        f"{method.upper()} {parts.scheme}://{parts.netloc.lower()}{parts.path}?{query}\n".encode()
+    )
+    digest.update(body or b"")
+    return digest.hexdigest()
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class Cassette:
+    def __init__(
+        self,
+        path: str,
+        mode: str = "once",
+        timing: str = "none",
+        ignore_params: Iterable[str] = (),
+    ) -> None:
+        """
+        Initialize a cassette of recorded HTTP interactions.
+
+        Interactions are stored one JSON object per line, gzip-compressed when
+        the path ends with ".gz". Replay looks requests up in an in-memory
+        index; identical requests are answered in the order they were
+        recorded, repeating the last answer once the recording runs out.
+
+        :param path: Cassette file path (.jsonl or .jsonl.gz).
+        :param mode: "record" (always hit the network and overwrite),
+            "replay" (never hit the network) or "once" (replay if the
+            cassette exists, record otherwise).
+        :param timing: "none" to replay at once, "recorded" to wait for the
+            recorded response time.
+        :param ignore_params: Query parameters left out of request matching.
+        :raises ValueError: If mode or timing is unknown.
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode '{mode}', expected one of {MODES}")
+        if timing not in TIMINGS:
+            raise ValueError(
+                f"Unknown cassette timing '{timing}', expected one of {TIMINGS}"
+            )
+        self.path = path
+        self.timing = timing
+        self.ignore_params = tuple(ignore_params)
+        self.recording = mode == "record" or (
+            mode == "once" and not os.path.exists(path)
+        )
+        self._interactions: List[Dict[str, Any]] = []
+        self._index: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._played: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self._dirty = False
+        # A missing cassette replays as empty, so every request misses
+        if not self.recording and os.path.exists(path):
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._interactions)
+
+    def load(self) -> None:
+        """
+        Read the cassette file and rebuild the lookup index.
+
+        :raises FileNotFoundError: If the cassette does not exist.
+        """
+        with _open(self.path, "r") as file:
+            interactions = [json.loads(line) for line in file if line.strip()]
+        with self._lock:
+            self._interactions = interactions
+            self._index = defaultdict(list)
+            self._played = defaultdict(int)
+            for interaction in interactions:
+                self._index[interaction["key"]].append(interaction)
+        logger.info(f"Loaded {len(interactions)} interactions from {self.path}")
+
+    def save(self) -> Optional[str]:
+        """
+        Write the recorded interactions, replacing the file atomically.
+
+        :return: The cassette path, or None if nothing was recorded.
+        """
+        with self._lock:
+            if not self._dirty:
+                return None
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp{os.getpid()}"
+            if self.path.endswith(".gz"):
+                temp_path += ".gz"
+            with _open(temp_path, "w") as file:
+                for interaction in self._interactions:
+                    file.write(json.dumps(interaction, separators=(",", ":")))
+                    file.write("\n")
+            os.replace(temp_path, self.path)
+            self._dirty = False
+        logger.info(f"Saved {len(self._interactions)} interactions to {self.path}")
+        return self.path
+
+    def key(self, request: PreparedRequest) -> str:
+        return normalize_request(
+            request.method, request.url, request.body, self.ignore_params
+        )
+
+    def record(
+        self, request: PreparedRequest, response: Response, elapsed: float
+    ) -> None:
+        """
+        Append an interaction; the response content is read if needed.
+
+        :param request: The sent request.
+        :param response: The received response.
+        :param elapsed: Seconds until the response headers arrived.
+        """
+        self._append(request, response, response.content or b"", elapsed)
+
+    def record_stream(
+        self, request: PreparedRequest, response: Response, elapsed: float
+    ) -> None:
+        """
+        Record a streamed response once its body has been read, teeing the
+        chunks the caller reads instead of buffering the body up front.
+
+        Bodies read undecoded (raw Content-Encoding bytes), read only in part
+        or larger than MAX_STREAM_RECORD_BYTES are not recorded.
+
+        :param request: The sent request.
+        :param response: The received response, whose raw stream is wrapped.
+        :param elapsed: Seconds until the response headers arrived.
+        """
+        if response.raw is not None:
+            response.raw = _TeeStream(
+                response.raw,
+                lambda content: self._append(request, response, content, elapsed),
+                f"{request.method} {request.url}",
+            )
+
+    def _append(
+        self,
+        request: PreparedRequest,
+        response: Response,
+        content: bytes,
+        elapsed: float,
+    ) -> None:
+        try:
+            body: Dict[str, str] = {"body": content.decode("utf-8")}
+        except UnicodeDecodeError:
+            body = {"body_b64": base64.b64encode(content).decode("ascii")}
+        interaction = {
+            "key": self.key(request),
+            "request": {"method": request.method, "url": request.url},
+            "response": {
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": {
+                    name: value
+                    for name, value in response.headers.items()
+                    if name.lower() not in DROPPED_RESPONSE_HEADERS
+                },
+                **body,
+            },
+            "elapsed": round(elapsed, 6),
+        }
+        with self._lock:
+            self._interactions.append(interaction)
+            self._index[interaction["key"]].append(interaction)
+            self._dirty = True
+
+    def play(self, request: PreparedRequest) -> Optional[Dict[str, Any]]:
+        """
+        Find the recorded interaction answering a request.
+
+        :param request: The request to answer.
+        :return: The interaction, or None if the request was never recorded.
+        """
+        key = self.key(request)
+        with self._lock:
+            matches = self._index.get(key)
+            if not matches:
+                return None
+            position = self._played[key]
+            self._played[key] = position + 1
+        return matches[min(position, len(matches) - 1)]
+
+    def __enter__(self) -> "Cassette":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self.recording:
+            self.save()
+
+
+class _TeeStream:
+    """
+    Proxy of a urllib3 response passing the decoded chunks read through
+    stream() to a callback once the body is exhausted.
+    """
+
+    def __init__(
+        self, raw: Any, on_complete: Callable[[bytes], None], description: str
+    ) -> None:
+        self._raw = raw
+        self._on_complete = on_complete
+        self._description = description
+
+    def stream(self, amt: Optional[int] = None, decode_content: Optional[bool] = None):
+        if not decode_content:
+            logger.warning(
+                f"Not recording {self._description}: its body is read undecoded"
+            )
+            yield from self._raw.stream(amt, decode_content=decode_content)
+            return
+        chunks: Optional[List[bytes]] = []
+        size = 0
+        for chunk in self._raw.stream(amt, decode_content=True):
+            if chunks is not None:
+                size += len(chunk)
+                if size > MAX_STREAM_RECORD_BYTES:
+                    logger.warning(
+                        f"Not recording {self._description}: body exceeds "
+                        f"{MAX_STREAM_RECORD_BYTES:,} bytes"
+                    )
+                    chunks = None
+                else:
+                    chunks.append(chunk)
+            yield chunk
+        if chunks is not None:
+            self._on_complete(b"".join(chunks))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._raw, name)
+
+
+class CassetteAdapter(TimingHTTPAdapter):
+    """
+    HTTPAdapter recording to or replaying from a Cassette.
+    """
+
+    def __init__(self, cassette: Cassette, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        if self.cassette.recording:
+            # Session.send sets response.elapsed only after the adapter returns
+            started = time.perf_counter()
+            response = super().send(request, **kwargs)
+            elapsed = time.perf_counter() - started
+            if kwargs.get("stream"):
+                self.cassette.record_stream(request, response, elapsed)
+            else:
+                self.cassette.record(request, response, elapsed)
+            return response
+
+        interaction = self.cassette.play(request)
+        if interaction is None:
+            raise CassetteMissError(request.method, request.url, self.cassette.path)
+        if self.cassette.timing == "recorded":
+            time.sleep(interaction["elapsed"])
+        return self._build_response(request, interaction)
+
+    def _build_response(
+        self, request: PreparedRequest, interaction: Dict[str, Any]
+    ) -> Response:
+        recorded = interaction["response"]
+        response = Response()
+        response.status_code = recorded["status"]
+        response.reason = recorded.get("reason")
+        response.headers = CaseInsensitiveDict(recorded["headers"])
+        if "body_b64" in recorded:
+            response._content = base64.b64decode(recorded["body_b64"])
+        else:
+            response._content = recorded["body"].encode("utf-8")
+        # Streamed reads (iter_content) are served from the recorded body
+        response._content_consumed = True
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+
+# Example usage
+# client = APIClient("https://api.example.com")
+# with Cassette("cassettes/users.jsonl.gz", mode="once") as cassette:
+#     client.use_cassette(cassette)
+#     client.get("/users/1")  # recorded on the first run, replayed afterwards
+# client.use_cassette(None)
@@ -0,0 +1,324 @@
+import configparser
+import json
+import logging
+import os
+import threading
+from configparser import ConfigParser
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set
+
+
+from src.core.config_snapshot import ConfigSnapshot
+from src.core.exceptions.config_exceptions import ConfigError, JSONParsingError
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+CONFIG_DIR = os.path.join(BASE_DIR, "config")
+
+# Key of structured config files listing other files to merge in first
+INCLUDE_KEY = "include"
+
+_dotenv_lock = threading.Lock()
+_dotenv_loaded = False
+
+
+def load_dotenv_once() -> None:
+    """
+    Load the .env file into the environment once per process.
+
+    Existing environment variables are never overridden.
+    """
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    with _dotenv_lock:
+        if not _dotenv_loaded:
+            from dotenv import load_dotenv
+
+            load_dotenv()
+            _dotenv_loaded = True
+
+
+def read_config_file(file_path: str) -> Dict[str, Any]:
+    """
+    Parse a JSON, YAML, TOML or INI configuration file.
+
+    INI files are flattened: the DEFAULT section is merged at the top level and
+    other sections become nested dictionaries. Key case is preserved.
+
+    :param file_path: Path to the configuration file
+    :return: The parsed configuration
+    :raises FileNotFoundError: If the file does not exist
+    :raises JSONParsingError: If the file cannot be parsed
+    :raises ConfigError: If the configuration file format is not supported
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(file_path)
+    with open(file_path, "r") as config_file:
+        return parse_config_text(config_file.read(), file_path)
+
+
+def parse_config_text(content: str, file_path: str) -> Dict[str, Any]:
+    """
+    Parse configuration content already read from a file.
+
+    :param content: The file content
+    :param file_path: Path the content was read from; its extension selects
+        the format
+    :return: The parsed configuration
+    :raises JSONParsingError: If the content cannot be parsed
+    :raises ConfigError: If the configuration file format is not supported
+    """
+    if file_path.endswith(".json"):
+        try:
+            return json.loads(content) or {}
+        except json.JSONDecodeError as e:
+            raise JSONParsingError(file_path, str(e))
+    if file_path.endswith((".yaml", ".yml")):
+        import yaml
+
+        try:
+            return yaml.safe_load(content) or {}
+        except yaml.YAMLError as e:
+            raise JSONParsingError(file_path, str(e))
+    if file_path.endswith(".toml"):
+        import toml
+
+        try:
+            return toml.loads(content)
+        except toml.TomlDecodeError as e:
+            raise JSONParsingError(file_path, str(e))
+    if file_path.endswith(".ini"):
+        parser = _new_ini_parser()
+        try:
+            parser.read_string(content, source=file_path)
+        except configparser.Error as e:
+            raise JSONParsingError(file_path, str(e))
+        return _flatten_ini(parser)
+    raise ConfigError(
+        "Unsupported configuration file format. "
+        "Supported formats are JSON, YAML, TOML and INI."
+    )
+
+
+def _new_ini_parser() -> ConfigParser:
+    parser = ConfigParser()
+    parser.optionxform = str  # keep "API_KEY" instead of "api_key"
+    return parser
+
+
+def _flatten_ini(parser: ConfigParser) -> Dict[str, Any]:
+    values: Dict[str, Any] = dict(parser.defaults())
+    for section in parser.sections():
+        values[section] = {
+            key: value
+            for key, value in parser.items(section)
+            if key not in parser.defaults()
+        }
+    return values
+
+
+def _environment_overlay(file_path: str, env: str) -> str:
+    root, extension = os.path.splitext(file_path)
+    return f"{root}.{env}{extension}"
+
+
+class ConfigEngine:
+    """
+    Layered configuration whose files are resolved once per process; the
+    environment is overlaid at lookup time.
+
+    Layers, from lowest to highest precedence:
+
+    1. defaults passed in code
+    2. ``config/base.ini`` (optional) then ``config/<ENV>.ini``
+    3. structured files (JSON/YAML/TOML) from ``files`` or the ``CONFIG_FILES``
+       variable; each may list files to merge first under ``include`` and is
+       followed by its ``<name>.<ENV>.<ext>`` overlay when present
+    4. the environment, including values from ``.env``
+    """
+
+    def __init__(
+        self,
+        env: Optional[str] = None,
+        config_dir: str = CONFIG_DIR,
+        files: Optional[Sequence[str]] = None,
+        defaults: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """
+        Initialize the engine; nothing is read until first use.
+
+        :param env: Environment name (defaults to the ENV variable, then "dev")
+        :param config_dir: Directory holding the INI files
+        :param files: Structured config files (defaults to CONFIG_FILES)
+        :param defaults: Lowest-precedence default values
+        """
+        self._env = env
+        self.config_dir = config_dir
+        self._files = files
+        self.defaults: Dict[str, Any] = dict(defaults or {})
+        self._lock = threading.Lock()
+        self._snapshot: Optional[ConfigSnapshot] = None
+        self._file_values: Dict[str, Any] = {}
+        self._ini_parser: Optional[ConfigParser] = None
+
+    @property
+    def env(self) -> str:
+        load_dotenv_once()
+        return (self._env or os.getenv("ENV", "dev")).lower()
+
+    @property
+    def ini_file(self) -> str:
+        return os.path.join(self.config_dir, f"{self.env}.ini")
+
+    @property
+    def files(self) -> List[str]:
+        if self._files is not None:
+            return list(self._files)
+        load_dotenv_once()
+        return [
+            path for path in os.getenv("CONFIG_FILES", "").split(os.pathsep) if path
+        ]
+
+    @property
+    def ini_parser(self) -> ConfigParser:
+        """
+        The INI layers as a ConfigParser, for config/settings.py style access.
+        """
+        self.resolve()
+        return self._ini_parser
+
+    def resolve(self) -> ConfigSnapshot:
+        """
+        Get the resolved configuration, loading every file on first call.
+        The snapshot reads os.environ at lookup time, so environment changes
+        need no reload.
+
+        :return: The cached ConfigSnapshot
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._snapshot = self._load()
+                snapshot = self._snapshot
+        return snapshot
+
+    def resolve_with(
+        self,
+        file_values: Mapping[str, Any],
+        defaults: Optional[Mapping[str, Any]] = None,
+        frozen: bool = False,
+        missed: Optional[Set[str]] = None,
+    ) -> ConfigSnapshot:
+        """
+        Resolve the layers with extra file values above the engine's own
+        files and below the environment, e.g. a ConfigManager's file.
+
+        :param file_values: The extra configuration values
+        :param defaults: Extra defaults above the engine's defaults
+        :param frozen: Copy the environment now instead of reading it at
+            lookup time
+        :param missed: Set of keys already reported missing (see ConfigSnapshot)
+        :return: A new ConfigSnapshot
+        """
+        self.resolve()
+        values = {
+            **self.defaults,
+            **(defaults or {}),
+            **self._file_values,
+            **file_values,
+        }
+        if frozen:
+            return ConfigSnapshot({**values, **os.environ}, missed=missed)
+        return ConfigSnapshot(values, environment=os.environ, missed=missed)
+
+    def reload(self) -> ConfigSnapshot:
+        """
+        Drop the cached view and load every source again.
+
+        :return: The new ConfigSnapshot
+        """
+        with self._lock:
+            self._snapshot = self._load()
+            return self._snapshot
+
+    def _load(self) -> ConfigSnapshot:
+        load_dotenv_once()
+        env = self.env
+
+        parser = _new_ini_parser()
+        ini_files = [os.path.join(self.config_dir, "base.ini"), self.ini_file]
+        loaded_ini = parser.read(ini_files)
+        if self.ini_file not in loaded_ini:
+            logger.warning(f"Configuration file not found: {self.ini_file}")
+        self._ini_parser = parser
+
+        file_values: Dict[str, Any] = _flatten_ini(parser)
+        for file_path in self.files:
+            file_values.update(self._load_with_includes(file_path, set()))
+            overlay = _environment_overlay(file_path, env)
+            if os.path.exists(overlay):
+                file_values.update(self._load_with_includes(overlay, set()))
+
+        logger.info(
+            f"Configuration resolved for environment '{env}' from "
+            f"{len(loaded_ini)} INI and {len(self.files)} structured file(s)."
+        )
+        self._file_values = file_values
+        return ConfigSnapshot({**self.defaults, **file_values}, environment=os.environ)
+
+    def _load_with_includes(self, file_path: str, seen: Set[str]) -> Dict[str, Any]:
+        file_path = os.path.abspath(file_path)
+        if file_path in seen:
+            raise ConfigError(f"Circular configuration include: {file_path}")
+        seen = seen | {file_path}
+
+        values = read_config_file(file_path)
+        includes = values.pop(INCLUDE_KEY, [])
+        if isinstance(includes, str):
+            includes = [includes]
+
+        merged: Dict[str, Any] = {}
+        for include in includes:
+            include_path = os.path.join(os.path.dirname(file_path), include)
+            merged.update(self._load_with_includes(include_path, seen))
+        merged.update(values)
+        return merged
+
+
+_engine_lock = threading.Lock()
+_engine: Optional[ConfigEngine] = None
+
+
+def get_config_engine() -> ConfigEngine:
+    """
+    Get the process-wide configuration engine.
+
+    :return: The shared ConfigEngine
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = ConfigEngine()
+    return _engine
+
+
+def get_config() -> ConfigSnapshot:
+    """
+    Get the process-wide resolved configuration.
+
+    :return: The cached ConfigSnapshot
+    """
+    return get_config_engine().resolve()
+
+
+def reload_config() -> ConfigSnapshot:
+    """
+    Re-read every configuration file, e.g. after editing one (environment
+    changes are picked up without it).
+
+    :return: The new ConfigSnapshot
+    """
+    return get_config_engine().reload()
@@ -1,102 +1,254 @@
-import json
+import hashlib
 import logging
 import os
-from typing import Any, Dict, Optional
+import threading
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
-import toml
-import yaml
-from dotenv import load_dotenv
-
-from src.core.exceptions.config_exceptions import ConfigError, JSONParsingError
-
-# Load environment variables from a .env file if present
-load_dotenv()
+from src.core.config_engine import (
+    get_config_engine,
+    load_dotenv_once,
+    parse_config_text,
+)
+from src.core.config_snapshot import ConfigSnapshot
+from src.core.exceptions.config_exceptions import ConfigError
 
 # Set up logger
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+
+# Callback receiving the old config, the new config and the changed keys
+ConfigSubscriber = Callable[[Dict[str, Any], Dict[str, Any], Set[str]], None]
+
+
+def _changed_keys(old: Dict[str, Any], new: Dict[str, Any]) -> Set[str]:
+    return {
+        key
+        for key in old.keys() | new.keys()
+        if key not in old or key not in new or old[key] != new[key]
+    }
 
 
 class ConfigManager:
-    def __init__(self, config_file_path: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        config_file_path: Optional[str] = None,
+        validator: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> None:
         """
         Initialize ConfigManager.
 
         :param config_file_path: Path to the configuration file (optional)
+        :param validator: Optional callable raising an exception to reject a
+            reloaded configuration (e.g. a missing required key)
         """
+        # Load environment variables from a .env file if present (once per process)
+        load_dotenv_once()
         self.config: Dict[str, Any] = {}
+        self.config_file_path: Optional[str] = None
+        self._reload_lock = threading.Lock()
+        self._subscribers: List[ConfigSubscriber] = []
+        self._validator = validator
+        self._file_stat: Optional[Tuple[int, int]] = None
+        self._file_hash: Optional[str] = None
+        self._stop_event = threading.Event()
+        self._watch_thread: Optional[threading.Thread] = None
+        # (file config, engine snapshot, resolved snapshot) of the last lookup
+        self._resolved: Optional[
+            Tuple[Dict[str, Any], ConfigSnapshot, ConfigSnapshot]
+        ] = None
+        # Keys reported missing, kept across rebuilt snapshots
+        self._missed: Set[str] = set()
         if config_file_path:
             self.load_config_file(config_file_path)
 
     def load_config_file(self, file_path: str) -> None:
         """
-        Load configuration values from a JSON, YAML, or TOML file.
+        Load configuration values from a JSON, YAML, TOML or INI file.
 
         :param file_path: Path to the configuration file
         :raises FileNotFoundError: If the file does not exist
         :raises JSONParsingError: If the JSON file cannot be parsed
         :raises ConfigError: If the configuration file format is not supported
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(file_path)
+        with self._reload_lock:
+            if not os.path.exists(file_path):
+                raise FileNotFoundError(file_path)
+            stat = os.stat(file_path)
+            with open(file_path, "rb") as config_file:
+                content = config_file.read()
+            self.config = parse_config_text(content.decode("utf-8"), file_path)
+            self.config_file_path = file_path
+            self._file_stat = (stat.st_mtime_ns, stat.st_size)
+            self._file_hash = hashlib.sha256(content).hexdigest()
+        logger.info(f"Configuration loaded successfully from {file_path}.")
+
+    def subscribe(self, callback: ConfigSubscriber) -> None:
+        """
+        Register a callback invoked after every successful reload.
+
+        The callback receives the previous config, the new config and the set
+        of keys that were added, removed or changed. It runs on the watcher
+        thread and must not modify the dictionaries it is given.
+
+        :param callback: The change callback
+        """
+        self._subscribers.append(callback)
 
+    def unsubscribe(self, callback: ConfigSubscriber) -> None:
+        self._subscribers.remove(callback)
+
+    def check_for_changes(self) -> bool:
+        """
+        Reload the config file if its content changed since the last load.
+
+        The file is only read when its modification time or size changed, and
+        the new content is only parsed when its hash differs. A file that fails
+        to parse or validate is rejected and the last good config is kept.
+
+        :return: True if a new configuration was swapped in
+        """
+        file_path = self.config_file_path
+        if file_path is None:
+            return False
         try:
-            if file_path.endswith(".json"):
-                with open(file_path, "r") as config_file:
-                    self.config = json.load(config_file)
-                logger.info(f"Configuration loaded successfully from {file_path}.")
-            elif file_path.endswith((".yaml", ".yml")):
-                with open(file_path, "r") as config_file:
-                    self.config = yaml.safe_load(config_file)
-                logger.info(f"Configuration loaded successfully from {file_path}.")
-            elif file_path.endswith(".toml"):
-                with open(file_path, "r") as config_file:
-                    self.config = toml.load(config_file)
-                logger.info(f"Configuration loaded successfully from {file_path}.")
-            else:
-                raise ConfigError(
-                    "Unsupported configuration file format. Supported formats are JSON, YAML, and TOML."
+            stat = os.stat(file_path)
+        except OSError:
+            # Editors may replace the file by rename; try again next poll
+            return False
+        file_stat = (stat.st_mtime_ns, stat.st_size)
+        if file_stat == self._file_stat:
+            return False
+
+        with self._reload_lock:
+            try:
+                with open(file_path, "rb") as config_file:
+                    content = config_file.read()
+            except OSError:
+                return False
+            file_hash = hashlib.sha256(content).hexdigest()
+            if file_hash == self._file_hash:
+                self._file_stat = file_stat
+                return False
+
+            try:
+                new_config = parse_config_text(content.decode("utf-8"), file_path)
+                if not isinstance(new_config, dict):
+                    raise ConfigError(
+                        f"Configuration file {file_path} must contain a mapping."
+                    )
+                if self._validator is not None:
+                    self._validator(new_config)
+            except Exception as e:
+                # Remember the rejected content so it is not re-parsed every poll
+                self._file_stat = file_stat
+                self._file_hash = file_hash
+                logger.error(
+                    f"Rejected configuration change in {file_path}, "
+                    f"keeping the last good configuration: {e}"
                 )
-        except (json.JSONDecodeError, yaml.YAMLError, toml.TomlDecodeError) as e:
-            raise JSONParsingError(file_path, str(e))
+                return False
+
+            old_config = self.config
+            # A single reference assignment: readers see the old or new dict
+            self.config = new_config
+            self._file_stat = file_stat
+            self._file_hash = file_hash
+
+        changed = _changed_keys(old_config, new_config)
+        logger.info(
+            f"Configuration reloaded from {file_path}; changed keys: {sorted(changed)}"
+        )
+        for callback in list(self._subscribers):
+            try:
+                callback(old_config, new_config, changed)
+            except Exception as e:
+                logger.error(f"Configuration subscriber {callback!r} failed: {e}")
+        return True
+
+    def watch(self, interval: float = 1.0) -> None:
+        """
+        Start polling the config file for changes in a background thread.
+
+        :param interval: Seconds between polls
+        :raises ConfigError: If no config file has been loaded
+        """
+        if self.config_file_path is None:
+            raise ConfigError("Cannot watch configuration: no file loaded.")
+        if self._watch_thread is not None and self._watch_thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._watch_thread = threading.Thread(
+            target=self._watch_loop,
+            args=(interval,),
+            name="config-watcher",
+            daemon=True,
+        )
+        self._watch_thread.start()
+        logger.info(f"Watching {self.config_file_path} for changes every {interval}s.")
+
+    def stop_watching(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the watcher thread started by watch().
+
+        :param timeout: Seconds to wait for the thread to finish
+        """
+        self._stop_event.set()
+        if self._watch_thread is not None:
+            self._watch_thread.join(timeout)
+            self._watch_thread = None
+
+    def _watch_loop(self, interval: float) -> None:
+        while not self._stop_event.wait(interval):
+            try:
+                self.check_for_changes()
+            except Exception as e:
+                logger.error(f"Configuration watcher error: {e}")
 
     def get_config_value(
         self, key: str, expected_type: type, default: Optional[Any] = None
     ) -> Any:
         """
-        Get a configuration value from the environment or config file.
+        Get a configuration value from the layered configuration.
+
+        The precedence is environment > this manager's config file > the
+        configuration engine's files > default. Environment changes and
+        reloads of the file are picked up on the next call, and a missing key
+        is logged once per manager.
 
         :param key: The key for the configuration value
         :param expected_type: The expected type of the configuration value
         :param default: The default value to return if the key is not found
         :return: The configuration value or the default value
-        :raises TypeError: If the value does not match the expected type
-        """
-        # First, try to get the value from environment variables
-        value = os.getenv(key)
-        if value is not None:
-            logger.debug(
-                f"Retrieved config key '{key}' from environment with value: {value}"
-            )
-            return self._validate_type(key, value, expected_type)
-
-        # Then, try to get the value from the loaded config file
-        if key in self.config:
-            value = self.config[key]
-            logger.debug(
-                f"Retrieved config key '{key}' from config file with value: {value}"
-            )
-            return self._validate_type(key, value, expected_type)
-
-        # If not found, use the provided default
-        logger.warning(f"Config key '{key}' not found. Using default value: {default}")
-        return (
-            self._validate_type(key, default, expected_type)
-            if default is not None
-            else default
-        )
+        :raises TypeError: If the value cannot be converted to the expected type
+        """
+        return self._resolve().get(key, expected_type, default)
+
+    def _resolve(self) -> ConfigSnapshot:
+        # One read of the reference, so a concurrent reload cannot be observed
+        # half-way; the engine snapshot changes only on reload_config()
+        config = self.config
+        engine = get_config_engine()
+        base = engine.resolve()
+        resolved = self._resolved
+        if resolved is None or resolved[0] is not config or resolved[1] is not base:
+            snapshot = engine.resolve_with(config, missed=self._missed)
+            resolved = (config, base, snapshot)
+            self._resolved = resolved
+        return resolved[2]
+
+    def snapshot(self, defaults: Optional[Dict[str, Any]] = None) -> ConfigSnapshot:
+        """
+        Build an immutable, typed snapshot of the configuration.
+
+        The environment is read once, so hot paths should keep the snapshot
+        and call ``snapshot.get(key, int)`` instead of get_config_value.
+
+        :param defaults: Values used when neither the environment nor the
+            config files define a key
+        :return: ConfigSnapshot resolved with the same layers as
+            get_config_value, defaults lowest
+        """
+        logger.info("Building configuration snapshot.")
+        return get_config_engine().resolve_with(self.config, defaults, frozen=True)
 
     def load_all_environment_variables(self) -> Dict[str, str]:
         """
@@ -107,22 +259,6 @@ class ConfigManager:
         logger.info("Loading all configuration values from environment variables.")
         return {key: value for key, value in os.environ.items()}
 
-    def _validate_type(self, key: str, value: Any, expected_type: type) -> Any:
-        """
-        Validate the type of the configuration value.
-
-        :param key: The key for the configuration value
-        :param value: The configuration value to validate
-        :param expected_type: The expected type of the value
-        :return: The validated value
-        :raises TypeError: If the value does not match the expected type
-        """
-        if not isinstance(value, expected_type):
-            raise TypeError(
-                f"Config key '{key}' is expected to be of type '{expected_type.__name__}', but got '{type(value).__name__}'"
-            )
-        return value
-
 
 # Example usage
 # if __name__ == "__main__":
@@ -134,3 +270,9 @@ class ConfigManager:
 #         "API_BASE_URL", str, "http://localhost:5000"
 #     )
 #     logger.info(f"API Base URL: {api_base_url}")
+#
+#     # Pick up edits to the file during a long run
+#     config_manager.subscribe(
+#         lambda old, new, changed: logger.info(f"Config changed: {changed}")
+#     )
+#     config_manager.watch(interval=2.0)
@@ -0,0 +1,219 @@
+import logging
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+_FALSE_VALUES = frozenset({"false", "0", "no", "off"})
+_MISSING = object()
+
+
+def convert_value(key: str, value: Any, expected_type: type) -> Any:
+    """
+    Convert a raw configuration value to the expected type.
+
+    Strings coming from the environment or INI files are parsed: "true"/"false"
+    (also yes/no, on/off, 1/0) become bool, "5" becomes int and "1.5" float.
+
+    :param key: The configuration key, used in error messages.
+    :param value: The raw value.
+    :param expected_type: The type to convert to.
+    :return: The converted value.
+    :raises TypeError: If the value cannot be converted to the expected type.
+    """
+    if isinstance(value, expected_type) and not (
+        expected_type is int and isinstance(value, bool)
+    ):
+        return value
+    if isinstance(value, str):
+        text = value.strip()
+        if expected_type is bool:
+            lowered = text.lower()
+            if lowered in _TRUE_VALUES:
+                return True
+            if lowered in _FALSE_VALUES:
+                return False
+        elif expected_type in (int, float):
+            try:
+                return expected_type(text)
+            except ValueError:
+                pass
+    elif (
+        expected_type is float
+        and isinstance(value, int)
+        and not isinstance(value, bool)
+    ):
+        return float(value)
+    raise TypeError(
+        f"Config key '{key}' is expected to be of type '{expected_type.__name__}', "
+        f"but got '{type(value).__name__}'"
+    )
+
+
+class ConfigSnapshot:
+    """
+    Immutable, typed view of the configuration resolved once.
+
+    Values are resolved with the precedence environment > config file >
+    defaults when the snapshot is built. Every key gets a fixed slot, typed
+    conversions are cached per slot, and a missing key is logged only once.
+
+    A snapshot may also overlay a live environment mapping (usually
+    os.environ), consulted on every lookup, so environment changes are seen
+    without resolving the file layers again.
+    """
+
+    __slots__ = (
+        "_slots",
+        "_values",
+        "_converted",
+        "_missed",
+        "_environment",
+        "_environment_converted",
+    )
+
+    def __init__(
+        self,
+        values: Mapping[str, Any],
+        environment: Optional[Mapping[str, str]] = None,
+        missed: Optional[Set[str]] = None,
+    ) -> None:
+        """
+        Initialize a snapshot from already-resolved values.
+
+        :param values: Mapping of configuration keys to raw values.
+        :param environment: Live mapping read on every lookup, above the values.
+        :param missed: Set of keys already reported missing, shared with other
+            snapshots so a key is logged once per owner (default: a new set).
+        """
+        keys = tuple(values)
+        object.__setattr__(self, "_slots", {key: slot for slot, key in enumerate(keys)})
+        object.__setattr__(self, "_values", tuple(values[key] for key in keys))
+        object.__setattr__(self, "_converted", {})
+        object.__setattr__(self, "_missed", set() if missed is None else missed)
+        object.__setattr__(self, "_environment", environment)
+        object.__setattr__(self, "_environment_converted", {})
+
+    @classmethod
+    def build(
+        cls,
+        defaults: Optional[Mapping[str, Any]] = None,
+        file_values: Optional[Mapping[str, Any]] = None,
+        environment: Optional[Mapping[str, str]] = None,
+    ) -> "ConfigSnapshot":
+        """
+        Resolve the configuration layers into a snapshot.
+
+        :param defaults: Lowest-precedence default values.
+        :param file_values: Values loaded from configuration files.
+        :param environment: Highest-precedence values, usually os.environ.
+        :return: A new ConfigSnapshot.
+        """
+        resolved: Dict[str, Any] = {}
+        for layer in (defaults, file_values, environment):
+            if layer:
+                resolved.update(layer)
+        return cls(resolved)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("ConfigSnapshot is immutable.")
+
+    def slot(self, key: str) -> Optional[int]:
+        """
+        Get the precomputed slot of a key.
+
+        :param key: The configuration key.
+        :return: The slot index, or None if the key is unknown.
+        """
+        return self._slots.get(key)
+
+    def get(
+        self,
+        key: str,
+        expected_type: Optional[type] = str,
+        default: Optional[Any] = None,
+    ) -> Any:
+        """
+        Get a typed configuration value.
+
+        :param key: The configuration key.
+        :param expected_type: Type the value is converted to (None returns the
+            raw value unconverted).
+        :param default: Value returned (after conversion) when the key is missing.
+        :return: The converted value or the default.
+        :raises TypeError: If the value cannot be converted to the expected type.
+        """
+        if self._environment is not None:
+            raw = self._environment.get(key)
+            if raw is not None:
+                return self._convert_environment(key, raw, expected_type)
+        slot = self._slots.get(key)
+        if slot is None:
+            if key not in self._missed:
+                self._missed.add(key)
+                logger.warning(
+                    "Config key '%s' not found. Using default value: %s", key, default
+                )
+            return (
+                convert_value(key, default, expected_type)
+                if default is not None and expected_type is not None
+                else default
+            )
+        if expected_type is None:
+            return self._values[slot]
+
+        cache_key: Tuple[int, type] = (slot, expected_type)
+        value = self._converted.get(cache_key, _MISSING)
+        if value is _MISSING:
+            value = convert_value(key, self._values[slot], expected_type)
+            self._converted[cache_key] = value
+        return value
+
+    def _convert_environment(
+        self, key: str, raw: str, expected_type: Optional[type]
+    ) -> Any:
+        if expected_type is None:
+            return raw
+        # Keyed on the raw text, so a changed variable is converted again
+        cache_key = (key, expected_type)
+        cached = self._environment_converted.get(cache_key)
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+        value = convert_value(key, raw, expected_type)
+        self._environment_converted[cache_key] = (raw, value)
+        return value
+
+    def __getitem__(self, key: str) -> Any:
+        if self._environment is not None and key in self._environment:
+            return self._environment[key]
+        slot = self._slots.get(key)
+        if slot is None:
+            raise KeyError(key)
+        return self._values[slot]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._slots or (
+            self._environment is not None and key in self._environment
+        )
+
+    def __len__(self) -> int:
+        return len(self.as_dict())
+
+    def as_dict(self) -> Mapping[str, Any]:
+        """
+        Get a read-only mapping of all raw values.
+
+        :return: A read-only mapping of keys to raw values.
+        """
+        values = dict(zip(self._slots, self._values))
+        if self._environment is not None:
+            values.update(self._environment)
+        return MappingProxyType(values)
+
+    @property
+    def missed_keys(self) -> Set[str]:
+        """
+        Keys that were requested but not present.
+        """
+        return set(self._missed)
@@ -1,4 +1,9 @@
-from .api_exceptions import APIClientError, APIRequestError, APITimeoutError
+from .api_exceptions import (
+    APIClientError,
+    APIRequestError,
+    APITimeoutError,
+    CassetteMissError,
+)
 from .base_exception import AutomationFrameworkError
 from .config_exceptions import (
     ConfigError,
@@ -15,5 +20,6 @@ __all__ = [
     "APIClientError",
     "APIRequestError",
     "APITimeoutError",
+    "CassetteMissError",
     "AutomationFrameworkError",
 ]
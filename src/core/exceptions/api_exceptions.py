@@ -30,3 +30,17 @@ class APITimeoutError(APIClientError):
     def __init__(self, timeout_value: int) -> None:
         super().__init__(f"API request timed out after {timeout_value} seconds")
         self.timeout_value = timeout_value
+
+
+class CassetteMissError(APIClientError):
+    """
+    Raised when a replayed cassette has no interaction for a request.
+    """
+
+    def __init__(self, method: str, url: str, cassette_path: str) -> None:
+        super().__init__(
+            f"No recorded interaction for {method} {url} in cassette {cassette_path}"
+        )
+        self.method = method
+        self.url = url
+        self.cassette_path = cassette_path
@@ -0,0 +1,181 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from src.utils.logger import get_logger
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class _Call:
+    """
+    One in-flight call whose outcome is handed to every waiter.
+    """
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    def __init__(self, name: str = "single_flight") -> None:
+        """
+        Initialize a thread-safe coalescer of identical concurrent calls.
+
+        While a call for a key runs, later calls for the same key wait for
+        it and get its result instead of running again. Once it finishes the
+        key is free, so results are never cached beyond the call itself.
+
+        Coroutines coalesce through async_flight, an AsyncSingleFlight kept
+        with this one so that whoever shares the coalescer shares both.
+
+        :param name: Name used in logs.
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._stats = {"calls": 0, "executed": 0, "deduplicated": 0}
+        self.async_flight = AsyncSingleFlight(f"{name}.async")
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters of both coalescers. Coroutines leading a shared call are
+        expected to run it through do() (e.g. in a worker thread), where
+        they are counted, so only the coroutines joining them are added.
+        """
+        shared = self.async_flight.stats
+        with self._lock:
+            return {
+                "calls": self._stats["calls"] + shared["deduplicated"],
+                "executed": self._stats["executed"],
+                "deduplicated": self._stats["deduplicated"] + shared["deduplicated"],
+                "in_flight": len(self._calls),
+            }
+
+    def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], T],
+        copy: Optional[Callable[[T], T]] = None,
+        on_shared: Optional[Callable[[], None]] = None,
+    ) -> T:
+        """
+        Run fn, or join the call already running for the same key.
+
+        :param key: Identity of the call, e.g. method and URL.
+        :param fn: The call to run.
+        :param copy: Optional function giving each joining caller its own
+            copy of the result, for mutable results.
+        :param on_shared: Optional callback run when this call is deduplicated.
+        :return: The result of fn.
+        :raises Exception: Whatever fn raised, in every waiter.
+        """
+        with self._lock:
+            self._stats["calls"] += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._stats["executed"] += 1
+            else:
+                self._stats["deduplicated"] += 1
+
+        if not leader:
+            logger.debug(f"{self.name}: joined in-flight call {key}")
+            if on_shared is not None:
+                on_shared()
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result if copy is None else copy(call.result)
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            # Free the key before waking the waiters so new calls start afresh
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    def __init__(self, name: str = "async_single_flight") -> None:
+        """
+        Initialize a coalescer of identical concurrent coroutine calls.
+
+        The shared call runs as its own task, so cancelling one waiter,
+        including the one that started it, does not cancel it for the others.
+        Calls are only shared within one event loop.
+
+        :param name: Name used in logs.
+        """
+        self.name = name
+        self._tasks: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self._stats = {"calls": 0, "executed": 0, "deduplicated": 0}
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {**self._stats, "in_flight": len(self._tasks)}
+
+    def _forget(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Mark the error retrieved even if every waiter was cancelled
+            task.exception()
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[T]],
+        copy: Optional[Callable[[T], T]] = None,
+        on_shared: Optional[Callable[[], None]] = None,
+    ) -> T:
+        """
+        Await fn(), or join the call already running for the same key.
+
+        :param key: Identity of the call, e.g. method and URL.
+        :param fn: Function returning the awaitable to run.
+        :param copy: Optional function giving each joining caller its own
+            copy of the result, for mutable results.
+        :param on_shared: Optional callback run when this call is deduplicated.
+        :return: The result of the awaitable.
+        :raises Exception: Whatever the awaitable raised, in every waiter.
+        """
+        loop = asyncio.get_running_loop()
+        self._stats["calls"] += 1
+        task = self._tasks.get(key)
+        leader = task is None or task.get_loop() is not loop
+        if leader:
+            task = self._tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self._stats["executed"] += 1
+        else:
+            self._stats["deduplicated"] += 1
+            logger.debug(f"{self.name}: joined in-flight call {key}")
+            if on_shared is not None:
+                on_shared()
+
+        result = await asyncio.shield(task)
+        return result if leader or copy is None else copy(result)
+
+
+# Example usage
+# flight = SingleFlight()
+# threads = [
+#     threading.Thread(target=flight.do, args=("user-1", lambda: client.get("/users/1")))
+#     for _ in range(10)
+# ]
+# ...
+# print(flight.stats)  # {"calls": 10, "executed": 1, "deduplicated": 9, ...}
@@ -0,0 +1,229 @@
+import io
+import mimetypes
+import os
+import uuid
+import zlib
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from src.utils.logger import get_logger
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+# Content-Encoding values accepted for request compression
+ENCODINGS = ("gzip", "zstd")
+
+BodySource = Union[str, bytes, IO[bytes], Iterable[bytes]]
+FileSpec = Union[str, Tuple[str, Union[str, IO[bytes]]], Tuple[str, Any, str]]
+
+
+def iter_file(
+    source: Union[str, IO[bytes]], chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Read a file in chunks.
+
+    :param source: File path or binary file object.
+    :param chunk_size: Bytes per chunk.
+    :return: Iterator of chunks.
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as file:
+            yield from iter_file(file, chunk_size)
+        return
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+def source_size(source: Any) -> Optional[int]:
+    """
+    Get the number of bytes left in a body source, if it can be known
+    without reading it.
+
+    :param source: File path, bytes, or file object.
+    :return: Size in bytes, or None for iterators and unseekable files.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        return len(source)
+    if isinstance(source, str):
+        return os.path.getsize(source)
+    try:
+        position = source.tell()
+        end = source.seek(0, io.SEEK_END)
+        source.seek(position)
+        return end - position
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _zstd_compressor(level: Optional[int]) -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise RuntimeError(
+            "zstd compression needs the optional 'zstandard' package"
+        ) from e
+    return zstandard.ZstdCompressor(level=level or 3).compressobj()
+
+
+def compress_stream(
+    chunks: Iterable[bytes], encoding: str, level: Optional[int] = None
+) -> Iterator[bytes]:
+    """
+    Compress a byte stream incrementally.
+
+    :param chunks: Uncompressed chunks.
+    :param encoding: "gzip" or "zstd" (needs the optional zstandard package).
+    :param level: Compression level (default: 6 for gzip, 3 for zstd).
+    :return: Iterator of compressed chunks.
+    :raises ValueError: If the encoding is not supported.
+    :raises RuntimeError: If zstd is requested without zstandard installed.
+    """
+    if encoding == "gzip":
+        compressor: Any = zlib.compressobj(
+            6 if level is None else level, zlib.DEFLATED, 31
+        )
+    elif encoding == "zstd":
+        compressor = _zstd_compressor(level)
+    else:
+        raise ValueError(
+            f"Unsupported encoding '{encoding}', expected one of {ENCODINGS}"
+        )
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+class BodyStream:
+    """
+    Request body streamed from an iterable, counting the bytes sent.
+
+    requests sends a Content-Length header when a streamed body has a len
+    attribute, and chunked transfer encoding otherwise.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], length: Optional[int] = None) -> None:
+        self._chunks = chunks
+        self.sent = 0
+        if length is not None:
+            self.len = length
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._chunks:
+            self.sent += len(chunk)
+            yield chunk
+
+
+def body_stream(
+    source: BodySource,
+    compress: Optional[str] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> BodyStream:
+    """
+    Build a streamed request body.
+
+    :param source: File path, bytes, binary file object, or iterable of chunks.
+    :param compress: Optional Content-Encoding to compress with.
+    :param chunk_size: Bytes read per chunk from files.
+    :return: The body; its length is known unless it is compressed or
+        comes from an iterator.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        chunks: Iterable[bytes] = [bytes(source)]
+    elif isinstance(source, str) or hasattr(source, "read"):
+        chunks = iter_file(source, chunk_size)
+    else:
+        chunks = source
+    length = None if compress else source_size(source)
+    if compress:
+        chunks = compress_stream(chunks, compress)
+    return BodyStream(chunks, length)
+
+
+class MultipartEncoder:
+    def __init__(
+        self,
+        files: Dict[str, FileSpec],
+        fields: Optional[Dict[str, str]] = None,
+        boundary: Optional[str] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        """
+        Initialize a multipart/form-data body that streams its files from
+        disk instead of building the whole body in memory, as requests'
+        files= argument does.
+
+        :param files: Field name to a file path, (filename, path or file
+            object) or (filename, path or file object, content type).
+        :param fields: Plain form fields.
+        :param boundary: Part boundary (default: random).
+        :param chunk_size: Bytes read per chunk from files.
+        """
+        self.boundary = boundary or uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self._parts: List[Tuple[bytes, Optional[Union[str, IO[bytes]]]]] = []
+        for name, value in (fields or {}).items():
+            header = self._header(name)
+            self._parts.append((header + str(value).encode() + b"\r\n", None))
+        for name, spec in files.items():
+            if isinstance(spec, str):
+                spec = (os.path.basename(spec), spec)
+            filename, source = spec[0], spec[1]
+            content_type = (
+                spec[2]
+                if len(spec) > 2
+                else mimetypes.guess_type(filename)[0] or "application/octet-stream"
+            )
+            self._parts.append((self._header(name, filename, content_type), source))
+        self._closing = f"--{self.boundary}--\r\n".encode()
+
+    def _header(
+        self, name: str, filename: Optional[str] = None, content_type: str = ""
+    ) -> bytes:
+        disposition = f'form-data; name="{name}"'
+        if filename is not None:
+            disposition += f'; filename="{filename}"'
+        header = f"--{self.boundary}\r\nContent-Disposition: {disposition}\r\n"
+        if content_type:
+            header += f"Content-Type: {content_type}\r\n"
+        return (header + "\r\n").encode()
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def length(self) -> Optional[int]:
+        """
+        Total body size, or None if a file object's size cannot be known.
+        """
+        total = len(self._closing)
+        for header, source in self._parts:
+            total += len(header)
+            if source is not None:
+                size = source_size(source)
+                if size is None:
+                    return None
+                total += size + 2
+        return total
+
+    def __iter__(self) -> Iterator[bytes]:
+        for header, source in self._parts:
+            yield header
+            if source is not None:
+                yield from iter_file(source, self.chunk_size)
+                yield b"\r\n"
+        yield self._closing
+
+
+# Example usage
+# encoder = MultipartEncoder({"file": "reports/big.bin"}, fields={"kind": "report"})
+# body = BodyStream(encoder, encoder.length)
+# requests.post(url, data=body, headers={"Content-Type": encoder.content_type})
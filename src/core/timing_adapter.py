@@ -0,0 +1,121 @@
+import socket
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
+
+
+class RequestTimings:
+    """
+    Phase timings of a single HTTP request, in seconds.
+
+    ``dns`` and ``connect`` stay None when a pooled connection was reused.
+    """
+
+    __slots__ = ("dns", "connect", "ttfb", "total")
+
+    def __init__(self) -> None:
+        self.dns: Optional[float] = None
+        self.connect: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self.total: Optional[float] = None
+
+
+_current_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "current_request_timings", default=None
+)
+
+
+@contextmanager
+def collect_timings() -> Iterator[RequestTimings]:
+    """
+    Collect connection phase timings for requests made inside the block.
+
+    :yield: The RequestTimings filled in by the timed connections.
+    """
+    timings = RequestTimings()
+    token = _current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_timings.reset(token)
+
+
+class _TimedConnectionMixin:
+    def _new_conn(self) -> socket.socket:
+        timings = _current_timings.get()
+        if timings is None:
+            return super()._new_conn()
+
+        host = self._dns_host
+        started = time.perf_counter()
+        try:
+            addresses: List[str] = list(
+                dict.fromkeys(
+                    info[4][0]
+                    for info in socket.getaddrinfo(
+                        host, self.port, 0, socket.SOCK_STREAM
+                    )
+                )
+            )
+        except OSError:
+            # Let urllib3 raise its own resolution error
+            return super()._new_conn()
+        timings.dns = time.perf_counter() - started
+
+        # Connect to the already-resolved addresses in order, like create_connection
+        error: Optional[NewConnectionError] = None
+        try:
+            for address in addresses:
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except NewConnectionError as e:
+                    error = e
+            raise error
+        finally:
+            self._dns_host = host
+
+    def connect(self) -> None:
+        timings = _current_timings.get()
+        started = time.perf_counter()
+        super().connect()
+        if timings is not None:
+            # Includes the TLS handshake for HTTPS connections
+            timings.connect = time.perf_counter() - started - (timings.dns or 0.0)
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimingHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose connections report DNS and connect timings.
+
+    Timings are only collected inside a collect_timings block.
+    """
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
@@ -0,0 +1,17 @@
+from .distributed import LoadCoordinator, LoadWorker
+from .engine import LoadEngine
+from .profiles import LoadProfile
+from .report import LoadReport, TaskStats
+from .scenario import Scenario, ScenarioContext, load_scenario
+
+__all__ = [
+    "LoadCoordinator",
+    "LoadEngine",
+    "LoadProfile",
+    "LoadReport",
+    "LoadWorker",
+    "TaskStats",
+    "Scenario",
+    "ScenarioContext",
+    "load_scenario",
+]
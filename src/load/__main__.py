@@ -0,0 +1,109 @@
+import argparse
+import json
+import os
+from typing import Tuple
+
+from src.load.distributed import LoadCoordinator, LoadWorker
+from src.load.engine import MODELS, LoadEngine
+from src.load.profiles import LoadProfile
+from src.utils import ConfigLoader
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.load",
+        description="Drive UserService/ProductService scenarios under load.",
+    )
+    parser.add_argument(
+        "--scenario",
+        default="src.load.scenarios:user_crud",
+        help="Scenario factory as 'module:function'",
+    )
+    parser.add_argument(
+        "--base-url",
+        default=ConfigLoader.get_config_value("API_BASE_URL", "http://localhost:5000"),
+    )
+    parser.add_argument("--model", choices=MODELS, default="closed")
+    parser.add_argument(
+        "--target",
+        type=float,
+        help="Virtual users (closed model) or arrivals per second (open model)",
+    )
+    parser.add_argument("--ramp-up", type=float, default=0.0)
+    parser.add_argument("--duration", type=float, default=60.0, help="Hold seconds")
+    parser.add_argument("--ramp-down", type=float, default=0.0)
+    parser.add_argument("--think-min", type=float, default=0.0)
+    parser.add_argument("--think-max", type=float, default=0.0)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes on this machine",
+    )
+    parser.add_argument("--max-concurrency", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", dest="json_path", help="Write the summary as JSON")
+    distributed = parser.add_mutually_exclusive_group()
+    distributed.add_argument(
+        "--listen",
+        metavar="HOST:PORT",
+        help="Coordinate the load of --nodes worker nodes instead of running it",
+    )
+    distributed.add_argument(
+        "--connect",
+        metavar="HOST:PORT",
+        help="Run as a worker node of the coordinator at this address; "
+        "the load options come from the coordinator",
+    )
+    parser.add_argument("--nodes", type=int, default=1, help="Nodes to wait for")
+    return parser
+
+
+def parse_address(value: str) -> Tuple[str, int]:
+    """
+    Parse "host:port", or ":port" for all interfaces.
+    """
+    host, _, port = value.rpartition(":")
+    return host or "0.0.0.0", int(port)
+
+
+def main() -> None:
+    parser = build_parser()
+    args = parser.parse_args()
+    if args.connect:
+        host, port = parse_address(args.connect)
+        LoadWorker(host, port, processes=args.workers).run()
+        return
+    if args.target is None:
+        parser.error("--target is required")
+    if args.ramp_up or args.ramp_down:
+        profile = LoadProfile.ramp(
+            args.target, args.ramp_up, args.duration, args.ramp_down
+        )
+    else:
+        profile = LoadProfile.constant(args.target, args.duration)
+
+    engine = LoadEngine(
+        scenario=args.scenario,
+        base_url=args.base_url,
+        profile=profile,
+        model=args.model,
+        think_time=(args.think_min, args.think_max),
+        workers=args.workers,
+        max_concurrency=args.max_concurrency,
+        seed=args.seed,
+    )
+    if args.listen:
+        host, port = parse_address(args.listen)
+        report = LoadCoordinator(engine, args.nodes, host=host, port=port).run()
+    else:
+        report = engine.run()
+
+    print(report.format_text())
+    if args.json_path:
+        with open(args.json_path, "w") as file:
+            json.dump(report.summary(), file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
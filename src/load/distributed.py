@@ -0,0 +1,319 @@
+import json
+import math
+import os
+import socket
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.load.engine import LoadEngine, run_workers
+from src.load.report import LoadReport
+from src.utils.logger import get_logger
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+# Round trips timed per node; the fastest one gives the network delay
+PINGS = 5
+
+
+class _Channel:
+    """
+    Newline-delimited JSON messages over a TCP connection.
+    """
+
+    def __init__(self, sock: socket.socket) -> None:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock = sock
+        self._reader = sock.makefile("rb")
+
+    def send(self, message: Dict[str, Any]) -> None:
+        data = json.dumps(message, separators=(",", ":")).encode()
+        self.sock.sendall(data + b"\n")
+
+    def receive(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Wait for the next message.
+
+        :param timeout: Seconds to wait, None to wait forever.
+        :return: The decoded message.
+        :raises ConnectionError: If the peer closed the connection.
+        """
+        self.sock.settimeout(timeout)
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Peer closed the connection")
+        return json.loads(line)
+
+    def close(self) -> None:
+        self._reader.close()
+        self.sock.close()
+
+
+def _expect(message: Dict[str, Any], kind: str, peer: str) -> Dict[str, Any]:
+    if message.get("type") == "error":
+        raise RuntimeError(f"Load node {peer} failed: {message.get('message')}")
+    if message.get("type") != kind:
+        raise RuntimeError(f"Expected '{kind}' from {peer}, got {message!r}")
+    return message
+
+
+class _Node:
+    def __init__(self, channel: _Channel, name: str, processes: int) -> None:
+        self.channel = channel
+        self.name = name
+        self.processes = processes
+        self.round_trip = math.inf
+        self.clock_offset = 0.0
+
+
+class LoadCoordinator:
+    def __init__(
+        self,
+        engine: LoadEngine,
+        nodes: int,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        join_timeout: float = 60.0,
+        start_delay: float = 2.0,
+        report_timeout: float = 60.0,
+    ) -> None:
+        """
+        Initialize a coordinator running an engine's load on worker nodes.
+
+        Nodes connect with LoadWorker and say how many processes they run;
+        together these replace the engine's workers setting, and virtual users
+        (closed model) or arrivals per second (open model) are split evenly
+        across all of them as LoadEngine does on one machine. Each node sends
+        back one merged report whose latency histograms are sparse bucket
+        counts, so the result stays small whatever the request count.
+
+        Nodes are told to start after a delay rather than at a wall-clock
+        time, so differences between the nodes' clocks do not matter; each
+        delay is shortened by half of the node's fastest measured round trip.
+
+        :param engine: Engine whose scenario, profile and model are run.
+        :param nodes: Number of nodes to wait for.
+        :param host: Interface to listen on; "0.0.0.0" for remote nodes.
+        :param port: Port to listen on, 0 for any free port (see address).
+        :param join_timeout: Seconds to wait for every node to connect.
+        :param start_delay: Seconds between the start command and the load,
+            enough for the nodes to start their processes.
+        :param report_timeout: Seconds to wait for reports after the load ends.
+        """
+        if nodes < 1:
+            raise ValueError("nodes must be at least 1.")
+        self.engine = engine
+        self.nodes = nodes
+        self.join_timeout = join_timeout
+        self.start_delay = start_delay
+        self.report_timeout = report_timeout
+        self._server = socket.create_server((host, port))
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._server.getsockname()[:2]
+
+    def run(self) -> LoadReport:
+        """
+        Wait for the nodes, start the load on all of them and merge their reports.
+
+        :return: The merged LoadReport.
+        :raises RuntimeError: If nodes do not join in time or a node fails.
+        """
+        nodes: List[_Node] = []
+        try:
+            self._accept(nodes)
+            for node in nodes:
+                self._measure(node)
+                logger.info(
+                    f"Node {node.name}: {node.processes} process(es), round trip "
+                    f"{node.round_trip * 1000:.2f} ms, clock offset "
+                    f"{node.clock_offset * 1000:+.1f} ms"
+                )
+            self._start(nodes)
+            results = self._collect(nodes)
+        finally:
+            for node in nodes:
+                node.channel.close()
+            self._server.close()
+
+        report = LoadReport.merge_all(
+            (LoadReport.from_dict(result) for result in results),
+            scenario=results[0]["scenario"],
+            model=self.engine.model,
+        )
+        logger.info(f"Distributed load finished\n{report.format_text()}")
+        return report
+
+    def _accept(self, nodes: List[_Node]) -> None:
+        deadline = time.monotonic() + self.join_timeout
+        while len(nodes) < self.nodes:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise RuntimeError(
+                    f"Only {len(nodes)} of {self.nodes} load nodes joined "
+                    f"within {self.join_timeout}s"
+                )
+            self._server.settimeout(remaining)
+            try:
+                sock, address = self._server.accept()
+            except socket.timeout:
+                continue
+            channel = _Channel(sock)
+            peer = f"{address[0]}:{address[1]}"
+            try:
+                hello = _expect(channel.receive(timeout=remaining), "hello", peer)
+                processes = int(hello["processes"])
+                if processes < 1:
+                    raise ValueError(f"invalid process count {processes}")
+            except (OSError, KeyError, TypeError, ValueError, RuntimeError) as error:
+                logger.warning(f"Rejected load node {peer}: {error}")
+                channel.close()
+                continue
+            nodes.append(_Node(channel, hello.get("name") or peer, processes))
+            logger.info(
+                f"Load node {nodes[-1].name} joined ({len(nodes)}/{self.nodes})"
+            )
+
+    def _measure(self, node: _Node) -> None:
+        for _ in range(PINGS):
+            sent = time.perf_counter()
+            sent_at = time.time()
+            node.channel.send({"type": "ping"})
+            pong = _expect(node.channel.receive(timeout=10.0), "pong", node.name)
+            round_trip = time.perf_counter() - sent
+            if round_trip < node.round_trip:
+                node.round_trip = round_trip
+                # Informational only: the start barrier does not use wall clocks
+                node.clock_offset = pong["time"] - (sent_at + round_trip / 2)
+
+    def _start(self, nodes: List[_Node]) -> None:
+        settings = self.engine.settings()
+        settings["workers"] = sum(node.processes for node in nodes)
+        start = time.perf_counter() + self.start_delay
+        first = 0
+        for node in nodes:
+            indexes = list(range(first, first + node.processes))
+            first += node.processes
+            node.channel.send(
+                {
+                    "type": "start",
+                    "settings": settings,
+                    "indexes": indexes,
+                    "start_in": start - time.perf_counter() - node.round_trip / 2,
+                }
+            )
+        logger.info(
+            f"Starting {self.engine.model} load of {self.engine.scenario} for "
+            f"{self.engine.profile.duration:.1f}s on {len(nodes)} node(s), "
+            f"{settings['workers']} worker(s)"
+        )
+
+    def _collect(self, nodes: List[_Node]) -> List[dict]:
+        deadline = (
+            time.monotonic()
+            + self.start_delay
+            + self.engine.profile.duration
+            + self.report_timeout
+        )
+        results = []
+        for node in nodes:
+            remaining = max(0.0, deadline - time.monotonic())
+            try:
+                message = node.channel.receive(timeout=remaining)
+            except socket.timeout:
+                raise RuntimeError(f"No report from load node {node.name} in time")
+            results.append(_expect(message, "report", node.name)["report"])
+        return results
+
+
+class LoadWorker:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        processes: int = 1,
+        name: Optional[str] = None,
+        connect_timeout: float = 30.0,
+    ) -> None:
+        """
+        Initialize a load node that runs its share of a coordinator's load.
+
+        :param host: Coordinator host.
+        :param port: Coordinator port.
+        :param processes: Worker processes run on this node.
+        :param name: Name shown in the coordinator's logs (default host:pid).
+        :param connect_timeout: Seconds to keep retrying the connection, so
+            nodes may be started before the coordinator.
+        """
+        if processes < 1:
+            raise ValueError("processes must be at least 1.")
+        self.host = host
+        self.port = port
+        self.processes = processes
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}"
+        self.connect_timeout = connect_timeout
+
+    def _connect(self) -> _Channel:
+        deadline = time.monotonic() + self.connect_timeout
+        while True:
+            try:
+                return _Channel(
+                    socket.create_connection((self.host, self.port), timeout=5.0)
+                )
+            except OSError as error:
+                if time.monotonic() >= deadline:
+                    raise RuntimeError(
+                        f"Could not reach load coordinator {self.host}:{self.port}: "
+                        f"{error}"
+                    )
+                time.sleep(0.2)
+
+    def run(self) -> None:
+        """
+        Connect, wait for the start command, run the load and send the report.
+
+        :raises RuntimeError: If the coordinator cannot be reached or sends
+            something unexpected.
+        """
+        channel = self._connect()
+        peer = f"{self.host}:{self.port}"
+        try:
+            channel.send(
+                {"type": "hello", "name": self.name, "processes": self.processes}
+            )
+            while True:
+                message = channel.receive()
+                if message.get("type") != "ping":
+                    break
+                channel.send({"type": "pong", "time": time.time()})
+            # Converted to this node's clock on receipt, see LoadCoordinator
+            start_at = time.time() + _expect(message, "start", peer)["start_in"]
+            settings = message["settings"]
+            logger.info(
+                f"Node {self.name} running workers {message['indexes']} of "
+                f"{settings['workers']}"
+            )
+            try:
+                results = run_workers(settings, message["indexes"], start_at)
+            except Exception as error:
+                channel.send(
+                    {"type": "error", "message": f"{type(error).__name__}: {error}"}
+                )
+                raise
+            report = LoadReport.merge_all(
+                (LoadReport.from_dict(result) for result in results),
+                scenario=results[0]["scenario"],
+                model=settings["model"],
+            )
+            channel.send({"type": "report", "report": report.to_dict()})
+        finally:
+            channel.close()
+
+
+# Example usage
+# On the coordinator:
+# engine = LoadEngine("src.load.scenarios:user_crud", base_url, LoadProfile.constant(500, 60), model="open")
+# report = LoadCoordinator(engine, nodes=3, host="0.0.0.0", port=7070).run()
+# On each node:
+# LoadWorker("coordinator.example.com", 7070, processes=os.cpu_count()).run()
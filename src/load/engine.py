@@ -0,0 +1,243 @@
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.load.profiles import LoadProfile
+from src.load.report import LoadReport
+from src.load.scenario import Scenario, ScenarioContext, load_scenario
+from src.utils.logger import get_logger
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+MODELS = ("closed", "open")
+
+
+class LoadEngine:
+    def __init__(
+        self,
+        scenario: str,
+        base_url: str,
+        profile: LoadProfile,
+        model: str = "closed",
+        think_time: Tuple[float, float] = (0.0, 0.0),
+        workers: int = 1,
+        max_concurrency: int = 1000,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize a load engine.
+
+        In the closed model the profile target is the number of virtual users,
+        each running tasks back to back separated by think time. In the open
+        model the target is the arrival rate per second, independent of how
+        fast the system responds; latency is measured from the scheduled
+        arrival so queueing delay is not hidden.
+
+        :param scenario: "module:factory" reference of the scenario to run.
+        :param base_url: Base URL of the system under test.
+        :param profile: Virtual users (closed) or arrivals/s (open) over time.
+        :param model: "closed" or "open".
+        :param think_time: (min, max) seconds a virtual user waits between tasks.
+        :param workers: Worker processes sharing the load (1 runs in-process).
+        :param max_concurrency: Open model in-flight limit per worker process.
+        :param seed: Seed for reproducible task selection.
+        """
+        if model not in MODELS:
+            raise ValueError(f"Unknown load model '{model}', expected one of {MODELS}.")
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        self.scenario = scenario
+        self.base_url = base_url
+        self.profile = profile
+        self.model = model
+        self.think_time = think_time
+        self.workers = workers
+        self.max_concurrency = max_concurrency
+        self.seed = seed
+
+    def settings(self) -> Dict[str, Any]:
+        """
+        Get the picklable settings handed to worker processes.
+
+        :return: Dictionary of engine settings.
+        """
+        return {
+            "scenario": self.scenario,
+            "base_url": self.base_url,
+            "stages": self.profile.stages,
+            "start": self.profile.start,
+            "model": self.model,
+            "think_time": tuple(self.think_time),
+            "workers": self.workers,
+            "max_concurrency": self.max_concurrency,
+            "seed": self.seed,
+        }
+
+    def run(self) -> LoadReport:
+        """
+        Run the load and merge the results of every worker.
+
+        :return: The merged LoadReport.
+        """
+        logger.info(
+            f"Starting {self.model} load of {self.scenario} for "
+            f"{self.profile.duration:.1f}s with {self.workers} worker(s)"
+        )
+        settings = self.settings()
+        if self.workers == 1:
+            results = run_workers(settings, [0], time.time())
+        else:
+            # Give every process time to import the scenario before the common start
+            results = run_workers(settings, range(self.workers), time.time() + 1.0)
+
+        report = LoadReport.merge_all(
+            (LoadReport.from_dict(result) for result in results),
+            scenario=results[0]["scenario"],
+            model=self.model,
+        )
+        logger.info(f"Load finished\n{report.format_text()}")
+        return report
+
+
+def run_workers(
+    settings: Dict[str, Any], indexes: Sequence[int], start_at: float
+) -> List[dict]:
+    """
+    Run several workers' shares of the load, one process each if there are
+    more than one.
+
+    :param settings: Engine settings from LoadEngine.settings.
+    :param indexes: Indexes of the workers among settings["workers"].
+    :param start_at: Wall-clock time (time.time) at which the load starts.
+    :return: The workers' LoadReports serialized with to_dict.
+    """
+    if len(indexes) == 1:
+        return [run_worker(settings, indexes[0], start_at)]
+    with ProcessPoolExecutor(max_workers=len(indexes)) as executor:
+        futures = [
+            executor.submit(run_worker, settings, index, start_at) for index in indexes
+        ]
+        return [future.result() for future in futures]
+
+
+def run_worker(settings: Dict[str, Any], worker_index: int, start_at: float) -> dict:
+    """
+    Run one worker's share of the load.
+
+    :param settings: Engine settings from LoadEngine.settings.
+    :param worker_index: Index of this worker among settings["workers"].
+    :param start_at: Wall-clock time (time.time) at which the load starts.
+    :return: The worker's LoadReport serialized with to_dict.
+    """
+    scenario = load_scenario(settings["scenario"], settings["base_url"])
+    profile = LoadProfile(settings["stages"], start=settings["start"])
+    delay = start_at - time.time()
+    if delay > 0:
+        time.sleep(delay)
+
+    if settings["model"] == "closed":
+        reports, duration = _run_closed(scenario, profile, settings, worker_index)
+    else:
+        reports, duration = _run_open(scenario, profile, settings, worker_index)
+
+    merged = LoadReport.merge_all(reports, scenario.name, settings["model"])
+    merged.duration = duration
+    return merged.to_dict()
+
+
+def _execute(
+    scenario: Scenario, context: ScenarioContext, report: LoadReport, started: float
+) -> None:
+    name, function = scenario.pick(context.rng)
+    try:
+        function(context)
+    except Exception as error:
+        report.stats_for(name).record_error(time.perf_counter() - started, error)
+    else:
+        report.stats_for(name).record_success(time.perf_counter() - started)
+
+
+def _run_closed(
+    scenario: Scenario,
+    profile: LoadProfile,
+    settings: Dict[str, Any],
+    worker_index: int,
+) -> Tuple[List[LoadReport], float]:
+    workers = settings["workers"]
+    think_min, think_max = settings["think_time"]
+    # Virtual users are numbered globally and dealt round-robin to the workers
+    user_ids = range(worker_index, int(profile.peak + 0.999), workers)
+    reports = [LoadReport(scenario.name, "closed") for _ in user_ids]
+    start = time.perf_counter()
+    end = start + profile.duration
+
+    def virtual_user(user_id: int, report: LoadReport) -> None:
+        context = scenario.create_context(user_id, settings["seed"])
+        while True:
+            now = time.perf_counter()
+            if now >= end:
+                return
+            if user_id >= profile.value_at(now - start):
+                time.sleep(min(0.05, end - now))
+                continue
+            _execute(scenario, context, report, now)
+            if think_max > 0:
+                time.sleep(context.rng.uniform(think_min, think_max))
+
+    threads = [
+        threading.Thread(target=virtual_user, args=(user_id, report), daemon=True)
+        for user_id, report in zip(user_ids, reports)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return reports, time.perf_counter() - start
+
+
+def _run_open(
+    scenario: Scenario,
+    profile: LoadProfile,
+    settings: Dict[str, Any],
+    worker_index: int,
+) -> Tuple[List[LoadReport], float]:
+    workers = settings["workers"]
+    max_concurrency = settings["max_concurrency"]
+    reports: List[LoadReport] = []
+    local = threading.local()
+    slots = threading.BoundedSemaphore(max_concurrency)
+    scheduler_report = LoadReport(scenario.name, "open")
+    reports.append(scheduler_report)
+
+    def arrival(sequence: int, scheduled: float) -> None:
+        try:
+            if not hasattr(local, "report"):
+                local.report = LoadReport(scenario.name, "open")
+                local.context = scenario.create_context(
+                    worker_index + sequence * workers, settings["seed"]
+                )
+                reports.append(local.report)
+            _execute(scenario, local.context, local.report, scheduled)
+        finally:
+            slots.release()
+
+    start = time.perf_counter()
+    sequence = 0
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        while True:
+            # This worker takes every workers-th arrival of the whole run
+            offset = profile.time_of_arrival(sequence * workers + worker_index)
+            if offset >= profile.duration:
+                break
+            next_arrival = start + offset
+            now = time.perf_counter()
+            if next_arrival > now:
+                time.sleep(next_arrival - now)
+            if slots.acquire(blocking=False):
+                executor.submit(arrival, sequence, next_arrival)
+            else:
+                scheduler_report.dropped += 1
+            sequence += 1
+    return reports, time.perf_counter() - start
@@ -0,0 +1,108 @@
+import math
+from typing import List, Sequence, Tuple
+
+
+class LoadProfile:
+    """
+    Piecewise-linear load profile.
+
+    The profile is a list of stages, each ramping linearly from the previous
+    target to a new target over a duration. The target is a number of virtual
+    users in the closed model and an arrival rate (per second) in the open model.
+    """
+
+    def __init__(
+        self, stages: Sequence[Tuple[float, float]], start: float = 0.0
+    ) -> None:
+        """
+        Initialize a load profile.
+
+        :param stages: Sequence of (duration_seconds, target) pairs.
+        :param start: Target at time zero.
+        :raises ValueError: If no stage is given or a duration is negative.
+        """
+        if not stages:
+            raise ValueError("A load profile needs at least one stage.")
+        if any(duration < 0 for duration, _ in stages):
+            raise ValueError("Stage durations must not be negative.")
+        self.start = start
+        self.stages: List[Tuple[float, float]] = [
+            (float(duration), float(target)) for duration, target in stages
+        ]
+
+    @classmethod
+    def constant(cls, target: float, duration: float) -> "LoadProfile":
+        """
+        Build a profile that holds a target for the whole run.
+
+        :param target: Virtual users or arrivals per second.
+        :param duration: Run duration in seconds.
+        :return: A LoadProfile instance.
+        """
+        return cls([(duration, target)], start=target)
+
+    @classmethod
+    def ramp(
+        cls, target: float, ramp_up: float, hold: float, ramp_down: float = 0.0
+    ) -> "LoadProfile":
+        """
+        Build a ramp-up, steady state and optional ramp-down profile.
+
+        :param target: Peak virtual users or arrivals per second.
+        :param ramp_up: Seconds to reach the target from zero.
+        :param hold: Seconds to hold the target.
+        :param ramp_down: Seconds to return to zero.
+        :return: A LoadProfile instance.
+        """
+        stages = [(ramp_up, target), (hold, target)]
+        if ramp_down:
+            stages.append((ramp_down, 0.0))
+        return cls(stages)
+
+    @property
+    def duration(self) -> float:
+        return sum(duration for duration, _ in self.stages)
+
+    @property
+    def peak(self) -> float:
+        return max([self.start] + [target for _, target in self.stages])
+
+    def value_at(self, elapsed: float) -> float:
+        """
+        Get the target at a point in time.
+
+        :param elapsed: Seconds since the start of the run.
+        :return: The interpolated target (0 once the profile is over).
+        """
+        previous = self.start
+        for duration, target in self.stages:
+            if elapsed < duration:
+                return previous + (target - previous) * (elapsed / duration)
+            elapsed -= duration
+            previous = target
+        return 0.0
+
+    def time_of_arrival(self, arrivals: float) -> float:
+        """
+        Get the time at which an open-model run has seen a number of arrivals,
+        integrating the arrival rate over the stages (so ramps starting from
+        zero are scheduled as densely as their area, not their first rate).
+
+        :param arrivals: Number of arrivals since the start of the run.
+        :return: Seconds since the start (inf if the profile ends first).
+        """
+        elapsed = 0.0
+        previous = self.start
+        for duration, target in self.stages:
+            area = (previous + target) / 2 * duration
+            if area > 0 and arrivals <= area:
+                slope = (target - previous) / duration
+                if slope == 0:
+                    return elapsed + arrivals / previous
+                # Solve previous * t + slope * t^2 / 2 = arrivals
+                root = math.sqrt(max(previous**2 + 2 * slope * arrivals, 0.0))
+                return elapsed + (root - previous) / slope
+            arrivals -= area
+            elapsed += duration
+            previous = target
+        return math.inf
@@ -0,0 +1,177 @@
+from typing import Any, Dict, Iterable, Optional
+
+from src.utils.metrics.histogram import LatencyHistogram
+
+
+class TaskStats:
+    """
+    Latency histogram and outcome counters for one task.
+    """
+
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.successes: int = 0
+        self.errors: Dict[str, int] = {}
+
+    @property
+    def requests(self) -> int:
+        return self.successes + sum(self.errors.values())
+
+    def record_success(self, seconds: float) -> None:
+        self.successes += 1
+        self.latency.record(seconds)
+
+    def record_error(self, seconds: float, error: BaseException) -> None:
+        name = type(error).__name__
+        self.errors[name] = self.errors.get(name, 0) + 1
+        self.latency.record(seconds)
+
+    def merge(self, other: "TaskStats") -> None:
+        self.latency.merge(other.latency)
+        self.successes += other.successes
+        for name, count in other.errors.items():
+            self.errors[name] = self.errors.get(name, 0) + count
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "latency": self.latency.to_dict(),
+            "successes": self.successes,
+            "errors": dict(self.errors),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TaskStats":
+        stats = cls()
+        stats.latency = LatencyHistogram.from_dict(data["latency"])
+        stats.successes = data["successes"]
+        stats.errors = dict(data["errors"])
+        return stats
+
+
+class LoadReport:
+    """
+    Aggregated results of a load run, mergeable across threads and processes.
+    """
+
+    def __init__(self, scenario: str, model: str, duration: float = 0.0) -> None:
+        self.scenario = scenario
+        self.model = model
+        self.duration = duration
+        self.tasks: Dict[str, TaskStats] = {}
+        # Open-model arrivals skipped because max_concurrency was reached
+        self.dropped: int = 0
+
+    def stats_for(self, task_name: str) -> TaskStats:
+        stats = self.tasks.get(task_name)
+        if stats is None:
+            stats = self.tasks[task_name] = TaskStats()
+        return stats
+
+    def merge(self, other: "LoadReport") -> "LoadReport":
+        """
+        Merge another report into this one.
+
+        :param other: The report to merge in.
+        :return: This report, for chaining.
+        """
+        for name, stats in other.tasks.items():
+            self.stats_for(name).merge(stats)
+        self.dropped += other.dropped
+        self.duration = max(self.duration, other.duration)
+        return self
+
+    @classmethod
+    def merge_all(
+        cls, reports: Iterable["LoadReport"], scenario: str, model: str
+    ) -> "LoadReport":
+        merged = cls(scenario, model)
+        for report in reports:
+            merged.merge(report)
+        return merged
+
+    def total(self) -> TaskStats:
+        """
+        Get the statistics of all tasks combined.
+
+        :return: A TaskStats instance covering every task.
+        """
+        total = TaskStats()
+        for stats in self.tasks.values():
+            total.merge(stats)
+        return total
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Get a human-oriented summary: throughput, error rates and percentiles.
+
+        :return: JSON-compatible dictionary.
+        """
+
+        def describe(stats: TaskStats) -> Dict[str, Any]:
+            errors = sum(stats.errors.values())
+            return {
+                "requests": stats.requests,
+                "throughput_rps": round(stats.requests / self.duration, 2)
+                if self.duration
+                else 0.0,
+                "error_rate": round(errors / stats.requests, 4)
+                if stats.requests
+                else 0.0,
+                "errors": dict(stats.errors),
+                "latency": stats.latency.summary(),
+            }
+
+        return {
+            "scenario": self.scenario,
+            "model": self.model,
+            "duration_s": round(self.duration, 3),
+            "dropped": self.dropped,
+            "total": describe(self.total()),
+            "tasks": {name: describe(stats) for name, stats in self.tasks.items()},
+        }
+
+    def format_text(self, percents: Optional[Iterable[float]] = None) -> str:
+        """
+        Render the report as a fixed-width table.
+
+        :param percents: Percentiles to show (defaults to 50, 90, 99, 99.9).
+        :return: The formatted table.
+        """
+        percents = list(percents or (50, 90, 99, 99.9))
+        header = f"{'task':<24}{'reqs':>9}{'rps':>10}{'err%':>8}" + "".join(
+            f"{f'p{p:g}(ms)':>12}" for p in percents
+        )
+        lines = [
+            f"Scenario {self.scenario} ({self.model} model, {self.duration:.1f}s, "
+            f"dropped={self.dropped})",
+            header,
+        ]
+        rows = list(self.tasks.items()) + [("TOTAL", self.total())]
+        for name, stats in rows:
+            errors = sum(stats.errors.values())
+            rps = stats.requests / self.duration if self.duration else 0.0
+            error_pct = 100 * errors / stats.requests if stats.requests else 0.0
+            values = stats.latency.percentiles(percents)
+            lines.append(
+                f"{name:<24}{stats.requests:>9}{rps:>10.1f}{error_pct:>8.2f}"
+                + "".join(f"{values[p] / 1000:>12.2f}" for p in percents)
+            )
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "scenario": self.scenario,
+            "model": self.model,
+            "duration": self.duration,
+            "dropped": self.dropped,
+            "tasks": {name: stats.to_dict() for name, stats in self.tasks.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LoadReport":
+        report = cls(data["scenario"], data["model"], data["duration"])
+        report.dropped = data["dropped"]
+        report.tasks = {
+            name: TaskStats.from_dict(stats) for name, stats in data["tasks"].items()
+        }
+        return report
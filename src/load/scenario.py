@@ -0,0 +1,138 @@
+import importlib
+import random
+from typing import Any, Callable, List, Optional, Tuple
+
+from src.core.api_client import APIClient
+from src.services.product_service import ProductService
+from src.services.user_service import UserService
+
+TaskFunction = Callable[["ScenarioContext"], Any]
+
+
+class ScenarioContext:
+    """
+    Per virtual user state handed to every task.
+
+    Services are created lazily and share one APIClient, so a task only pays for
+    the services it uses.
+    """
+
+    def __init__(self, base_url: str, user_id: int, rng: random.Random) -> None:
+        self.base_url = base_url
+        self.user_id = user_id
+        self.rng = rng
+        self.data: dict = {}
+        self._api_client: Optional[APIClient] = None
+        self._user_service: Optional[UserService] = None
+        self._product_service: Optional[ProductService] = None
+
+    @property
+    def api_client(self) -> APIClient:
+        if self._api_client is None:
+            self._api_client = APIClient(self.base_url)
+        return self._api_client
+
+    @property
+    def user_service(self) -> UserService:
+        if self._user_service is None:
+            self._user_service = UserService(self.api_client)
+        return self._user_service
+
+    @property
+    def product_service(self) -> ProductService:
+        if self._product_service is None:
+            self._product_service = ProductService(self.api_client)
+        return self._product_service
+
+
+class Scenario:
+    """
+    A named, weighted mix of tasks executed by virtual users.
+    """
+
+    def __init__(self, name: str, base_url: str) -> None:
+        """
+        Initialize a scenario.
+
+        :param name: Name shown in reports.
+        :param base_url: Base URL of the system under test.
+        """
+        self.name = name
+        self.base_url = base_url
+        self.tasks: List[Tuple[str, TaskFunction, int]] = []
+        self._cumulative_weights: List[int] = []
+
+    def add_task(self, name: str, function: TaskFunction, weight: int = 1) -> None:
+        """
+        Register a task.
+
+        :param name: Task name used to group statistics in the report.
+        :param function: Callable receiving the ScenarioContext.
+        :param weight: Relative frequency of the task.
+        """
+        if weight <= 0:
+            raise ValueError("Task weight must be greater than zero.")
+        self.tasks.append((name, function, weight))
+        total = self._cumulative_weights[-1] if self._cumulative_weights else 0
+        self._cumulative_weights.append(total + weight)
+
+    def task(self, weight: int = 1, name: Optional[str] = None):
+        """
+        Decorator form of add_task.
+
+        :param weight: Relative frequency of the task.
+        :param name: Task name (defaults to the function name).
+        """
+
+        def decorator(function: TaskFunction) -> TaskFunction:
+            self.add_task(name or function.__name__, function, weight)
+            return function
+
+        return decorator
+
+    def create_context(
+        self, user_id: int, seed: Optional[int] = None
+    ) -> ScenarioContext:
+        """
+        Create the state for one virtual user.
+
+        :param user_id: Global virtual user number.
+        :param seed: Optional seed for reproducible task selection.
+        :return: A ScenarioContext instance.
+        """
+        rng = random.Random(None if seed is None else seed + user_id)
+        return ScenarioContext(self.base_url, user_id, rng)
+
+    def pick(self, rng: random.Random) -> Tuple[str, TaskFunction]:
+        """
+        Pick a task according to the weights.
+
+        :param rng: Random generator of the calling virtual user.
+        :return: Tuple of task name and task function.
+        """
+        if not self.tasks:
+            raise ValueError(f"Scenario '{self.name}' has no tasks.")
+        point = rng.random() * self._cumulative_weights[-1]
+        for (name, function, _), bound in zip(self.tasks, self._cumulative_weights):
+            if point < bound:
+                return name, function
+        name, function, _ = self.tasks[-1]
+        return name, function
+
+
+def load_scenario(path: str, base_url: str) -> Scenario:
+    """
+    Build a scenario from an importable factory.
+
+    Worker processes rebuild the scenario from this path, so factories must
+    live at module level.
+
+    :param path: "package.module:factory" reference; the factory takes the base URL.
+    :param base_url: Base URL of the system under test.
+    :return: The Scenario returned by the factory.
+    """
+    module_name, _, attribute = path.partition(":")
+    if not attribute:
+        raise ValueError(f"Scenario path '{path}' must look like 'module:factory'.")
+    factory = getattr(importlib.import_module(module_name), attribute)
+    return factory(base_url)
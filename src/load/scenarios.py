@@ -0,0 +1,70 @@
+from src.load.scenario import Scenario, ScenarioContext
+
+
+def user_crud(base_url: str) -> Scenario:
+    """
+    Create, read, update and delete users through UserService.
+
+    :param base_url: Base URL of the system under test.
+    :return: The user CRUD scenario.
+    """
+    scenario = Scenario("user_crud", base_url)
+
+    @scenario.task(weight=6)
+    def get_user(context: ScenarioContext) -> None:
+        context.user_service.get_user(context.rng.randint(1, 100))
+
+    @scenario.task(weight=2)
+    def create_user(context: ScenarioContext) -> None:
+        context.user_service.create_user(
+            {
+                "name": f"Load User {context.user_id}",
+                "email": f"load.user{context.user_id}@example.com",
+                "age": context.rng.randint(18, 90),
+            }
+        )
+
+    @scenario.task(weight=1)
+    def update_user(context: ScenarioContext) -> None:
+        context.user_service.update_user(
+            context.rng.randint(1, 100), {"age": context.rng.randint(18, 90)}
+        )
+
+    @scenario.task(weight=1)
+    def delete_user(context: ScenarioContext) -> None:
+        context.user_service.delete_user(context.rng.randint(1, 100))
+
+    return scenario
+
+
+def catalog_browse(base_url: str) -> Scenario:
+    """
+    Mostly read products through ProductService with occasional writes.
+
+    :param base_url: Base URL of the system under test.
+    :return: The catalog browsing scenario.
+    """
+    scenario = Scenario("catalog_browse", base_url)
+
+    @scenario.task(weight=8)
+    def get_product(context: ScenarioContext) -> None:
+        context.product_service.get_product(context.rng.randint(1, 100))
+
+    @scenario.task(weight=1)
+    def create_product(context: ScenarioContext) -> None:
+        context.product_service.create_product(
+            {
+                "name": f"Load Product {context.user_id}",
+                "description": "Created by the load engine",
+                "price": round(context.rng.uniform(1, 500), 2),
+                "stock": context.rng.randint(0, 1000),
+            }
+        )
+
+    @scenario.task(weight=1)
+    def update_product(context: ScenarioContext) -> None:
+        context.product_service.update_product(
+            context.rng.randint(1, 100), {"stock": context.rng.randint(0, 1000)}
+        )
+
+    return scenario
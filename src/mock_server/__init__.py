@@ -0,0 +1,11 @@
+from .server import FaultConfig, MockAPIServer
+from .store import RESOURCES, RecordValidationError, ResourceStore, build_stores
+
+__all__ = [
+    "FaultConfig",
+    "MockAPIServer",
+    "RESOURCES",
+    "RecordValidationError",
+    "ResourceStore",
+    "build_stores",
+]
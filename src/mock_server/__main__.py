@@ -0,0 +1,53 @@
+import argparse
+import asyncio
+
+from src.mock_server.server import FaultConfig, MockAPIServer
+from src.mock_server.store import DATA_FILE
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.mock_server",
+        description="Serve /users and /products CRUD from in-memory data.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument(
+        "--records", type=int, default=100, help="Generated records per resource"
+    )
+    parser.add_argument(
+        "--data-file", default=DATA_FILE, help="JSON seed records per resource"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Fraction of failed requests"
+    )
+    parser.add_argument("--error-status", type=int, default=503)
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    server = MockAPIServer(
+        host=args.host,
+        port=args.port,
+        faults=FaultConfig(
+            latency=args.latency_ms / 1000,
+            jitter=args.jitter_ms / 1000,
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+        ),
+        records=args.records,
+        data_file=args.data_file,
+        seed=args.seed,
+    )
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+import asyncio
+import json
+import math
+import random
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from src.mock_server.store import (
+    DATA_FILE,
+    RecordValidationError,
+    ResourceStore,
+    build_stores,
+)
+from src.utils.logger import get_logger
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+REASONS = {
+    200: "OK",
+    201: "Created",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable",
+    504: "Gateway Timeout",
+}
+
+# Per-request fault overrides, e.g. for a single functional test
+LATENCY_HEADER = "x-mock-latency-ms"
+STATUS_HEADER = "x-mock-status"
+
+
+@dataclass
+class FaultConfig:
+    """
+    Faults injected into every request.
+
+    :param latency: Seconds added before each response.
+    :param jitter: Extra random seconds, uniform in [0, jitter].
+    :param error_rate: Fraction of requests answered with error_status.
+    :param error_status: Status code of injected errors.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+
+
+class MockAPIServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        faults: Optional[FaultConfig] = None,
+        records: int = 100,
+        data_file: Optional[str] = DATA_FILE,
+        seed: Optional[int] = 0,
+    ) -> None:
+        """
+        Initialize an asyncio HTTP/1.1 server answering /users and /products
+        CRUD requests from in-memory stores validated against schemas/.
+
+        :param host: Address to bind.
+        :param port: Port to bind (0 picks a free port).
+        :param faults: Latency and error injection settings.
+        :param records: Records generated per resource without seed data.
+        :param data_file: JSON file with seed records per resource.
+        :param seed: Random seed for generated records and injected faults.
+        """
+        self.host = host
+        self.port = port
+        self.faults = faults or FaultConfig()
+        self.stores: Dict[str, ResourceStore] = build_stores(records, data_file, seed)
+        self.stats: Dict[str, int] = {"requests": 0, "injected_errors": 0}
+        self._records = records
+        self._data_file = data_file
+        self._seed = seed
+        self._rng = random.Random(seed)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._connections: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def reset(self) -> None:
+        """
+        Restore the seed records and clear the request statistics.
+        """
+        self.stores = build_stores(self._records, self._data_file, self._seed)
+        self.stats = {"requests": 0, "injected_errors": 0}
+
+    async def serve_forever(self) -> None:
+        """
+        Serve on the current event loop until cancelled.
+        """
+        await self._listen()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _listen(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, backlog=1024
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Mock API server listening on {self.url}")
+
+    def start(self) -> "MockAPIServer":
+        """
+        Serve from a background thread with its own event loop.
+
+        :return: The started server.
+        """
+        self._loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        failure: list = []
+
+        def run() -> None:
+            asyncio.set_event_loop(self._loop)
+            try:
+                self._loop.run_until_complete(self._listen())
+            except Exception as e:
+                failure.append(e)
+                ready.set()
+                return
+            ready.set()
+            self._loop.run_forever()
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="mock-api", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if failure:
+            raise RuntimeError(f"Mock API server failed to start: {failure[0]}")
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop a server started with start().
+
+        :param timeout: Seconds to wait for the serving thread.
+        """
+        if self._loop is None or self._thread is None:
+            return
+
+        async def shutdown() -> None:
+            self._server.close()
+            # Idle keep-alive connections would otherwise never finish; closing
+            # them ends their handlers at the next read
+            for writer in list(self._connections.values()):
+                writer.close()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+
+        future = asyncio.run_coroutine_threadsafe(shutdown(), self._loop)
+        try:
+            future.result(timeout)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        self._loop = self._thread = None
+
+    def __enter__(self) -> "MockAPIServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+                request_line, *header_lines = head[:-4].decode("latin-1").split("\r\n")
+                method, target, version = request_line.split(" ", 2)
+                headers = {}
+                for line in header_lines:
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length") or 0)
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload = await self._respond(method, target, headers, body)
+                keep_alive = (
+                    version == "HTTP/1.1"
+                    and headers.get("connection", "").lower() != "close"
+                )
+                writer.write(_encode_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            self._connections.pop(task, None)
+            writer.close()
+
+    async def _respond(
+        self, method: str, target: str, headers: Dict[str, str], body: bytes
+    ) -> Tuple[int, Any]:
+        self.stats["requests"] += 1
+        faults = self.faults
+        delay = faults.latency
+        if faults.jitter:
+            delay += self._rng.uniform(0, faults.jitter)
+        forced_status = headers.get(STATUS_HEADER)
+        try:
+            if LATENCY_HEADER in headers:
+                delay = _control_value(headers, LATENCY_HEADER, float, 0) / 1000
+            if forced_status:
+                forced_status = _control_value(headers, STATUS_HEADER, int, 100, 599)
+        except ValueError as e:
+            return 400, {"error": str(e)}
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if forced_status:
+            self.stats["injected_errors"] += 1
+            return forced_status, {"error": "injected by X-Mock-Status"}
+        if faults.error_rate and self._rng.random() < faults.error_rate:
+            self.stats["injected_errors"] += 1
+            return faults.error_status, {"error": "injected fault"}
+        try:
+            return self._dispatch(method, urlsplit(target).path, body)
+        except Exception as e:
+            # Answer instead of dropping the connection, like a real backend
+            logger.exception(f"Mock server failed on {method} {target}")
+            return 500, {"error": f"{type(e).__name__}: {e}"}
+
+    def _dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, Any]:
+        resource, _, record_id = path.strip("/").partition("/")
+        store = self.stores.get(resource)
+        if store is None or "/" in record_id:
+            return 404, {"error": f"Unknown route {path}"}
+
+        try:
+            data = json.loads(body) if body else {}
+        except ValueError:
+            return 400, {"error": "Request body is not valid JSON"}
+
+        if not record_id:
+            if method == "GET":
+                return 200, store.list()
+            if method == "POST":
+                return self._write(lambda: store.create(data), 201)
+            return 405, {"error": f"{method} not allowed on {path}"}
+
+        try:
+            key = int(record_id)
+        except ValueError:
+            return 404, {"error": f"Unknown route {path}"}
+        if method == "GET":
+            record = store.get(key)
+        elif method in ("PUT", "PATCH"):
+            return self._write(lambda: store.update(key, data), 200)
+        elif method == "DELETE":
+            record = {} if store.delete(key) else None
+        else:
+            return 405, {"error": f"{method} not allowed on {path}"}
+        if record is None:
+            return 404, {"error": f"{resource} {key} not found"}
+        return 200, record
+
+    @staticmethod
+    def _write(operation: Any, status: int) -> Tuple[int, Any]:
+        try:
+            record = operation()
+        except RecordValidationError as e:
+            return 400, {"error": "Schema validation failed", "details": e.errors}
+        if record is None:
+            return 404, {"error": "Not found"}
+        return status, record
+
+
+def _control_value(
+    headers: Dict[str, str],
+    name: str,
+    kind: type,
+    minimum: float,
+    maximum: float = float("inf"),
+) -> Any:
+    """
+    Parse a numeric fault control header.
+
+    :param headers: Request headers with lower-case names.
+    :param name: Header name.
+    :param kind: int or float.
+    :param minimum: Smallest accepted value.
+    :param maximum: Largest accepted value.
+    :return: The parsed value.
+    :raises ValueError: If the value is not a finite number within the bounds.
+    """
+    raw = headers[name]
+    try:
+        value = kind(raw)
+    except ValueError:
+        value = None
+    if value is None or not math.isfinite(value) or not minimum <= value <= maximum:
+        raise ValueError(f"Invalid {name} header: {raw!r}")
+    return value
+
+
+def _encode_response(status: int, payload: Any, keep_alive: bool) -> bytes:
+    body = json.dumps(payload).encode()
+    return (
+        f"HTTP/1.1 {status} {REASONS.get(status, 'Unknown')}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    ).encode("latin-1") + body
+
+
+# Example usage
+# with MockAPIServer(faults=FaultConfig(latency=0.02, error_rate=0.01)) as server:
+#     user_service = UserService(APIClient(server.url))
+#     user_service.get_user(1)
@@ -0,0 +1,174 @@
+import copy
+import json
+import os
+import random
+import threading
+from typing import Any, Dict, List, Optional
+
+from jsonschema import Draft7Validator
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+SCHEMA_DIR = os.path.join(BASE_DIR, "schemas")
+DATA_FILE = os.path.join(BASE_DIR, "data", "test_data.json")
+
+# Served resource -> schema file describing its records
+RESOURCES: Dict[str, str] = {
+    "users": "user_schema.json",
+    "products": "product_schema.json",
+}
+
+
+class RecordValidationError(ValueError):
+    def __init__(self, errors: List[str]) -> None:
+        self.errors = errors
+        super().__init__("; ".join(errors))
+
+
+def generate_record(
+    schema: Dict[str, Any], record_id: int, rng: random.Random
+) -> Dict[str, Any]:
+    """
+    Build a record that satisfies a flat object schema.
+
+    :param schema: JSON schema of the record.
+    :param record_id: Value of the "id" property.
+    :param rng: Random generator, seeded for reproducible data.
+    :return: The generated record.
+    """
+    record: Dict[str, Any] = {}
+    for name, spec in schema.get("properties", {}).items():
+        kind = spec.get("type")
+        minimum = spec.get("minimum", 0)
+        if name == "id":
+            record[name] = record_id
+        elif kind == "integer":
+            record[name] = rng.randint(minimum, minimum + 100)
+        elif kind == "number":
+            record[name] = round(rng.uniform(minimum, minimum + 500), 2)
+        elif kind == "boolean":
+            record[name] = rng.random() < 0.5
+        elif spec.get("format") == "email":
+            record[name] = f"user{record_id}@example.com"
+        else:
+            record[name] = f"{name.capitalize()} {record_id}"
+    return record
+
+
+class ResourceStore:
+    def __init__(self, name: str, schema: Dict[str, Any]) -> None:
+        """
+        Initialize an in-memory collection of schema-validated records.
+
+        :param name: Resource name, e.g. "users".
+        :param schema: JSON schema every stored record must satisfy.
+        """
+        self.name = name
+        self.schema = schema
+        self.validator = Draft7Validator(schema)
+        self._records: Dict[int, Dict[str, Any]] = {}
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def _check(self, record: Dict[str, Any]) -> None:
+        errors = [error.message for error in self.validator.iter_errors(record)]
+        if errors:
+            raise RecordValidationError(errors)
+
+    def seed(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Replace the collection with the given records.
+
+        :param records: Records with integer "id" values.
+        """
+        with self._lock:
+            self._records = {record["id"]: dict(record) for record in records}
+            self._next_id = max(self._records, default=0) + 1
+
+    def list(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._records.values())
+
+    def get(self, record_id: int) -> Optional[Dict[str, Any]]:
+        return self._records.get(record_id)
+
+    def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store a new record under the next free id.
+
+        :param data: Record fields; an "id" in the payload is ignored.
+        :return: The stored record.
+        :raises RecordValidationError: If the record does not match the schema.
+        """
+        with self._lock:
+            record = {**data, "id": self._next_id}
+            self._check(record)
+            self._records[record["id"]] = record
+            self._next_id += 1
+            return record
+
+    def update(self, record_id: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Merge fields into an existing record, like json-server's PATCH.
+
+        :param record_id: Id of the record to update.
+        :param data: Fields to change.
+        :return: The updated record, or None if it does not exist.
+        :raises RecordValidationError: If the result does not match the schema.
+        """
+        with self._lock:
+            current = self._records.get(record_id)
+            if current is None:
+                return None
+            record = {**current, **data, "id": record_id}
+            self._check(record)
+            self._records[record_id] = record
+            return record
+
+    def delete(self, record_id: int) -> bool:
+        with self._lock:
+            return self._records.pop(record_id, None) is not None
+
+
+def load_seed_data(data_file: str = DATA_FILE) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Read seed records from a JSON file mapping resource names to record lists.
+
+    :param data_file: Path to the data file; a missing or empty file gives {}.
+    :return: Records per resource.
+    """
+    if not os.path.exists(data_file) or os.path.getsize(data_file) == 0:
+        return {}
+    with open(data_file, "r") as file:
+        data = json.load(file)
+    return {name: data[name] for name in RESOURCES if isinstance(data.get(name), list)}
+
+
+def build_stores(
+    records: int = 100,
+    data_file: Optional[str] = DATA_FILE,
+    seed: Optional[int] = 0,
+) -> Dict[str, ResourceStore]:
+    """
+    Create the served resources, seeded from the data file when it has
+    records for a resource and generated from its schema otherwise.
+
+    :param records: Records generated per resource without seed data.
+    :param data_file: JSON file with seed records, or None to always generate.
+    :param seed: Random seed for the generated records.
+    :return: Store per resource name.
+    """
+    seed_data = load_seed_data(data_file) if data_file else {}
+    rng = random.Random(seed)
+    stores = {}
+    for name, schema_file in RESOURCES.items():
+        with open(os.path.join(SCHEMA_DIR, schema_file), "r") as file:
+            schema = json.load(file)
+        store = ResourceStore(name, schema)
+        if name in seed_data:
+            store.seed(copy.deepcopy(seed_data[name]))
+        else:
+            store.seed(
+                [generate_record(schema, index, rng) for index in range(1, records + 1)]
+            )
+        stores[name] = store
+    return stores
@@ -0,0 +1,4 @@
+from .base import ApiResponse, ModelCollection, Record
+from .resources import Product, User
+
+__all__ = ["ApiResponse", "ModelCollection", "Product", "Record", "User"]
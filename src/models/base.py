@@ -0,0 +1,330 @@
+import dataclasses
+from array import array
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from requests import Response
+
+from src.utils.logger import get_logger
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+M = TypeVar("M", bound="Record")
+
+_UNSET: Any = object()
+
+
+# Field type -> array typecode used to store the field in collections
+_TYPECODES = {int: "q", float: "d"}
+
+
+@lru_cache(maxsize=None)
+def _layout(model: type) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Get the declared field names of a record type, and those without defaults.
+    """
+    fields = [field for field in dataclasses.fields(model) if field.name != "extra"]
+    required = tuple(
+        field.name
+        for field in fields
+        if field.default is dataclasses.MISSING
+        and field.default_factory is dataclasses.MISSING
+    )
+    return tuple(field.name for field in fields), required
+
+
+@lru_cache(maxsize=None)
+def _typecodes(model: type) -> Dict[str, str]:
+    return {
+        field.name: _TYPECODES[field.type]
+        for field in dataclasses.fields(model)
+        if field.type in _TYPECODES
+    }
+
+
+def _pack(values: List[Any], typecode: Optional[str]) -> Any:
+    """
+    Store numbers in a typed array (8 bytes each instead of a Python object
+    and a pointer); anything else, or numbers mixed with None, stays a list.
+    """
+    if typecode is None:
+        return values
+    try:
+        return array(typecode, values)
+    except (TypeError, OverflowError):
+        return values
+
+
+class Record:
+    """
+    Base of the slotted dataclass models. Fields the model does not declare,
+    such as nested objects, are kept as decoded in extra and only turned
+    into objects by the caller that needs them.
+    """
+
+    __slots__ = ()
+
+    extra: Dict[str, Any]
+
+    @classmethod
+    def field_names(cls) -> Tuple[str, ...]:
+        return _layout(cls)[0]
+
+    @classmethod
+    def from_dict(cls: Type[M], data: Dict[str, Any]) -> M:
+        """
+        Build a record from decoded JSON.
+
+        :param data: Decoded JSON object.
+        :return: The record.
+        :raises ValueError: If required fields are missing.
+        """
+        if not isinstance(data, dict):
+            raise ValueError(f"{cls.__name__} needs a JSON object, got {data!r}")
+        names, required = _layout(cls)
+        missing = [name for name in required if name not in data]
+        if missing:
+            raise ValueError(f"{cls.__name__} is missing fields {missing}")
+        values = {name: data[name] for name in names if name in data}
+        extra = {key: value for key, value in data.items() if key not in values}
+        return cls(**values, extra=extra)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {name: getattr(self, name) for name in self.field_names()}
+        data.update(self.extra)
+        return data
+
+
+class ModelCollection(Generic[M]):
+    """
+    Column-oriented list of records: one list or typed array per field
+    instead of a dict per item, so large collections take a fraction of the memory and
+    per-field scans do not touch every item. Records are built on access.
+    """
+
+    __slots__ = ("model", "columns", "extras", "_length")
+
+    def __init__(
+        self,
+        model: Type[M],
+        columns: Dict[str, Sequence[Any]],
+        extras: Optional[List[Optional[Dict[str, Any]]]] = None,
+    ) -> None:
+        self.model = model
+        self.columns: Dict[str, Any] = columns
+        self.extras = extras
+        self._length = len(next(iter(columns.values()), ()))
+
+    @classmethod
+    def from_records(
+        cls, model: Type[M], records: List[Dict[str, Any]]
+    ) -> "ModelCollection[M]":
+        """
+        Build a collection from decoded JSON objects.
+
+        :param model: Record type of the items.
+        :param records: Decoded JSON objects.
+        :return: The collection.
+        :raises ValueError: If an item misses a required field.
+        """
+        names, required = _layout(model)
+        for name in required:
+            if any(name not in record for record in records):
+                raise ValueError(f"{model.__name__} items are missing field '{name}'")
+        typecodes = _typecodes(model)
+        columns = {
+            name: _pack([record.get(name) for record in records], typecodes.get(name))
+            for name in names
+        }
+        declared = len(names)
+        extras = None
+        if any(len(record) > declared for record in records):
+            extras = [
+                {key: value for key, value in record.items() if key not in columns}
+                or None
+                for record in records
+            ]
+        return cls(model, columns, extras)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _build(self, index: int) -> M:
+        values = {name: column[index] for name, column in self.columns.items()}
+        extra = self.extras[index] if self.extras else None
+        return self.model(**values, extra=dict(extra) if extra else {})
+
+    @overload
+    def __getitem__(self, index: int) -> M: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ModelCollection[M]": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return self._select(range(self._length)[index])
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(f"{self.model.__name__} index {index} out of range")
+        return self._build(index)
+
+    def __iter__(self) -> Iterator[M]:
+        for index in range(self._length):
+            yield self._build(index)
+
+    def __repr__(self) -> str:
+        return f"ModelCollection({self.model.__name__}, {self._length} items)"
+
+    def column(self, name: str) -> Sequence[Any]:
+        """
+        Get every value of one field.
+
+        :param name: Field name.
+        :return: The values in item order, as a list or, for numeric fields,
+            an array; do not modify.
+        :raises KeyError: If the model has no such field.
+        """
+        return self.columns[name]
+
+    def _select(self, indexes: Any) -> "ModelCollection[M]":
+        columns = {}
+        for name, column in self.columns.items():
+            values = [column[index] for index in indexes]
+            columns[name] = (
+                array(column.typecode, values) if isinstance(column, array) else values
+            )
+        extras = [self.extras[index] for index in indexes] if self.extras else None
+        return ModelCollection(self.model, columns, extras)
+
+    def where(self, **equals: Any) -> "ModelCollection[M]":
+        """
+        Select the items whose fields equal the given values.
+
+        :param equals: Field name to the expected value.
+        :return: The matching items.
+        """
+        indexes: Any = range(self._length)
+        for name, expected in equals.items():
+            column = self.columns[name]
+            indexes = [index for index in indexes if column[index] == expected]
+        return self._select(indexes)
+
+    def filter(
+        self, name: str, predicate: Callable[[Any], bool]
+    ) -> "ModelCollection[M]":
+        """
+        Select the items for which a test on one field passes.
+
+        :param name: Field name.
+        :param predicate: Test on the field value, e.g. lambda price: price > 10.
+        :return: The matching items.
+        """
+        column = self.columns[name]
+        return self._select(
+            [index for index, value in enumerate(column) if predicate(value)]
+        )
+
+    def find(self, **equals: Any) -> Optional[M]:
+        """
+        Get the first item whose fields equal the given values.
+
+        :param equals: Field name to the expected value.
+        :return: The item, or None.
+        """
+        matches = self.where(**equals)
+        return matches[0] if len(matches) else None
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        return [record.to_dict() for record in self]
+
+
+class ApiResponse(Generic[M]):
+    """
+    Response of a service call, typed by the record it carries.
+
+    The body is decoded once, on the first json(), model or models access,
+    and the result is shared by later calls. Other attributes
+    (status_code, headers, text, ...) come from the wrapped Response.
+    """
+
+    __slots__ = ("response", "model_type", "_json", "_model", "_models")
+
+    def __init__(self, response: Response, model_type: Type[M]) -> None:
+        self.response = response
+        self.model_type = model_type
+        self._json: Any = _UNSET
+        self._model: Any = _UNSET
+        self._models: Any = _UNSET
+
+    @property
+    def status_code(self) -> int:
+        return self.response.status_code
+
+    def json(self) -> Any:
+        """
+        Decode the body once; later calls return the same object.
+
+        :return: The decoded JSON.
+        """
+        if self._json is _UNSET:
+            self._json = self.response.json()
+        return self._json
+
+    @property
+    def model(self) -> M:
+        """
+        The body as a single record, built on first access.
+
+        :raises ValueError: If the body is not a valid record.
+        """
+        if self._model is _UNSET:
+            self._model = self.model_type.from_dict(self.json())
+        return self._model
+
+    @property
+    def models(self) -> ModelCollection[M]:
+        """
+        The body as a columnar collection of records, built on first access.
+        Keep the collection rather than the response to let the decoded
+        dicts be freed.
+
+        :raises ValueError: If the body is not a list of valid records.
+        """
+        if self._models is _UNSET:
+            data = self.json()
+            if not isinstance(data, list):
+                raise ValueError(f"Expected a JSON list of {self.model_type.__name__}")
+            self._models = ModelCollection.from_records(self.model_type, data)
+        return self._models
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Copies and pickles decode the body again rather than carrying the
+        # _UNSET sentinel, which would not survive them
+        return ApiResponse, (self.response, self.model_type)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names missing on the wrapper; private names such
+        # as the __deepcopy__ probe of copy, and response itself on an
+        # instance whose slots are not set yet, must not be forwarded
+        if name.startswith("_") or name == "response":
+            raise AttributeError(name)
+        return getattr(self.response, name)
+
+    def __repr__(self) -> str:
+        return f"<ApiResponse[{self.model_type.__name__}] [{self.status_code}]>"
@@ -0,0 +1,36 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+from src.models.base import Record
+
+
+@dataclass(slots=True)
+class User(Record):
+    """
+    A user as described by schemas/user_schema.json.
+    """
+
+    id: int
+    name: str
+    email: str
+    age: int
+    extra: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+
+
+@dataclass(slots=True)
+class Product(Record):
+    """
+    A product as described by schemas/product_schema.json.
+    """
+
+    id: int
+    name: str
+    description: str
+    price: float
+    stock: int
+    extra: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+
+
+# Example usage
+# user = User.from_dict({"id": 1, "name": "Ann", "email": "ann@example.com", "age": 30})
+# user.to_dict()
@@ -0,0 +1,73 @@
+import os
+import re
+from typing import Iterator, Optional
+
+import pytest
+
+from src.core.cassette import MODES, TIMINGS, Cassette
+
+DEFAULT_CASSETTE_DIR = "cassettes"
+CASSETTE_SUFFIX = ".jsonl.gz"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("cassettes", "HTTP record and replay")
+    group.addoption(
+        "--cassette-mode",
+        choices=("off",) + MODES,
+        default="off",
+        help="Record shared_api_client traffic per test, replay it, or both "
+        "('once' replays existing cassettes and records missing ones).",
+    )
+    group.addoption(
+        "--cassette-dir",
+        default=DEFAULT_CASSETTE_DIR,
+        help="Directory holding one cassette per test.",
+    )
+    group.addoption(
+        "--cassette-timing",
+        choices=TIMINGS,
+        default="none",
+        help="Replay at once or with the recorded response times.",
+    )
+
+
+def cassette_path(cassette_dir: str, nodeid: str) -> str:
+    """
+    Map a test node id to its cassette file.
+
+    :param cassette_dir: Root cassette directory.
+    :param nodeid: Node id such as "src/tests/test_x.py::TestA::test_b[1]".
+    :return: Path such as "<dir>/src/tests/test_x/TestA/test_b[1].jsonl.gz".
+    """
+    file_part, *names = nodeid.split("::")
+    parts = os.path.splitext(file_part)[0].split("/") + names
+    safe = [re.sub(r"[^\w.\-\[\]=]", "_", part) for part in parts]
+    return os.path.join(cassette_dir, *safe) + CASSETTE_SUFFIX
+
+
+@pytest.fixture(autouse=True)
+def api_cassette(request: pytest.FixtureRequest) -> Iterator[Optional[Cassette]]:
+    """
+    Point the shared API client at the test's cassette when --cassette-mode
+    is set and the test uses shared_api_client.
+    """
+    config = request.config
+    mode = config.getoption("cassette_mode")
+    if mode == "off" or "shared_api_client" not in request.fixturenames:
+        yield None
+        return
+
+    client = request.getfixturevalue("shared_api_client")
+    cassette = Cassette(
+        cassette_path(config.getoption("cassette_dir"), request.node.nodeid),
+        mode=mode,
+        timing=config.getoption("cassette_timing"),
+    )
+    client.use_cassette(cassette)
+    try:
+        yield cassette
+    finally:
+        client.use_cassette(None)
+        if cassette.recording:
+            cassette.save()
@@ -0,0 +1,615 @@
+import argparse
+import heapq
+import html
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+from src.utils.tracing import TRACER, Span
+from src.utils.worker import is_worker
+
+DEFAULT_PROFILE_DIR = os.path.join("reports", "profile")
+
+# Seconds between two stack samples of a profiled test
+SAMPLE_INTERVAL: float = 0.005
+MAX_STACK_DEPTH: int = 64
+# Distinct stacks kept per profiled test, most frequent first
+MAX_STACKS_PER_TEST: int = 200
+
+PHASES: Tuple[str, ...] = ("setup", "call", "teardown")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("profiling", "test duration profiling")
+    group.addoption(
+        "--profile-tests",
+        action="store_true",
+        default=False,
+        help="Record per-test and per-fixture wall/CPU time and write a report.",
+    )
+    group.addoption(
+        "--profile-dir",
+        default=DEFAULT_PROFILE_DIR,
+        help="Directory for the JSON and HTML profile reports.",
+    )
+    group.addoption(
+        "--profile-top",
+        type=int,
+        default=20,
+        help="Number of slowest tests shown in the summaries.",
+    )
+    group.addoption(
+        "--profile-sample",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Sample the call stacks of every test and keep those of the N slowest.",
+    )
+    group.addoption(
+        "--profile-baseline",
+        default=None,
+        help="Earlier profile JSON to compare this run against.",
+    )
+    group.addoption(
+        "--profile-threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown reported as a regression (0.2 = 20%%).",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if config.getoption("profile_tests"):
+        config.pluginmanager.register(TestProfiler(config), "test-profiler")
+
+
+class StackSampler:
+    """
+    Samples the call stack of one thread at a fixed interval.
+
+    Stacks are counted in the collapsed "outer;inner" format understood by
+    flamegraph.pl and speedscope.
+    """
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL) -> None:
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> Dict[str, int]:
+        """
+        Stop sampling.
+
+        :return: The most frequent collapsed stacks and their sample counts.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return dict(self.samples.most_common(MAX_STACKS_PER_TEST))
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            frames: List[str] = []
+            while frame is not None and len(frames) < MAX_STACK_DEPTH:
+                code = frame.f_code
+                frames.append(
+                    f"{code.co_name} ({os.path.basename(code.co_filename)}"
+                    f":{code.co_firstlineno})"
+                )
+                frame = frame.f_back
+            if frames:
+                self.samples[";".join(reversed(frames))] += 1
+
+
+def _timing() -> Dict[str, float]:
+    return {"wall": 0.0, "cpu": 0.0}
+
+
+class _LogRecordCounter(logging.Handler):
+    """
+    Counts the log records emitted while a test runs, a proxy for its logging cost.
+    """
+
+    def __init__(self, profiler: "TestProfiler") -> None:
+        super().__init__(logging.NOTSET)
+        self.profiler = profiler
+
+    def emit(self, record: logging.LogRecord) -> None:
+        current = self.profiler._current
+        if current is not None:
+            current["log_records"] += 1
+
+
+class TestProfiler:
+    """
+    Pytest plugin recording where test time goes.
+
+    Each test records its setup/call/teardown wall and CPU time, the setup
+    time of every fixture it instantiated, and the time spent in traced
+    calls (APIClient "http", SSHClient "ssh", UDP "udp" spans). The record
+    travels on the teardown report, so pytest-xdist workers ship it to the
+    controller, which writes a single ranked report.
+    """
+
+    # Not a test class, despite the name
+    __test__ = False
+
+    def __init__(self, config: pytest.Config) -> None:
+        self.config = config
+        self.top: int = config.getoption("profile_top")
+        self.sample_top: int = config.getoption("profile_sample")
+        self.profile_dir: str = config.getoption("profile_dir")
+        self.baseline: Optional[str] = config.getoption("profile_baseline")
+        self.threshold: float = config.getoption("profile_threshold")
+        self.records: List[Dict[str, Any]] = []
+        self.report: Optional[Dict[str, Any]] = None
+        self.diff: Optional[Dict[str, Any]] = None
+        self.paths: Tuple[str, ...] = ()
+        self._current: Optional[Dict[str, Any]] = None
+        self._started: Tuple[float, float] = (0.0, 0.0)
+        self._sampler: Optional[StackSampler] = None
+        # Wall times of the slowest sampled tests seen by this process
+        self._sampled_heap: List[float] = []
+        self._lock = threading.Lock()
+        self._log_counter = _LogRecordCounter(self)
+        # Call times come from the spans of the http/ssh/udp clients
+        self._tracing_was_enabled = TRACER.enabled
+        TRACER.enabled = True
+        TRACER.add_listener(self._on_span)
+        logging.getLogger().addHandler(self._log_counter)
+
+    def pytest_unconfigure(self) -> None:
+        TRACER.remove_listener(self._on_span)
+        TRACER.enabled = self._tracing_was_enabled
+        logging.getLogger().removeHandler(self._log_counter)
+
+    def _on_span(self, span: Span) -> None:
+        record = self._current
+        if record is None or span.category == "test":
+            return
+        with self._lock:
+            calls = record["calls"].setdefault(span.category, {"count": 0, "wall": 0.0})
+            calls["count"] += 1
+            calls["wall"] += span.duration
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item: pytest.Item, nextitem):
+        self._current = {
+            "nodeid": item.nodeid,
+            "outcome": "passed",
+            "wall": 0.0,
+            "cpu": 0.0,
+            "phases": {phase: _timing() for phase in PHASES},
+            "fixtures": {},
+            "calls": {},
+            "log_records": 0,
+        }
+        self._started = (time.perf_counter(), time.process_time())
+        if self.sample_top > 0:
+            self._sampler = StackSampler(threading.get_ident())
+            self._sampler.start()
+        yield
+        if self._sampler is not None:
+            # Interrupted before the teardown report
+            self._sampler.stop()
+            self._sampler = None
+        self._current = None
+
+    def _time_phase(self, phase: str):
+        wall, cpu = time.perf_counter(), time.process_time()
+        yield
+        record = self._current
+        if record is not None:
+            record["phases"][phase]["wall"] += time.perf_counter() - wall
+            record["phases"][phase]["cpu"] += time.process_time() - cpu
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item: pytest.Item):
+        yield from self._time_phase("setup")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item: pytest.Item):
+        yield from self._time_phase("call")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item: pytest.Item, nextitem):
+        yield from self._time_phase("teardown")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        wall, cpu = time.perf_counter(), time.process_time()
+        yield
+        record = self._current
+        if record is not None:
+            timing = record["fixtures"].setdefault(
+                fixturedef.argname, {"scope": fixturedef.scope, **_timing()}
+            )
+            timing["wall"] += time.perf_counter() - wall
+            timing["cpu"] += time.process_time() - cpu
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item: pytest.Item, call):
+        outcome = yield
+        report = outcome.get_result()
+        record = self._current
+        if record is None:
+            return
+        if report.failed:
+            record["outcome"] = "failed"
+        elif report.skipped and record["outcome"] == "passed":
+            record["outcome"] = "skipped"
+        if report.when == "teardown":
+            record["wall"] = time.perf_counter() - self._started[0]
+            record["cpu"] = time.process_time() - self._started[1]
+            if self._sampler is not None:
+                samples = self._sampler.stop()
+                self._sampler = None
+                if self._keep_samples(record["wall"]):
+                    record["samples"] = samples
+            # Serialized with the report, so xdist workers ship it too
+            report.profile = record
+
+    def _keep_samples(self, wall: float) -> bool:
+        heap = self._sampled_heap
+        if len(heap) < self.sample_top:
+            heapq.heappush(heap, wall)
+            return True
+        if wall > heap[0]:
+            heapq.heapreplace(heap, wall)
+            return True
+        return False
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        record = getattr(report, "profile", None)
+        if record is not None:
+            self.records.append(record)
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        if is_worker() or not self.records:
+            return
+        self.report = build_profile_report(self.records, self.sample_top)
+        os.makedirs(self.profile_dir, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        json_path = os.path.join(self.profile_dir, f"profile_{stamp}.json")
+        html_path = os.path.join(self.profile_dir, f"profile_{stamp}.html")
+        if self.baseline:
+            with open(self.baseline, "r") as file:
+                self.diff = diff_reports(json.load(file), self.report, self.threshold)
+        with open(json_path, "w") as file:
+            json.dump(self.report, file, indent=2)
+        with open(html_path, "w") as file:
+            file.write(render_html(self.report, self.diff, self.top))
+        self.paths = (json_path, html_path)
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if self.report is None:
+            return
+        terminalreporter.section("test profile")
+        for line in format_text(self.report, self.top).splitlines():
+            terminalreporter.write_line(line)
+        if self.diff is not None:
+            terminalreporter.write_line("")
+            for line in format_diff(self.diff).splitlines():
+                terminalreporter.write_line(line)
+        for path in self.paths:
+            terminalreporter.write_line(f"Profile written to {path}")
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_html_results_summary(self, prefix, summary, postfix, session):
+        if self.records:
+            report = build_profile_report(self.records, 0)
+            postfix.append(_html_tests_table(report, min(self.top, 10)))
+
+
+def build_profile_report(
+    records: List[Dict[str, Any]], sample_top: int = 0
+) -> Dict[str, Any]:
+    """
+    Aggregate per-test records into a ranked profile report.
+
+    :param records: Per-test records produced by TestProfiler.
+    :param sample_top: Number of slowest tests whose stack samples are kept.
+    :return: JSON-compatible report with ranked tests, fixtures and call totals.
+    """
+    tests = sorted(records, key=lambda record: record["wall"], reverse=True)
+    totals = {
+        "wall": 0.0,
+        "cpu": 0.0,
+        **{phase: 0.0 for phase in PHASES},
+        "log_records": 0,
+    }
+    fixtures: Dict[str, Dict[str, Any]] = {}
+    calls: Dict[str, Dict[str, float]] = {}
+    ranked: List[Dict[str, Any]] = []
+    profiles: Dict[str, Dict[str, Any]] = {}
+
+    for rank, record in enumerate(tests, start=1):
+        totals["wall"] += record["wall"]
+        totals["cpu"] += record["cpu"]
+        totals["log_records"] += record["log_records"]
+        for phase in PHASES:
+            totals[phase] += record["phases"][phase]["wall"]
+        for name, timing in record["fixtures"].items():
+            fixture = fixtures.setdefault(
+                name, {"name": name, "scope": timing["scope"], "count": 0, **_timing()}
+            )
+            fixture["count"] += 1
+            fixture["wall"] += timing["wall"]
+            fixture["cpu"] += timing["cpu"]
+        for category, timing in record["calls"].items():
+            total = calls.setdefault(category, {"count": 0, "wall": 0.0})
+            total["count"] += timing["count"]
+            total["wall"] += timing["wall"]
+        if record.get("samples") and len(profiles) < sample_top:
+            profiles[record["nodeid"]] = {
+                "interval": SAMPLE_INTERVAL,
+                "samples": record["samples"],
+            }
+        ranked.append(
+            {"rank": rank, **{k: v for k, v in record.items() if k != "samples"}}
+        )
+
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "tests_count": len(ranked),
+        "totals": totals,
+        "calls": calls,
+        "fixtures": sorted(
+            fixtures.values(), key=lambda fixture: fixture["wall"], reverse=True
+        ),
+        "tests": ranked,
+        "profiles": profiles,
+    }
+
+
+def _change(before: float, after: float) -> Optional[float]:
+    return (after - before) / before if before else None
+
+
+def diff_reports(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = 0.2,
+    min_delta: float = 0.05,
+) -> Dict[str, Any]:
+    """
+    Compare two profile reports.
+
+    A test or fixture regressed when it got slower by more than the relative
+    threshold and by at least min_delta seconds, so tiny tests do not flap.
+
+    :param baseline: The earlier report.
+    :param current: The report to check.
+    :param threshold: Relative slowdown reported (0.2 = 20%).
+    :param min_delta: Minimum absolute slowdown in seconds.
+    :return: Dictionary with totals, regressions, improvements, added and removed.
+    """
+    result: Dict[str, Any] = {
+        "threshold": threshold,
+        "total": {
+            "before": baseline["totals"]["wall"],
+            "after": current["totals"]["wall"],
+            "change": _change(baseline["totals"]["wall"], current["totals"]["wall"]),
+        },
+        "regressions": [],
+        "improvements": [],
+        "added": [],
+        "removed": [],
+    }
+    for kind, collection, key in (
+        ("test", "tests", "nodeid"),
+        ("fixture", "fixtures", "name"),
+    ):
+        before = {entry[key]: entry["wall"] for entry in baseline[collection]}
+        after = {entry[key]: entry["wall"] for entry in current[collection]}
+        for name, wall in after.items():
+            if name not in before:
+                if kind == "test":
+                    result["added"].append(name)
+                continue
+            delta = wall - before[name]
+            if abs(delta) < min_delta:
+                continue
+            entry = {
+                "kind": kind,
+                "name": name,
+                "before": before[name],
+                "after": wall,
+                "change": _change(before[name], wall),
+            }
+            if before[name] and delta > before[name] * threshold:
+                result["regressions"].append(entry)
+            elif before[name] and -delta > before[name] * threshold:
+                result["improvements"].append(entry)
+        if kind == "test":
+            result["removed"] = sorted(set(before) - set(after))
+    result["regressions"].sort(key=lambda entry: entry["after"] - entry["before"])
+    result["regressions"].reverse()
+    result["improvements"].sort(key=lambda entry: entry["after"] - entry["before"])
+    return result
+
+
+def _calls_text(calls: Dict[str, Dict[str, float]]) -> str:
+    return ", ".join(
+        f"{category} {timing['wall']:.3f}s/{timing['count']}"
+        for category, timing in sorted(calls.items())
+    )
+
+
+def format_text(report: Dict[str, Any], top: int = 20) -> str:
+    """
+    Render the slowest tests and fixtures as plain text.
+
+    :param report: A report from build_profile_report.
+    :param top: Number of tests and fixtures listed.
+    :return: The text summary.
+    """
+    totals = report["totals"]
+    lines = [
+        f"{report['tests_count']} tests: {totals['wall']:.3f}s wall, "
+        f"{totals['cpu']:.3f}s CPU (setup {totals['setup']:.3f}s, "
+        f"call {totals['call']:.3f}s, teardown {totals['teardown']:.3f}s), "
+        f"{totals['log_records']} log records",
+    ]
+    if report["calls"]:
+        lines.append(f"Traced calls: {_calls_text(report['calls'])}")
+    lines.append(f"Slowest {min(top, len(report['tests']))} tests:")
+    for test in report["tests"][:top]:
+        calls = _calls_text(test["calls"])
+        lines.append(
+            f"  {test['wall']:8.3f}s wall {test['cpu']:8.3f}s cpu  {test['nodeid']}"
+            + (f"  [{calls}]" if calls else "")
+        )
+    if report["fixtures"]:
+        lines.append("Slowest fixtures (setup):")
+        for fixture in report["fixtures"][:top]:
+            lines.append(
+                f"  {fixture['wall']:8.3f}s wall {fixture['cpu']:8.3f}s cpu  "
+                f"{fixture['name']} ({fixture['scope']}, x{fixture['count']})"
+            )
+    return "\n".join(lines)
+
+
+def format_diff(diff: Dict[str, Any]) -> str:
+    """
+    Render a report comparison as plain text.
+
+    :param diff: A result of diff_reports.
+    :return: The text summary.
+    """
+    total = diff["total"]
+    change = f" ({total['change']:+.1%})" if total["change"] is not None else ""
+    lines = [
+        f"Total wall time {total['before']:.3f}s -> {total['after']:.3f}s{change}",
+        f"{len(diff['regressions'])} regression(s) over "
+        f"{diff['threshold']:.0%}, {len(diff['improvements'])} improvement(s), "
+        f"{len(diff['added'])} added, {len(diff['removed'])} removed",
+    ]
+    for entry in diff["regressions"]:
+        change = f" ({entry['change']:+.1%})" if entry["change"] is not None else ""
+        lines.append(
+            f"  SLOWER {entry['kind']} {entry['name']}: "
+            f"{entry['before']:.3f}s -> {entry['after']:.3f}s{change}"
+        )
+    return "\n".join(lines)
+
+
+def _html_tests_table(report: Dict[str, Any], top: int) -> str:
+    rows = "".join(
+        "<tr>"
+        f"<td>{test['rank']}</td><td>{html.escape(test['nodeid'])}</td>"
+        f"<td>{test['outcome']}</td><td>{test['wall']:.3f}</td>"
+        f"<td>{test['cpu']:.3f}</td>"
+        + "".join(f"<td>{test['phases'][phase]['wall']:.3f}</td>" for phase in PHASES)
+        + f"<td>{html.escape(_calls_text(test['calls']))}</td></tr>"
+        for test in report["tests"][:top]
+    )
+    return (
+        f"<h2>Slowest tests</h2><table><thead><tr><th>#</th><th>Test</th>"
+        "<th>Outcome</th><th>Wall (s)</th><th>CPU (s)</th><th>Setup (s)</th>"
+        "<th>Call (s)</th><th>Teardown (s)</th><th>Traced calls</th></tr></thead>"
+        f"<tbody>{rows}</tbody></table>"
+    )
+
+
+def render_html(
+    report: Dict[str, Any], diff: Optional[Dict[str, Any]] = None, top: int = 20
+) -> str:
+    """
+    Render the profile report as a standalone HTML page.
+
+    :param report: A report from build_profile_report.
+    :param diff: Optional comparison with a baseline report.
+    :param top: Number of tests and fixtures listed.
+    :return: The HTML document.
+    """
+    sections = [
+        f"<h1>Test profile</h1><pre>{html.escape(format_text(report, 0))}</pre>"
+    ]
+    if diff is not None:
+        sections.append(
+            f"<h2>Compared with baseline</h2><pre>{html.escape(format_diff(diff))}</pre>"
+        )
+    sections.append(_html_tests_table(report, top))
+    fixture_rows = "".join(
+        f"<tr><td>{html.escape(fixture['name'])}</td><td>{fixture['scope']}</td>"
+        f"<td>{fixture['count']}</td><td>{fixture['wall']:.3f}</td>"
+        f"<td>{fixture['cpu']:.3f}</td></tr>"
+        for fixture in report["fixtures"][:top]
+    )
+    sections.append(
+        "<h2>Slowest fixtures (setup)</h2><table><thead><tr><th>Fixture</th>"
+        "<th>Scope</th><th>Tests</th><th>Wall (s)</th><th>CPU (s)</th></tr></thead>"
+        f"<tbody>{fixture_rows}</tbody></table>"
+    )
+    for nodeid, profile in report["profiles"].items():
+        total = sum(profile["samples"].values()) or 1
+        stacks = "".join(
+            f"<tr><td>{count / total:.1%}</td><td><code>"
+            f"{html.escape(stack.rsplit(';', 3)[-1] if ';' in stack else stack)}"
+            "</code></td></tr>"
+            for stack, count in list(profile["samples"].items())[:15]
+        )
+        sections.append(
+            f"<h3>Samples: {html.escape(nodeid)}</h3><table><thead><tr>"
+            "<th>Share</th><th>Innermost frames</th></tr></thead>"
+            f"<tbody>{stacks}</tbody></table>"
+        )
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Test profile"
+        "</title><style>body{font-family:sans-serif}table{border-collapse:"
+        "collapse}td,th{border:1px solid #ccc;padding:2px 6px;text-align:left}"
+        f"</style></head><body>{''.join(sections)}</body></html>"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Compare two profile reports from the command line.
+
+    :param argv: Command line arguments (defaults to sys.argv).
+    :return: Exit code, 1 when regressions were found.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m src.plugins.profiling",
+        description="Compare two test profile reports.",
+    )
+    parser.add_argument("baseline", help="Earlier profile JSON.")
+    parser.add_argument("current", help="Profile JSON to check.")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--min-delta", type=float, default=0.05)
+    args = parser.parse_args(argv)
+
+    with open(args.baseline, "r") as file:
+        baseline = json.load(file)
+    with open(args.current, "r") as file:
+        current = json.load(file)
+    diff = diff_reports(baseline, current, args.threshold, args.min_delta)
+    print(format_diff(diff))
+    return 1 if diff["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# Example usage
+# pytest src/tests --profile-tests --profile-sample 5
+# pytest src/tests --profile-tests --profile-baseline reports/profile/profile_<ts>.json
+# python -m src.plugins.profiling old.json new.json --threshold 0.3
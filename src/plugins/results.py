@@ -0,0 +1,149 @@
+import argparse
+import sys
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from src.utils.metrics.request_metrics import REQUEST_METRICS
+from src.utils.metrics.results_store import (
+    DEFAULT_RESULTS_DB,
+    ResultsStore,
+    current_revision,
+)
+from src.utils.worker import is_worker
+
+# Merges the request metrics of xdist workers into the controller's registry
+pytest_plugins = ["src.plugins.worker_output"]
+
+# Finished tests buffered before they are written in one transaction
+FLUSH_EVERY: int = 200
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("results", "run history")
+    group.addoption(
+        "--results-db",
+        default=None,
+        metavar="PATH",
+        help="Store test outcomes, durations and endpoint latencies in this "
+        f"SQLite database, e.g. {DEFAULT_RESULTS_DB}.",
+    )
+    group.addoption(
+        "--results-label",
+        default=None,
+        help="Label stored with the run, e.g. the environment.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if config.getoption("results_db"):
+        config.pluginmanager.register(ResultsRecorder(config), "results-recorder")
+
+
+class ResultsRecorder:
+    """
+    Pytest plugin writing every run to a ResultsStore.
+
+    The controller records the outcome and setup + call + teardown duration
+    of each test from its reports, writing them FLUSH_EVERY at a time, and
+    the endpoint latency histograms at the end of the session. Under
+    pytest-xdist the worker_output plugin has merged the workers' histograms
+    into the controller's registry by then.
+    """
+
+    def __init__(self, config: pytest.Config) -> None:
+        self.config = config
+        self.path: str = config.getoption("results_db")
+        self.label: Optional[str] = config.getoption("results_label")
+        self.store: Optional[ResultsStore] = None
+        self.run_id: Optional[int] = None
+        self.pending: List[Dict[str, Any]] = []
+        self._tests: Dict[str, Dict[str, Any]] = {}
+
+    def pytest_sessionstart(self, session: pytest.Session) -> None:
+        if is_worker():
+            return
+        revision, branch = current_revision(str(self.config.rootpath))
+        self.store = ResultsStore(self.path)
+        self.run_id = self.store.start_run(revision, branch, self.label)
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        if self.store is None:
+            return
+        test = self._tests.setdefault(
+            report.nodeid,
+            {"nodeid": report.nodeid, "outcome": "passed", "duration": 0.0},
+        )
+        test["duration"] += report.duration
+        if report.failed:
+            test["outcome"] = "failed"
+        elif report.skipped and test["outcome"] == "passed":
+            test["outcome"] = "skipped"
+        if report.when == "teardown":
+            self.pending.append(self._tests.pop(report.nodeid))
+            if len(self.pending) >= FLUSH_EVERY:
+                self._flush()
+
+    def _flush(self) -> None:
+        if self.store is not None and self.pending:
+            self.store.add_test_results(self.run_id, self.pending)
+            self.pending = []
+
+    def pytest_sessionfinish(self, session: pytest.Session, exitstatus: int) -> None:
+        if self.store is None:
+            return
+        # Tests interrupted before their teardown report
+        self.pending.extend(self._tests.values())
+        self._tests = {}
+        self._flush()
+        self.store.add_endpoint_metrics(self.run_id, REQUEST_METRICS.snapshot())
+        self.store.finish_run(self.run_id, int(exitstatus))
+        self.store.close()
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if self.store is not None:
+            terminalreporter.write_line(f"Run {self.run_id} stored in {self.path}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Compare two stored runs, or the runs of two git commits, from the command line.
+
+    :param argv: Command line arguments (defaults to sys.argv).
+    :return: Exit code, 1 when significant slowdowns or new failures were found.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m src.plugins.results",
+        description="Flag significant slowdowns between stored test runs.",
+    )
+    parser.add_argument(
+        "baseline",
+        nargs="?",
+        default="previous",
+        help="Run id ('#12'), 'latest', 'previous' or git commit prefix ('git:3f2a').",
+    )
+    parser.add_argument("candidate", nargs="?", default="latest")
+    parser.add_argument("--db", default=DEFAULT_RESULTS_DB)
+    parser.add_argument("--alpha", type=float, default=0.05)
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument("--min-samples", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    store = ResultsStore(args.db)
+    try:
+        comparison = store.compare(
+            args.baseline, args.candidate, args.alpha, args.threshold, args.min_samples
+        )
+    finally:
+        store.close()
+    print(comparison.format_text())
+    return 1 if comparison.regressions or comparison.new_failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# Example usage
+# pytest src/tests -n 4 --results-db reports/results.db --results-label staging
+# python -m src.plugins.results previous latest
+# python -m src.plugins.results 3f2a9c1 8d41e07 --alpha 0.01
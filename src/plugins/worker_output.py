@@ -0,0 +1,32 @@
+from typing import Any, Dict
+
+import pytest
+
+from src.utils.metrics.request_metrics import REQUEST_METRICS
+from src.utils.tracing import TRACER
+from src.utils.worker import is_worker
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """
+    Ship this xdist worker's request metrics and spans to the controller.
+    """
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if not is_worker() or workeroutput is None:
+        return
+    workeroutput["request_metrics"] = REQUEST_METRICS.snapshot()
+    if TRACER.enabled:
+        workeroutput["trace"] = TRACER.to_chrome_trace()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    """
+    Merge a finished worker's metrics and spans into the controller's, so the
+    session ends with one metrics export and one trace.
+    """
+    workeroutput: Dict[str, Any] = getattr(node, "workeroutput", {})
+    if workeroutput.get("request_metrics"):
+        REQUEST_METRICS.merge_snapshot(workeroutput["request_metrics"])
+    if workeroutput.get("trace"):
+        TRACER.import_chrome_trace(workeroutput["trace"])
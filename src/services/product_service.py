@@ -3,6 +3,7 @@ from typing import Any, Dict, Optional
 from requests import Response
 
 from src.core.api_client import APIClient
+from src.models import ApiResponse, Product
 from src.utils import ConfigLoader
 from src.utils.logger import get_logger
 
@@ -19,52 +20,64 @@ class ProductService:
         )
         self.endpoint: str = "/products"
 
-    def get_product(self, product_id: int) -> Response:
+    def list_products(self) -> ApiResponse[Product]:
+        """
+        Get every product.
+
+        :return: Response whose models property is a columnar collection
+        """
+        logger.info("Fetching all products")
+        response: Response = self.api_client.get(self.endpoint)
+        return ApiResponse(response, Product)
+
+    def get_product(self, product_id: int) -> ApiResponse[Product]:
         """
         Get a product's details by product ID.
 
         :param product_id: The ID of the product to retrieve
-        :return: Response object
+        :return: Response carrying a Product
         """
         logger.info(f"Fetching product with ID: {product_id}")
         response: Response = self.api_client.get(f"{self.endpoint}/{product_id}")
-        return response
+        return ApiResponse(response, Product)
 
-    def create_product(self, product_data: Dict[str, Any]) -> Response:
+    def create_product(self, product_data: Dict[str, Any]) -> ApiResponse[Product]:
         """
         Create a new product with the provided product data.
 
         :param product_data: Dictionary containing product data to create
-        :return: Response object
+        :return: Response carrying a Product
         """
         logger.info(f"Creating a new product with data: {product_data}")
         response: Response = self.api_client.post(self.endpoint, data=product_data)
-        return response
+        return ApiResponse(response, Product)
 
-    def update_product(self, product_id: int, product_data: Dict[str, Any]) -> Response:
+    def update_product(
+        self, product_id: int, product_data: Dict[str, Any]
+    ) -> ApiResponse[Product]:
         """
         Update an existing product's details by product ID.
 
         :param product_id: The ID of the product to update
         :param product_data: Dictionary containing updated product data
-        :return: Response object
+        :return: Response carrying a Product
         """
         logger.info(f"Updating product with ID: {product_id} with data: {product_data}")
         response: Response = self.api_client.put(
             f"{self.endpoint}/{product_id}", data=product_data
         )
-        return response
+        return ApiResponse(response, Product)
 
-    def delete_product(self, product_id: int) -> Response:
+    def delete_product(self, product_id: int) -> ApiResponse[Product]:
         """
         Delete a product by product ID.
 
         :param product_id: The ID of the product to delete
-        :return: Response object
+        :return: Response object; its body carries no record
         """
         logger.info(f"Deleting product with ID: {product_id}")
         response: Response = self.api_client.delete(f"{self.endpoint}/{product_id}")
-        return response
+        return ApiResponse(response, Product)
 
 
 # Usage example
@@ -73,4 +86,4 @@ class ProductService:
 #
 #     # Example to get product details
 #     response = product_service.get_product(product_id=1)
-#     logger.info(f"Response: {response.status_code}, {response.json()}")
+#     logger.info(f"Response: {response.status_code}, {response.model}")
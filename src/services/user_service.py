@@ -3,6 +3,7 @@ from typing import Any, Dict, Optional
 from requests import Response
 
 from src.core.api_client import APIClient
+from src.models import ApiResponse, User
 from src.utils import ConfigLoader
 from src.utils.logger import get_logger
 
@@ -19,52 +20,62 @@ class UserService:
         )
         self.endpoint: str = "/users"
 
-    def get_user(self, user_id: int) -> Response:
+    def list_users(self) -> ApiResponse[User]:
+        """
+        Get every user.
+
+        :return: Response whose models property is a columnar collection
+        """
+        logger.info("Fetching all users")
+        response: Response = self.api_client.get(self.endpoint)
+        return ApiResponse(response, User)
+
+    def get_user(self, user_id: int) -> ApiResponse[User]:
         """
         Get a user's details by user ID.
 
         :param user_id: The ID of the user to retrieve
-        :return: Response object
+        :return: Response carrying a User
         """
         logger.info(f"Fetching user with ID: {user_id}")
         response: Response = self.api_client.get(f"{self.endpoint}/{user_id}")
-        return response
+        return ApiResponse(response, User)
 
-    def create_user(self, user_data: Dict[str, Any]) -> Response:
+    def create_user(self, user_data: Dict[str, Any]) -> ApiResponse[User]:
         """
         Create a new user with the provided user data.
 
         :param user_data: Dictionary containing user data to create
-        :return: Response object
+        :return: Response carrying a User
         """
         logger.info(f"Creating a new user with data: {user_data}")
         response: Response = self.api_client.post(self.endpoint, data=user_data)
-        return response
+        return ApiResponse(response, User)
 
-    def update_user(self, user_id: int, user_data: Dict[str, Any]) -> Response:
+    def update_user(self, user_id: int, user_data: Dict[str, Any]) -> ApiResponse[User]:
         """
         Update an existing user's details by user ID.
 
         :param user_id: The ID of the user to update
         :param user_data: Dictionary containing updated user data
-        :return: Response object
+        :return: Response carrying a User
         """
         logger.info(f"Updating user with ID: {user_id} with data: {user_data}")
         response: Response = self.api_client.put(
             f"{self.endpoint}/{user_id}", data=user_data
         )
-        return response
+        return ApiResponse(response, User)
 
-    def delete_user(self, user_id: int) -> Response:
+    def delete_user(self, user_id: int) -> ApiResponse[User]:
         """
         Delete a user by user ID.
 
         :param user_id: The ID of the user to delete
-        :return: Response object
+        :return: Response object; its body carries no record
         """
         logger.info(f"Deleting user with ID: {user_id}")
         response: Response = self.api_client.delete(f"{self.endpoint}/{user_id}")
-        return response
+        return ApiResponse(response, User)
 
 
 # Usage example
@@ -73,4 +84,4 @@ class UserService:
 #
 #     # Example to get user details
 #     response = user_service.get_user(user_id=1)
-#     logger.info(f"Response: {response.status_code}, {response.json()}")
+#     logger.info(f"Response: {response.status_code}, {response.model}")
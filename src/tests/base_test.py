@@ -4,7 +4,6 @@ from typing import Any
 import pytest
 
 from src.core.api_client import APIClient
-from src.utils import ConfigLoader
 
 # Setting up a logger
 logger = logging.getLogger(__name__)
@@ -17,21 +16,17 @@ class BaseTest:
     """
 
     @pytest.fixture(scope="class", autouse=True)
-    def setup_class(self, request: Any) -> None:
+    def setup_class(self, request: Any, shared_api_client: APIClient) -> None:
         """
         Set up method that is run once per test class.
 
-        Initializes API client and other shared resources for the tests.
+        Attaches the API client shared by every test class of this worker.
 
         :param request: Provides information about the requesting test context.
+        :param shared_api_client: The worker's session-scoped API client.
         """
         logger.info(f"Setting up test class: {request.cls.__name__}")
-
-        # Initialize API client with base URL from configuration
-        base_url = ConfigLoader.get_config_value(
-            "API_BASE_URL", "http://localhost:5000"
-        )
-        request.cls.api_client = APIClient(base_url)
+        request.cls.api_client = shared_api_client
 
     @pytest.fixture(scope="function", autouse=True)
     def setup_method(self, request: Any) -> None:
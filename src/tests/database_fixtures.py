@@ -0,0 +1,76 @@
+import logging
+from typing import Any, Iterator
+
+import pytest
+
+from src.utils.config.config_loader import ConfigLoader
+from src.utils.databases import (
+    ConnectionPool,
+    Database,
+    TransactionalSession,
+    create_pool,
+    snapshot_for,
+)
+from src.utils.worker import worker_id
+
+# Setting up a logger
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture(scope="session")
+def db_pool() -> Iterator[ConnectionPool]:
+    """
+    Pool for the database behind the API, from the DATABASE_URL setting.
+
+    A "{worker}" placeholder in the URL is replaced by the xdist worker id,
+    so every worker can get its own SQLite file or PostgreSQL database.
+    """
+    url = ConfigLoader.get_config_value("DATABASE_URL")
+    if not url:
+        pytest.skip("DATABASE_URL is not configured")
+    pool = create_pool(url.replace("{worker}", worker_id()))
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def database(db_pool: ConnectionPool) -> Database:
+    """Query helpers on the session pool."""
+    return Database(db_pool)
+
+
+@pytest.fixture(scope="session")
+def db_snapshot(db_pool: ConnectionPool) -> Iterator[Any]:
+    """
+    Snapshot of the database as it is when first requested. PostgreSQL
+    targets also need DATABASE_ADMIN_URL for the template database.
+    """
+    admin_url = ConfigLoader.get_config_value("DATABASE_ADMIN_URL")
+    admin_pool = create_pool(admin_url, max_size=1) if admin_url else None
+    snapshot = snapshot_for(db_pool, admin_pool=admin_pool)
+    snapshot.take()
+    yield snapshot
+    snapshot.close()
+    if admin_pool is not None:
+        admin_pool.close()
+
+
+@pytest.fixture
+def db_restore(db_snapshot: Any, database: Database) -> Iterator[Database]:
+    """
+    Database restored to the session snapshot after the test, undoing
+    writes made through the API as well as through this helper.
+    """
+    yield database
+    db_snapshot.restore()
+
+
+@pytest.fixture
+def db_transaction(db_pool: ConnectionPool) -> Iterator[Database]:
+    """
+    Database helper whose writes are rolled back after the test. Only the
+    test's own writes are undone; use db_restore for writes made by the API.
+    """
+    with TransactionalSession(db_pool) as session:
+        with session.savepoint() as database:
+            yield database
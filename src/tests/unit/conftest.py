@@ -0,0 +1,26 @@
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from src.utils.databases import Database, sqlite_pool
+
+
+@pytest.fixture
+def database(request: pytest.FixtureRequest, tmp_path: Path) -> Iterator[Database]:
+    """
+    Database on a file-backed SQLite pool, closed on teardown.
+
+    A test module sets up its own tables by listing SQL statements in a
+    module-level DATABASE_SCHEMA, run in order before each test.
+
+    :param request: Pytest request of the test using the fixture
+    :param tmp_path: Temporary directory provided by pytest
+    :return: The Database helper
+    """
+    pool = sqlite_pool(str(tmp_path / "test.db"))
+    database = Database(pool)
+    for statement in getattr(request.module, "DATABASE_SCHEMA", ()):
+        database.execute(statement)
+    yield database
+    pool.close()
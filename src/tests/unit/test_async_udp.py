@@ -0,0 +1,107 @@
+import asyncio
+import socket
+
+import pytest
+
+from src.utils import AsyncUDPListener, AsyncUDPSender
+from src.utils.logger import get_logger
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+
+def test_async_udp_round_trip_many_messages() -> None:
+    """
+    Test that thousands of concurrent sends are received via async iteration.
+    """
+    message_count: int = 2000
+
+    async def scenario() -> set:
+        async with AsyncUDPListener(
+            host="127.0.0.1", port=0, receive_buffer_size=4 * 1024 * 1024
+        ) as listener:
+            async with AsyncUDPSender("127.0.0.1", listener.port) as sender:
+                await asyncio.gather(
+                    *(sender.send(f"msg-{i}") for i in range(message_count))
+                )
+                received = set()
+                async for data, _addr in listener:
+                    received.add(data)
+                    if len(received) == message_count:
+                        break
+                return received
+
+    received = asyncio.run(asyncio.wait_for(scenario(), timeout=10))
+    assert len(received) == message_count
+    logger.info(f"Async UDP round trip received {len(received)} messages")
+
+
+def test_async_udp_receive_until_matches_reply() -> None:
+    """
+    Test that receive_until skips non-matching datagrams and returns the match.
+    """
+
+    async def scenario() -> bytes:
+        async with AsyncUDPListener(host="127.0.0.1", port=0) as listener:
+            async with AsyncUDPSender("127.0.0.1", listener.port) as sender:
+                await sender.send(b"ping")
+                _data, addr = await listener.receive(timeout=2)
+                await listener.send_to(b"noise", addr)
+                await listener.send_to(b"pong", addr)
+                data, _addr = await sender.receive_until(
+                    lambda payload, _: payload == b"pong", timeout=2
+                )
+                return data
+
+    assert asyncio.run(scenario()) == b"pong"
+
+
+def test_async_udp_receive_until_times_out() -> None:
+    """
+    Test that receive_until raises a timeout when nothing matches.
+    """
+
+    async def scenario() -> None:
+        async with AsyncUDPListener(host="127.0.0.1", port=0) as listener:
+            await listener.receive_until(lambda payload, _: True, timeout=0.1)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(scenario())
+
+
+def test_async_udp_close_reaches_a_full_queue() -> None:
+    """
+    Test that closing a listener whose queue is full still ends iteration.
+    """
+
+    async def scenario() -> list:
+        listener = AsyncUDPListener(host="127.0.0.1", port=0, max_queue_size=2)
+        await listener.start()
+        async with AsyncUDPSender("127.0.0.1", listener.port) as sender:
+            for index in range(5):
+                await sender.send(f"msg-{index}")
+            while listener.dropped < 3:
+                await asyncio.sleep(0.01)
+        await listener.close()
+        return [data async for data, _addr in listener]
+
+    received = asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+    assert received == [b"msg-1"]
+
+
+def test_async_udp_receive_raises_socket_errors() -> None:
+    """
+    Test that an ICMP port unreachable reported by the socket reaches receive().
+    """
+    probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    probe.bind(("127.0.0.1", 0))
+    closed_port = probe.getsockname()[1]
+    probe.close()
+
+    async def scenario() -> None:
+        async with AsyncUDPSender("127.0.0.1", closed_port) as sender:
+            await sender.send("anyone there?")
+            await sender.receive(timeout=2)
+
+    with pytest.raises(ConnectionRefusedError):
+        asyncio.run(scenario())
@@ -0,0 +1,94 @@
+import logging
+import time
+from typing import Any, Dict
+
+from src.benchmarks.runner import compare_results, measure, run_benchmarks
+from src.utils.logger import get_logger
+from src.utils.metrics.request_metrics import REQUEST_METRICS
+
+logger = get_logger(__name__)
+
+
+def _document(**ops_per_sec: float) -> Dict[str, Any]:
+    return {
+        "results": {
+            name.replace("_", "."): {"ops_per_sec": value}
+            for name, value in ops_per_sec.items()
+        }
+    }
+
+
+def test_measure_times_every_operation() -> None:
+    """
+    Test that measure counts operations, items and latency consistently.
+    """
+    result = measure(
+        "sleep", "naps", lambda: time.sleep(0.001), 4, min_time=0.02, warmup=0
+    )
+    logger.info(f"Measured {result.to_dict()}")
+
+    assert result.operations >= 1
+    assert result.items == result.operations * 4
+    assert result.latency.count == result.operations
+    assert result.to_dict()["p50_us"] >= 1000
+
+
+def test_measure_respects_operation_cap() -> None:
+    """
+    Test that max_operations bounds the timed calls.
+    """
+    result = measure("noop", "calls", lambda: None, min_time=10, max_operations=50)
+
+    assert result.operations == 50
+
+
+def test_compare_results_applies_thresholds() -> None:
+    """
+    Test that regressions use per-benchmark thresholds over the default.
+    """
+    baseline = _document(csv_load=100.0, ssh_exec=100.0, udp_send=100.0, gone=1.0)
+    current = _document(csv_load=85.0, ssh_exec=85.0, udp_send=130.0)
+
+    comparison = compare_results(
+        baseline, current, threshold=0.1, thresholds={"ssh.exec": 0.3}
+    )
+
+    assert [entry["name"] for entry in comparison["regressions"]] == ["csv.load"]
+    assert [entry["name"] for entry in comparison["improvements"]] == ["udp.send"]
+    assert comparison["missing"] == ["gone"]
+
+
+def test_run_benchmarks_against_local_stubs() -> None:
+    """
+    Test a quick run of file, UDP, HTTP client and import benchmarks end to end.
+    """
+    document = run_benchmarks(
+        ["csv.load", "udp.send", "api_client", "import.src_utils"],
+        min_time=0.02,
+        quick=True,
+    )
+    results = document["results"]
+    logger.info(f"Benchmark results: {results}")
+
+    assert set(results) == {
+        "csv.load[rows=100]",
+        "udp.send[batch=1]",
+        "api_client.make_request",
+        "import.src_utils",
+    }
+    assert all(result["ops_per_sec"] > 0 for result in results.values())
+    assert results["csv.load[rows=100]"]["items_per_sec"] > 0
+
+
+def test_run_benchmarks_keeps_the_callers_metrics_and_logging() -> None:
+    """
+    Test that a run inside pytest leaves the session's metrics and the root
+    logger level as they were.
+    """
+    root_level = logging.getLogger().level
+    with REQUEST_METRICS.isolated():
+        REQUEST_METRICS.record("GET", "/session", "200", {"total": 0.01})
+        run_benchmarks(["api_client.make_request"], min_time=0.01, quick=True)
+
+        assert list(REQUEST_METRICS.to_dict()) == ["GET /session"]
+    assert logging.getLogger().level == root_level
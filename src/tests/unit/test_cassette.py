@@ -0,0 +1,192 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from src.core.api_client import APIClient
+from src.core.cassette import Cassette, normalize_request
+from src.core.exceptions.api_exceptions import CassetteMissError
+from src.mock_server import FaultConfig, MockAPIServer
+from src.plugins.cassettes import cassette_path
+from src.utils.logger import get_logger
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+
+
+def _record_session(server: MockAPIServer, path: str) -> None:
+    client = APIClient(server.url)
+    with Cassette(path, mode="record") as cassette:
+        client.use_cassette(cassette)
+        client.get("/users/1")
+        client.put("/users/1", data={"age": 77})
+        client.get("/users/1")
+    client.close()
+
+
+def test_request_key_normalization() -> None:
+    """
+    Test that query order, JSON key order and host case do not change the key.
+    """
+    key = normalize_request(
+        "get", "http://API.local/users?b=2&a=1", b'{"x": 1, "y": 2}'
+    )
+
+    assert key == normalize_request(
+        "GET", "http://api.local/users?a=1&b=2", '{"y":2,"x":1}'
+    )
+    assert key != normalize_request("GET", "http://api.local/users?a=1&b=3")
+    assert normalize_request(
+        "GET", "http://api.local/users?a=1&_=123", ignore_params=["_"]
+    ) == normalize_request("GET", "http://api.local/users?a=1")
+
+
+def test_replay_without_network(tmp_path: Path) -> None:
+    """
+    Test that a recorded session replays in order after the server is gone.
+
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    path = str(tmp_path / "users.jsonl.gz")
+    with MockAPIServer(records=5) as server:
+        url = server.url
+        _record_session(server, path)
+
+    client = APIClient(url, cassette=Cassette(path, mode="replay"))
+    first = client.get("/users/1").json()
+    updated = client.put("/users/1", data={"age": 77}).json()
+    second = client.get("/users/1").json()
+    logger.info(f"Replayed {first} then {second}")
+
+    assert updated["age"] == second["age"] == 77
+    assert first["age"] != 77
+
+
+def test_streamed_download_is_recorded_as_read(tmp_path: Path) -> None:
+    """
+    Test that a streamed download is teed into the cassette and replays,
+    while an undecoded raw read is left out.
+
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    path = str(tmp_path / "downloads.jsonl.gz")
+    with MockAPIServer(records=2) as server:
+        url = server.url
+        client = APIClient(url)
+        with Cassette(path, mode="record") as cassette:
+            client.use_cassette(cassette)
+            client.download("/users/1", str(tmp_path / "live.json"))
+            client.download("/users/2", str(tmp_path / "raw.json"), decode=False)
+        client.close()
+
+    client = APIClient(url, cassette=Cassette(path, mode="replay"))
+    client.download("/users/1", str(tmp_path / "replayed.json"))
+
+    assert (tmp_path / "replayed.json").read_bytes() == (
+        tmp_path / "live.json"
+    ).read_bytes()
+    with pytest.raises(CassetteMissError):
+        client.download("/users/2", str(tmp_path / "missing.json"))
+
+
+def test_miss_fails_without_retries(tmp_path: Path) -> None:
+    """
+    Test that an unrecorded request raises at once instead of being retried.
+
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    client = APIClient(
+        "http://replay.invalid",
+        cassette=Cassette(str(tmp_path / "empty.jsonl"), mode="replay"),
+    )
+    started = time.perf_counter()
+    with pytest.raises(CassetteMissError):
+        client.get("/users/404")
+
+    assert time.perf_counter() - started < 1
+
+
+def test_recorded_timing(tmp_path: Path) -> None:
+    """
+    Test that "recorded" timing waits for the original response time.
+
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    path = str(tmp_path / "slow.jsonl")
+    with MockAPIServer(records=1, faults=FaultConfig(latency=0.2)) as server:
+        url = server.url
+        client = APIClient(url)
+        with Cassette(path, mode="once") as cassette:
+            client.use_cassette(cassette)
+            client.get("/users/1")
+
+    for timing, minimum, maximum in (("none", 0, 0.1), ("recorded", 0.2, 1)):
+        client = APIClient(url, cassette=Cassette(path, timing=timing))
+        elapsed = client.get("/users/1").elapsed.total_seconds()
+        logger.info(f"Replay with timing={timing} took {elapsed:.3f}s")
+        assert minimum <= elapsed < maximum
+
+
+def test_cassette_path_from_node_id() -> None:
+    """
+    Test the per-test cassette location.
+    """
+    path = cassette_path("cassettes", "src/tests/test_x.py::TestA::test_b[a b]")
+
+    assert Path(path) == Path("cassettes/src/tests/test_x/TestA/test_b[a_b].jsonl.gz")
+
+
+def test_plugin_records_then_replays(tmp_path: Path) -> None:
+    """
+    Test --cassette-mode once: the first run records, the second replays.
+
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    with MockAPIServer(records=3) as server:
+        (tmp_path / "test_sample.py").write_text(
+            "import pytest\n"
+            "from src.core.api_client import APIClient\n"
+            "@pytest.fixture(scope='session')\n"
+            "def shared_api_client():\n"
+            f"    return APIClient('{server.url}')\n"
+            "def test_get(shared_api_client):\n"
+            "    assert shared_api_client.get('/users/3').json()['id'] == 3\n"
+        )
+        env = {
+            **{
+                name: value
+                for name, value in os.environ.items()
+                if not name.startswith("PYTEST_XDIST")
+            },
+            "PYTHONPATH": str(PROJECT_ROOT),
+        }
+        command = [
+            sys.executable,
+            "-m",
+            "pytest",
+            "-q",
+            "-p",
+            "no:cacheprovider",
+            "-p",
+            "src.plugins.cassettes",
+            "--cassette-mode=once",
+            f"--cassette-dir={tmp_path / 'cassettes'}",
+            str(tmp_path / "test_sample.py"),
+        ]
+        recorded = subprocess.run(
+            command, cwd=tmp_path, env=env, capture_output=True, text=True
+        )
+    assert recorded.returncode == 0, recorded.stdout
+    assert list((tmp_path / "cassettes").rglob("*.jsonl.gz"))
+
+    # The server is stopped; only the cassette can answer now
+    replayed = subprocess.run(
+        command, cwd=tmp_path, env=env, capture_output=True, text=True
+    )
+    logger.info(f"Replayed run output:\n{replayed.stdout}")
+    assert replayed.returncode == 0, replayed.stdout
@@ -0,0 +1,165 @@
+import logging
+from pathlib import Path
+
+import pytest
+
+from src.core.config_engine import ConfigEngine, get_config, get_config_engine
+from src.core.config_manager import ConfigManager
+from src.core.exceptions.config_exceptions import ConfigError
+from src.utils import ConfigLoader
+
+
+def _write(path: Path, content: str) -> str:
+    path.write_text(content)
+    return str(path)
+
+
+def test_layers_resolve_with_includes_and_overlays(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test INI < included file < file < environment overlay < environment precedence.
+
+    :param tmp_path: Temporary directory provided by pytest
+    :param monkeypatch: Pytest fixture to patch the environment
+    """
+    _write(tmp_path / "base.ini", "[DEFAULT]\nTIMEOUT = 5\nREGION = base\n")
+    _write(tmp_path / "qa.ini", "[DEFAULT]\nREGION = qa-ini\nDEBUG = true\n")
+    _write(tmp_path / "common.json", '{"RATE_LIMIT": 10, "REGION": "common"}')
+    app = _write(
+        tmp_path / "app.yaml", "include: common.json\nRATE_LIMIT: 20\nWORKERS: 2\n"
+    )
+    _write(tmp_path / "app.qa.yaml", "WORKERS: 8\n")
+    monkeypatch.setenv("TIMEOUT", "30")
+
+    engine = ConfigEngine(env="qa", config_dir=str(tmp_path), files=[app])
+    snapshot = engine.resolve()
+
+    assert snapshot.get("TIMEOUT", int) == 30
+    assert snapshot.get("REGION") == "common"
+    assert snapshot.get("RATE_LIMIT", int) == 20
+    assert snapshot.get("WORKERS", int) == 8
+    assert snapshot.get("DEBUG", bool) is True
+    assert engine.ini_parser.get("DEFAULT", "REGION") == "qa-ini"
+    assert engine.resolve() is snapshot
+
+
+def test_missing_ini_does_not_raise(tmp_path: Path) -> None:
+    """
+    Test that a missing environment INI file is tolerated.
+
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    engine = ConfigEngine(env="nowhere", config_dir=str(tmp_path), files=[])
+
+    assert engine.resolve().get("NOT_SET", str, "fallback") == "fallback"
+    assert engine.ini_parser.defaults() == {}
+
+
+def test_circular_include_is_rejected(tmp_path: Path) -> None:
+    """
+    Test that files including each other raise a ConfigError.
+
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    _write(tmp_path / "a.json", '{"include": "b.json"}')
+    _write(tmp_path / "b.json", '{"include": "a.json"}')
+
+    engine = ConfigEngine(
+        env="dev", config_dir=str(tmp_path), files=[str(tmp_path / "a.json")]
+    )
+    with pytest.raises(ConfigError):
+        engine.resolve()
+
+
+def test_config_loader_and_settings_share_one_view() -> None:
+    """
+    Test that ConfigLoader and config/settings.py are served by the same engine.
+    """
+    from config import settings
+
+    assert settings._engine is get_config_engine()
+    assert settings.config is get_config_engine().ini_parser
+    assert ConfigLoader.get_config_value("MISSING_KEY", "default") == "default"
+
+
+def test_environment_changes_are_picked_up(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that ConfigLoader and ConfigManager see the environment as it is now,
+    and that ConfigManager resolves environment > its file > default.
+
+    :param tmp_path: Temporary directory provided by pytest
+    :param monkeypatch: Pytest fixture to patch the environment
+    """
+    monkeypatch.delenv("RATE_LIMIT", raising=False)
+    manager = ConfigManager(_write(tmp_path / "soak.json", '{"RATE_LIMIT": 10}'))
+    before = get_config()
+
+    assert manager.get_config_value("RATE_LIMIT", int) == 10
+    assert manager.get_config_value("MISSING_KEY", int, 3) == 3
+
+    monkeypatch.setenv("RATE_LIMIT", "25")
+    assert ConfigLoader.get_config_value("RATE_LIMIT") == "25"
+    assert manager.get_config_value("RATE_LIMIT", int) == 25
+    assert get_config() is before
+
+    monkeypatch.delenv("RATE_LIMIT")
+    assert ConfigLoader.get_config_value("RATE_LIMIT", "unset") == "unset"
+    assert manager.get_config_value("RATE_LIMIT", int) == 10
+
+
+def test_environment_changes_do_not_reparse_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that the files are parsed once while the environment is read live.
+
+    :param tmp_path: Temporary directory provided by pytest
+    :param monkeypatch: Pytest fixture to patch the environment
+    """
+    _write(tmp_path / "qa.ini", "[DEFAULT]\nTIMEOUT = 5\n")
+    engine = ConfigEngine(env="qa", config_dir=str(tmp_path), files=[])
+    snapshot = engine.resolve()
+    loads = []
+    monkeypatch.setattr(engine, "_load", lambda: loads.append(1))
+
+    for value in range(100):
+        monkeypatch.setenv("TIMEOUT", str(value))
+        assert engine.resolve().get("TIMEOUT", int) == value
+    monkeypatch.delenv("TIMEOUT")
+
+    assert engine.resolve() is snapshot
+    assert snapshot.get("TIMEOUT", int) == 5
+    assert loads == []
+
+
+def test_manager_logs_misses_once_and_snapshots_every_layer(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """
+    Test that a manager reports a missing key once across file reloads, and
+    that snapshot() sees the engine's layers like get_config_value does.
+
+    :param tmp_path: Temporary directory provided by pytest
+    :param monkeypatch: Pytest fixture to patch the environment
+    :param caplog: Pytest fixture capturing log records
+    """
+    config_path = _write(tmp_path / "soak.json", '{"RATE_LIMIT": 10}')
+    manager = ConfigManager(config_path)
+    monkeypatch.delenv("API_KEY", raising=False)
+
+    with caplog.at_level(logging.WARNING, logger="src.core.config_snapshot"):
+        for _ in range(3):
+            assert manager.get_config_value("MISSING_KEY", int, 3) == 3
+            manager.load_config_file(config_path)
+
+    misses = [r for r in caplog.records if r.name == "src.core.config_snapshot"]
+    assert len(misses) == 1
+    # API_KEY comes from config/<ENV>.ini, not from the manager's file
+    assert manager.snapshot().get("API_KEY") == manager.get_config_value("API_KEY", str)
+    assert manager.snapshot().get("API_KEY") is not None
+    assert manager.snapshot(defaults={"RATE_LIMIT": 1}).get("RATE_LIMIT", int) == 10
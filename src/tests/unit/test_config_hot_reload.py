@@ -0,0 +1,106 @@
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+from src.core.config_manager import ConfigManager
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _write_json(path: Path, values: Dict[str, Any]) -> None:
+    path.write_text(json.dumps(values))
+    # Move mtime forward so the change is seen on coarse-grained filesystems
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_change_is_swapped_in_and_published(tmp_path: Path) -> None:
+    """
+    Test that an edited file is reloaded and subscribers get the changed keys.
+
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    config_path = tmp_path / "soak.json"
+    _write_json(config_path, {"RATE_LIMIT": 10, "TARGET_URL": "http://a"})
+    manager = ConfigManager(str(config_path))
+    changes: List[Tuple[Dict[str, Any], Dict[str, Any], Set[str]]] = []
+    manager.subscribe(lambda old, new, changed: changes.append((old, new, changed)))
+
+    assert manager.check_for_changes() is False
+
+    _write_json(config_path, {"RATE_LIMIT": 50, "TARGET_URL": "http://a", "VU": 4})
+    assert manager.check_for_changes() is True
+
+    assert manager.get_config_value("RATE_LIMIT", int) == 50
+    old, new, changed = changes[0]
+    assert old["RATE_LIMIT"] == 10 and new["RATE_LIMIT"] == 50
+    assert changed == {"RATE_LIMIT", "VU"}
+    logger.info(f"Reload published changed keys: {changed}")
+
+
+def test_invalid_edit_keeps_last_good_config(tmp_path: Path) -> None:
+    """
+    Test that unparsable or invalid content is rejected without a swap.
+
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    config_path = tmp_path / "soak.json"
+    _write_json(config_path, {"RATE_LIMIT": 10})
+    manager = ConfigManager(
+        str(config_path), validator=lambda config: int(config["RATE_LIMIT"])
+    )
+    calls: List[Set[str]] = []
+    manager.subscribe(lambda old, new, changed: calls.append(changed))
+
+    config_path.write_text('{"RATE_LIMIT": 20,')
+    assert manager.check_for_changes() is False
+    _write_json(config_path, {"WORKERS": 3})
+    assert manager.check_for_changes() is False
+
+    assert manager.config == {"RATE_LIMIT": 10}
+    assert calls == []
+
+    _write_json(config_path, {"RATE_LIMIT": 30})
+    assert manager.check_for_changes() is True
+    assert manager.config == {"RATE_LIMIT": 30}
+
+
+def test_watcher_thread_reloads_under_concurrent_readers(tmp_path: Path) -> None:
+    """
+    Test that the polling watcher reloads while readers only ever see
+    complete configurations.
+
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    config_path = tmp_path / "soak.json"
+    _write_json(config_path, {"A": 1, "B": 1})
+    manager = ConfigManager(str(config_path))
+    reloaded = threading.Event()
+    manager.subscribe(lambda old, new, changed: reloaded.set())
+    stop = threading.Event()
+    torn_reads: List[Dict[str, Any]] = []
+
+    def reader() -> None:
+        while not stop.is_set():
+            config = manager.config
+            if config["A"] != config["B"]:
+                torn_reads.append(config)
+
+    readers = [threading.Thread(target=reader) for _ in range(4)]
+    for thread in readers:
+        thread.start()
+    manager.watch(interval=0.01)
+    try:
+        _write_json(config_path, {"A": 2, "B": 2})
+        assert reloaded.wait(timeout=5)
+    finally:
+        manager.stop_watching(timeout=5)
+        stop.set()
+        for thread in readers:
+            thread.join()
+
+    assert manager.get_config_value("A", int) == 2
+    assert torn_reads == []
@@ -0,0 +1,62 @@
+import logging
+from pathlib import Path
+
+import pytest
+
+from src.core.config_manager import ConfigManager
+from src.core.config_snapshot import ConfigSnapshot
+
+
+def test_snapshot_precedence_env_over_file_over_defaults(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that the snapshot resolves environment > config file > defaults.
+
+    :param tmp_path: Temporary directory provided by pytest
+    :param monkeypatch: Pytest fixture to patch the environment
+    """
+    config_path = tmp_path / "config.json"
+    config_path.write_text('{"RETRIES": 3, "API_BASE_URL": "http://file"}')
+    monkeypatch.setenv("API_BASE_URL", "http://env")
+
+    snapshot = ConfigManager(str(config_path)).snapshot(
+        defaults={"RETRIES": 1, "VERBOSE": "false", "TIMEOUT": "2.5"}
+    )
+
+    assert snapshot.get("API_BASE_URL") == "http://env"
+    assert snapshot.get("RETRIES", int) == 3
+    assert snapshot.get("VERBOSE", bool) is False
+    assert snapshot.get("TIMEOUT", float) == 2.5
+
+
+def test_snapshot_converts_strings_and_rejects_bad_values() -> None:
+    """
+    Test string conversion to bool/int and the TypeError on invalid values.
+    """
+    snapshot = ConfigSnapshot({"DEBUG": "True", "WORKERS": "5", "NAME": "svc"})
+
+    assert snapshot.get("DEBUG", bool) is True
+    assert snapshot.get("WORKERS", int) == 5
+    with pytest.raises(TypeError):
+        snapshot.get("NAME", int)
+
+
+def test_snapshot_is_immutable_and_logs_misses_once(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """
+    Test that snapshots cannot be modified and a missing key warns only once.
+
+    :param caplog: Pytest fixture capturing log records
+    """
+    snapshot = ConfigSnapshot({"A": "1"})
+    with pytest.raises(AttributeError):
+        snapshot.extra = 1
+
+    with caplog.at_level(logging.WARNING, logger="src.core.config_snapshot"):
+        for _ in range(100):
+            assert snapshot.get("MISSING", int, "7") == 7
+
+    assert len(caplog.records) == 1
+    assert snapshot.missed_keys == {"MISSING"}
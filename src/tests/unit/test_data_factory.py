@@ -0,0 +1,75 @@
+from pathlib import Path
+
+import pytest
+
+from src.utils.data_factory import DataFactory
+from src.utils.databases import Database, iter_records, sqlite_pool
+from src.utils.logger import get_logger
+from src.utils.schema_validator import SchemaValidator
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+
+@pytest.mark.parametrize("schema", ["user", "product"])
+def test_generated_records_match_the_schema(schema: str) -> None:
+    """
+    Test that every generated record validates against its schema.
+
+    :param schema: Schema name in schemas/
+    """
+    validator = SchemaValidator.load(schema)
+    records = list(DataFactory(schema, seed=7, chunk_size=1000).generate(5_000))
+
+    assert [record["id"] for record in records] == list(range(1, 5_001))
+    assert all(validator.is_valid(record) for record in records)
+    assert len({record["name"] for record in records}) > 50
+
+
+def test_output_does_not_depend_on_process_count(tmp_path: Path) -> None:
+    """
+    Test that a seed gives the same file with one or several processes, and a
+    different one with another seed.
+
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    single, parallel, other = (tmp_path / name for name in ("1.csv", "2.csv", "o.csv"))
+    DataFactory("user", seed=3, chunk_size=500).to_csv(str(single), 2_000, processes=1)
+    DataFactory("user", seed=3, chunk_size=500).to_csv(
+        str(parallel), 2_000, processes=2
+    )
+    DataFactory("user", seed=4, chunk_size=500).to_csv(str(other), 2_000, processes=1)
+
+    assert single.read_text() == parallel.read_text()
+    assert single.read_text() != other.read_text()
+    assert single.read_text().startswith("id,name,email,age\n1,")
+
+
+def test_jsonl_and_database_sinks(tmp_path: Path) -> None:
+    """
+    Test the JSON Lines sink and bulk loading into SQLite.
+
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    factory = DataFactory("product", seed=1, chunk_size=1_000)
+    path = tmp_path / "products.jsonl"
+    factory.to_jsonl(str(path), 2_500, processes=1)
+    pool = sqlite_pool(str(tmp_path / "factory.db"))
+    database = Database(pool)
+
+    report = factory.to_database(database, "products", 2_500, processes=1)
+
+    assert list(iter_records(str(path))) == list(factory.generate(2_500))
+    assert report.rows == 2_500
+    assert database.fetch_value('SELECT MIN(price) FROM "products"') >= 0
+    pool.close()
+
+
+def test_unsupported_properties_fail_early() -> None:
+    """
+    Test that nested properties are rejected when the factory is created.
+    """
+    schema = {"type": "object", "properties": {"tags": {"type": "array"}}}
+
+    with pytest.raises(ValueError, match="tags"):
+        DataFactory(schema)
@@ -0,0 +1,153 @@
+import importlib.util
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.utils.databases import (
+    Database,
+    PoolTimeoutError,
+    create_pool,
+    postgres_pool,
+    sqlite_pool,
+)
+from src.utils.logger import get_logger
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+
+# Tables of the shared database fixture (src/tests/unit/conftest.py)
+DATABASE_SCHEMA = [
+    "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT)",
+]
+
+
+def test_checks_reuse_pooled_connections(database: Database) -> None:
+    """
+    Test that many checks share one connection instead of opening new ones.
+
+    :param database: Database helper
+    """
+    database.execute(
+        "INSERT INTO users (name, email) VALUES (?, ?)", ("Ann", "ann@example.com")
+    )
+    started = time.perf_counter()
+    for _ in range(200):
+        row = database.fetch_one("SELECT * FROM users WHERE name = ?", ("Ann",))
+    elapsed = time.perf_counter() - started
+    logger.info(f"200 pooled lookups took {elapsed * 1000:.1f} ms")
+
+    assert row == {"id": 1, "name": "Ann", "email": "ann@example.com"}
+    assert database.pool.stats["created"] == 1
+
+
+def test_executemany_batches_a_generator(database: Database) -> None:
+    """
+    Test that executemany consumes an iterator in batches in one transaction.
+
+    :param database: Database helper
+    """
+    rows = ((f"user {index}", f"user{index}@example.com") for index in range(10_000))
+
+    inserted = database.executemany(
+        "INSERT INTO users (name, email) VALUES (?, ?)", rows, batch_size=999
+    )
+
+    assert inserted == 10_000
+    assert database.fetch_value("SELECT COUNT(*) FROM users") == 10_000
+
+
+def test_fetch_iter_streams_and_releases(database: Database) -> None:
+    """
+    Test that fetch_iter yields every row and gives its connection back.
+
+    :param database: Database helper
+    """
+    database.executemany(
+        "INSERT INTO users (name) VALUES (?)", ((str(i),) for i in range(2_500))
+    )
+    rows = database.fetch_iter("SELECT id FROM users ORDER BY id", batch_size=1000)
+
+    assert next(rows) == {"id": 1}
+    assert database.pool.stats["in_use"] == 1
+    assert sum(1 for _ in rows) == 2_499
+    assert database.pool.stats["in_use"] == 0
+
+
+def test_transaction_rolls_back_on_error(database: Database) -> None:
+    """
+    Test that a failing transaction leaves no rows behind.
+
+    :param database: Database helper
+    """
+    with pytest.raises(RuntimeError):
+        with database.transaction() as connection:
+            connection.execute("INSERT INTO users (name) VALUES ('ghost')")
+            raise RuntimeError("boom")
+
+    assert database.fetch_value("SELECT COUNT(*) FROM users") == 0
+
+
+def test_pool_limits_and_waits(tmp_path: Path) -> None:
+    """
+    Test that checkouts beyond max_size wait for a release or time out.
+
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    pool = sqlite_pool(str(tmp_path / "limit.db"), max_size=1, timeout=0.1)
+    connection = pool.acquire()
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
+
+    threading.Timer(0.05, pool.release, args=(connection,)).start()
+    with pool.connection(timeout=2) as reused:
+        assert reused is connection
+    assert pool.stats["waited"] >= 1
+    pool.close()
+
+
+def test_dead_connection_is_replaced(tmp_path: Path) -> None:
+    """
+    Test that a connection failing its ping is discarded on checkout.
+
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    pool = sqlite_pool(str(tmp_path / "ping.db"), ping_interval=0)
+    with pool.connection() as connection:
+        pass
+    connection.close()
+
+    with pool.connection() as replacement:
+        assert replacement.execute("SELECT 1").fetchone() == (1,)
+    assert pool.stats["created"] == 2
+    assert pool.stats["discarded"] == 1
+    pool.close()
+
+
+def test_create_pool_from_url(tmp_path: Path) -> None:
+    """
+    Test URL dispatch and the error for unknown schemes.
+
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    pool = create_pool(f"sqlite:///{tmp_path / 'url.db'}")
+
+    assert pool.driver == "sqlite3"
+    assert Database(pool).fetch_value("SELECT 41 + 1") == 42
+    with pytest.raises(ValueError):
+        create_pool("mysql://localhost/db")
+    pool.close()
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("psycopg") or importlib.util.find_spec("psycopg2"),
+    reason="a PostgreSQL driver is installed",
+)
+def test_postgres_pool_requires_a_driver() -> None:
+    """
+    Test the error raised when no PostgreSQL driver is installed.
+    """
+    with pytest.raises(RuntimeError, match="psycopg"):
+        postgres_pool("postgresql://localhost/test")
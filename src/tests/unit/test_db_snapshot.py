@@ -0,0 +1,130 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from src.utils.databases import Database, SQLiteSnapshot, TransactionalSession
+from src.utils.logger import get_logger
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+
+SAMPLE_SUITE = """
+def test_api_write_is_undone(db_restore):
+    db_restore.execute("INSERT INTO users (name) VALUES ('from api')")
+
+
+def test_transactional_write_is_undone(db_transaction):
+    db_transaction.execute("INSERT INTO users (name) VALUES ('from test')")
+    assert db_transaction.fetch_value("SELECT COUNT(*) FROM users") == 2
+
+
+def test_state_is_clean(database):
+    assert database.fetch_value("SELECT COUNT(*) FROM users") == 1
+"""
+
+
+# Tables of the shared database fixture (src/tests/unit/conftest.py), with
+# one seeded user
+DATABASE_SCHEMA = [
+    "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)",
+    "INSERT INTO users (name) VALUES ('seed')",
+]
+
+
+def test_sqlite_snapshot_restores_rows_and_tables(database: Database) -> None:
+    """
+    Test that restore brings back the snapshot state, including dropped tables.
+
+    :param database: Database with a seeded user
+    """
+    snapshot = SQLiteSnapshot(database.pool)
+    snapshot.take()
+    database.executemany(
+        "INSERT INTO users (name) VALUES (?)", ((str(i),) for i in range(5000))
+    )
+    database.execute("CREATE TABLE orders (id INTEGER PRIMARY KEY)")
+
+    snapshot.restore()
+
+    assert database.fetch_value("SELECT COUNT(*) FROM users") == 1
+    assert (
+        database.fetch_one("SELECT name FROM sqlite_master WHERE name = 'orders'")
+        is None
+    )
+    snapshot.close()
+
+
+def test_sqlite_snapshot_file_is_reusable(database: Database, tmp_path: Path) -> None:
+    """
+    Test that a snapshot saved to a file restores through a new snapshot object.
+
+    :param database: Database with a seeded user
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    path = str(tmp_path / "seed.snapshot.db")
+    first = SQLiteSnapshot(database.pool, path)
+    first.take()
+    first.close()
+    database.execute("DELETE FROM users")
+
+    SQLiteSnapshot(database.pool, path).restore()
+
+    assert database.fetch_value("SELECT name FROM users") == "seed"
+
+
+def test_transactional_session_nests_savepoints(database: Database) -> None:
+    """
+    Test module-level seeding with per-test savepoints, none of it committed.
+
+    :param database: Database with a seeded user
+    """
+    with TransactionalSession(database.pool) as session:
+        session.database.execute("INSERT INTO users (name) VALUES ('module seed')")
+        for name in ("first test", "second test"):
+            with session.savepoint() as scoped:
+                scoped.execute("INSERT INTO users (name) VALUES (?)", (name,))
+                assert scoped.fetch_value("SELECT COUNT(*) FROM users") == 3
+        assert session.database.fetch_value("SELECT COUNT(*) FROM users") == 2
+
+    assert database.fetch_value("SELECT COUNT(*) FROM users") == 1
+
+
+def test_fixtures_isolate_tests(database: Database, tmp_path: Path) -> None:
+    """
+    Test db_restore and db_transaction in a suite run in a subprocess.
+
+    :param database: Database with a seeded user
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    (tmp_path / "test_sample.py").write_text(SAMPLE_SUITE)
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "-q",
+            "-p",
+            "no:cacheprovider",
+            "-p",
+            "src.tests.database_fixtures",
+            str(tmp_path / "test_sample.py"),
+        ],
+        cwd=tmp_path,
+        env={
+            **{
+                name: value
+                for name, value in os.environ.items()
+                if not name.startswith("PYTEST_XDIST")
+            },
+            "PYTHONPATH": str(PROJECT_ROOT),
+            "DATABASE_URL": f"sqlite:///{database.pool.name}",
+        },
+        capture_output=True,
+        text=True,
+    )
+    logger.info(f"Sample suite output:\n{result.stdout}")
+
+    assert result.returncode == 0, result.stdout + result.stderr
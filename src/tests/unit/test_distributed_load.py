@@ -0,0 +1,112 @@
+import multiprocessing
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.load import LoadCoordinator, LoadEngine, LoadProfile, LoadWorker
+from src.utils.logger import get_logger
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+SCENARIO_PATH = "src.tests.unit.test_load_engine:fake_scenario"
+
+
+def run_node(port: int, processes: int, clock_skew: float = 0.0) -> None:
+    """
+    Run a load node in a child process, optionally with a skewed wall clock.
+
+    :param port: Coordinator port
+    :param processes: Worker processes of the node
+    :param clock_skew: Seconds added to time.time() on this node
+    """
+    real_time = time.time
+    with patch("time.time", lambda: real_time() + clock_skew):
+        LoadWorker("127.0.0.1", port, processes=processes).run()
+
+
+@pytest.fixture
+def start_nodes():
+    """
+    Start load nodes as local processes and stop any left running.
+
+    :return: Function taking the coordinator port and (processes, clock_skew)
+        tuples, returning the started processes
+    """
+    started = []
+
+    def start(port: int, *nodes: tuple) -> list:
+        # Not daemonic, since nodes with several processes start their own
+        processes = [
+            multiprocessing.Process(target=run_node, args=(port, *node))
+            for node in nodes
+        ]
+        for process in processes:
+            process.start()
+        started.extend(processes)
+        return processes
+
+    yield start
+    for process in started:
+        process.join(timeout=10)
+        if process.is_alive():
+            process.terminate()
+
+
+def test_coordinator_merges_reports_of_skewed_nodes(start_nodes) -> None:
+    """
+    Test that nodes whose clocks disagree by an hour run one synchronized load.
+
+    :param start_nodes: Fixture starting load nodes as local processes
+    """
+    engine = LoadEngine(
+        SCENARIO_PATH, "http://localhost:5000", LoadProfile.constant(120, 1.0), "open"
+    )
+    coordinator = LoadCoordinator(engine, nodes=2, start_delay=1.0)
+    nodes = start_nodes(coordinator.address[1], (1, 3600.0), (2, -3600.0))
+
+    started = time.perf_counter()
+    report = coordinator.run()
+    elapsed = time.perf_counter() - started
+    for node in nodes:
+        node.join(timeout=10)
+    logger.info(f"Distributed run took {elapsed:.2f}s: {report.summary()['total']}")
+
+    assert all(node.exitcode == 0 for node in nodes)
+    # 120 arrivals/s for 1s, split over 3 worker processes on 2 nodes
+    assert 100 <= report.total().requests <= 130
+    assert report.tasks["failing"].errors["RuntimeError"] > 0
+    # Neither waited for its skewed clock nor started before the barrier
+    assert elapsed < 10
+    assert 0.9 <= report.duration <= 1.5
+
+
+def test_failing_node_fails_the_run(start_nodes) -> None:
+    """
+    Test that an error on a node is reported by the coordinator.
+
+    :param start_nodes: Fixture starting load nodes as local processes
+    """
+    engine = LoadEngine(
+        "src.load.scenarios:missing",
+        "http://localhost:5000",
+        LoadProfile.constant(1, 0.1),
+    )
+    coordinator = LoadCoordinator(engine, nodes=1, start_delay=0.1)
+    start_nodes(coordinator.address[1], (1,))
+
+    with pytest.raises(RuntimeError, match="failed"):
+        coordinator.run()
+
+
+def test_coordinator_times_out_waiting_for_nodes() -> None:
+    """
+    Test that the coordinator gives up when too few nodes join.
+    """
+    engine = LoadEngine(
+        SCENARIO_PATH, "http://localhost:5000", LoadProfile.constant(1, 0.1)
+    )
+
+    with pytest.raises(RuntimeError, match="0 of 1"):
+        LoadCoordinator(engine, nodes=1, join_timeout=0.2).run()
@@ -0,0 +1,66 @@
+import json
+import os
+import subprocess
+import sys
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..")
+)
+
+# Modules that importing src.utils must not pull in
+HEAVY_MODULES = ("paramiko", "asyncio", "csv", "socket", "dotenv", "requests")
+
+
+def _run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "PYTHONPATH": PROJECT_ROOT},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_package_import_is_lazy() -> None:
+    """
+    Test that importing src.utils does not import heavy optional modules.
+    """
+    result = _run_python(
+        "import json, sys, src.utils; print(json.dumps(sorted(sys.modules)))"
+    )
+    loaded = set(json.loads(result.stdout))
+
+    assert [module for module in HEAVY_MODULES if module in loaded] == []
+
+
+def test_exports_resolve_on_access() -> None:
+    """
+    Test that lazy exports resolve to the real classes and are cached.
+    """
+    import src.utils
+    from src.utils.network.udp_utils import UDPSender
+
+    assert src.utils.UDPSender is UDPSender
+    assert "UDPSender" in vars(src.utils)
+    assert set(src.utils.__all__) <= set(dir(src.utils))
+
+
+def test_logger_setup_is_deferred() -> None:
+    """
+    Test that the logger neither prints nor opens its log file until used.
+    """
+    result = _run_python(
+        "import logging\n"
+        "from src.utils.logger import get_logger\n"
+        "get_logger('probe')\n"
+        "handlers = [h for h in logging.getLogger().handlers"
+        " if isinstance(h, logging.FileHandler)]\n"
+        "print(all(h.stream is None for h in handlers))\n"
+    )
+
+    assert result.stdout.strip() == "True"
@@ -0,0 +1,123 @@
+import copy
+
+from src.utils.data_factory import DataFactory
+from src.utils.file.csv_file_manager import CsvFileManager
+from src.utils.json_diff import ADDED, CHANGED, INVALID, REMOVED, JsonDiff, diff_json
+from src.utils.logger import get_logger
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+
+def test_keyed_lists_report_field_level_changes() -> None:
+    """
+    Test that lists of objects are aligned by id, not by position.
+    """
+    expected = [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}, {"id": 3}]
+    actual = [{"id": 4}, {"id": 2, "name": "B"}, {"id": 1, "name": "a"}]
+
+    result = diff_json(expected, actual)
+
+    assert [(d.path, d.kind) for d in result] == [
+        ("$[id=2].name", CHANGED),
+        ("$[id=3]", REMOVED),
+        ("$[id=4]", ADDED),
+    ]
+
+
+def test_unkeyed_lists_align_by_content() -> None:
+    """
+    Test that an insertion in a list without keys is one difference.
+    """
+    expected = [{"n": index} for index in range(50)]
+    actual = expected[:10] + [{"n": -1}] + expected[10:]
+
+    result = diff_json({"items": expected}, {"items": actual}, key=None)
+
+    assert [(d.path, d.kind) for d in result] == [("$.items[10]", ADDED)]
+
+
+def test_booleans_never_equal_numbers() -> None:
+    """
+    Test that true/false are reported against 1/0 while 1 still equals 1.0.
+    """
+    assert [(d.path, d.kind) for d in diff_json({"active": True}, {"active": 1})] == [
+        ("$.active", CHANGED)
+    ]
+    assert [d.path for d in diff_json([0, 1], [False, True], key=None)] == [
+        "$[0]",
+        "$[1]",
+    ]
+    assert [(d.path, d.kind) for d in diff_json([{"id": 1}], [{"id": True}])] == [
+        ("$[0].id", CHANGED)
+    ]
+    assert diff_json({"total": 1, "items": [2]}, {"items": [2.0], "total": 1.0}).equal
+
+
+def test_ignore_and_tolerance_rules() -> None:
+    """
+    Test that ignored paths and numbers within tolerance are not reported.
+    """
+    expected = {"meta": {"updated_at": "2024"}, "items": [{"id": 1, "price": 9.99}]}
+    actual = {"meta": {"updated_at": "2025"}, "items": [{"id": 1, "price": 9.994}]}
+
+    differ = JsonDiff(ignore=["*.updated_at"], tolerance={"$.items[*].price": 0.01})
+
+    assert differ.compare(expected, actual).equal
+    assert not JsonDiff().compare(expected, actual).equal
+
+
+def test_output_is_bounded() -> None:
+    """
+    Test that the walk stops at max_differences and values are shortened.
+    """
+    expected = {f"k{index}": "x" * 500 for index in range(1_000)}
+    actual = {key: "y" * 500 for key in expected}
+
+    result = diff_json(expected, actual, max_differences=5)
+    report = result.format(width=40)
+    logger.debug(report)
+
+    assert len(result) == 5 and result.truncated
+    assert report.startswith("5+ difference(s):")
+    assert max(len(line) for line in report.splitlines()) < 120
+
+
+def test_schema_and_fixture_file_integration(tmp_path) -> None:
+    """
+    Test a diff built from a schema against a CSV fixture.
+
+    :param tmp_path: Pytest temporary directory
+    """
+    fixture = str(tmp_path / "products.csv")
+    products = [
+        {"id": 1, "name": "Pen", "description": "Blue", "price": 1.5, "stock": 3},
+        {"id": 2, "name": "Cup", "description": "Red", "price": 4.0, "stock": 0},
+    ]
+    CsvFileManager.save_csv_data(fixture, products, list(products[0]))
+    actual = copy.deepcopy(products)
+    actual[0]["price"] = 1.5001
+    actual[1]["stock"] = "none"
+
+    result = JsonDiff.from_schema("product", tolerance=0.01).compare_file(
+        fixture, actual
+    )
+
+    assert [(d.path, d.kind) for d in result] == [
+        ("$[1]", INVALID),
+        ("$[id=2].stock", CHANGED),
+    ]
+
+
+def test_large_keyed_documents_report_the_one_change() -> None:
+    """
+    Test that a large keyed diff reports only the changed leaf. Its speed is
+    tracked by the json.diff benchmark.
+    """
+    expected = list(DataFactory("product", seed=1).generate(20_000))
+    actual = copy.deepcopy(expected)
+    actual[12_000]["price"] += 5
+
+    result = diff_json(expected, actual)
+
+    assert [d.path for d in result] == ["$[id=12001].price"]
@@ -0,0 +1,112 @@
+import time
+
+import pytest
+
+from src.load import LoadEngine, LoadProfile, Scenario
+from src.utils.logger import get_logger
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+SCENARIO_PATH = "src.tests.unit.test_load_engine:fake_scenario"
+
+
+def fake_scenario(base_url: str) -> Scenario:
+    """
+    Scenario without network calls: one fast task and one failing task.
+
+    :param base_url: Base URL of the system under test (unused)
+    :return: The fake scenario
+    """
+    scenario = Scenario("fake", base_url)
+
+    @scenario.task(weight=3)
+    def fast(context) -> None:
+        time.sleep(0.001)
+
+    @scenario.task(weight=1)
+    def failing(context) -> None:
+        raise RuntimeError("boom")
+
+    return scenario
+
+
+def test_load_profile_ramp_interpolates() -> None:
+    """
+    Test that a ramp profile interpolates up, holds and ends at zero.
+    """
+    profile = LoadProfile.ramp(target=10, ramp_up=2, hold=3)
+
+    assert profile.duration == 5
+    assert profile.value_at(1) == pytest.approx(5)
+    assert profile.value_at(4) == 10
+    assert profile.value_at(6) == 0
+
+
+def test_closed_model_records_successes_and_errors() -> None:
+    """
+    Test that the closed model runs virtual users and groups errors by type.
+    """
+    report = LoadEngine(
+        SCENARIO_PATH,
+        "http://localhost:5000",
+        LoadProfile.constant(4, 0.5),
+        model="closed",
+        seed=7,
+    ).run()
+    summary = report.summary()
+    logger.info(f"Closed model summary: {summary['total']}")
+
+    assert report.tasks["fast"].successes > 0
+    assert report.tasks["failing"].errors["RuntimeError"] > 0
+    assert 0 < summary["total"]["error_rate"] < 1
+
+
+def test_open_model_follows_arrival_rate() -> None:
+    """
+    Test that the open model issues roughly rate * duration arrivals.
+    """
+    report = LoadEngine(
+        SCENARIO_PATH,
+        "http://localhost:5000",
+        LoadProfile.constant(200, 0.5),
+        model="open",
+    ).run()
+
+    assert 80 <= report.total().requests <= 110
+    assert report.dropped == 0
+
+
+def test_open_model_ramp_schedules_its_area() -> None:
+    """
+    Test that arrivals during a ramp from zero follow the integrated rate,
+    i.e. target / 2 per second of ramp, rather than the rate at its start.
+    """
+    profile = LoadProfile.ramp(target=100, ramp_up=1.0, hold=0)
+    scheduled = 0
+    while profile.time_of_arrival(scheduled) < profile.duration:
+        scheduled += 1
+    assert scheduled == 50
+    assert profile.time_of_arrival(25) == pytest.approx(2**-0.5)
+
+    report = LoadEngine(
+        SCENARIO_PATH, "http://localhost:5000", profile, model="open"
+    ).run()
+
+    assert 45 <= report.total().requests <= 50
+    assert report.dropped == 0
+
+
+def test_worker_processes_merge_reports() -> None:
+    """
+    Test that results from several worker processes are merged into one report.
+    """
+    report = LoadEngine(
+        SCENARIO_PATH,
+        "http://localhost:5000",
+        LoadProfile.constant(100, 0.5),
+        model="open",
+        workers=2,
+    ).run()
+
+    assert 40 <= report.total().requests <= 60
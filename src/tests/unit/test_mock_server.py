@@ -0,0 +1,154 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from src.core.api_client import APIClient
+from src.mock_server import FaultConfig, MockAPIServer
+from src.services.product_service import ProductService
+from src.services.user_service import UserService
+from src.utils.logger import get_logger
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+
+@pytest.fixture
+def server() -> MockAPIServer:
+    """
+    Private mock server, so fault settings and writes do not leak into the
+    session-wide one.
+    """
+    with MockAPIServer(records=10) as mock_server:
+        yield mock_server
+
+
+def test_user_crud_through_service(mock_api_server: MockAPIServer) -> None:
+    """
+    Test create, read, update and delete of a user over the real transport.
+
+    :param mock_api_server: Session-wide in-process mock API
+    """
+    client = APIClient(mock_api_server.url)
+    service = UserService(client)
+
+    created = service.create_user(
+        {"name": "Jane Roe", "email": "jane@example.com", "age": 41}
+    ).json()
+    logger.info(f"Created user: {created}")
+    assert service.get_user(created["id"]).json()["name"] == "Jane Roe"
+
+    updated = service.update_user(created["id"], {"age": 42}).json()
+    assert updated == {**created, "age": 42}
+
+    assert service.delete_user(created["id"]).status_code == 200
+    # Not through APIClient: its retries would wait on the 404
+    response = requests.get(f"{mock_api_server.url}/users/{created['id']}")
+    assert response.status_code == 404
+    client.close()
+
+
+def test_writes_are_validated_against_schemas(server: MockAPIServer) -> None:
+    """
+    Test that records violating schemas/ are rejected with a 400.
+
+    :param server: Private mock server
+    """
+    response = requests.post(
+        f"{server.url}/products", json={"name": "Lamp", "price": -1}
+    )
+    logger.info(f"Invalid product response: {response.json()}")
+
+    assert response.status_code == 400
+    assert any("stock" in detail for detail in response.json()["details"])
+    assert ProductService(APIClient(server.url)).get_product(10).status_code == 200
+    assert len(requests.get(f"{server.url}/products").json()) == 10
+
+
+def test_error_injection(server: MockAPIServer) -> None:
+    """
+    Test the configured error rate and the per-request status override.
+
+    :param server: Private mock server
+    """
+    server.faults = FaultConfig(error_rate=0.5, error_status=502)
+    session = requests.Session()
+    statuses = [session.get(f"{server.url}/users/1").status_code for _ in range(200)]
+
+    assert set(statuses) == {200, 502}
+    assert 60 < statuses.count(502) < 140
+    assert server.stats["injected_errors"] == statuses.count(502)
+
+    server.faults = FaultConfig()
+    forced = session.get(f"{server.url}/users/1", headers={"X-Mock-Status": "504"})
+    assert forced.status_code == 504
+
+
+def test_bad_control_headers_and_handler_errors_get_a_response(
+    server: MockAPIServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that malformed control headers get a 400 and a failing handler a 500,
+    and that the server keeps serving afterwards.
+
+    :param server: Private mock server
+    :param monkeypatch: Pytest monkeypatch fixture
+    """
+    session = requests.Session()
+    for headers in (
+        {"X-Mock-Status": "abc"},
+        {"X-Mock-Status": "99"},
+        {"X-Mock-Latency-Ms": "slow"},
+        {"X-Mock-Latency-Ms": "inf"},
+    ):
+        response = session.get(f"{server.url}/users/1", headers=headers)
+        assert response.status_code == 400
+        assert "header" in response.json()["error"]
+
+    def failing_dispatch(*args, **kwargs):
+        raise KeyError("boom")
+
+    monkeypatch.setattr(server, "_dispatch", failing_dispatch)
+    response = session.get(f"{server.url}/users/1")
+    assert response.status_code == 500
+    assert "KeyError" in response.json()["error"]
+
+    monkeypatch.undo()
+    assert session.get(f"{server.url}/users/1").status_code == 200
+
+
+def test_latency_does_not_serialize_requests(server: MockAPIServer) -> None:
+    """
+    Test that injected latency overlaps across concurrent connections.
+
+    :param server: Private mock server
+    """
+    server.faults = FaultConfig(latency=0.2)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(20) as executor:
+        statuses = list(
+            executor.map(
+                lambda _: requests.get(f"{server.url}/users/1").status_code, range(20)
+            )
+        )
+    elapsed = time.perf_counter() - started
+    logger.info(f"20 concurrent requests with 200 ms latency took {elapsed:.3f}s")
+
+    assert statuses == [200] * 20
+    assert 0.2 <= elapsed < 1.5
+
+
+def test_reset_restores_seed_data(server: MockAPIServer) -> None:
+    """
+    Test that reset() brings back deleted records and clears the stats.
+
+    :param server: Private mock server
+    """
+    requests.delete(f"{server.url}/users/1")
+    assert requests.get(f"{server.url}/users/1").status_code == 404
+
+    server.reset()
+
+    assert requests.get(f"{server.url}/users/1").status_code == 200
+    assert server.stats["requests"] == 1
@@ -0,0 +1,125 @@
+import copy
+import json
+import pickle
+import tracemalloc
+from array import array
+from unittest.mock import patch
+
+import pytest
+
+from src.core.api_client import APIClient
+from src.mock_server import MockAPIServer
+from src.models import ApiResponse, ModelCollection, Product, User
+from src.services.product_service import ProductService
+from src.services.user_service import UserService
+from src.utils.data_factory import DataFactory
+from src.utils.logger import get_logger
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+
+def test_models_are_slotted_and_keep_unknown_fields() -> None:
+    """
+    Test that models have no per-instance dict and keep undeclared fields.
+    """
+    user = User.from_dict(
+        {
+            "id": 1,
+            "name": "Ann",
+            "email": "ann@example.com",
+            "age": 30,
+            "address": {"city": "Gwenborough"},
+        }
+    )
+
+    assert not hasattr(user, "__dict__")
+    assert user.extra == {"address": {"city": "Gwenborough"}}
+    assert user.to_dict()["address"]["city"] == "Gwenborough"
+    with pytest.raises(ValueError, match="age"):
+        User.from_dict({"id": 1, "name": "Ann", "email": "ann@example.com"})
+
+
+def test_service_response_decodes_json_once(mock_api_server: MockAPIServer) -> None:
+    """
+    Test that json(), model and repeated access share a single decode.
+
+    :param mock_api_server: Session-wide in-process mock API
+    """
+    response = UserService(APIClient(mock_api_server.url)).get_user(1)
+
+    with patch.object(
+        response.response, "json", wraps=response.response.json
+    ) as decode:
+        logger.debug(f"Response received: {response.status_code}, {response.json()}")
+        assert response.json() is response.json()
+        assert response.model.id == 1
+        assert response.model is response.model
+    assert decode.call_count == 1
+    assert isinstance(response, ApiResponse)
+    assert response.headers["Content-Type"] == "application/json"
+
+
+def test_service_response_can_be_copied_and_pickled(
+    mock_api_server: MockAPIServer,
+) -> None:
+    """
+    Test that copy, deepcopy and pickle work on the response wrapper.
+
+    :param mock_api_server: Session-wide in-process mock API
+    """
+    response = UserService(APIClient(mock_api_server.url)).get_user(1)
+    response.json()
+
+    for clone in (
+        copy.copy(response),
+        copy.deepcopy(response),
+        pickle.loads(pickle.dumps(response)),
+    ):
+        assert clone.status_code == response.status_code
+        assert clone.model.id == 1
+        assert clone.headers["Content-Type"] == "application/json"
+    with pytest.raises(AttributeError):
+        response._missing
+
+
+def test_list_results_are_columnar(mock_api_server: MockAPIServer) -> None:
+    """
+    Test the columnar collection returned for list endpoints.
+
+    :param mock_api_server: Session-wide in-process mock API
+    """
+    products = ProductService(APIClient(mock_api_server.url)).list_products().models
+
+    assert isinstance(products, ModelCollection)
+    assert isinstance(products.column("price"), array)
+    assert len(products) == len(products.column("id")) > 0
+    first = products[0]
+    assert isinstance(first, Product)
+    assert products.find(id=first.id) == first
+    assert products[-1] == list(products)[-1]
+    cheap = products.filter("price", lambda price: price < 100)
+    assert all(product.price < 100 for product in cheap)
+    assert products.where(id=-1)[:5].to_dicts() == []
+
+
+def test_columnar_collection_uses_less_memory() -> None:
+    """
+    Test that a large collection takes much less memory than decoded dicts.
+    """
+    body = json.dumps(list(DataFactory("product", seed=1).generate(50_000)))
+
+    tracemalloc.start()
+    records = json.loads(body)
+    as_dicts = tracemalloc.get_traced_memory()[0]
+    products = ModelCollection.from_records(Product, records)
+    del records
+    as_columns = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    logger.info(
+        f"50k products: {as_dicts / 1e6:.1f} MB as dicts, "
+        f"{as_columns / 1e6:.1f} MB as columns"
+    )
+
+    assert len(products) == 50_000
+    assert as_columns < as_dicts * 0.7
@@ -6,6 +6,7 @@ import pytest
 import responses
 from jsonschema import ValidationError, validate
 
+from src.core.api_client import APIClient
 from src.services.product_service import ProductService
 from src.utils.logger import get_logger
 
@@ -21,14 +22,17 @@ with open(schema_path, "r") as f:
 
 
 @pytest.fixture(scope="module")
-def product_service() -> Generator[ProductService, None, None]:
+def product_service(
+    shared_api_client: APIClient,
+) -> Generator[ProductService, None, None]:
     """
     Fixture to initialize ProductService instance.
 
+    :param shared_api_client: The worker's session-scoped API client
     :return: Initialized ProductService instance
     """
     logger.info("Initializing ProductService instance")
-    yield ProductService()
+    yield ProductService(shared_api_client)
 
 
 @responses.activate
@@ -0,0 +1,164 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+from src.plugins.profiling import (
+    StackSampler,
+    build_profile_report,
+    diff_reports,
+    render_html,
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..")
+)
+
+SAMPLE_SUITE = """
+import time
+
+import pytest
+
+from src.utils.tracing import TRACER
+
+
+@pytest.fixture
+def slow_fixture():
+    time.sleep(0.05)
+    yield
+
+
+def test_network_wait(slow_fixture):
+    with TRACER.span("GET /users/{id}", "http"):
+        time.sleep(0.1)
+
+
+def test_fast():
+    pass
+"""
+
+
+def _record(nodeid: str, wall: float, fixture_wall: float = 0.0) -> Dict[str, Any]:
+    return {
+        "nodeid": nodeid,
+        "outcome": "passed",
+        "wall": wall,
+        "cpu": wall / 2,
+        "phases": {
+            "setup": {"wall": fixture_wall, "cpu": 0.0},
+            "call": {"wall": wall - fixture_wall, "cpu": wall / 2},
+            "teardown": {"wall": 0.0, "cpu": 0.0},
+        },
+        "fixtures": {"db": {"scope": "function", "wall": fixture_wall, "cpu": 0.0}},
+        "calls": {"http": {"count": 2, "wall": wall / 4}},
+        "log_records": 3,
+    }
+
+
+def test_report_ranks_tests_and_aggregates() -> None:
+    """
+    Test that tests are ranked by wall time and fixtures/calls are summed.
+    """
+    report = build_profile_report(
+        [_record("t::fast", 0.1, 0.05), _record("t::slow", 2.0, 0.5)]
+    )
+
+    assert [test["nodeid"] for test in report["tests"]] == ["t::slow", "t::fast"]
+    assert report["tests"][0]["rank"] == 1
+    assert report["fixtures"][0]["count"] == 2
+    assert abs(report["fixtures"][0]["wall"] - 0.55) < 1e-9
+    assert report["calls"]["http"]["count"] == 4
+    assert report["totals"]["log_records"] == 6
+    assert "t::slow" in render_html(report)
+
+
+def test_diff_flags_regressions_above_threshold() -> None:
+    """
+    Test that only slowdowns above the relative and absolute limits regress.
+    """
+    baseline = build_profile_report(
+        [_record("t::a", 1.0), _record("t::b", 0.01), _record("t::gone", 1.0)]
+    )
+    current = build_profile_report(
+        [_record("t::a", 1.5), _record("t::b", 0.03), _record("t::new", 1.0)]
+    )
+
+    diff = diff_reports(baseline, current, threshold=0.2, min_delta=0.05)
+
+    assert [entry["name"] for entry in diff["regressions"]] == ["t::a"]
+    assert diff["added"] == ["t::new"]
+    assert diff["removed"] == ["t::gone"]
+
+
+def test_stack_sampler_sees_the_waiting_function() -> None:
+    """
+    Test that the sampler records stacks of the target thread.
+    """
+
+    def waiting_function() -> None:
+        time.sleep(0.1)
+
+    sampler = StackSampler(threading.get_ident(), interval=0.002)
+    sampler.start()
+    waiting_function()
+    samples = sampler.stop()
+
+    assert any("waiting_function" in stack for stack in samples)
+
+
+def test_plugin_writes_ranked_report(tmp_path: Path) -> None:
+    """
+    Test the plugin end to end on a small suite run in a subprocess.
+
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    (tmp_path / "test_sample.py").write_text(SAMPLE_SUITE)
+    profile_dir = tmp_path / "profile"
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "-q",
+            "-p",
+            "src.plugins.profiling",
+            "-p",
+            "no:cacheprovider",
+            "--profile-tests",
+            "--profile-sample=1",
+            f"--profile-dir={profile_dir}",
+            str(tmp_path / "test_sample.py"),
+        ],
+        cwd=tmp_path,
+        # Under xdist the inherited worker variables would make the child
+        # behave like a worker and leave the report to a missing controller
+        env={
+            **{
+                name: value
+                for name, value in os.environ.items()
+                if not name.startswith("PYTEST_XDIST")
+            },
+            "PYTHONPATH": PROJECT_ROOT,
+        },
+        capture_output=True,
+        text=True,
+    )
+    logger.info(f"Profiled suite output:\n{result.stdout}")
+    assert result.returncode == 0, result.stdout
+
+    (json_path,) = profile_dir.glob("profile_*.json")
+    report = json.loads(json_path.read_text())
+    slowest = report["tests"][0]
+
+    assert slowest["nodeid"].endswith("test_network_wait")
+    assert slowest["fixtures"]["slow_fixture"]["wall"] >= 0.05
+    assert slowest["calls"]["http"]["wall"] >= 0.1
+    assert list(report["profiles"]) == [slowest["nodeid"]]
+    assert list(profile_dir.glob("profile_*.html"))
@@ -0,0 +1,89 @@
+import responses
+
+from src.core.api_client import APIClient
+from src.utils.logger import get_logger
+from src.utils.metrics import REQUEST_METRICS, RequestMetricsRegistry
+from src.utils.metrics.request_metrics import endpoint_template
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+
+def test_endpoint_template_collapses_identifiers() -> None:
+    """
+    Test that numeric and UUID path segments are collapsed into {id}.
+    """
+    assert endpoint_template("/users/42") == "/users/{id}"
+    assert (
+        endpoint_template("/orders/123e4567-e89b-12d3-a456-426614174000/items")
+        == "/orders/{id}/items"
+    )
+    assert endpoint_template("/products") == "/products"
+
+
+def test_registry_exports_json_and_prometheus() -> None:
+    """
+    Test that recorded requests are aggregated per method and template.
+    """
+    registry = RequestMetricsRegistry()
+    registry.record("get", "/users/1", "200", {"total": 0.004, "dns": None})
+    registry.record("GET", "/users/2", "404", {"total": 0.2}, bytes_received=10)
+    registry.record_retry("GET", "/users/2")
+
+    metrics = registry.to_dict()["GET /users/{id}"]
+    assert metrics["requests"] == 2
+    assert metrics["statuses"] == {"200": 1, "404": 1}
+    assert metrics["retries"] == 1
+    assert "dns" not in metrics["timings"]
+
+    prometheus = registry.to_prometheus()
+    assert (
+        'api_request_duration_seconds_bucket{method="GET",endpoint="/users/{id}",'
+        'le="0.005"} 1' in prometheus
+    )
+    assert (
+        'api_requests_total{method="GET",endpoint="/users/{id}",status="404"} 1'
+        in prometheus
+    )
+
+
+def test_snapshots_of_workers_merge_into_one_registry() -> None:
+    """
+    Test that worker snapshots merge into the same totals as one process.
+    """
+    workers = [RequestMetricsRegistry(), RequestMetricsRegistry()]
+    workers[0].record("GET", "/users/1", "200", {"total": 0.01, "ttfb": 0.008})
+    workers[1].record("GET", "/users/2", "500", {"total": 0.3}, bytes_received=5)
+    workers[1].record_retry("GET", "/users/2")
+
+    controller = RequestMetricsRegistry()
+    for worker in workers:
+        controller.merge_snapshot(worker.snapshot())
+
+    metrics = controller.to_dict()["GET /users/{id}"]
+    assert metrics["requests"] == 2
+    assert metrics["statuses"] == {"200": 1, "500": 1}
+    assert metrics["retries"] == 1
+    assert metrics["bytes_received"] == 5
+    assert metrics["timings"]["ttfb"]["count"] == 1
+
+
+@responses.activate
+def test_api_client_records_request_metrics() -> None:
+    """
+    Test that APIClient.make_request feeds status, timings and sizes to the registry.
+    """
+    responses.add(
+        responses.POST, "http://metrics.test/users", json={"id": 7}, status=201
+    )
+    key = "POST /users"
+    before = REQUEST_METRICS.to_dict().get(key, {}).get("requests", 0)
+
+    APIClient("http://metrics.test").post("/users", data={"name": "Jane"})
+
+    metrics = REQUEST_METRICS.to_dict()[key]
+    logger.info(f"Recorded metrics: {metrics}")
+    assert metrics["requests"] == before + 1
+    assert metrics["statuses"]["201"] >= 1
+    assert metrics["bytes_sent"] > 0
+    assert metrics["timings"]["total"]["count"] == before + 1
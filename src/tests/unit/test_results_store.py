@@ -0,0 +1,180 @@
+import os
+import random
+import subprocess
+import sys
+from collections import Counter
+from pathlib import Path
+
+from src.plugins.results import main as compare_main
+from src.utils.metrics.histogram import LatencyHistogram
+from src.utils.metrics.results_store import ResultsStore, mann_whitney_greater
+from src.utils.logger import get_logger
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+PROJECT_ROOT = str(Path(__file__).resolve().parents[3])
+
+SAMPLE_SUITE = """
+def test_passes():
+    assert True
+
+
+def test_fails():
+    assert False
+"""
+
+
+def latency_snapshot(rng: random.Random, median_ms: float, requests: int) -> dict:
+    """
+    Build a RequestMetricsRegistry.snapshot() entry of noisy latencies.
+
+    :param rng: Random generator
+    :param median_ms: Typical latency in milliseconds
+    :param requests: Number of requests
+    :return: Snapshot of one endpoint
+    """
+    histogram = LatencyHistogram()
+    for _ in range(requests):
+        histogram.record(rng.lognormvariate(0, 0.3) * median_ms / 1000)
+    return {"latency": histogram.to_dict(), "statuses": {"200": requests}}
+
+
+def store_run(store: ResultsStore, revision: str, test_seconds: float, rng, **kw):
+    run_id = store.start_run(revision=revision)
+    store.add_test_results(
+        run_id,
+        [
+            {
+                "nodeid": "test_a.py::test_slow",
+                "outcome": kw.get("outcome", "passed"),
+                "duration": test_seconds * rng.uniform(0.95, 1.05),
+            },
+            {"nodeid": "test_a.py::test_fast", "outcome": "passed", "duration": 0.01},
+        ],
+    )
+    store.add_endpoint_metrics(
+        run_id,
+        {"GET /users/{id}": latency_snapshot(rng, kw.get("latency_ms", 20.0), 500)},
+    )
+    store.finish_run(run_id)
+    return run_id
+
+
+def test_mann_whitney_detects_shifts_only() -> None:
+    """
+    Test the p-value of shifted, equal and reversed samples.
+    """
+    rng = random.Random(3)
+    before = Counter(round(rng.gauss(10, 1), 3) for _ in range(200))
+    after = Counter(round(rng.gauss(11, 1), 3) for _ in range(200))
+
+    assert mann_whitney_greater(before, after) < 0.001
+    assert mann_whitney_greater(after, before) > 0.99
+    assert mann_whitney_greater(before, before) > 0.4
+    assert mann_whitney_greater({5: 10}, {5: 10}) == 1.0
+
+
+def test_compare_flags_significant_slowdowns(tmp_path: Path) -> None:
+    """
+    Test that commits are compared on test durations and endpoint latency.
+
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    rng = random.Random(7)
+    store = ResultsStore(str(tmp_path / "results.db"))
+    for _ in range(3):
+        store_run(store, "aaa111", 1.0, rng)
+    for _ in range(3):
+        store_run(store, "bbb222", 1.5, rng, latency_ms=26.0, outcome="failed")
+    store_run(store, "ccc333", 1.0, rng, latency_ms=20.5)
+
+    slower = store.compare("aaa", "bbb")
+    noise = store.compare("aaa", "ccc")
+    logger.info(slower.format_text())
+
+    assert {(c.kind, c.name) for c in slower.regressions} == {
+        ("test", "test_a.py::test_slow"),
+        ("endpoint", "GET /users/{id}"),
+    }
+    assert slower.new_failures == ["test_a.py::test_slow"]
+    assert noise.regressions == []
+    # One run per side: the endpoint is tested on its requests, tests are not
+    assert [c.p_value is None for c in noise.changes if c.kind == "test"] == [
+        True,
+        True,
+    ]
+    assert store.resolve("latest") == [7]
+    assert [run["tests"] for run in store.runs(revision="bbb")] == [2, 2, 2]
+    assert len(store.endpoint_history("GET /users/{id}")) == 7
+    store.close()
+
+
+def test_resolve_tells_run_ids_from_numeric_commits(tmp_path: Path) -> None:
+    """
+    Test that digits-only selectors fall back to commits when no run has that id.
+
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    rng = random.Random(5)
+    store = ResultsStore(str(tmp_path / "results.db"))
+    first = store_run(store, "1234567abc", 1.0, rng)
+    second = store_run(store, "1234567abc", 1.0, rng)
+    other = store_run(store, "2b0f5e1", 1.0, rng)
+
+    assert store.resolve("1234") == [first, second]
+    assert store.resolve(str(first)) == [first]
+    assert store.resolve(f"#{other}") == [other]
+    assert store.resolve(other) == [other]
+    assert store.resolve("git:2") == [other]
+    assert store.resolve("git:1234") == [first, second]
+    store.close()
+
+
+def test_plugin_records_runs_for_comparison(tmp_path: Path) -> None:
+    """
+    Test the plugin and the compare command on a small suite run twice.
+
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    (tmp_path / "test_sample.py").write_text(SAMPLE_SUITE)
+    database = str(tmp_path / "results.db")
+    for _ in range(2):
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "pytest",
+                "-q",
+                "-p",
+                "src.plugins.results",
+                "-p",
+                "no:cacheprovider",
+                f"--results-db={database}",
+                str(tmp_path / "test_sample.py"),
+            ],
+            cwd=tmp_path,
+            # Inherited xdist variables would make the child act as a worker
+            env={
+                **{
+                    name: value
+                    for name, value in os.environ.items()
+                    if not name.startswith("PYTEST_XDIST")
+                },
+                "PYTHONPATH": PROJECT_ROOT,
+            },
+            capture_output=True,
+            text=True,
+        )
+        logger.info(f"Recorded suite output:\n{result.stdout}")
+        assert "stored in" in result.stdout
+
+    store = ResultsStore(database)
+    runs = store.runs()
+    history = store.test_history("test_sample.py::test_fails")
+    store.close()
+
+    assert [run["exit_status"] for run in runs] == [1, 1]
+    assert [run["failed"] for run in runs] == [1, 1]
+    assert [row["outcome"] for row in history] == ["failed", "failed"]
+    assert compare_main(["previous", "latest", "--db", database]) == 0
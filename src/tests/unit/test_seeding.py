@@ -0,0 +1,158 @@
+import json
+from pathlib import Path
+
+import pytest
+from jsonschema import Draft7Validator
+
+from src.utils.databases import Database, SeedingPipeline
+from src.utils.file.csv_file_manager import CsvFileManager
+from src.utils.logger import get_logger
+from src.utils.schema_validator import SchemaValidator
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+
+def _write_users_csv(path: Path, count: int) -> None:
+    rows = [
+        {
+            "id": str(index),
+            "name": f"user {index}",
+            "email": f"user{index}@example.com",
+            "age": str(20 + index % 50),
+        }
+        for index in range(1, count + 1)
+    ]
+    CsvFileManager.save_csv_data(str(path), rows, list(rows[0]))
+
+
+def test_seeds_csv_and_skips_invalid_rows(database: Database, tmp_path: Path) -> None:
+    """
+    Test that CSV values are coerced to the schema types and invalid rows are
+    reported instead of inserted.
+
+    :param database: Database helper
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    path = tmp_path / "users.csv"
+    _write_users_csv(path, 100)
+    with open(path, "a") as file:
+        file.write("101,broken,broken@example.com,not-a-number\n")
+    pipeline = SeedingPipeline(database, "users", schema="user", batch_size=30)
+    pipeline.create_table()
+
+    report = pipeline.run(str(path))
+
+    assert (report.rows, report.rejected) == (100, 1)
+    assert "age" in report.errors[0]
+    assert database.fetch_one('SELECT * FROM "users" WHERE id = 7') == {
+        "id": 7,
+        "name": "user 7",
+        "email": "user7@example.com",
+        "age": 27,
+    }
+
+
+def test_seeds_json_lines_and_raises_on_invalid(
+    database: Database, tmp_path: Path
+) -> None:
+    """
+    Test JSON Lines sources and the raise mode for invalid records.
+
+    :param database: Database helper
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    path = tmp_path / "users.jsonl"
+    records = [
+        {"id": 1, "name": "Ann", "email": "ann@example.com", "age": 30},
+        {"id": 2, "name": "Bob", "email": "bob@example.com"},
+    ]
+    path.write_text("\n".join(json.dumps(record) for record in records))
+    pipeline = SeedingPipeline(database, "users", schema="user", on_invalid="raise")
+    pipeline.create_table()
+
+    with pytest.raises(ValueError, match="'age' is a required property"):
+        pipeline.run(str(path))
+    assert SeedingPipeline(database, "users").run(records[:1]).rows == 1
+
+
+def test_seeding_reports_progress(database: Database, tmp_path: Path) -> None:
+    """
+    Test that a larger CSV fixture is seeded completely with progress reports.
+    Throughput is tracked by the db.seed benchmark.
+
+    :param database: Database helper
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    path = tmp_path / "users.csv"
+    _write_users_csv(path, 5_000)
+    progress = []
+    pipeline = SeedingPipeline(
+        database,
+        "users",
+        schema="user",
+        batch_size=1_000,
+        progress_every=1_000,
+        progress=progress.append,
+    )
+    pipeline.create_table()
+
+    report = pipeline.run(str(path))
+    logger.info(f"Seeded {report.rows:,} rows")
+
+    assert report.rows == 5_000
+    assert database.fetch_value('SELECT COUNT(*) FROM "users"') == 5_000
+    assert len(progress) == 5
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        {"id": 1, "name": "Ann", "email": "ann@example.com", "age": 30},
+        {"id": 1.0, "name": "Ann", "email": "ann@example.com", "age": 30},
+        {"id": True, "name": "Ann", "email": "ann@example.com", "age": 30},
+        {"id": 1, "name": None, "email": "ann@example.com", "age": 30},
+        {"id": 1, "name": "Ann", "email": "ann@example.com"},
+        {"id": 1, "name": "Ann", "email": "ann@example.com", "age": 30, "x": 1},
+        [],
+    ],
+)
+def test_compiled_validator_matches_jsonschema(record: object) -> None:
+    """
+    Test that the compiled fast path agrees with jsonschema.
+
+    :param record: Record to validate
+    """
+    validator = SchemaValidator.load("user")
+    reference = Draft7Validator(validator.schema)
+
+    assert validator.compiled
+    assert validator.is_valid(record) == reference.is_valid(record)
+
+
+def test_coerce_keeps_values_it_cannot_convert() -> None:
+    """
+    Test that CSV strings are converted to the schema types, and that values
+    that are not numbers or booleans are kept for validation to report.
+    """
+    validator = SchemaValidator(
+        {
+            "type": "object",
+            "properties": {
+                "age": {"type": "integer"},
+                "active": {"type": "boolean"},
+            },
+        }
+    )
+
+    assert validator.coerce({"age": "30", "active": "Yes"}) == {
+        "age": 30,
+        "active": True,
+    }
+    assert validator.coerce({"age": "", "active": "0"}) == {
+        "age": None,
+        "active": False,
+    }
+    record = validator.coerce({"age": "thirty", "active": "abc"})
+    assert record == {"age": "thirty", "active": "abc"}
+    assert not validator.is_valid(record)
@@ -0,0 +1,180 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.core.api_client import APIClient
+from src.core.single_flight import AsyncSingleFlight, SingleFlight
+from src.mock_server import FaultConfig, MockAPIServer
+from src.utils.logger import get_logger
+from src.utils.metrics.request_metrics import REQUEST_METRICS
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+
+def test_threads_share_one_call() -> None:
+    """
+    Test that concurrent calls for one key run once and all get the result,
+    while a later call runs again.
+    """
+    flight = SingleFlight()
+    executions = []
+    barrier = threading.Barrier(8)
+
+    def call() -> dict:
+        executions.append(1)
+        time.sleep(0.2)
+        return {"id": 1}
+
+    def worker(_: int) -> dict:
+        barrier.wait()
+        return flight.do("user-1", call, copy=dict)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(worker, range(8)))
+
+    assert len(executions) == 1
+    assert all(result == {"id": 1} for result in results)
+    assert len({id(result) for result in results}) == 8
+    assert flight.stats == {
+        "calls": 8,
+        "executed": 1,
+        "deduplicated": 7,
+        "in_flight": 0,
+    }
+    flight.do("user-1", call)
+    assert len(executions) == 2
+
+
+def test_threads_share_the_error() -> None:
+    """
+    Test that every waiter of a failing call gets its error.
+    """
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def call() -> None:
+        started.set()
+        time.sleep(0.1)
+        raise ConnectionError("down")
+
+    def follower() -> None:
+        started.wait()
+        flight.do("key", call)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(flight.do, "key", call), executor.submit(follower)]
+        for future in futures:
+            with pytest.raises(ConnectionError):
+                future.result()
+    assert flight.stats["executed"] == 1
+
+
+def test_coroutines_share_one_call_despite_cancellation() -> None:
+    """
+    Test asyncio coalescing, and that cancelling the first waiter leaves the
+    shared call running for the others.
+    """
+    flight = AsyncSingleFlight()
+    executions = []
+
+    async def call() -> str:
+        executions.append(1)
+        await asyncio.sleep(0.1)
+        return "done"
+
+    async def main() -> list:
+        first = asyncio.ensure_future(flight.do("key", call))
+        await asyncio.sleep(0)
+        others = [asyncio.ensure_future(flight.do("key", call)) for _ in range(5)]
+        first.cancel()
+        return await asyncio.gather(*others)
+
+    assert asyncio.run(main()) == ["done"] * 5
+    assert len(executions) == 1
+    assert flight.stats["deduplicated"] == 5
+
+
+def test_api_client_coalesces_identical_gets() -> None:
+    """
+    Test that identical GETs from threads and from coroutines reach the
+    server once each, and that every caller gets its own response object.
+    """
+
+    def deduplicated() -> int:
+        return (
+            REQUEST_METRICS.to_dict().get("GET /users/{id}", {}).get("deduplicated", 0)
+        )
+
+    before = deduplicated()
+    with MockAPIServer(records=5, faults=FaultConfig(latency=0.2)) as server:
+        client = APIClient(server.url, single_flight=SingleFlight())
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            responses = list(executor.map(lambda _: client.get("/users/1"), range(6)))
+
+        async def gather() -> list:
+            return await asyncio.gather(
+                *(client.get_async("/users/2") for _ in range(6))
+            )
+
+        async_responses = asyncio.run(gather())
+        requests_seen = server.stats["requests"]
+        client.close()
+
+    logger.info(f"Single-flight stats: {client.single_flight.stats}")
+    assert requests_seen == 2
+    assert {response.json()["id"] for response in responses} == {1}
+    assert {response.json()["id"] for response in async_responses} == {2}
+    assert len({id(response) for response in responses + async_responses}) == 12
+    assert deduplicated() - before == 10
+
+
+def test_shared_coalescer_keeps_credentials_apart() -> None:
+    """
+    Test that clients sharing a coalescer only share responses when they send
+    the same Authorization header.
+    """
+    flight = SingleFlight()
+    with MockAPIServer(records=5, faults=FaultConfig(latency=0.2)) as server:
+        clients = [APIClient(server.url, single_flight=flight) for _ in range(3)]
+        for client, token in zip(clients, ("alice", "bob", "alice")):
+            client.headers["Authorization"] = f"Bearer {token}"
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda client: client.get("/users/1"), clients))
+        requests_seen = server.stats["requests"]
+        for client in clients:
+            client.close()
+
+    assert requests_seen == 2
+    assert flight.stats["deduplicated"] == 1
+
+
+def test_shared_coalescer_deduplicates_coroutines_across_clients() -> None:
+    """
+    Test that clients sharing a coalescer also share coroutine GETs, and that
+    its stats count them.
+    """
+    flight = SingleFlight()
+    with MockAPIServer(records=5, faults=FaultConfig(latency=0.2)) as server:
+        clients = [APIClient(server.url, single_flight=flight) for _ in range(2)]
+
+        async def gather() -> list:
+            return await asyncio.gather(
+                *(client.get_async("/users/3") for client in clients * 3)
+            )
+
+        asyncio.run(gather())
+        requests_seen = server.stats["requests"]
+        for client in clients:
+            client.close()
+
+    assert requests_seen == 1
+    assert flight.stats == {
+        "calls": 6,
+        "executed": 1,
+        "deduplicated": 5,
+        "in_flight": 0,
+    }
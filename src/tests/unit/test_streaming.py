@@ -0,0 +1,243 @@
+import gzip
+import hashlib
+import importlib.util
+import json
+import os
+import threading
+import tracemalloc
+import zlib
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from src.core.api_client import APIClient
+from src.core.cassette import normalize_request
+from src.utils.logger import get_logger
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+PAYLOAD_SIZE = 16 * 1024 * 1024
+DOWNLOAD = gzip.compress(bytes(range(256)) * (PAYLOAD_SIZE // 256))
+
+
+class _FileHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _body_chunks(self) -> Iterator[bytes]:
+        if self.headers.get("Transfer-Encoding") == "chunked":
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                if size == 0:
+                    self.rfile.readline()
+                    return
+                yield self.rfile.read(size)
+                self.rfile.readline()
+        remaining = int(self.headers.get("Content-Length", 0))
+        while remaining:
+            chunk = self.rfile.read(min(remaining, 65536))
+            remaining -= len(chunk)
+            yield chunk
+
+    def _reply(self, payload: dict) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:
+        if self.path == "/multipart":
+            body = b"".join(self._body_chunks())
+            header = f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode()
+            message = BytesParser().parsebytes(header + body)
+            self._reply(
+                {
+                    part.get_param(
+                        "name", header="content-disposition"
+                    ): hashlib.sha256(part.get_payload(decode=True)).hexdigest()
+                    for part in message.get_payload()
+                }
+            )
+            return
+        digest = hashlib.sha256()
+        size = 0
+        decompressor = (
+            zlib.decompressobj(31)
+            if self.headers.get("Content-Encoding") == "gzip"
+            else None
+        )
+        for chunk in self._body_chunks():
+            if decompressor is not None:
+                chunk = decompressor.decompress(chunk)
+            digest.update(chunk)
+            size += len(chunk)
+        self._reply(
+            {
+                "bytes": size,
+                "sha256": digest.hexdigest(),
+                "chunked": self.headers.get("Transfer-Encoding") == "chunked",
+            }
+        )
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(DOWNLOAD)))
+        self.end_headers()
+        self.wfile.write(DOWNLOAD)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def client() -> APIClient:
+    """
+    APIClient pointed at a local server with upload and download endpoints.
+
+    :return: The client
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FileHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = APIClient(f"http://127.0.0.1:{server.server_address[1]}")
+    yield client
+    client.close()
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope="module")
+def big_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    A 16 MiB file of random bytes.
+
+    :param tmp_path_factory: Temporary directory factory provided by pytest
+    :return: Path of the file
+    """
+    path = tmp_path_factory.mktemp("streaming") / "big.bin"
+    with open(path, "wb") as file:
+        for _ in range(PAYLOAD_SIZE // (1024 * 1024)):
+            file.write(os.urandom(1024 * 1024))
+    return path
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def test_file_upload_streams_with_bounded_memory(
+    client: APIClient, big_file: Path
+) -> None:
+    """
+    Test that uploading a file sends it with a Content-Length and never
+    holds it in memory.
+
+    :param client: Client of the local file server
+    :param big_file: 16 MiB file
+    """
+    tracemalloc.start()
+    response = client.upload("/upload", str(big_file))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    logger.info(f"Peak memory while uploading 16 MiB: {peak / 1024:.0f} KiB")
+
+    assert response.json() == {
+        "bytes": PAYLOAD_SIZE,
+        "sha256": _sha256(big_file),
+        "chunked": False,
+    }
+    assert peak < PAYLOAD_SIZE / 8
+
+
+def test_generator_upload_with_gzip(client: APIClient) -> None:
+    """
+    Test a generator body compressed on the fly and sent chunked.
+
+    :param client: Client of the local file server
+    """
+    chunks = [f"line {index}\n".encode() * 100 for index in range(1000)]
+
+    response = client.upload("/upload", iter(chunks), compress="gzip")
+
+    assert response.json() == {
+        "bytes": sum(map(len, chunks)),
+        "sha256": hashlib.sha256(b"".join(chunks)).hexdigest(),
+        "chunked": True,
+    }
+
+
+def test_multipart_upload(client: APIClient, tmp_path: Path) -> None:
+    """
+    Test a multipart upload of a form field and a file.
+
+    :param client: Client of the local file server
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    path = tmp_path / "report.csv"
+    path.write_bytes(b"id,name\n1,Ann\n" * 1000)
+
+    response = client.upload_multipart(
+        "/multipart", files={"report": str(path)}, fields={"kind": "users"}
+    )
+
+    assert response.json() == {
+        "kind": hashlib.sha256(b"users").hexdigest(),
+        "report": _sha256(path),
+    }
+
+
+def test_download_decodes_to_disk_with_bounded_memory(
+    client: APIClient, tmp_path: Path
+) -> None:
+    """
+    Test that a gzip-encoded download is decoded chunk by chunk into a file.
+
+    :param client: Client of the local file server
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    target = tmp_path / "out" / "payload.bin"
+
+    tracemalloc.start()
+    written = client.download("/payload", str(target), chunk_size=256 * 1024)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    logger.info(f"Peak memory while downloading 16 MiB: {peak / 1024:.0f} KiB")
+
+    assert written == PAYLOAD_SIZE == target.stat().st_size
+    assert target.read_bytes()[:512] == bytes(range(256)) * 2
+    assert peak < PAYLOAD_SIZE / 8
+    raw = tmp_path / "raw.gz"
+    assert client.download("/payload", str(raw), decode=False) == len(DOWNLOAD)
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("zstandard") is not None,
+    reason="zstandard is installed",
+)
+def test_zstd_requires_the_optional_package(client: APIClient) -> None:
+    """
+    Test the error raised for zstd compression without zstandard.
+
+    :param client: Client of the local file server
+    """
+    with pytest.raises(RuntimeError, match="zstandard"):
+        client.upload("/upload", b"data", compress="zstd")
+
+
+def test_cassette_keys_ignore_streamed_bodies() -> None:
+    """
+    Test that a streamed body is not consumed to build a cassette key.
+    """
+    body = iter([b"chunk"])
+
+    key = normalize_request("POST", "http://api/upload", body)
+
+    assert key == normalize_request("POST", "http://api/upload")
+    assert next(body) == b"chunk"
@@ -0,0 +1,128 @@
+import asyncio
+import json
+import threading
+from pathlib import Path
+
+import pytest
+import responses
+
+from src.core.api_client import APIClient
+from src.utils.tracing import TRACER, Tracer
+
+
+def test_nested_spans_share_trace_and_link_parents() -> None:
+    """
+    Test that nested spans share the trace id and point to their parent.
+    """
+    tracer = Tracer(enabled=True)
+    with tracer.span("outer", "test") as outer:
+        with tracer.span("inner", "http") as inner:
+            pass
+
+    assert inner.trace_id == outer.trace_id
+    assert inner.parent_id == outer.span_id
+    assert [span.name for span in tracer.spans()] == ["inner", "outer"]
+
+
+def test_context_propagates_to_asyncio_tasks_and_threads() -> None:
+    """
+    Test that child spans in asyncio tasks and propagated threads find their parent.
+    """
+    tracer = Tracer(enabled=True)
+
+    async def child(name: str) -> None:
+        with tracer.span(name):
+            await asyncio.sleep(0)
+
+    async def scenario() -> None:
+        with tracer.span("root"):
+            await asyncio.gather(child("task-1"), child("task-2"))
+
+    asyncio.run(scenario())
+
+    def in_thread() -> None:
+        with tracer.span("thread-child"):
+            pass
+
+    with tracer.span("thread-root") as thread_root:
+        worker = threading.Thread(target=tracer.propagate(in_thread))
+        worker.start()
+        worker.join()
+
+    spans = {span.name: span for span in tracer.spans()}
+    assert spans["task-1"].parent_id == spans["root"].span_id
+    assert spans["task-2"].parent_id == spans["root"].span_id
+    assert spans["thread-child"].parent_id == thread_root.span_id
+
+
+def test_chrome_trace_export(tmp_path: Path) -> None:
+    """
+    Test that finished spans are written as Chrome complete events.
+
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    tracer = Tracer(enabled=True)
+    with tracer.span("work", "ssh", host="example"):
+        pass
+
+    trace_path = tracer.export_chrome_trace(str(tmp_path / "trace.json"))
+    with open(trace_path) as file:
+        events = json.load(file)["traceEvents"]
+
+    assert events[0]["name"] == "work"
+    assert events[0]["ph"] == "X"
+    assert events[0]["args"]["host"] == "example"
+
+
+def test_imported_worker_trace_is_exported_with_local_spans() -> None:
+    """
+    Test that a trace shipped by another process is written with local spans.
+    """
+    worker = Tracer(enabled=True)
+    with worker.span("test_remote", "test"):
+        pass
+    trace = worker.to_chrome_trace()
+    trace["traceEvents"][0]["pid"] = -1
+
+    controller = Tracer(enabled=True)
+    with controller.span("session"):
+        pass
+    controller.import_chrome_trace(trace)
+
+    events = controller.to_chrome_trace()["traceEvents"]
+    assert [(event["name"], event["pid"] == -1) for event in events] == [
+        ("session", False),
+        ("test_remote", True),
+    ]
+
+
+def test_tracer_is_disabled_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that spans are only collected when tracing is turned on.
+
+    :param monkeypatch: Pytest fixture to patch the environment
+    """
+    monkeypatch.delenv("TRACING_ENABLED", raising=False)
+    tracer = Tracer()
+    with tracer.span("ignored") as span:
+        pass
+
+    assert span is None and tracer.spans() == []
+    monkeypatch.setenv("TRACING_ENABLED", "true")
+    assert Tracer().enabled
+
+
+@responses.activate
+def test_api_client_injects_traceparent_header(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that APIClient sends the traceparent of its http span.
+
+    :param monkeypatch: Pytest fixture to enable the process-wide tracer
+    """
+    monkeypatch.setattr(TRACER, "enabled", True)
+    responses.add(responses.GET, "http://tracing.test/users/1", json={}, status=200)
+
+    APIClient("http://tracing.test").get("/users/1")
+
+    traceparent = responses.calls[0].request.headers["traceparent"]
+    assert traceparent.startswith("00-") and traceparent.endswith("-01")
@@ -0,0 +1,72 @@
+import threading
+from pathlib import Path
+
+from src.utils import UDPListener, UDPSender
+from src.utils.logger import get_logger
+from src.utils.network.udp_capture import (
+    UDPCaptureReader,
+    UDPCaptureWriter,
+    record_udp_traffic,
+    replay_udp_capture,
+)
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+
+def test_capture_round_trip_preserves_records(tmp_path: Path) -> None:
+    """
+    Test that written records are streamed back with timestamp, source and payload.
+
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    capture_path = str(tmp_path / "traffic.udpcap")
+    with UDPCaptureWriter(capture_path) as writer:
+        writer.write(b"first", ("127.0.0.1", 4000), timestamp_ns=1_000)
+        writer.write(b"", ("::1", 4001), timestamp_ns=2_000)
+    with UDPCaptureWriter(capture_path) as writer:
+        writer.write(b"appended", ("10.0.0.7", 4002), timestamp_ns=3_000)
+
+    records = list(UDPCaptureReader(capture_path))
+    assert [record.payload for record in records] == [b"first", b"", b"appended"]
+    assert records[1].source == ("::1", 4001)
+    assert [record.timestamp_ns for record in records] == [1_000, 2_000, 3_000]
+
+
+def test_record_and_replay_through_udp(tmp_path: Path) -> None:
+    """
+    Test recording from a UDPListener and replaying the capture through a UDPSender.
+
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    capture_path = str(tmp_path / "replay.udpcap")
+    source = UDPListener("127.0.0.1", 0)
+    sender = UDPSender("127.0.0.1", source.sock.getsockname()[1])
+    try:
+        sender.send_many([f"packet-{i}".encode() for i in range(20)])
+        with UDPCaptureWriter(capture_path) as writer:
+            recorded = record_udp_traffic(
+                source, writer, max_packets=20, idle_timeout=1
+            )
+    finally:
+        sender.close()
+        source.close()
+    assert recorded == 20
+
+    target = UDPListener("127.0.0.1", 0, buffer_size=65535)
+    replayer = UDPSender("127.0.0.1", target.sock.getsockname()[1])
+    received = []
+    reader = threading.Thread(
+        target=lambda: received.extend(target.receive(timeout=2)[0] for _ in range(20))
+    )
+    reader.start()
+    try:
+        replayed = replay_udp_capture(capture_path, replayer, speed=0)
+        reader.join()
+    finally:
+        replayer.close()
+        target.close()
+
+    logger.info(f"Replayed {replayed} datagrams")
+    assert replayed == 20
+    assert sorted(received) == sorted(f"packet-{i}".encode() for i in range(20))
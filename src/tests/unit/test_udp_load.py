@@ -0,0 +1,105 @@
+import pytest
+
+from src.utils import UDPListener, UDPSender
+from src.utils.logger import get_logger
+from src.utils.metrics import LatencyHistogram
+from src.utils.network.udp_load import (
+    LOAD_HEADER,
+    UDPLoadGenerator,
+    UDPLoadReceiver,
+    run_udp_load_test,
+)
+
+# Get a logger instance
+logger = get_logger(__name__)
+
+
+def test_latency_histogram_percentiles_and_merge() -> None:
+    """
+    Test that percentiles stay within the bucket error and merging is lossless.
+    """
+    first = LatencyHistogram()
+    second = LatencyHistogram()
+    for value in range(1, 5001):
+        first.record_us(value)
+        second.record_us(value + 5000)
+
+    merged = LatencyHistogram.from_dict(first.to_dict()).merge(second)
+    assert merged.count == 10000
+    assert abs(merged.percentile(50) - 5000) / 5000 < 0.01
+    assert abs(merged.percentile(99) - 9900) / 9900 < 0.01
+    assert merged.percentile(100) == 10000
+
+
+def test_send_many_sends_bytes_batch() -> None:
+    """
+    Test that send_many delivers every raw datagram of a batch.
+    """
+    listener = UDPListener("127.0.0.1", 0)
+    sender = UDPSender("127.0.0.1", listener.sock.getsockname()[1])
+    try:
+        assert sender.send_many([b"a", b"b", b"c"]) == 3
+        received = {listener.receive(timeout=1)[0] for _ in range(3)}
+    finally:
+        sender.close()
+        listener.close()
+    assert received == {b"a", b"b", b"c"}
+
+
+def test_receive_restores_the_socket_timeout() -> None:
+    """
+    Test that a receive with a timeout leaves the socket blocking afterwards.
+    """
+    listener = UDPListener("127.0.0.1", 0)
+    try:
+        with pytest.raises(TimeoutError):
+            listener.receive(timeout=0.01)
+        assert listener.sock.gettimeout() is None
+    finally:
+        listener.close()
+
+
+def test_load_generator_payload_carries_sequence() -> None:
+    """
+    Test that generated payloads embed the sequence number and template.
+    """
+    generator = UDPLoadGenerator(
+        UDPSender("127.0.0.1", 9), rate_pps=100, payload_template="seq={seq}"
+    )
+    payload = generator.build_payload(42)
+    _magic, sequence, _sent_ns = LOAD_HEADER.unpack_from(payload)
+    generator.sender.close()
+
+    assert sequence == 42
+    assert payload[LOAD_HEADER.size :] == b"seq=42"
+
+
+def test_run_udp_load_test_reports_no_loss_at_low_rate() -> None:
+    """
+    Test that a paced loopback run reports all packets with latency figures.
+    """
+    report = run_udp_load_test("127.0.0.1", 0, rate_pps=2000, count=500)
+    logger.info(f"UDP load report: {report}")
+
+    assert report["sent"] == 500
+    assert report["received"] == 500
+    assert report["lost"] == 0
+    assert report["latency"]["count"] == 500
+
+
+def test_run_udp_load_test_raises_the_receiver_error(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that a failing receiver thread surfaces its own error.
+
+    :param monkeypatch: Pytest fixture to make the receiver fail
+    """
+
+    def fail(self, expected: int, idle_timeout: float = 1.0) -> None:
+        raise OSError("receive buffer gone")
+
+    monkeypatch.setattr(UDPLoadReceiver, "collect", fail)
+
+    with pytest.raises(OSError, match="receive buffer gone"):
+        run_udp_load_test("127.0.0.1", 0, rate_pps=1000, count=10)
@@ -6,6 +6,7 @@ import pytest
 import responses
 from jsonschema import ValidationError, validate
 
+from src.core.api_client import APIClient
 from src.services.user_service import UserService
 from src.utils.logger import get_logger
 
@@ -21,14 +22,17 @@ with open(schema_path, "r") as f:
 
 
 @pytest.fixture(scope="module")
-def user_service() -> Generator[UserService, None, None]:
+def user_service(
+    shared_api_client: APIClient,
+) -> Generator[UserService, None, None]:
     """
     Fixture to initialize UserService instance.
 
+    :param shared_api_client: The worker's session-scoped API client
     :return: Initialized UserService instance
     """
     logger.info("Initializing UserService instance")
-    yield UserService()
+    yield UserService(shared_api_client)
 
 
 @responses.activate
@@ -0,0 +1,136 @@
+import os
+import socket
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from src.utils import TemporaryFileManager, UDPListener, worker
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@pytest.fixture
+def as_worker(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """
+    Make this process look like xdist worker gw2 of a fresh run.
+
+    :param monkeypatch: Pytest fixture to patch the environment
+    :param tmp_path: Temporary directory provided by pytest
+    """
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw2")
+    monkeypatch.setenv(worker.RUN_ID_ENV, "testrun")
+    monkeypatch.setattr(worker.tempfile, "gettempdir", lambda: str(tmp_path))
+    monkeypatch.setattr(worker, "_temp_dir", None)
+    yield
+    worker.remove_run_temp_dirs()
+
+
+def test_worker_identity(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test worker id parsing with and without pytest-xdist.
+
+    :param monkeypatch: Pytest fixture to patch the environment
+    """
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    assert (worker.worker_id(), worker.worker_index()) == ("master", 0)
+    assert worker.is_worker() is False
+
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw11")
+    assert (worker.worker_id(), worker.worker_index()) == ("gw11", 11)
+
+
+def test_ports_come_from_the_workers_block(as_worker: None) -> None:
+    """
+    Test that allocated ports are unique, bindable and in the worker's block.
+
+    :param as_worker: Fixture simulating an xdist worker
+    """
+    start = worker.PORT_BASE + 2 * worker.PORT_BLOCK_SIZE
+    ports = [worker.allocate_port() for _ in range(3)]
+    try:
+        assert len(set(ports)) == 3
+        assert all(start <= port < start + worker.PORT_BLOCK_SIZE for port in ports)
+        listener = UDPListener("127.0.0.1", ports[0])
+        listener.close()
+        tcp_port = worker.allocate_port(socket.SOCK_STREAM)
+        worker.release_port(tcp_port, socket.SOCK_STREAM)
+    finally:
+        for port in ports:
+            worker.release_port(port)
+
+
+def test_temp_files_go_to_the_worker_dir(tmp_path: Path, as_worker: None) -> None:
+    """
+    Test that TemporaryFileManager uses the worker's own temp directory.
+
+    :param tmp_path: Temporary directory provided by pytest
+    :param as_worker: Fixture simulating an xdist worker
+    """
+    path = TemporaryFileManager.create_temp_file(suffix=".json")
+
+    assert os.path.dirname(path) == str(tmp_path / "automation_testrun" / "gw2")
+
+
+def test_worker_logs_merge_in_timestamp_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that worker logs are merged by timestamp with multi-line records intact.
+
+    :param tmp_path: Temporary directory provided by pytest
+    :param monkeypatch: Pytest fixture to patch the environment
+    """
+    monkeypatch.setenv(worker.RUN_ID_ENV, "testrun")
+    worker_dir = tmp_path / "workers" / "testrun"
+    worker_dir.mkdir(parents=True)
+    (worker_dir / "run_gw0.log").write_text(
+        "2026-01-01 10:00:00,100 - [gw0] - a - INFO - first\n"
+        "2026-01-01 10:00:00,300 - [gw0] - a - ERROR - third\n"
+        "Traceback (most recent call last):\n"
+    )
+    (worker_dir / "run_gw1.log").write_text(
+        "2026-01-01 10:00:00,200 - [gw1] - b - INFO - second\n"
+    )
+
+    assert worker.merge_worker_logs(str(tmp_path), "run") == 2
+
+    lines: List[str] = (tmp_path / "run.log").read_text().splitlines()
+    assert [line.rsplit(" - ", 1)[-1] for line in lines] == [
+        "first",
+        "second",
+        "third",
+        "Traceback (most recent call last):",
+    ]
+    assert not worker_dir.exists()
+
+
+def test_shared_resource_is_created_once_and_closed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that a shared resource is built once and closed with the others.
+
+    :param monkeypatch: Pytest fixture to patch the registry
+    """
+    monkeypatch.setattr(worker, "_resources", {})
+
+    class Pool:
+        closed = False
+
+        def close(self) -> None:
+            self.closed = True
+
+    created: List[Pool] = []
+
+    def factory() -> Pool:
+        created.append(Pool())
+        return created[-1]
+
+    first = worker.shared_resource("test_pool", factory)
+    assert worker.shared_resource("test_pool", factory) is first
+    worker.close_shared_resources()
+
+    assert len(created) == 1 and first.closed
+    logger.info("Shared resource was created once and closed at session end")
@@ -1,16 +1,66 @@
-from .config.config_loader import ConfigLoader
-from .file.csv_file_manager import CsvFileManager
-from .file.json_file_manager import JsonFileManager
-from .file.temp_file_manager import TemporaryFileManager
-from .network.ssh_utils import SSHClient
-from .network.udp_utils import UDPListener, UDPSender
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .config.config_loader import ConfigLoader
+    from .data_factory import DataFactory
+    from .databases.database import Database
+    from .databases.pool import ConnectionPool
+    from .file.csv_file_manager import CsvFileManager
+    from .file.json_file_manager import JsonFileManager
+    from .file.temp_file_manager import TemporaryFileManager
+    from .json_diff import JsonDiff
+    from .network.async_udp_utils import AsyncUDPListener, AsyncUDPSender
+    from .network.ssh_utils import SSHClient
+    from .network.udp_utils import UDPListener, UDPSender
+    from .schema_validator import SchemaValidator
+
+# Exported name -> submodule defining it. Submodules are imported on first
+# attribute access so that e.g. ConfigLoader does not pull in paramiko.
+_LAZY_EXPORTS: Dict[str, str] = {
+    "UDPListener": ".network.udp_utils",
+    "UDPSender": ".network.udp_utils",
+    "AsyncUDPListener": ".network.async_udp_utils",
+    "AsyncUDPSender": ".network.async_udp_utils",
+    "SSHClient": ".network.ssh_utils",
+    "CsvFileManager": ".file.csv_file_manager",
+    "JsonFileManager": ".file.json_file_manager",
+    "TemporaryFileManager": ".file.temp_file_manager",
+    "ConfigLoader": ".config.config_loader",
+    "ConnectionPool": ".databases.pool",
+    "Database": ".databases.database",
+    "SchemaValidator": ".schema_validator",
+    "DataFactory": ".data_factory",
+    "JsonDiff": ".json_diff",
+}
 
 __all__ = [
     "UDPListener",
     "UDPSender",
+    "AsyncUDPListener",
+    "AsyncUDPSender",
     "SSHClient",
     "CsvFileManager",
     "JsonFileManager",
     "TemporaryFileManager",
     "ConfigLoader",
+    "ConnectionPool",
+    "Database",
+    "SchemaValidator",
+    "DataFactory",
+    "JsonDiff",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
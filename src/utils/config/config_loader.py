@@ -1,45 +1,35 @@
 import logging
-import os
 from typing import Any, Dict, Optional
 
-from dotenv import load_dotenv
+from src.core.config_engine import get_config
 
 
 class ConfigLoader:
-    # Load environment variables from a .env file
-    try:
-        load_dotenv()
-    except Exception as e:
-        raise RuntimeError(f"Error loading .env file: {str(e)}")
-
     # Set up a logger
     logger = logging.getLogger("ConfigLoader")
-    logging.basicConfig(level=logging.INFO)
 
     @staticmethod
     def get_config_value(key: str, default: Optional[Any] = None) -> Optional[str]:
         """
-        Get a configuration value from environment variables.
+        Get a configuration value from the resolved configuration.
+
+        Values come from the process-wide layered configuration (environment
+        and .env over config files over INI files). Files are loaded once and
+        the environment is read on each call. Call reload_config() after
+        editing files.
 
         :param key: The key for the configuration value
         :param default: The default value to return if the key is not found
-        :return: The configuration value as a string or the default value
-        :raises RuntimeError: If there is an issue accessing the environment variable
+        :return: The configuration value or the default value
+        :raises RuntimeError: If the configuration cannot be loaded
         """
         try:
-            value = os.getenv(key, default)
-            if value is None:
-                ConfigLoader.logger.warning(
-                    f"Config key '{key}' not found. Using default value: {default}"
-                )
-            return value
+            return get_config().get(key, None, default)
         except Exception as e:
             ConfigLoader.logger.error(
-                f"Error accessing environment variable '{key}': {str(e)}"
-            )
-            raise RuntimeError(
-                f"Error accessing environment variable '{key}': {str(e)}"
+                f"Error accessing configuration value '{key}': {str(e)}"
             )
+            raise RuntimeError(f"Error accessing configuration value '{key}': {str(e)}")
 
     @staticmethod
     def load_all_config() -> Dict[str, str]:
@@ -47,13 +37,13 @@ class ConfigLoader:
         Load all configuration values into a dictionary.
 
         :return: Dictionary of all configuration key-value pairs
-        :raises RuntimeError: If there is an issue accessing environment variables
+        :raises RuntimeError: If the configuration cannot be loaded
         """
         try:
-            return {key: value for key, value in os.environ.items()}
+            return dict(get_config().as_dict())
         except Exception as e:
-            ConfigLoader.logger.error(f"Error loading environment variables: {str(e)}")
-            raise RuntimeError(f"Error loading environment variables: {str(e)}")
+            ConfigLoader.logger.error(f"Error loading configuration: {str(e)}")
+            raise RuntimeError(f"Error loading configuration: {str(e)}")
 
 
 # Example usage:
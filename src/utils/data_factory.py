@@ -0,0 +1,413 @@
+import csv
+import io
+import json
+import logging
+import math
+import os
+import random
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple, Union
+
+from src.utils.databases.database import Database
+from src.utils.databases.seeding import SeedingPipeline, SeedReport, create_table_sql
+from src.utils.schema_validator import SchemaValidator
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+FIRST_NAMES = [
+    "Ann", "Bob", "Chloe", "David", "Elena", "Farid", "Grace", "Hiro", "Ines",
+    "Jamal", "Kate", "Liam", "Maya", "Noah", "Olga", "Pedro", "Quinn", "Rosa",
+    "Sam", "Tara", "Umar", "Vera", "Wei", "Xenia", "Yusuf", "Zoe",
+]  # fmt: skip
+LAST_NAMES = [
+    "Smith", "Garcia", "Chen", "Kowalski", "Okafor", "Novak", "Tanaka", "Silva",
+    "Müller", "Haddad", "Ivanova", "Brown", "Rossi", "Kim", "Dubois", "Singh",
+    "Jensen", "Moreau", "Costa", "Nakamura",
+]  # fmt: skip
+ADJECTIVES = [
+    "Compact", "Durable", "Ergonomic", "Lightweight", "Portable", "Premium",
+    "Rugged", "Sleek", "Smart", "Wireless", "Classic", "Modular",
+]  # fmt: skip
+MATERIALS = [
+    "Aluminium", "Bamboo", "Carbon", "Ceramic", "Cotton", "Glass", "Leather",
+    "Oak", "Steel", "Wool",
+]  # fmt: skip
+PRODUCTS = [
+    "Backpack", "Chair", "Desk Lamp", "Headphones", "Keyboard", "Kettle",
+    "Monitor Stand", "Mug", "Notebook", "Speaker", "Wallet", "Watch",
+]  # fmt: skip
+WORDS = [
+    "reliable", "everyday", "design", "made", "with", "care", "for", "home",
+    "office", "travel", "quality", "finish", "easy", "to", "clean", "and",
+    "built", "last", "comfortable", "grip", "modern", "look", "fits", "any",
+    "space", "great", "gift", "simple", "setup",
+]  # fmt: skip
+DOMAINS = ["example.com", "example.org", "example.net", "test.example"]
+
+# Span used above the minimum when a numeric property has no maximum
+_DEFAULT_SPANS = {"age": 72, "stock": 1000, "quantity": 100, "price": 500}
+_EPOCH = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+Column = List[Any]
+
+
+def _bounds(name: str, spec: Dict[str, Any], step: float) -> Tuple[float, float]:
+    low = spec.get("minimum")
+    if "exclusiveMinimum" in spec:
+        low = spec["exclusiveMinimum"] + step
+    high = spec.get("maximum")
+    if "exclusiveMaximum" in spec:
+        high = spec["exclusiveMaximum"] - step
+    if low is None:
+        low = 18 if name == "age" and high is None else 0
+    if high is None:
+        high = low + _DEFAULT_SPANS.get(name, 1000)
+    if high < low:
+        raise ValueError(f"Property '{name}' has an empty range")
+    return low, high
+
+
+def _strings(
+    name: str,
+    spec: Dict[str, Any],
+    ids: List[int],
+    rng: random.Random,
+    person: bool,
+) -> Column:
+    count = len(ids)
+    form = spec.get("format")
+    if form == "email" or name == "email":
+        firsts = rng.choices(FIRST_NAMES, k=count)
+        domains = rng.choices(DOMAINS, k=count)
+        # The id keeps every address unique
+        values = [
+            f"{first.lower()}{record_id}@{domain}"
+            for first, record_id, domain in zip(firsts, ids, domains)
+        ]
+    elif form == "uuid":
+        values = [str(uuid.UUID(int=rng.getrandbits(128), version=4)) for _ in ids]
+    elif form in ("date", "date-time"):
+        offsets = rng.choices(range(5 * 365 * 86400), k=count)
+        moments = [_EPOCH + timedelta(seconds=offset) for offset in offsets]
+        if form == "date":
+            values = [moment.date().isoformat() for moment in moments]
+        else:
+            values = [moment.isoformat() for moment in moments]
+    elif name == "name" and person:
+        values = list(
+            map(
+                "{} {}".format,
+                rng.choices(FIRST_NAMES, k=count),
+                rng.choices(LAST_NAMES, k=count),
+            )
+        )
+    elif name in ("name", "title"):
+        values = list(
+            map(
+                "{} {} {}".format,
+                rng.choices(ADJECTIVES, k=count),
+                rng.choices(MATERIALS, k=count),
+                rng.choices(PRODUCTS, k=count),
+            )
+        )
+    elif name == "description":
+        words = rng.choices(WORDS, k=count * 8)
+        values = [
+            " ".join(words[index : index + 8]).capitalize() + "."
+            for index in range(0, count * 8, 8)
+        ]
+    else:
+        values = [f"{name.capitalize()} {record_id}" for record_id in ids]
+
+    min_length = spec.get("minLength")
+    max_length = spec.get("maxLength")
+    if min_length:
+        values = [value.ljust(min_length, "x") for value in values]
+    if max_length is not None:
+        values = [value[:max_length] for value in values]
+    return values
+
+
+def _column(
+    name: str,
+    spec: Dict[str, Any],
+    ids: List[int],
+    rng: random.Random,
+    person: bool,
+) -> Column:
+    """
+    Generate one property for a whole batch of records.
+
+    :param name: Property name.
+    :param spec: Property schema.
+    :param ids: Ids of the records in the batch.
+    :param rng: Random generator of the batch.
+    :param person: Whether the records describe people (names and emails).
+    :return: The property values, one per id.
+    :raises ValueError: If the property type is not supported.
+    """
+    count = len(ids)
+    kind = spec.get("type")
+    if "enum" in spec:
+        return rng.choices(spec["enum"], k=count)
+    if name == "id" and kind in ("integer", "string"):
+        return ids if kind == "integer" else [str(record_id) for record_id in ids]
+    if kind == "integer":
+        low, high = _bounds(name, spec, 1)
+        return rng.choices(range(math.ceil(low), math.floor(high) + 1), k=count)
+    if kind == "number":
+        # Whole cents, like prices
+        low, high = _bounds(name, spec, 0.01)
+        cents = rng.choices(
+            range(math.ceil(low * 100), math.floor(high * 100) + 1), k=count
+        )
+        return [cent / 100 for cent in cents]
+    if kind == "boolean":
+        return rng.choices((True, False), k=count)
+    if kind == "null":
+        return [None] * count
+    if kind == "string":
+        return _strings(name, spec, ids, rng, person)
+    raise ValueError(f"Cannot generate property '{name}' of type {kind!r}")
+
+
+def _render_chunk(
+    schema: Dict[str, Any], seed: int, index: int, start: int, count: int, fmt: str
+) -> Any:
+    # Module level so worker processes can unpickle it
+    factory = DataFactory(schema, seed=seed)
+    return factory.render(index, start, count, fmt)
+
+
+class DataFactory:
+    def __init__(
+        self,
+        schema: Union[str, Dict[str, Any], SchemaValidator],
+        seed: int = 0,
+        chunk_size: int = 50_000,
+    ) -> None:
+        """
+        Initialize a generator of realistic records for a flat object schema.
+
+        Records are built a column at a time for a whole chunk, so each
+        property costs one batched random call instead of one call per field.
+        Chunk n covers ids start + n * chunk_size onwards and draws from its
+        own generator seeded with (seed, n). The output therefore only
+        depends on seed and chunk_size, not on the number of processes.
+
+        :param schema: Schema name in schemas/ (e.g. "user"), schema dict or
+            validator.
+        :param seed: Random seed.
+        :param chunk_size: Records generated per chunk and per process task.
+        :raises ValueError: If a property cannot be generated.
+        """
+        if isinstance(schema, str):
+            schema = SchemaValidator.load(schema)
+        if isinstance(schema, SchemaValidator):
+            schema = schema.schema
+        self.schema = schema
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.properties: Dict[str, Dict[str, Any]] = schema.get("properties", {})
+        self.columns = list(self.properties)
+        self._person = any(
+            spec.get("format") == "email" or name == "email"
+            for name, spec in self.properties.items()
+        )
+        # Fail on unsupported properties now rather than in a worker process
+        self.columns_for(0, 1, random.Random(seed))
+
+    def columns_for(self, start: int, count: int, rng: random.Random) -> List[Column]:
+        """
+        Generate the columns of count records with consecutive ids.
+
+        :param start: Id of the first record.
+        :param count: Number of records.
+        :param rng: Random generator.
+        :return: One list of values per schema property.
+        """
+        ids = list(range(start, start + count))
+        return [
+            _column(name, spec, ids, rng, self._person)
+            for name, spec in self.properties.items()
+        ]
+
+    def render(self, index: int, start: int, count: int, fmt: str = "records") -> Any:
+        """
+        Generate one chunk in an output format.
+
+        :param index: Chunk index, which seeds its generator.
+        :param start: Id of the first record.
+        :param count: Number of records.
+        :param fmt: "records" (list of dicts), "rows" (list of tuples), "csv"
+            or "jsonl" (text without a header).
+        :return: The chunk.
+        """
+        rng = random.Random(f"{self.seed}:{index}")
+        rows = zip(*self.columns_for(start, count, rng))
+        if fmt == "rows":
+            return list(rows)
+        if fmt == "csv":
+            buffer = io.StringIO()
+            csv.writer(buffer, lineterminator="\n").writerows(rows)
+            return buffer.getvalue()
+        columns = self.columns
+        records = [dict(zip(columns, row)) for row in rows]
+        if fmt == "jsonl":
+            return "".join(
+                json.dumps(record, ensure_ascii=False) + "\n" for record in records
+            )
+        return records
+
+    def _chunks(self, count: int, start_id: int) -> Iterator[Tuple[int, int, int]]:
+        for index in range(math.ceil(count / self.chunk_size)):
+            offset = index * self.chunk_size
+            yield index, start_id + offset, min(self.chunk_size, count - offset)
+
+    def iter_chunks(
+        self,
+        count: int,
+        fmt: str = "records",
+        start_id: int = 1,
+        processes: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """
+        Generate count records as ordered chunks, optionally in worker processes.
+
+        At most two chunks per process are in flight, so memory stays bounded
+        however many records are requested.
+
+        :param count: Number of records.
+        :param fmt: Chunk format, see render().
+        :param start_id: Id of the first record.
+        :param processes: Worker processes (default: CPU count); 1 generates
+            in this process.
+        :return: Iterator of chunks in id order.
+        """
+        chunks = self._chunks(count, start_id)
+        processes = processes or os.cpu_count() or 1
+        if processes == 1 or count <= self.chunk_size:
+            for index, start, size in chunks:
+                yield self.render(index, start, size, fmt)
+            return
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            pending: Deque[Future] = deque()
+            for index, start, size in chunks:
+                pending.append(
+                    executor.submit(
+                        _render_chunk, self.schema, self.seed, index, start, size, fmt
+                    )
+                )
+                if len(pending) >= processes * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def generate(self, count: int, start_id: int = 1) -> Iterator[Dict[str, Any]]:
+        """
+        Stream count records generated in this process.
+
+        :param count: Number of records.
+        :param start_id: Id of the first record.
+        :return: Iterator of records.
+        """
+        for chunk in self.iter_chunks(count, start_id=start_id, processes=1):
+            yield from chunk
+
+    def _write_file(
+        self,
+        path: str,
+        count: int,
+        fmt: str,
+        header: str,
+        processes: Optional[int],
+    ) -> int:
+        started = time.perf_counter()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            file.write(header)
+            for chunk in self.iter_chunks(count, fmt, processes=processes):
+                file.write(chunk)
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"Wrote {count:,} records to {path} in {elapsed:.2f}s "
+            f"({count / elapsed if elapsed else 0:,.0f} records/s)"
+        )
+        return count
+
+    def to_csv(self, path: str, count: int, processes: Optional[int] = None) -> int:
+        """
+        Write count records to a CSV file with a header row.
+
+        :param path: Output file.
+        :param count: Number of records.
+        :param processes: Worker processes (default: CPU count).
+        :return: Number of records written.
+        """
+        return self._write_file(
+            path, count, "csv", ",".join(self.columns) + "\n", processes
+        )
+
+    def to_jsonl(self, path: str, count: int, processes: Optional[int] = None) -> int:
+        """
+        Write count records to a JSON Lines file.
+
+        :param path: Output file.
+        :param count: Number of records.
+        :param processes: Worker processes (default: CPU count).
+        :return: Number of records written.
+        """
+        return self._write_file(path, count, "jsonl", "", processes)
+
+    def to_database(
+        self,
+        database: Database,
+        table: str,
+        count: int,
+        processes: Optional[int] = None,
+        create_table: bool = True,
+        progress: Optional[Callable[[SeedReport], None]] = None,
+    ) -> SeedReport:
+        """
+        Insert count records into a table through the seeding pipeline's bulk
+        path. Generated records already match the schema, so they are not
+        validated again.
+
+        :param database: Target database.
+        :param table: Target table.
+        :param count: Number of records.
+        :param processes: Worker processes (default: CPU count).
+        :param create_table: Create the table from the schema if missing.
+        :param progress: Optional callback receiving the running report.
+        :return: The seeding report.
+        """
+        if create_table:
+            database.execute(create_table_sql(table, self.schema))
+        pipeline = SeedingPipeline(
+            database,
+            table,
+            columns=self.columns,
+            batch_size=self.chunk_size,
+            progress=progress,
+        )
+        records = (
+            record
+            for chunk in self.iter_chunks(count, processes=processes)
+            for record in chunk
+        )
+        return pipeline.run(records)
+
+
+# Example usage
+# factory = DataFactory("user", seed=42)
+# factory.to_csv("reports/data/users.csv", 1_000_000)
+# factory.to_jsonl("reports/data/products.jsonl", 1_000_000)
+# factory.to_database(database, "users", 1_000_000)
@@ -0,0 +1,32 @@
+from .database import Database
+from .pool import (
+    ConnectionPool,
+    PoolTimeoutError,
+    create_pool,
+    postgres_pool,
+    sqlite_pool,
+)
+from .seeding import SeedingPipeline, SeedReport, create_table_sql, iter_records
+from .snapshot import (
+    PostgresTemplateSnapshot,
+    SQLiteSnapshot,
+    TransactionalSession,
+    snapshot_for,
+)
+
+__all__ = [
+    "ConnectionPool",
+    "Database",
+    "PoolTimeoutError",
+    "PostgresTemplateSnapshot",
+    "SQLiteSnapshot",
+    "SeedReport",
+    "SeedingPipeline",
+    "TransactionalSession",
+    "create_pool",
+    "create_table_sql",
+    "iter_records",
+    "postgres_pool",
+    "snapshot_for",
+    "sqlite_pool",
+]
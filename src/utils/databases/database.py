@@ -0,0 +1,194 @@
+import itertools
+import logging
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from src.utils.databases.pool import ConnectionPool
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+Params = Optional[Any]
+
+# Drivers whose named cursors stream rows from the server
+SERVER_SIDE_CURSOR_DRIVERS = ("psycopg", "psycopg2")
+
+
+def _rows_as_dicts(cursor: Any, rows: Sequence[Sequence[Any]]) -> List[Dict[str, Any]]:
+    columns = [column[0] for column in cursor.description]
+    return [dict(zip(columns, row)) for row in rows]
+
+
+class Database:
+    def __init__(self, pool: ConnectionPool) -> None:
+        """
+        Initialize query helpers on top of a connection pool.
+
+        SQL uses the driver's own placeholder style ("?" for sqlite3, "%s"
+        for psycopg). Every call borrows a pooled connection, so a check
+        after an API call costs a query, not a new connection.
+
+        :param pool: Pool providing the connections.
+        """
+        self.pool = pool
+        self._cursor_ids = itertools.count()
+
+    @contextmanager
+    def transaction(self) -> Iterator[Any]:
+        """
+        Run several statements on one connection and commit them together.
+
+        :yield: The connection; rolled back if the block raises.
+        """
+        with self.pool.connection() as connection:
+            try:
+                yield connection
+            except Exception:
+                connection.rollback()
+                raise
+            connection.commit()
+
+    def execute(self, sql: str, params: Params = None) -> int:
+        """
+        Execute one statement and commit it.
+
+        :param sql: Statement to execute.
+        :param params: Statement parameters.
+        :return: Number of affected rows.
+        """
+        with self.transaction() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(sql, params or ())
+                return cursor.rowcount
+            finally:
+                cursor.close()
+
+    def executemany(self, sql: str, rows: Iterable[Any], batch_size: int = 1000) -> int:
+        """
+        Execute a statement for many parameter sets in one transaction.
+
+        Rows are consumed in batches of batch_size, so generators of any size
+        can be inserted without building one big list. psycopg2 batches
+        through execute_batch, which saves a round trip per row.
+
+        :param sql: Statement to execute.
+        :param rows: Parameter sets.
+        :param batch_size: Parameter sets sent per driver call.
+        :return: Number of affected rows.
+        """
+        iterator = iter(rows)
+        total = 0
+        with self.transaction() as connection:
+            cursor = connection.cursor()
+            try:
+                while True:
+                    batch = list(itertools.islice(iterator, batch_size))
+                    if not batch:
+                        break
+                    if self.pool.driver == "psycopg2":
+                        from psycopg2.extras import execute_batch
+
+                        execute_batch(cursor, sql, batch, page_size=batch_size)
+                        total += len(batch)
+                    else:
+                        cursor.executemany(sql, batch)
+                        total += max(cursor.rowcount, 0)
+            finally:
+                cursor.close()
+        logger.debug(f"executemany affected {total} rows")
+        return total
+
+    def fetch_all(self, sql: str, params: Params = None) -> List[Dict[str, Any]]:
+        """
+        Fetch every row of a query.
+
+        :param sql: Query to run.
+        :param params: Query parameters.
+        :return: Rows as column -> value dictionaries.
+        """
+        with self.pool.connection() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(sql, params or ())
+                return _rows_as_dicts(cursor, cursor.fetchall())
+            finally:
+                cursor.close()
+
+    def fetch_one(self, sql: str, params: Params = None) -> Optional[Dict[str, Any]]:
+        """
+        Fetch the first row of a query.
+
+        :param sql: Query to run.
+        :param params: Query parameters.
+        :return: The row as a dictionary, or None if there is none.
+        """
+        with self.pool.connection() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(sql, params or ())
+                row = cursor.fetchone()
+                return None if row is None else _rows_as_dicts(cursor, [row])[0]
+            finally:
+                cursor.close()
+
+    def fetch_value(self, sql: str, params: Params = None) -> Any:
+        """
+        Fetch the first column of the first row, e.g. of a COUNT(*).
+
+        :param sql: Query to run.
+        :param params: Query parameters.
+        :return: The value, or None if there is no row.
+        """
+        with self.pool.connection() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(sql, params or ())
+                row = cursor.fetchone()
+                return None if row is None else row[0]
+            finally:
+                cursor.close()
+
+    def fetch_iter(
+        self, sql: str, params: Params = None, batch_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the rows of a large query batch by batch.
+
+        PostgreSQL drivers use a named (server-side) cursor, so only
+        batch_size rows are held in memory; sqlite3 steps through the result
+        lazily by itself. The connection stays borrowed until the iteration
+        ends or the generator is closed.
+
+        :param sql: Query to run.
+        :param params: Query parameters.
+        :param batch_size: Rows fetched per round trip.
+        :return: Iterator of rows as dictionaries.
+        """
+        with self.pool.connection() as connection:
+            if self.pool.driver in SERVER_SIDE_CURSOR_DRIVERS:
+                cursor = connection.cursor(name=f"fetch_iter_{next(self._cursor_ids)}")
+                cursor.itersize = batch_size
+            else:
+                cursor = connection.cursor()
+            try:
+                cursor.execute(sql, params or ())
+                columns = None
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    if columns is None:
+                        columns = [column[0] for column in cursor.description]
+                    for row in rows:
+                        yield dict(zip(columns, row))
+            finally:
+                cursor.close()
+
+
+# Example usage
+# database = Database(create_pool("sqlite:///reports/app.db"))
+# database.executemany("INSERT INTO users (name) VALUES (?)", [("a",), ("b",)])
+# assert database.fetch_value("SELECT COUNT(*) FROM users") == 2
+# for row in database.fetch_iter("SELECT * FROM users", batch_size=500):
+#     ...
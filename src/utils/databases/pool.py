@@ -0,0 +1,333 @@
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Tuple
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(RuntimeError):
+    pass
+
+
+class ConnectionPool:
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        max_size: int = 10,
+        min_size: int = 0,
+        timeout: float = 10.0,
+        max_idle: float = 300.0,
+        ping_interval: float = 30.0,
+        ping_sql: str = "SELECT 1",
+        driver: Optional[str] = None,
+        name: str = "db",
+    ) -> None:
+        """
+        Initialize a thread-safe pool of DB-API connections.
+
+        Connections are created on demand up to max_size and handed out most
+        recently used first, so a few warm connections serve most checkouts.
+        A connection idle for longer than ping_interval is checked with
+        ping_sql before reuse, and one idle for longer than max_idle is
+        replaced.
+
+        :param connect: Callable returning a new DB-API connection.
+        :param max_size: Maximum number of open connections.
+        :param min_size: Connections opened up front.
+        :param timeout: Default seconds to wait for a free connection.
+        :param max_idle: Seconds after which an idle connection is replaced.
+        :param ping_interval: Idle seconds after which a connection is pinged.
+        :param ping_sql: Cheap statement used to check a connection.
+        :param driver: DB-API module name ("sqlite3", "psycopg", "psycopg2").
+        :param name: Pool name used in logs.
+        :raises ValueError: If the sizes are inconsistent.
+        """
+        if max_size < 1 or not 0 <= min_size <= max_size:
+            raise ValueError(
+                f"Invalid pool sizes: min_size={min_size}, max_size={max_size}"
+            )
+        self._connect = connect
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.ping_interval = ping_interval
+        self.ping_sql = ping_sql
+        self.driver = driver
+        self.name = name
+        self._idle: Deque[Tuple[Any, float]] = deque()
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._stats: Dict[str, int] = {
+            "created": 0,
+            "acquired": 0,
+            "waited": 0,
+            "discarded": 0,
+        }
+        for _ in range(min_size):
+            self._idle.append((self._create(), time.monotonic()))
+            self._size += 1
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self._condition:
+            return {
+                **self._stats,
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+            }
+
+    def _create(self) -> Any:
+        connection = self._connect()
+        self._stats["created"] += 1
+        logger.debug(f"Pool '{self.name}' opened a connection")
+        return connection
+
+    def _ping(self, connection: Any) -> bool:
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(self.ping_sql)
+                cursor.fetchall()
+            finally:
+                cursor.close()
+            connection.rollback()
+            return True
+        except Exception as e:
+            logger.warning(f"Pool '{self.name}' dropped a dead connection: {e}")
+            return False
+
+    def _discard(self, connection: Any) -> None:
+        self._stats["discarded"] += 1
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """
+        Check a connection out of the pool.
+
+        :param timeout: Seconds to wait for a free connection (default: pool timeout).
+        :return: A DB-API connection; give it back with release().
+        :raises PoolTimeoutError: If no connection frees up in time.
+        :raises RuntimeError: If the pool is closed.
+        """
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        connection = None
+        idle_since = 0.0
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError(f"Pool '{self.name}' is closed")
+                if self._idle:
+                    connection, idle_since = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    # Reserve the slot; the connection is opened outside the lock
+                    self._size += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeoutError(
+                        f"No connection free in pool '{self.name}' "
+                        f"(max_size={self.max_size}) after "
+                        f"{self.timeout if timeout is None else timeout}s"
+                    )
+                self._stats["waited"] += 1
+                self._condition.wait(remaining)
+            self._stats["acquired"] += 1
+
+        if connection is not None:
+            idle = time.monotonic() - idle_since
+            if idle > self.max_idle or (
+                idle > self.ping_interval and not self._ping(connection)
+            ):
+                self._discard(connection)
+                connection = None
+        if connection is None:
+            try:
+                connection = self._create()
+            except Exception:
+                with self._condition:
+                    self._size -= 1
+                    self._condition.notify()
+                raise
+        return connection
+
+    def release(self, connection: Any, discard: bool = False) -> None:
+        """
+        Return a connection to the pool, rolling back any open transaction.
+
+        :param connection: Connection obtained from acquire().
+        :param discard: Close the connection instead of reusing it.
+        """
+        if not discard:
+            try:
+                connection.rollback()
+            except Exception:
+                discard = True
+        with self._condition:
+            if discard or self._closed:
+                self._size -= 1
+                self._discard(connection)
+            else:
+                self._idle.append((connection, time.monotonic()))
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        Borrow a connection for the duration of a with block.
+
+        :param timeout: Seconds to wait for a free connection.
+        :yield: A DB-API connection.
+        """
+        connection = self.acquire(timeout)
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def discard_idle(self) -> int:
+        """
+        Close the idle connections, e.g. after the database was replaced
+        underneath them; the pool stays open and reconnects on demand.
+
+        :return: Number of connections closed.
+        """
+        with self._condition:
+            count = len(self._idle)
+            while self._idle:
+                connection, _ = self._idle.pop()
+                self._size -= 1
+                self._discard(connection)
+            self._condition.notify_all()
+        return count
+
+    def close(self) -> None:
+        """
+        Close idle connections; connections in use are closed on release.
+        """
+        with self._condition:
+            self._closed = True
+        self.discard_idle()
+        logger.info(f"Pool '{self.name}' closed")
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def sqlite_pool(
+    database: str,
+    max_size: int = 5,
+    statement_cache_size: int = 256,
+    **kwargs: Any,
+) -> ConnectionPool:
+    """
+    Create a pool of sqlite3 connections.
+
+    sqlite3 keeps compiled statements per connection; statement_cache_size
+    sizes that cache, so repeated checks skip SQL parsing.
+
+    :param database: Database file path (":memory:" is per connection).
+    :param max_size: Maximum number of open connections.
+    :param statement_cache_size: Prepared statements cached per connection.
+    :param kwargs: Further ConnectionPool arguments.
+    :return: The pool.
+    """
+    import sqlite3
+
+    def connect() -> Any:
+        # The pool hands a connection to one thread at a time
+        return sqlite3.connect(
+            database,
+            check_same_thread=False,
+            cached_statements=statement_cache_size,
+        )
+
+    return ConnectionPool(
+        connect, max_size=max_size, driver="sqlite3", name=database, **kwargs
+    )
+
+
+def postgres_pool(
+    dsn: str,
+    max_size: int = 10,
+    statement_cache_size: int = 256,
+    prepare_threshold: int = 1,
+    **kwargs: Any,
+) -> ConnectionPool:
+    """
+    Create a pool of PostgreSQL connections with psycopg (3), falling back to
+    psycopg2. Both are optional dependencies.
+
+    With psycopg, statements run more than prepare_threshold times are
+    prepared server-side and up to statement_cache_size of them are kept
+    per connection. psycopg2 has no prepared statement support.
+
+    :param dsn: libpq connection string or URL.
+    :param max_size: Maximum number of open connections.
+    :param statement_cache_size: Prepared statements kept per connection (psycopg).
+    :param prepare_threshold: Executions before a statement is prepared (psycopg).
+    :param kwargs: Further ConnectionPool arguments.
+    :return: The pool.
+    :raises RuntimeError: If neither driver is installed.
+    """
+    try:
+        import psycopg
+
+        def connect() -> Any:
+            connection = psycopg.connect(dsn, prepare_threshold=prepare_threshold)
+            connection.prepared_max = statement_cache_size
+            return connection
+
+        driver = "psycopg"
+    except ImportError:
+        try:
+            import psycopg2
+        except ImportError as e:
+            raise RuntimeError(
+                "PostgreSQL pools need 'psycopg' or 'psycopg2' installed"
+            ) from e
+
+        def connect() -> Any:
+            return psycopg2.connect(dsn)
+
+        driver = "psycopg2"
+
+    return ConnectionPool(
+        connect, max_size=max_size, driver=driver, name="postgres", **kwargs
+    )
+
+
+def create_pool(url: str, **kwargs: Any) -> ConnectionPool:
+    """
+    Create a pool from a database URL.
+
+    :param url: "sqlite:///path/to.db", "sqlite:///:memory:" or "postgresql://...".
+    :param kwargs: Arguments for sqlite_pool or postgres_pool.
+    :return: The pool.
+    :raises ValueError: If the URL scheme is not supported.
+    """
+    scheme, _, rest = url.partition("://")
+    if scheme == "sqlite":
+        return sqlite_pool(rest[1:] if rest.startswith("/") else rest, **kwargs)
+    if scheme in ("postgres", "postgresql"):
+        return postgres_pool(url, **kwargs)
+    raise ValueError(f"Unsupported database URL scheme '{scheme}'")
+
+
+# Example usage
+# pool = create_pool("sqlite:///reports/results.db", max_size=4)
+# with pool.connection() as connection:
+#     connection.execute("SELECT 1")
+# pool.close()
@@ -0,0 +1,304 @@
+import itertools
+import logging
+import os
+import re
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+from src.utils.databases.database import Database
+from src.utils.databases.pool import ConnectionPool
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]{0,62}$")
+
+
+def _execute(connection: Any, sql: str, params: Any = ()) -> None:
+    cursor = connection.cursor()
+    try:
+        cursor.execute(sql, params)
+    finally:
+        cursor.close()
+
+
+class SQLiteSnapshot:
+    def __init__(self, pool: ConnectionPool, path: Optional[str] = None) -> None:
+        """
+        Initialize a snapshot of a SQLite database taken with the backup API.
+
+        The copy is consistent even while other connections are open. It is
+        kept in memory, or in a file when path is given so it can be reused
+        by later runs.
+
+        :param pool: Pool of the database to snapshot and restore.
+        :param path: Optional snapshot file; restore() loads it if take()
+            was not called.
+        """
+        self.pool = pool
+        self.path = path
+        self._snapshot: Optional[Any] = None
+
+    def _open_snapshot(self) -> Any:
+        import sqlite3
+
+        return sqlite3.connect(self.path or ":memory:", check_same_thread=False)
+
+    def take(self) -> None:
+        """
+        Copy the current database into the snapshot.
+        """
+        self.close()
+        self._snapshot = self._open_snapshot()
+        with self.pool.connection() as connection:
+            connection.backup(self._snapshot)
+        logger.info(f"Took snapshot of SQLite database {self.pool.name}")
+
+    def restore(self) -> None:
+        """
+        Overwrite the database with the snapshot.
+
+        :raises RuntimeError: If there is neither a taken nor a saved snapshot.
+        """
+        if self._snapshot is None:
+            if not (self.path and os.path.exists(self.path)):
+                raise RuntimeError("No snapshot to restore; call take() first")
+            self._snapshot = self._open_snapshot()
+        with self.pool.connection() as connection:
+            self._snapshot.backup(connection)
+        logger.debug(f"Restored SQLite database {self.pool.name}")
+
+    def close(self) -> None:
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+
+
+class PostgresTemplateSnapshot:
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        admin_pool: ConnectionPool,
+        database: str,
+        template: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a snapshot kept as a PostgreSQL template database.
+
+        take() clones the database into the template and restore() recreates
+        the database from it with CREATE DATABASE ... TEMPLATE. This is a
+        file-level copy on the server, far faster than replaying seed data.
+        Both statements need the database to have no other sessions, so
+        restore() also terminates them and empties the pool's idle list.
+
+        :param pool: Pool of the database under test.
+        :param admin_pool: Pool connected to another database of the same
+            server (e.g. "postgres") with CREATEDB rights.
+        :param database: Name of the database under test.
+        :param template: Template name (default: "<database>_snapshot").
+        :raises ValueError: If a database name is not a plain identifier.
+        """
+        template = template or f"{database}_snapshot"
+        for name in (database, template):
+            if not _IDENTIFIER.match(name):
+                raise ValueError(f"Unsupported database name '{name}'")
+        self.pool = pool
+        self.admin_pool = admin_pool
+        self.database = database
+        self.template = template
+
+    @contextmanager
+    def _admin(self) -> Iterator[Any]:
+        # CREATE/DROP DATABASE cannot run inside a transaction block
+        with self.admin_pool.connection() as connection:
+            connection.autocommit = True
+            try:
+                yield connection
+            finally:
+                connection.autocommit = False
+
+    def _disconnect(self, connection: Any, database: str) -> None:
+        self.pool.discard_idle()
+        _execute(
+            connection,
+            "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+            "WHERE datname = %s AND pid <> pg_backend_pid()",
+            (database,),
+        )
+
+    def take(self) -> None:
+        """
+        Clone the database into the template database.
+        """
+        with self._admin() as connection:
+            self._disconnect(connection, self.database)
+            _execute(connection, f'DROP DATABASE IF EXISTS "{self.template}"')
+            _execute(
+                connection,
+                f'CREATE DATABASE "{self.template}" TEMPLATE "{self.database}"',
+            )
+        logger.info(f"Cloned database {self.database} into {self.template}")
+
+    def restore(self) -> None:
+        """
+        Recreate the database from the template database.
+        """
+        with self._admin() as connection:
+            self._disconnect(connection, self.database)
+            _execute(connection, f'DROP DATABASE IF EXISTS "{self.database}"')
+            _execute(
+                connection,
+                f'CREATE DATABASE "{self.database}" TEMPLATE "{self.template}"',
+            )
+        logger.debug(f"Recreated database {self.database} from {self.template}")
+
+    def close(self) -> None:
+        with self._admin() as connection:
+            _execute(connection, f'DROP DATABASE IF EXISTS "{self.template}"')
+
+
+class _SavepointConnection:
+    """
+    Connection proxy whose commit and rollback act on a savepoint, so the
+    work stays inside the enclosing session transaction.
+    """
+
+    def __init__(self, connection: Any, name: str) -> None:
+        self._connection = connection
+        self._name = name
+        _execute(connection, f"SAVEPOINT {name}")
+
+    def commit(self) -> None:
+        _execute(self._connection, f"RELEASE SAVEPOINT {self._name}")
+        _execute(self._connection, f"SAVEPOINT {self._name}")
+
+    def rollback(self) -> None:
+        _execute(self._connection, f"ROLLBACK TO SAVEPOINT {self._name}")
+
+    def finish(self) -> None:
+        # Uncommitted work is dropped, as the real pool does on release
+        self.rollback()
+        _execute(self._connection, f"RELEASE SAVEPOINT {self._name}")
+
+    def close(self) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+
+class _SessionPool:
+    """
+    Pool stand-in lending the session's connection, one savepoint per borrow.
+    """
+
+    def __init__(self, session: "TransactionalSession") -> None:
+        self._session = session
+        self.driver = session.pool.driver
+        self.name = session.pool.name
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        proxy = _SavepointConnection(
+            self._session.connection, f"borrow_{next(self._session._ids)}"
+        )
+        try:
+            yield proxy
+        finally:
+            proxy.finish()
+
+
+class TransactionalSession:
+    def __init__(self, pool: ConnectionPool) -> None:
+        """
+        Initialize a session running on one pooled connection inside a
+        transaction that is rolled back at the end, so nothing it writes is
+        ever committed.
+
+        savepoint() blocks nest inside it: seed once per module, then roll
+        each test back to the seeded state. Writes made by the system under
+        test through its own connections are not covered; use a snapshot for
+        those.
+
+        :param pool: Pool to borrow the connection from.
+        """
+        self.pool = pool
+        self.connection: Optional[Any] = None
+        self.database = Database(_SessionPool(self))
+        self._ids = itertools.count()
+
+    def begin(self) -> Database:
+        """
+        Borrow the connection and open the session transaction.
+
+        :return: Database helper whose commits stay inside the session.
+        """
+        self.connection = self.pool.acquire()
+        if self.pool.driver == "sqlite3":
+            # Other drivers open the transaction with the first statement
+            _execute(self.connection, "BEGIN")
+        return self.database
+
+    @contextmanager
+    def savepoint(self) -> Iterator[Database]:
+        """
+        Roll everything written inside the block back when it ends.
+
+        :yield: The session's Database helper.
+        """
+        name = f"test_{next(self._ids)}"
+        _execute(self.connection, f"SAVEPOINT {name}")
+        try:
+            yield self.database
+        finally:
+            _execute(self.connection, f"ROLLBACK TO SAVEPOINT {name}")
+            _execute(self.connection, f"RELEASE SAVEPOINT {name}")
+
+    def end(self) -> None:
+        """
+        Roll the session transaction back and return the connection.
+        """
+        if self.connection is not None:
+            self.pool.release(self.connection)
+            self.connection = None
+
+    def __enter__(self) -> "TransactionalSession":
+        self.begin()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.end()
+
+
+def snapshot_for(
+    pool: ConnectionPool,
+    admin_pool: Optional[ConnectionPool] = None,
+    database: Optional[str] = None,
+    path: Optional[str] = None,
+) -> Any:
+    """
+    Pick the snapshot strategy for a pool's driver.
+
+    :param pool: Pool of the database under test.
+    :param admin_pool: Admin pool, required for PostgreSQL.
+    :param database: Database name for PostgreSQL (default: current database).
+    :param path: Optional snapshot file for SQLite.
+    :return: A SQLiteSnapshot or PostgresTemplateSnapshot.
+    :raises ValueError: If the driver is unsupported or admin_pool is missing.
+    """
+    if pool.driver == "sqlite3":
+        return SQLiteSnapshot(pool, path)
+    if pool.driver in ("psycopg", "psycopg2"):
+        if admin_pool is None:
+            raise ValueError("PostgreSQL template snapshots need an admin pool")
+        if database is None:
+            database = Database(pool).fetch_value("SELECT current_database()")
+        return PostgresTemplateSnapshot(pool, admin_pool, database)
+    raise ValueError(f"No snapshot strategy for driver '{pool.driver}'")
+
+
+# Example usage
+# snapshot = snapshot_for(sqlite_pool("reports/app.db"))
+# snapshot.take()
+# ...  # the test writes to the database
+# snapshot.restore()
@@ -1,6 +1,6 @@
 import csv
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 
 class CsvFileManager:
@@ -25,6 +25,22 @@ class CsvFileManager:
         except csv.Error as e:
             raise RuntimeError(f"Error parsing CSV file {file_path}: {str(e)}")
 
+    @staticmethod
+    def iter_csv_data(file_path: str) -> Iterator[Dict[str, str]]:
+        """
+        Stream the rows of a CSV file one at a time, for files too large to load.
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"The file {file_path} does not exist.")
+
+        try:
+            with open(file_path, "r", newline="") as file:
+                yield from csv.DictReader(file)
+        except OSError as e:
+            raise RuntimeError(f"Error reading file {file_path}: {str(e)}")
+        except csv.Error as e:
+            raise RuntimeError(f"Error parsing CSV file {file_path}: {str(e)}")
+
     @staticmethod
     def save_csv_data(
         file_path: str, data: List[Dict[str, Any]], fieldnames: List[str]
@@ -1,6 +1,6 @@
 import json
 import os
-from typing import Any
+from typing import Any, Iterator, Optional
 
 
 class JsonFileManager:
@@ -24,6 +24,34 @@ class JsonFileManager:
         except OSError as e:
             raise RuntimeError(f"Error reading file {file_path}: {str(e)}")
 
+    @staticmethod
+    def iter_json_records(file_path: str, key: Optional[str] = None) -> Iterator[Any]:
+        """
+        Yield the records of a JSON array, or of the array under key, or of a
+        JSON Lines file (.jsonl/.ndjson), which is streamed line by line.
+        """
+        if not file_path.endswith((".jsonl", ".ndjson")):
+            data = JsonFileManager.load_json_data(file_path)
+            records = data[key] if key is not None else data
+            if not isinstance(records, list):
+                raise RuntimeError(f"Expected a list of records in {file_path}")
+            yield from records
+            return
+
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"The file {file_path} does not exist.")
+        try:
+            with open(file_path, "r") as file:
+                for line_number, line in enumerate(file, 1):
+                    if line.strip():
+                        yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise RuntimeError(
+                f"Error parsing JSON line {line_number} of file {file_path}: {str(e)}"
+            )
+        except OSError as e:
+            raise RuntimeError(f"Error reading file {file_path}: {str(e)}")
+
     @staticmethod
     def save_json_data(file_path: str, data: Any) -> None:
         """
@@ -1,6 +1,15 @@
 import os
 import tempfile
-from typing import Generator
+from typing import Generator, Optional
+
+from src.utils.worker import is_worker, worker_temp_dir
+
+
+def _default_dir(dir: Optional[str]) -> Optional[str]:
+    # Keep parallel test workers out of each other's way
+    if dir is None and is_worker():
+        return worker_temp_dir()
+    return dir
 
 
 class TemporaryFileManager:
@@ -17,11 +26,12 @@ class TemporaryFileManager:
 
         :param suffix: The file name suffix (e.g., '.json').
         :param prefix: The file name prefix.
-        :param dir: The directory where the file is to be created.
+        :param dir: The directory where the file is to be created (defaults to
+            the system temp dir, or the worker's own temp dir under pytest-xdist).
         :return: The path to the created temporary file.
         """
         temp_file = tempfile.NamedTemporaryFile(
-            delete=False, suffix=suffix, prefix=prefix, dir=dir
+            delete=False, suffix=suffix, prefix=prefix, dir=_default_dir(dir)
         )
         return temp_file.name
 
@@ -35,11 +45,12 @@ class TemporaryFileManager:
         :param content: The content to write to the file.
         :param suffix: The file name suffix.
         :param prefix: The file name prefix.
-        :param dir: The directory where the file is to be created.
+        :param dir: The directory where the file is to be created (defaults to
+            the system temp dir, or the worker's own temp dir under pytest-xdist).
         :return: The path to the created temporary file.
         """
         temp_file = tempfile.NamedTemporaryFile(
-            delete=False, suffix=suffix, prefix=prefix, dir=dir, mode="w"
+            delete=False, suffix=suffix, prefix=prefix, dir=_default_dir(dir), mode="w"
         )
         temp_file.write(content)
         temp_file.close()
@@ -67,11 +78,12 @@ class TemporaryFileManager:
 
         :param suffix: The file name suffix.
         :param prefix: The file name prefix.
-        :param dir: The directory where the file is to be created.
+        :param dir: The directory where the file is to be created (defaults to
+            the system temp dir, or the worker's own temp dir under pytest-xdist).
         :yield: The path to the created temporary file.
         """
         temp_file_path = tempfile.NamedTemporaryFile(
-            delete=False, suffix=suffix, prefix=prefix, dir=dir
+            delete=False, suffix=suffix, prefix=prefix, dir=_default_dir(dir)
         ).name
         try:
             yield temp_file_path
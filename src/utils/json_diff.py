@@ -0,0 +1,540 @@
+import json
+import logging
+import math
+import operator
+import re
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from itertools import chain, compress
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Union
+
+from src.utils.schema_validator import SchemaValidator
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+INVALID = "invalid"
+
+
+class _Full(Exception):
+    """Raised internally to stop walking once enough differences are found."""
+
+
+def _translate(pattern: str) -> str:
+    # Only * is special, so that list paths such as $[*].price need no escaping
+    return ".*".join(re.escape(part) for part in pattern.split("*"))
+
+
+def _compile(patterns: Iterable[str]) -> Optional["re.Pattern[str]"]:
+    patterns = list(patterns)
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{_translate(pattern)})" for pattern in patterns))
+
+
+def _child(path: str, key: str) -> str:
+    if key.isidentifier():
+        return f"{path}.{key}"
+    return f"{path}[{json.dumps(key)}]"
+
+
+def _item(path: str, key: str, value: Any) -> str:
+    return f"{path}[{key}={json.dumps(value, default=str)}]"
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _same(expected: Any, actual: Any) -> bool:
+    # == holds for True == 1 and False == 0, which JSON tells apart
+    if expected is actual:
+        return True
+    return expected == actual and _same_types(expected, actual)
+
+
+def _same_types(expected: Any, actual: Any) -> bool:
+    # For values equal by ==: whether no boolean stands for a number
+    if isinstance(expected, dict):
+        return all(_same_types(value, actual[name]) for name, value in expected.items())
+    if isinstance(expected, list):
+        return all(map(_same_types, expected, actual))
+    return isinstance(expected, bool) == isinstance(actual, bool)
+
+
+_CONTAINERS = (dict, list)
+
+
+def _of_kind(values: List[Any], kinds: Set[type], kind: type) -> List[Any]:
+    if kind not in kinds:
+        return []
+    if len(kinds) == 1:
+        return values
+    return [value for value in values if type(value) is kind]
+
+
+def _children(values: List[Any], kinds: Set[type]) -> Iterator[Any]:
+    # The next tree level: values of the dicts and items of the lists
+    return chain(
+        chain.from_iterable(map(dict.values, _of_kind(values, kinds, dict))),
+        chain.from_iterable(_of_kind(values, kinds, list)),
+    )
+
+
+def _has_bool(values: List[Any]) -> bool:
+    # One tree level at a time, with C-level passes instead of a Python loop
+    # per value; a level is only kept in memory if it holds containers
+    kinds = set(map(type, values))
+    while bool not in kinds:
+        if kinds.isdisjoint(_CONTAINERS):
+            return False
+        children = set(map(type, _children(values, kinds)))
+        if not children.isdisjoint(_CONTAINERS):
+            values = list(_children(values, kinds))
+        kinds = children
+    return True
+
+
+def _types_match(left: List[Any], right: List[Any]) -> bool:
+    # For values pairwise equal by ==: whether no boolean stands for a number.
+    # Values holding booleans are lined up one tree level at a time; False
+    # may also mean 1 against 1.0 or keys in another order, which callers
+    # then settle pair by pair with _same
+    if not (_has_bool(left) or _has_bool(right)):
+        return True
+    while left:
+        types = list(map(type, left))
+        if types != list(map(type, right)):
+            return False
+        kinds = set(types)
+        # Iterating a dict yields its keys; the same keys in the same order
+        # line the values of both sides up
+        if list(chain.from_iterable(_of_kind(left, kinds, dict))) != list(
+            chain.from_iterable(_of_kind(right, kinds, dict))
+        ):
+            return False
+        left = list(_children(left, kinds))
+        right = list(_children(right, kinds))
+    return True
+
+
+def _equal_pairs(left: List[Any], right: List[Any]) -> List[bool]:
+    # Whether each aligned pair is equal, with booleans apart from numbers;
+    # one bulk type check unless it fails
+    equal = list(map(operator.eq, left, right))
+    if _types_match(list(compress(left, equal)), list(compress(right, equal))):
+        return equal
+    return [
+        same and _same_types(value, other)
+        for same, value, other in zip(equal, left, right)
+    ]
+
+
+# Canonical encoding used to align list items by content; a shared encoder
+# avoids building one per item
+_fingerprint = json.JSONEncoder(sort_keys=True, default=str).encode
+
+
+def _short(value: Any, width: int) -> str:
+    text = json.dumps(value, default=str)
+    return text if len(text) <= width else f"{text[: width - 3]}..."
+
+
+@dataclass
+class Difference:
+    """
+    One difference between an expected and an actual document.
+
+    Paths start at $ for the document root: $.meta.total, $[3] for the
+    fourth item of a list, or $[id=7].price for the item with id 7 of a
+    list aligned by key.
+    """
+
+    path: str
+    kind: str
+    expected: Any = None
+    actual: Any = None
+
+    def describe(self, width: int = 80) -> str:
+        if self.kind == CHANGED:
+            return (
+                f"{self.path}: {_short(self.expected, width)}"
+                f" -> {_short(self.actual, width)}"
+            )
+        if self.kind == ADDED:
+            return f"{self.path}: unexpected {_short(self.actual, width)}"
+        if self.kind == REMOVED:
+            return f"{self.path}: missing {_short(self.expected, width)}"
+        return f"{self.path}: {self.actual}"
+
+
+@dataclass
+class DiffResult:
+    differences: List[Difference] = field(default_factory=list)
+    # True if the walk stopped at max_differences and more may exist
+    truncated: bool = False
+
+    @property
+    def equal(self) -> bool:
+        return not self.differences
+
+    def __len__(self) -> int:
+        return len(self.differences)
+
+    def __iter__(self) -> Iterator[Difference]:
+        return iter(self.differences)
+
+    def format(self, width: int = 80) -> str:
+        """
+        Describe the differences, one per line.
+
+        :param width: Maximum length of each value shown.
+        :return: The report, or "no differences".
+        """
+        if self.equal:
+            return "no differences"
+        count = f"{len(self.differences)}{'+' if self.truncated else ''}"
+        lines = [f"{count} difference(s):"]
+        lines.extend(f"  {difference.describe(width)}" for difference in self)
+        if self.truncated:
+            lines.append("  ... more not shown")
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.format()
+
+
+class JsonDiff:
+    def __init__(
+        self,
+        key: Union[None, str, Dict[str, str]] = "id",
+        ignore: Iterable[str] = (),
+        tolerance: Optional[Dict[str, float]] = None,
+        validator: Optional[SchemaValidator] = None,
+        max_differences: Optional[int] = 100,
+        width: int = 80,
+    ) -> None:
+        """
+        Initialize a structural diff of decoded JSON documents.
+
+        Identical branches are skipped with C-level comparisons before any
+        path is built, so the cost follows the size of what differs rather
+        than the size of the document. Numbers compare by value, as with ==,
+        but booleans never equal numbers.
+
+        :param key: Field aligning lists of objects, e.g. "id", so that
+            reordered, inserted and deleted items are matched by key rather
+            than position; or a mapping of list path patterns to fields,
+            e.g. {"$.orders": "order_id"}. Lists whose items do not all carry
+            a unique key are aligned by content.
+        :param ignore: Path patterns never reported, e.g. "*.updated_at".
+            In patterns * matches any run of characters.
+        :param tolerance: Path patterns to the absolute difference allowed
+            between numbers, e.g. {"*.price": 0.01}.
+        :param validator: Schema the actual records (the document or the
+            items of a list document) are also checked against.
+        :param max_differences: Stop after this many differences; None for all.
+        :param width: Maximum length of each value in the formatted report.
+        """
+        self.key = key
+        self.validator = validator
+        self.max_differences = max_differences
+        self.width = width
+        self._ignore = _compile(ignore)
+        self._keys = (
+            [(re.compile(_translate(path)), name) for path, name in key.items()]
+            if isinstance(key, dict)
+            else None
+        )
+        self._tolerances = [
+            (re.compile(_translate(path)), allowed)
+            for path, allowed in (tolerance or {}).items()
+        ]
+
+    @classmethod
+    def from_schema(
+        cls,
+        schema: Union[str, Dict[str, Any], SchemaValidator],
+        tolerance: Optional[float] = None,
+        **options: Any,
+    ) -> "JsonDiff":
+        """
+        Build a diff for records of one schema: lists are aligned by id if the
+        schema requires one, the given tolerance applies to every number
+        property (such as price), and actual records are validated.
+
+        :param schema: Schema name (see SchemaValidator.load), schema or validator.
+        :param tolerance: Absolute tolerance of number properties.
+        :param options: Other JsonDiff arguments; they take precedence.
+        :return: The diff.
+        """
+        if isinstance(schema, str):
+            validator = SchemaValidator.load(schema)
+        elif isinstance(schema, dict):
+            validator = SchemaValidator(schema)
+        else:
+            validator = schema
+        properties = validator.schema.get("properties", {})
+        if "id" in validator.schema.get("required", ()):
+            options.setdefault("key", "id")
+        else:
+            options.setdefault("key", None)
+        if tolerance is not None:
+            options.setdefault(
+                "tolerance",
+                {
+                    f"*.{name}": tolerance
+                    for name, spec in properties.items()
+                    if spec.get("type") == "number"
+                },
+            )
+        options.setdefault("validator", validator)
+        return cls(**options)
+
+    def compare(self, expected: Any, actual: Any) -> DiffResult:
+        """
+        Compare two decoded JSON documents.
+
+        :param expected: Expected document, e.g. a fixture.
+        :param actual: Actual document, e.g. a response body.
+        :return: The differences, at most max_differences of them.
+        """
+        result = DiffResult()
+        try:
+            if self.validator is not None:
+                self._validate(actual, result.differences)
+            self._diff(expected, actual, "$", result.differences)
+        except _Full:
+            result.truncated = True
+        logger.debug(
+            f"JSON diff found {len(result)}{'+' if result.truncated else ''} "
+            "difference(s)"
+        )
+        return result
+
+    def compare_file(self, path: str, actual: Any) -> DiffResult:
+        """
+        Compare a document with a fixture file.
+
+        :param path: .json, .jsonl/.ndjson or .csv fixture. CSV values are
+            converted to the validator's property types, if there is one.
+        :param actual: Actual document.
+        :return: The differences.
+        """
+        from src.utils.file.csv_file_manager import CsvFileManager
+        from src.utils.file.json_file_manager import JsonFileManager
+
+        if path.endswith(".csv"):
+            rows = CsvFileManager.iter_csv_data(path)
+            if self.validator is not None:
+                rows = (self.validator.coerce(row) for row in rows)
+            expected: Any = list(rows)
+        elif path.endswith((".jsonl", ".ndjson")):
+            expected = list(JsonFileManager.iter_json_records(path))
+        else:
+            expected = JsonFileManager.load_json_data(path)
+        return self.compare(expected, actual)
+
+    def assert_equal(self, expected: Any, actual: Any) -> None:
+        """
+        Compare two documents in a test.
+
+        :param expected: Expected document, or path to a fixture file.
+        :param actual: Actual document.
+        :raises AssertionError: With the formatted differences, if any.
+        """
+        if isinstance(expected, str):
+            result = self.compare_file(expected, actual)
+        else:
+            result = self.compare(expected, actual)
+        if not result.equal:
+            raise AssertionError(result.format(self.width))
+
+    def _report(self, differences: List[Difference], difference: Difference) -> None:
+        differences.append(difference)
+        if (
+            self.max_differences is not None
+            and len(differences) >= self.max_differences
+        ):
+            raise _Full()
+
+    def _validate(self, actual: Any, differences: List[Difference]) -> None:
+        assert self.validator is not None
+        records = enumerate(actual) if isinstance(actual, list) else [(None, actual)]
+        for index, record in records:
+            if not self.validator.is_valid(record):
+                path = "$" if index is None else f"$[{index}]"
+                message = self.validator.errors(record)[0]
+                self._report(differences, Difference(path, INVALID, actual=message))
+
+    def _diff(
+        self, expected: Any, actual: Any, path: str, differences: List[Difference]
+    ) -> None:
+        if _same(expected, actual):
+            return
+        if self._ignore is not None and self._ignore.fullmatch(path):
+            return
+        if isinstance(expected, dict) and isinstance(actual, dict):
+            self._diff_objects(expected, actual, path, differences)
+        elif isinstance(expected, list) and isinstance(actual, list):
+            key = self._key_for(path, expected, actual)
+            if key is not None:
+                self._diff_keyed(expected, actual, key, path, differences)
+            else:
+                self._diff_sequences(expected, actual, path, differences)
+        elif _is_number(expected) and _is_number(actual):
+            allowed = self._tolerance_for(path)
+            if allowed is None or not math.isclose(
+                expected, actual, rel_tol=0, abs_tol=allowed
+            ):
+                self._report(differences, Difference(path, CHANGED, expected, actual))
+        else:
+            self._report(differences, Difference(path, CHANGED, expected, actual))
+
+    def _missing(
+        self, differences: List[Difference], path: str, kind: str, value: Any
+    ) -> None:
+        if self._ignore is not None and self._ignore.fullmatch(path):
+            return
+        if kind == ADDED:
+            self._report(differences, Difference(path, ADDED, actual=value))
+        else:
+            self._report(differences, Difference(path, REMOVED, expected=value))
+
+    def _diff_objects(
+        self,
+        expected: Dict[str, Any],
+        actual: Dict[str, Any],
+        path: str,
+        differences: List[Difference],
+    ) -> None:
+        names = [name for name in expected if name in actual]
+        # Compare here so that no path is built for identical branches
+        equal = dict(
+            zip(
+                names,
+                _equal_pairs(
+                    list(map(expected.__getitem__, names)),
+                    list(map(actual.__getitem__, names)),
+                ),
+            )
+        )
+        for name, value in expected.items():
+            if name not in actual:
+                self._missing(differences, _child(path, name), REMOVED, value)
+            elif not equal[name]:
+                self._diff(value, actual[name], _child(path, name), differences)
+        for name, value in actual.items():
+            if name not in expected:
+                self._missing(differences, _child(path, name), ADDED, value)
+
+    def _key_for(self, path: str, expected: List[Any], actual: List[Any]) -> Any:
+        if self._keys is not None:
+            key = next(
+                (name for pattern, name in self._keys if pattern.fullmatch(path)),
+                None,
+            )
+        else:
+            key = self.key
+        if key is None:
+            return None
+        for items in (expected, actual):
+            try:
+                values = {item[key] for item in items}
+            except (TypeError, KeyError):
+                return None
+            # A set cannot tell True from 1, so boolean keys align by content
+            if len(values) != len(items) or bool in set(map(type, values)):
+                return None
+        return key
+
+    def _diff_keyed(
+        self,
+        expected: List[Dict[str, Any]],
+        actual: List[Dict[str, Any]],
+        key: str,
+        path: str,
+        differences: List[Difference],
+    ) -> None:
+        by_key = {item[key]: item for item in actual}
+        others = [by_key.pop(item[key], None) for item in expected]
+        for item, other, equal in zip(expected, others, _equal_pairs(expected, others)):
+            value = item[key]
+            if other is None:
+                self._missing(differences, _item(path, key, value), REMOVED, item)
+            elif not equal:
+                self._diff(item, other, _item(path, key, value), differences)
+        for value, item in by_key.items():
+            self._missing(differences, _item(path, key, value), ADDED, item)
+
+    def _diff_sequences(
+        self,
+        expected: List[Any],
+        actual: List[Any],
+        path: str,
+        differences: List[Difference],
+    ) -> None:
+        # Trim the common ends, then align the rest by content hash so that
+        # one inserted item is not reported as every later item changing
+        shortest = min(len(expected), len(actual))
+        for equal in (operator.eq, _same):
+            start = 0
+            while start < shortest and equal(expected[start], actual[start]):
+                start += 1
+            expected_end, actual_end = len(expected), len(actual)
+            while (
+                expected_end > start
+                and actual_end > start
+                and equal(expected[expected_end - 1], actual[actual_end - 1])
+            ):
+                expected_end -= 1
+                actual_end -= 1
+            # Trimmed with ==, the common ends must also match in type
+            if equal is _same or (
+                _types_match(expected[:start], actual[:start])
+                and _types_match(expected[expected_end:], actual[actual_end:])
+            ):
+                break
+        matcher = SequenceMatcher(
+            None,
+            list(map(_fingerprint, expected[start:expected_end])),
+            list(map(_fingerprint, actual[start:actual_end])),
+            autojunk=False,
+        )
+        for operation, i1, i2, j1, j2 in matcher.get_opcodes():
+            if operation == "equal":
+                continue
+            for i, j in zip(
+                range(start + i1, start + i2), range(start + j1, start + j2)
+            ):
+                self._diff(expected[i], actual[j], f"{path}[{i}]", differences)
+            paired = min(i2 - i1, j2 - j1)
+            for i in range(start + i1 + paired, start + i2):
+                self._missing(differences, f"{path}[{i}]", REMOVED, expected[i])
+            for j in range(start + j1 + paired, start + j2):
+                self._missing(differences, f"{path}[{j}]", ADDED, actual[j])
+
+    def _tolerance_for(self, path: str) -> Optional[float]:
+        for pattern, allowed in self._tolerances:
+            if pattern.fullmatch(path):
+                return allowed
+        return None
+
+
+def diff_json(expected: Any, actual: Any, **options: Any) -> DiffResult:
+    """
+    Compare two decoded JSON documents; see JsonDiff for the options.
+    """
+    return JsonDiff(**options).compare(expected, actual)
+
+
+# Example usage
+# differ = JsonDiff(ignore=["*.updated_at"], tolerance={"*.price": 0.01})
+# result = differ.compare(expected_products, response.json())
+# print(result.format())
+# JsonDiff.from_schema("product", tolerance=0.01).assert_equal(
+#     "fixtures/products.json", response.json()
+# )
@@ -1,41 +1,78 @@
 import logging
 import os
+import threading
 from datetime import datetime
 
+from src.utils.worker import is_worker, worker_id, worker_log_file
+
 # Define the root of the project and log directory explicitly
 BASE_DIR = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "..", "..")
 )  # Moving up to the project root
 LOG_DIR = os.path.join(BASE_DIR, "logs")
 
-# Create logs directory if it doesn't exist
-if not os.path.exists(LOG_DIR):
-    os.makedirs(LOG_DIR)
+LOG_BASE_NAME = f"automation_{datetime.now().strftime('%Y-%m-%d')}"
 
-# Set up log file path
-LOG_FILE: str = os.path.join(
-    LOG_DIR, f"automation_{datetime.now().strftime('%Y-%m-%d')}.log"
-)
+# Set up log file path; xdist workers each get their own file, merged at the end
+LOG_FILE: str = worker_log_file(LOG_DIR, LOG_BASE_NAME)
 
-# Print log path for debugging purposes
-print(f"Log file path: {LOG_FILE}")  # Debugging: Check if the path is correct
-
-# Set up logging configuration
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(LOG_FILE, mode="a"),  # 'a' for append mode
-        logging.StreamHandler(),
-    ],
+LOG_FORMAT = (
+    f"%(asctime)s - [{worker_id()}] - %(name)s - %(levelname)s - %(message)s"
+    if is_worker()
+    else "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
+_configure_lock = threading.Lock()
+_configured = False
+
+
+class _LazyFileHandler(logging.FileHandler):
+    """
+    File handler that creates the log directory and opens the file on the
+    first record instead of at construction.
+    """
+
+    def __init__(self, filename: str, mode: str = "a") -> None:
+        super().__init__(filename, mode=mode, delay=True)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+
+def configure_logging() -> None:
+    """
+    Set up the root logger handlers once per process.
+
+    Nothing is created on disk until the first record is written. Like
+    logging.basicConfig, this does nothing if the root logger already has
+    handlers (e.g. configured by pytest or an application).
+    """
+    global _configured
+    if _configured:
+        return
+    with _configure_lock:
+        if _configured:
+            return
+        logging.basicConfig(
+            level=logging.DEBUG,
+            format=LOG_FORMAT,
+            handlers=[
+                _LazyFileHandler(LOG_FILE, mode="a"),  # 'a' for append mode
+                logging.StreamHandler(),
+            ],
+        )
+        _configured = True
+
 
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance with the specified name.
 
+    The logging handlers are configured on the first call.
+
     :param name: Name of the logger
     :return: Configured logger instance
     """
+    configure_logging()
     return logging.getLogger(name)
@@ -0,0 +1,9 @@
+from .histogram import LatencyHistogram
+from .request_metrics import REQUEST_METRICS, RequestMetricsRegistry, endpoint_template
+
+__all__ = [
+    "LatencyHistogram",
+    "REQUEST_METRICS",
+    "RequestMetricsRegistry",
+    "endpoint_template",
+]
@@ -0,0 +1,201 @@
+import threading
+from typing import Dict, Iterable, List, Optional
+
+# Sub-buckets per power of two; 2^7 keeps the relative error under 1%
+SUB_BUCKET_BITS: int = 7
+_SUB_BUCKET_COUNT: int = 1 << SUB_BUCKET_BITS
+_SUB_BUCKET_MASK: int = _SUB_BUCKET_COUNT - 1
+
+
+def _bucket_index(value: int) -> int:
+    if value < _SUB_BUCKET_COUNT:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    return ((shift + 1) << SUB_BUCKET_BITS) + (value >> shift) - _SUB_BUCKET_COUNT
+
+
+def _bucket_midpoint(index: int) -> int:
+    if index < (_SUB_BUCKET_COUNT << 1):
+        return index
+    shift = (index >> SUB_BUCKET_BITS) - 1
+    low = ((index & _SUB_BUCKET_MASK) + _SUB_BUCKET_COUNT) << shift
+    return low + ((1 << shift) >> 1)
+
+
+class LatencyHistogram:
+    """
+    HDR-style log-linear histogram of latencies recorded in microseconds.
+
+    Values are bucketed with a bounded relative error, so memory stays constant
+    regardless of how many samples are recorded, and histograms from several
+    threads, processes or nodes can be merged losslessly.
+    """
+
+    def __init__(self) -> None:
+        self._counts: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.count: int = 0
+        self.total_us: int = 0
+        self.min_us: Optional[int] = None
+        self.max_us: Optional[int] = None
+
+    def record(self, seconds: float) -> None:
+        """
+        Record a latency expressed in seconds.
+
+        :param seconds: The latency to record.
+        """
+        self.record_us(int(seconds * 1_000_000))
+
+    def record_us(self, value_us: int, count: int = 1) -> None:
+        """
+        Record a latency expressed in whole microseconds.
+
+        :param value_us: The latency to record (negative values are clamped to 0).
+        :param count: How many times to record the value.
+        """
+        if value_us < 0:
+            value_us = 0
+        index = _bucket_index(value_us)
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + count
+            self.count += count
+            self.total_us += value_us * count
+            if self.min_us is None or value_us < self.min_us:
+                self.min_us = value_us
+            if self.max_us is None or value_us > self.max_us:
+                self.max_us = value_us
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """
+        Add all samples of another histogram into this one.
+
+        :param other: The histogram to merge in.
+        :return: This histogram, for chaining.
+        """
+        with self._lock:
+            for index, count in other._counts.items():
+                self._counts[index] = self._counts.get(index, 0) + count
+            self.count += other.count
+            self.total_us += other.total_us
+            if other.min_us is not None:
+                self.min_us = (
+                    other.min_us
+                    if self.min_us is None
+                    else min(self.min_us, other.min_us)
+                )
+            if other.max_us is not None:
+                self.max_us = (
+                    other.max_us
+                    if self.max_us is None
+                    else max(self.max_us, other.max_us)
+                )
+        return self
+
+    @property
+    def mean_us(self) -> float:
+        """
+        The arithmetic mean of all recorded values in microseconds.
+        """
+        return self.total_us / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> int:
+        """
+        Get the value at the given percentile.
+
+        :param percent: Percentile between 0 and 100.
+        :return: The latency in microseconds (0 when the histogram is empty).
+        """
+        return self.percentiles([percent])[percent]
+
+    def percentiles(self, percents: Iterable[float]) -> Dict[float, int]:
+        """
+        Get several percentiles in a single pass over the buckets.
+
+        :param percents: Percentiles between 0 and 100.
+        :return: Mapping of percentile to latency in microseconds.
+        """
+        wanted = sorted(percents)
+        result: Dict[float, int] = {percent: 0 for percent in wanted}
+        if not self.count:
+            return result
+
+        with self._lock:
+            buckets = sorted(self._counts.items())
+        position = 0
+        seen = 0
+        for percent in wanted:
+            if percent >= 100:
+                result[percent] = self.max_us
+                continue
+            target = max(1, -(-self.count * percent // 100))
+            while seen < target and position < len(buckets):
+                seen += buckets[position][1]
+                position += 1
+            value = _bucket_midpoint(buckets[position - 1][0])
+            result[percent] = min(max(value, self.min_us), self.max_us)
+        return result
+
+    def count_at_or_below(self, value_us: int) -> int:
+        """
+        Count the samples recorded at or below a value (within bucket precision).
+
+        :param value_us: Upper bound in microseconds.
+        :return: The number of samples in buckets up to the value's bucket.
+        """
+        limit = _bucket_index(value_us)
+        with self._lock:
+            return sum(count for index, count in self._counts.items() if index <= limit)
+
+    def summary(
+        self, percents: Iterable[float] = (50, 90, 95, 99, 99.9)
+    ) -> Dict[str, float]:
+        """
+        Get a compact summary of the histogram in milliseconds.
+
+        :param percents: Percentiles to include.
+        :return: Dictionary with count, min, mean, max and the requested percentiles.
+        """
+        summary: Dict[str, float] = {
+            "count": self.count,
+            "min_ms": (self.min_us or 0) / 1000,
+            "mean_ms": round(self.mean_us / 1000, 3),
+            "max_ms": (self.max_us or 0) / 1000,
+        }
+        for percent, value in self.percentiles(percents).items():
+            summary[f"p{percent:g}_ms"] = value / 1000
+        return summary
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Serialize the histogram into a compact JSON-compatible dictionary.
+
+        :return: Dictionary with the sparse bucket counts and aggregate fields.
+        """
+        with self._lock:
+            buckets: List[List[int]] = [
+                [index, count] for index, count in sorted(self._counts.items())
+            ]
+        return {
+            "buckets": buckets,
+            "count": self.count,
+            "total_us": self.total_us,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "LatencyHistogram":
+        """
+        Rebuild a histogram serialized with to_dict.
+
+        :param data: The serialized histogram.
+        :return: A new LatencyHistogram instance.
+        """
+        histogram = cls()
+        histogram._counts = {int(index): int(count) for index, count in data["buckets"]}
+        histogram.count = int(data["count"])
+        histogram.total_us = int(data["total_us"])
+        histogram.min_us = data["min_us"]
+        histogram.max_us = data["max_us"]
+        return histogram
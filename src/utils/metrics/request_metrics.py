@@ -0,0 +1,331 @@
+import json
+import os
+import re
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.utils.metrics.histogram import LatencyHistogram
+
+# Path segments that identify a resource rather than an endpoint
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    r"|[0-9a-fA-F]{16,})$"
+)
+
+# Upper bounds (seconds) of the Prometheus histogram buckets
+PROMETHEUS_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+PHASES: Tuple[str, ...] = ("dns", "connect", "ttfb", "total")
+
+# EndpointMetrics counters carried by snapshots
+_COUNTERS: Tuple[str, ...] = ("retries", "deduplicated", "bytes_sent", "bytes_received")
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(endpoint: str) -> str:
+    """
+    Collapse resource identifiers in an endpoint path.
+
+    Example: ``/users/42`` becomes ``/users/{id}``.
+
+    :param endpoint: The endpoint path, without the query string.
+    :return: The endpoint template.
+    """
+    path = endpoint.split("?", 1)[0]
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")
+    )
+
+
+class EndpointMetrics:
+    """
+    Aggregated metrics for one method and endpoint template.
+    """
+
+    def __init__(self) -> None:
+        self.phases: Dict[str, LatencyHistogram] = {
+            phase: LatencyHistogram() for phase in PHASES
+        }
+        self.statuses: Dict[str, int] = {}
+        self.retries: int = 0
+        self.deduplicated: int = 0
+        self.bytes_sent: int = 0
+        self.bytes_received: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.phases["total"].count,
+            "statuses": dict(self.statuses),
+            "retries": self.retries,
+            "deduplicated": self.deduplicated,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "timings": {
+                phase: histogram.summary()
+                for phase, histogram in self.phases.items()
+                if histogram.count
+            },
+        }
+
+
+class RequestMetricsRegistry:
+    """
+    Per method and endpoint template request metrics.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[Tuple[str, str], EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, method: str, endpoint: str) -> EndpointMetrics:
+        key = (method.upper(), endpoint_template(endpoint))
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            with self._lock:
+                metrics = self._metrics.setdefault(key, EndpointMetrics())
+        return metrics
+
+    def record(
+        self,
+        method: str,
+        endpoint: str,
+        status: str,
+        timings: Dict[str, Optional[float]],
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+    ) -> None:
+        """
+        Record one request attempt.
+
+        :param method: HTTP method.
+        :param endpoint: Endpoint path, collapsed into its template.
+        :param status: Status code, or the error name when no response arrived.
+        :param timings: Phase name to seconds; None values are skipped.
+        :param bytes_sent: Request body size.
+        :param bytes_received: Response body size.
+        """
+        metrics = self._get(method, endpoint)
+        for phase, seconds in timings.items():
+            if seconds is not None:
+                metrics.phases[phase].record(seconds)
+        with self._lock:
+            metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+            metrics.bytes_sent += bytes_sent
+            metrics.bytes_received += bytes_received
+
+    def record_retry(self, method: str, endpoint: str) -> None:
+        """
+        Count a retry of a request.
+
+        :param method: HTTP method.
+        :param endpoint: Endpoint path, collapsed into its template.
+        """
+        metrics = self._get(method, endpoint)
+        with self._lock:
+            metrics.retries += 1
+
+    def record_deduplicated(self, method: str, endpoint: str) -> None:
+        """
+        Count a request served by an identical request already in flight.
+
+        :param method: HTTP method.
+        :param endpoint: Endpoint path, collapsed into its template.
+        """
+        metrics = self._get(method, endpoint)
+        with self._lock:
+            metrics.deduplicated += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._metrics = {}
+
+    @contextmanager
+    def isolated(self) -> Iterator["RequestMetricsRegistry"]:
+        """
+        Record into an empty registry for the duration of the block, then put
+        the previous metrics back (e.g. benchmarks running inside pytest).
+
+        :yield: This registry.
+        """
+        with self._lock:
+            saved, self._metrics = self._metrics, {}
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._metrics = saved
+
+    def __bool__(self) -> bool:
+        return bool(self._metrics)
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the metrics as a JSON-compatible dictionary.
+
+        :return: Mapping of "METHOD template" to the endpoint metrics.
+        """
+        return {
+            f"{method} {template}": metrics.to_dict()
+            for (method, template), metrics in sorted(self._metrics.items())
+        }
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the metrics of every endpoint serialized losslessly, so that
+        processes can ship and merge them (to_dict only keeps percentiles).
+
+        :return: Mapping of "METHOD template" to {"latency", "statuses",
+            "phases", and the counters}; "latency" is the total phase.
+        """
+        with self._lock:
+            items = sorted(self._metrics.items())
+        return {
+            f"{method} {template}": {
+                "latency": metrics.phases["total"].to_dict(),
+                "statuses": dict(metrics.statuses),
+                "phases": {
+                    phase: histogram.to_dict()
+                    for phase, histogram in metrics.phases.items()
+                    if phase != "total" and histogram.count
+                },
+                **{counter: getattr(metrics, counter) for counter in _COUNTERS},
+            }
+            for (method, template), metrics in items
+        }
+
+    def merge_snapshot(self, snapshot: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Add the metrics of another process, e.g. an xdist worker.
+
+        :param snapshot: Output of snapshot() in that process.
+        """
+        for endpoint, data in snapshot.items():
+            method, template = endpoint.split(" ", 1)
+            metrics = self._get(method, template)
+            phases = {**data.get("phases", {}), "total": data["latency"]}
+            with self._lock:
+                for phase, histogram in phases.items():
+                    metrics.phases[phase].merge(LatencyHistogram.from_dict(histogram))
+                for status, count in data["statuses"].items():
+                    metrics.statuses[status] = metrics.statuses.get(status, 0) + count
+                for counter in _COUNTERS:
+                    setattr(
+                        metrics,
+                        counter,
+                        getattr(metrics, counter) + data.get(counter, 0),
+                    )
+
+    def to_prometheus(self) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        :return: The exposition text.
+        """
+        lines: List[str] = [
+            "# HELP api_request_duration_seconds Total duration of API requests.",
+            "# TYPE api_request_duration_seconds histogram",
+        ]
+        items = sorted(self._metrics.items())
+        for (method, template), metrics in items:
+            labels = f'method="{method}",endpoint="{template}"'
+            total = metrics.phases["total"]
+            for bound in PROMETHEUS_BUCKETS:
+                count = total.count_at_or_below(int(bound * 1_000_000))
+                lines.append(
+                    f'api_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}'
+                )
+            lines.append(
+                f'api_request_duration_seconds_bucket{{{labels},le="+Inf"}} {total.count}'
+            )
+            lines.append(
+                f"api_request_duration_seconds_sum{{{labels}}} {total.total_us / 1e6}"
+            )
+            lines.append(
+                f"api_request_duration_seconds_count{{{labels}}} {total.count}"
+            )
+
+        lines += [
+            "# HELP api_request_phase_seconds Request phase latency quantiles.",
+            "# TYPE api_request_phase_seconds summary",
+        ]
+        for (method, template), metrics in items:
+            for phase, histogram in metrics.phases.items():
+                if not histogram.count:
+                    continue
+                labels = f'method="{method}",endpoint="{template}",phase="{phase}"'
+                for percent, value in histogram.percentiles((50, 90, 99)).items():
+                    lines.append(
+                        f'api_request_phase_seconds{{{labels},quantile="{percent / 100:g}"}}'
+                        f" {value / 1e6}"
+                    )
+                lines.append(
+                    f"api_request_phase_seconds_sum{{{labels}}} {histogram.total_us / 1e6}"
+                )
+                lines.append(
+                    f"api_request_phase_seconds_count{{{labels}}} {histogram.count}"
+                )
+
+        counters = (
+            ("api_request_retries_total", "Retried API requests.", "retries"),
+            (
+                "api_request_deduplicated_total",
+                "API requests served by an identical in-flight request.",
+                "deduplicated",
+            ),
+            ("api_request_bytes_sent_total", "Request body bytes.", "bytes_sent"),
+            ("api_response_bytes_total", "Response body bytes.", "bytes_received"),
+        )
+        for name, description, attribute in counters:
+            lines += [f"# HELP {name} {description}", f"# TYPE {name} counter"]
+            for (method, template), metrics in items:
+                lines.append(
+                    f'{name}{{method="{method}",endpoint="{template}"}} '
+                    f"{getattr(metrics, attribute)}"
+                )
+
+        lines += [
+            "# HELP api_requests_total API requests by status.",
+            "# TYPE api_requests_total counter",
+        ]
+        for (method, template), metrics in items:
+            for status, count in sorted(metrics.statuses.items()):
+                lines.append(
+                    f'api_requests_total{{method="{method}",endpoint="{template}",'
+                    f'status="{status}"}} {count}'
+                )
+        return "\n".join(lines) + "\n"
+
+    def export(self, directory: str, name: str = "api_metrics") -> Tuple[str, str]:
+        """
+        Write the metrics as JSON and Prometheus text files.
+
+        :param directory: Output directory, created if missing.
+        :param name: Base file name.
+        :return: Paths of the JSON and Prometheus files.
+        """
+        os.makedirs(directory, exist_ok=True)
+        json_path = os.path.join(directory, f"{name}.json")
+        prometheus_path = os.path.join(directory, f"{name}.prom")
+        with open(json_path, "w") as file:
+            json.dump(self.to_dict(), file, indent=4)
+        with open(prometheus_path, "w") as file:
+            file.write(self.to_prometheus())
+        return json_path, prometheus_path
+
+
+# Process-wide registry fed by APIClient
+REQUEST_METRICS = RequestMetricsRegistry()
@@ -0,0 +1,500 @@
+import json
+import logging
+import math
+import os
+import statistics
+import subprocess
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from src.utils.databases.database import Database
+from src.utils.databases.pool import sqlite_pool
+from src.utils.metrics.histogram import LatencyHistogram
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESULTS_DB = os.path.join("reports", "results.db")
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS runs (
+        id INTEGER PRIMARY KEY,
+        started_at REAL NOT NULL,
+        finished_at REAL,
+        revision TEXT,
+        branch TEXT,
+        label TEXT,
+        exit_status INTEGER
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS runs_revision ON runs (revision)",
+    """
+    CREATE TABLE IF NOT EXISTS test_results (
+        run_id INTEGER NOT NULL REFERENCES runs (id),
+        nodeid TEXT NOT NULL,
+        outcome TEXT NOT NULL,
+        duration REAL NOT NULL,
+        PRIMARY KEY (run_id, nodeid)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS test_results_nodeid ON test_results (nodeid)",
+    """
+    CREATE TABLE IF NOT EXISTS endpoint_latency (
+        run_id INTEGER NOT NULL REFERENCES runs (id),
+        endpoint TEXT NOT NULL,
+        requests INTEGER NOT NULL,
+        errors INTEGER NOT NULL,
+        mean_ms REAL,
+        p50_ms REAL,
+        p90_ms REAL,
+        p99_ms REAL,
+        max_ms REAL,
+        histogram TEXT NOT NULL,
+        PRIMARY KEY (run_id, endpoint)
+    )
+    """,
+)
+
+RunSelector = Union[int, str]
+
+
+def current_revision(cwd: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Get the git commit and branch of a working tree.
+
+    :param cwd: Directory inside the working tree (default: current directory).
+    :return: (commit, branch); None for what git cannot tell.
+    """
+    values = []
+    for args in (["rev-parse", "HEAD"], ["rev-parse", "--abbrev-ref", "HEAD"]):
+        try:
+            result = subprocess.run(
+                ["git", *args], cwd=cwd, capture_output=True, text=True, timeout=5
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None, None
+        values.append(
+            (result.stdout.strip() or None) if result.returncode == 0 else None
+        )
+    return values[0], values[1]
+
+
+def mann_whitney_greater(
+    baseline: Mapping[Any, int], candidate: Mapping[Any, int]
+) -> float:
+    """
+    One-sided Mann-Whitney U test that candidate values tend to be larger.
+
+    Samples are value -> count mappings, so latency histograms are tested on
+    their bucket counts without expanding them. Equal values share their
+    average rank and the tie-corrected normal approximation is used.
+
+    :param baseline: Baseline values and their counts.
+    :param candidate: Candidate values and their counts.
+    :return: The p-value; small means the candidate is significantly larger.
+    """
+    baseline_count = sum(baseline.values())
+    candidate_count = sum(candidate.values())
+    total = baseline_count + candidate_count
+    if not baseline_count or not candidate_count:
+        return 1.0
+    ranked = 0
+    candidate_ranks = 0.0
+    ties = 0
+    for value in sorted(set(baseline) | set(candidate)):
+        group = baseline.get(value, 0) + candidate.get(value, 0)
+        candidate_ranks += candidate.get(value, 0) * (ranked + (group + 1) / 2)
+        ties += group**3 - group
+        ranked += group
+    u = candidate_ranks - candidate_count * (candidate_count + 1) / 2
+    variance = (
+        baseline_count
+        * candidate_count
+        / 12
+        * ((total + 1) - ties / (total * (total - 1)))
+    )
+    if variance <= 0:
+        return 1.0
+    # Continuity correction, since U moves in steps of one
+    z = (u - baseline_count * candidate_count / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+@dataclass
+class Change:
+    kind: str
+    name: str
+    baseline: float
+    candidate: float
+    baseline_samples: int
+    candidate_samples: int
+    # None when there were too few samples to test
+    p_value: Optional[float] = None
+    significant: bool = False
+
+    @property
+    def change(self) -> Optional[float]:
+        return self.candidate / self.baseline - 1 if self.baseline else None
+
+
+@dataclass
+class Comparison:
+    baseline_runs: List[int]
+    candidate_runs: List[int]
+    alpha: float
+    threshold: float
+    changes: List[Change] = field(default_factory=list)
+    # Tests that passed in every baseline run and failed in a candidate run
+    new_failures: List[str] = field(default_factory=list)
+
+    @property
+    def regressions(self) -> List[Change]:
+        return [change for change in self.changes if change.significant]
+
+    def format_text(self) -> str:
+        """
+        Render the comparison as plain text.
+
+        :return: The text summary.
+        """
+        tested = sum(change.p_value is not None for change in self.changes)
+        lines = [
+            f"Runs {self.baseline_runs} -> {self.candidate_runs}: "
+            f"{len(self.regressions)} significant slowdown(s) over "
+            f"{self.threshold:.0%} (p < {self.alpha:g}) among {tested} tested, "
+            f"{len(self.new_failures)} new failure(s)"
+        ]
+        for change in self.regressions:
+            unit = "ms" if change.kind == "endpoint" else "s"
+            lines.append(
+                f"  SLOWER {change.kind} {change.name}: median "
+                f"{change.baseline:.3f}{unit} -> {change.candidate:.3f}{unit} "
+                f"({change.change:+.1%}, p={change.p_value:.2g}, "
+                f"n={change.baseline_samples}/{change.candidate_samples})"
+            )
+        for nodeid in self.new_failures:
+            lines.append(f"  FAILING {nodeid}")
+        return "\n".join(lines)
+
+
+class ResultsStore:
+    def __init__(self, path: str = DEFAULT_RESULTS_DB) -> None:
+        """
+        Open (and create) a SQLite store of test run results.
+
+        Every run keeps its tests' outcomes and durations and, per endpoint,
+        request counts, latency percentiles and the full latency histogram,
+        from which compare() tests whether slowdowns are significant.
+
+        :param path: Database file, created with its directory if missing.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.database = Database(sqlite_pool(path, max_size=1))
+        with self.database.transaction() as connection:
+            # WAL lets history queries read while a run is being written
+            connection.execute("PRAGMA journal_mode=WAL")
+            for statement in SCHEMA:
+                connection.execute(statement)
+
+    def close(self) -> None:
+        self.database.pool.close()
+
+    def start_run(
+        self,
+        revision: Optional[str] = None,
+        branch: Optional[str] = None,
+        label: Optional[str] = None,
+        started_at: Optional[float] = None,
+    ) -> int:
+        """
+        Record the start of a run.
+
+        :param revision: Git commit under test.
+        :param branch: Git branch under test.
+        :param label: Free text, e.g. the environment.
+        :param started_at: Unix time of the start (default: now).
+        :return: The run id.
+        """
+        with self.database.transaction() as connection:
+            cursor = connection.execute(
+                "INSERT INTO runs (started_at, revision, branch, label) "
+                "VALUES (?, ?, ?, ?)",
+                (started_at or time.time(), revision, branch, label),
+            )
+            return cursor.lastrowid
+
+    def finish_run(
+        self, run_id: int, exit_status: int = 0, finished_at: Optional[float] = None
+    ) -> None:
+        self.database.execute(
+            "UPDATE runs SET finished_at = ?, exit_status = ? WHERE id = ?",
+            (finished_at or time.time(), exit_status, run_id),
+        )
+
+    def add_test_results(self, run_id: int, results: Iterable[Dict[str, Any]]) -> int:
+        """
+        Store test outcomes in one transaction.
+
+        :param run_id: Run the tests belong to.
+        :param results: Dictionaries with nodeid, outcome and duration (seconds).
+        :return: Number of rows written.
+        """
+        return self.database.executemany(
+            "INSERT OR REPLACE INTO test_results (run_id, nodeid, outcome, duration) "
+            "VALUES (?, ?, ?, ?)",
+            (
+                (run_id, result["nodeid"], result["outcome"], result["duration"])
+                for result in results
+            ),
+        )
+
+    def add_endpoint_metrics(
+        self, run_id: int, endpoints: Mapping[str, Dict[str, Any]]
+    ) -> int:
+        """
+        Store per-endpoint latency in one transaction.
+
+        :param run_id: Run the requests belong to.
+        :param endpoints: RequestMetricsRegistry.snapshot() output.
+        :return: Number of rows written.
+        """
+        rows = []
+        for endpoint, metrics in endpoints.items():
+            histogram = LatencyHistogram.from_dict(metrics["latency"])
+            summary = histogram.summary()
+            errors = sum(
+                count
+                for status, count in metrics["statuses"].items()
+                if status[:1] not in ("2", "3")
+            )
+            rows.append(
+                (
+                    run_id,
+                    endpoint,
+                    histogram.count,
+                    errors,
+                    summary.get("mean_ms"),
+                    summary.get("p50_ms"),
+                    summary.get("p90_ms"),
+                    summary.get("p99_ms"),
+                    summary.get("max_ms"),
+                    json.dumps(metrics["latency"], separators=(",", ":")),
+                )
+            )
+        return self.database.executemany(
+            "INSERT OR REPLACE INTO endpoint_latency (run_id, endpoint, requests, "
+            "errors, mean_ms, p50_ms, p90_ms, p99_ms, max_ms, histogram) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def runs(self, revision: Optional[str] = None, limit: int = 20) -> List[Dict]:
+        """
+        List the latest runs, newest first.
+
+        :param revision: Only runs of commits starting with this prefix.
+        :param limit: Maximum number of runs.
+        :return: Run rows with their test counts.
+        """
+        return self.database.fetch_all(
+            "SELECT runs.*, COUNT(test_results.nodeid) AS tests, "
+            "SUM(test_results.outcome = 'failed') AS failed "
+            "FROM runs LEFT JOIN test_results ON test_results.run_id = runs.id "
+            "WHERE ? IS NULL OR runs.revision LIKE ? || '%' "
+            "GROUP BY runs.id ORDER BY runs.id DESC LIMIT ?",
+            (revision, revision, limit),
+        )
+
+    def test_history(self, nodeid: str, limit: int = 50) -> List[Dict]:
+        """
+        Get the outcomes and durations of one test, newest first.
+        """
+        return self.database.fetch_all(
+            "SELECT runs.id AS run_id, runs.started_at, runs.revision, "
+            "test_results.outcome, test_results.duration "
+            "FROM test_results JOIN runs ON runs.id = test_results.run_id "
+            "WHERE test_results.nodeid = ? ORDER BY runs.id DESC LIMIT ?",
+            (nodeid, limit),
+        )
+
+    def endpoint_history(self, endpoint: str, limit: int = 50) -> List[Dict]:
+        """
+        Get the latency summaries of one endpoint ("GET /users/{id}"), newest first.
+        """
+        return self.database.fetch_all(
+            "SELECT runs.id AS run_id, runs.started_at, runs.revision, "
+            "requests, errors, mean_ms, p50_ms, p90_ms, p99_ms, max_ms "
+            "FROM endpoint_latency JOIN runs ON runs.id = endpoint_latency.run_id "
+            "WHERE endpoint = ? ORDER BY runs.id DESC LIMIT ?",
+            (endpoint, limit),
+        )
+
+    def resolve(self, selector: RunSelector) -> List[int]:
+        """
+        Turn a run selector into run ids.
+
+        :param selector: A run id (an int or "#12"), "latest", "previous"
+            (the run before the latest), or a git commit prefix (optionally
+            "git:"-prefixed) selecting every finished run of that commit. A
+            digits-only string is a run id when such a run exists and a commit
+            prefix otherwise.
+        :return: The run ids.
+        :raises ValueError: If no run matches.
+        """
+        text = str(selector)
+        if isinstance(selector, int) or (text.startswith("#") and text[1:].isdigit()):
+            rows = self._runs_with_id(int(text.lstrip("#")))
+        elif text in ("latest", "previous"):
+            rows = self.database.fetch_all(
+                "SELECT id FROM runs WHERE finished_at IS NOT NULL "
+                "ORDER BY id DESC LIMIT 1 OFFSET ?",
+                (0 if text == "latest" else 1,),
+            )
+        elif text.startswith("git:"):
+            rows = self._runs_of_revision(text[len("git:") :])
+        else:
+            rows = (self._runs_with_id(int(text)) if text.isdigit() else []) or (
+                self._runs_of_revision(text)
+            )
+        if not rows:
+            raise ValueError(f"No finished run matches '{selector}' in {self.path}")
+        return [row["id"] for row in rows]
+
+    def _runs_with_id(self, run_id: int) -> List[Dict[str, Any]]:
+        return self.database.fetch_all("SELECT id FROM runs WHERE id = ?", (run_id,))
+
+    def _runs_of_revision(self, prefix: str) -> List[Dict[str, Any]]:
+        return self.database.fetch_all(
+            "SELECT id FROM runs WHERE finished_at IS NOT NULL "
+            "AND revision LIKE ? || '%' ORDER BY id",
+            (prefix,),
+        )
+
+    def compare(
+        self,
+        baseline: RunSelector,
+        candidate: RunSelector,
+        alpha: float = 0.05,
+        threshold: float = 0.1,
+        min_samples: int = 3,
+    ) -> Comparison:
+        """
+        Find significant slowdowns between two runs or two git commits.
+
+        A test or endpoint regressed when its median got slower by more than
+        threshold and a one-sided Mann-Whitney U test on the two samples
+        gives p < alpha. Endpoint samples are every request of the selected
+        runs, taken from their histograms, so two single runs can be
+        compared; test samples are one duration per run, so tests are only
+        tested when both sides have min_samples runs (e.g. several runs per
+        commit).
+
+        :param baseline: Run selector of the reference (see resolve).
+        :param candidate: Run selector to check.
+        :param alpha: Significance level.
+        :param threshold: Minimum relative slowdown of the median.
+        :param min_samples: Minimum samples on each side for a test.
+        :return: The comparison.
+        """
+        baseline_runs = self.resolve(baseline)
+        candidate_runs = self.resolve(candidate)
+        comparison = Comparison(baseline_runs, candidate_runs, alpha, threshold)
+
+        before = self._durations(baseline_runs)
+        after = self._durations(candidate_runs)
+        for nodeid in sorted(before.keys() & after.keys()):
+            durations = [duration for _, duration in before[nodeid]]
+            candidates = [duration for _, duration in after[nodeid]]
+            change = Change(
+                "test",
+                nodeid,
+                statistics.median(durations),
+                statistics.median(candidates),
+                len(durations),
+                len(candidates),
+            )
+            if len(durations) >= min_samples and len(candidates) >= min_samples:
+                change.p_value = mann_whitney_greater(
+                    Counter(durations), Counter(candidates)
+                )
+            comparison.changes.append(change)
+            if all(outcome == "passed" for outcome, _ in before[nodeid]) and any(
+                outcome == "failed" for outcome, _ in after[nodeid]
+            ):
+                comparison.new_failures.append(nodeid)
+
+        before_latency = self._histograms(baseline_runs)
+        after_latency = self._histograms(candidate_runs)
+        for endpoint in sorted(before_latency.keys() & after_latency.keys()):
+            old, new = before_latency[endpoint], after_latency[endpoint]
+            change = Change(
+                "endpoint",
+                endpoint,
+                old.percentile(50) / 1000,
+                new.percentile(50) / 1000,
+                old.count,
+                new.count,
+            )
+            if old.count >= min_samples and new.count >= min_samples:
+                # Ranks only depend on order, which bucket indexes preserve
+                change.p_value = mann_whitney_greater(_buckets(old), _buckets(new))
+            comparison.changes.append(change)
+
+        for change in comparison.changes:
+            change.significant = (
+                change.p_value is not None
+                and change.p_value < alpha
+                and change.change is not None
+                and change.change > threshold
+            )
+        logger.info(
+            f"Compared runs {baseline_runs} with {candidate_runs}: "
+            f"{len(comparison.regressions)} significant slowdown(s)"
+        )
+        return comparison
+
+    def _durations(self, run_ids: List[int]) -> Dict[str, List[Tuple[str, float]]]:
+        rows = self.database.fetch_all(
+            "SELECT nodeid, outcome, duration FROM test_results "
+            f"WHERE run_id IN ({', '.join('?' * len(run_ids))}) "
+            "AND outcome != 'skipped'",
+            run_ids,
+        )
+        durations: Dict[str, List[Tuple[str, float]]] = {}
+        for row in rows:
+            durations.setdefault(row["nodeid"], []).append(
+                (row["outcome"], row["duration"])
+            )
+        return durations
+
+    def _histograms(self, run_ids: List[int]) -> Dict[str, LatencyHistogram]:
+        rows = self.database.fetch_all(
+            "SELECT endpoint, histogram FROM endpoint_latency "
+            f"WHERE run_id IN ({', '.join('?' * len(run_ids))})",
+            run_ids,
+        )
+        histograms: Dict[str, LatencyHistogram] = {}
+        for row in rows:
+            histogram = LatencyHistogram.from_dict(json.loads(row["histogram"]))
+            if row["endpoint"] in histograms:
+                histograms[row["endpoint"]].merge(histogram)
+            else:
+                histograms[row["endpoint"]] = histogram
+        return histograms
+
+
+def _buckets(histogram: LatencyHistogram) -> Dict[int, int]:
+    return {index: count for index, count in histogram.to_dict()["buckets"]}
+
+
+# Example usage
+# store = ResultsStore("reports/results.db")
+# print(store.compare("previous", "latest").format_text())
+# print(store.compare("3f2a9c1", "8d41e07").format_text())
+# store.endpoint_history("GET /users/{id}")
@@ -0,0 +1,290 @@
+import asyncio
+import logging
+import socket
+from typing import AsyncIterator, Callable, Optional, Tuple, Union
+
+from src.utils.tracing import TRACER
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+Datagram = Tuple[bytes, Tuple[str, int]]
+
+
+class _EndpointClosed(ConnectionError):
+    """
+    Raised by receive() once the endpoint is closed; ends async iteration.
+    """
+
+
+class _DatagramQueueProtocol(asyncio.DatagramProtocol):
+    """
+    Datagram protocol that queues received packets and tracks write backpressure.
+    """
+
+    def __init__(self, max_queue_size: int) -> None:
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        # Datagrams, then errors reported by the socket and the None close sentinel
+        self.queue: "asyncio.Queue[Union[Datagram, Exception, None]]" = asyncio.Queue(
+            maxsize=max_queue_size
+        )
+        self.can_write = asyncio.Event()
+        self.can_write.set()
+        self.dropped: int = 0
+        self.error: Optional[Exception] = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        try:
+            self.queue.put_nowait((data, addr))
+        except asyncio.QueueFull:
+            # Keep the event loop responsive: drop instead of blocking the protocol
+            self.dropped += 1
+
+    def error_received(self, exc: Exception) -> None:
+        logger.error(f"UDP endpoint error: {exc}")
+        self.error = exc
+        self._put_control(exc)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.can_write.set()
+        self._put_control(None)
+
+    def _put_control(self, item: Optional[Exception]) -> None:
+        # Errors and the close sentinel must reach consumers: make room by
+        # dropping the oldest datagram when the queue is full
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(item)
+
+    def pause_writing(self) -> None:
+        self.can_write.clear()
+
+    def resume_writing(self) -> None:
+        self.can_write.set()
+
+
+class _AsyncUDPEndpoint:
+    """
+    Shared receive logic for asyncio UDP endpoints.
+    """
+
+    def __init__(self, max_queue_size: int = 10000) -> None:
+        self.max_queue_size = max_queue_size
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        self._protocol: Optional[_DatagramQueueProtocol] = None
+        self._closed = False
+
+    async def _open(self, **endpoint_kwargs) -> None:
+        loop = asyncio.get_running_loop()
+        self._transport, self._protocol = await loop.create_datagram_endpoint(
+            lambda: _DatagramQueueProtocol(self.max_queue_size), **endpoint_kwargs
+        )
+        self._closed = False
+
+    @property
+    def local_address(self) -> Tuple[str, int]:
+        """
+        The (host, port) the endpoint is bound to.
+        """
+        return self._require_transport().get_extra_info("sockname")[:2]
+
+    @property
+    def dropped(self) -> int:
+        """
+        Number of datagrams dropped because the receive queue was full.
+        """
+        return self._protocol.dropped if self._protocol else 0
+
+    async def receive(self, timeout: Optional[float] = None) -> Datagram:
+        """
+        Receive a single datagram.
+
+        :param timeout: Seconds to wait before giving up (None waits forever).
+        :return: A tuple containing the raw payload and the address of the sender.
+        :raises asyncio.TimeoutError: If no datagram arrives within the timeout.
+        :raises ConnectionError: If the endpoint is closed.
+        :raises OSError: The error reported by the socket (e.g. ConnectionRefusedError
+            when a connected endpoint's target port is closed).
+        """
+        self._require_transport()
+        item = await asyncio.wait_for(self._protocol.queue.get(), timeout)
+        if item is None:
+            # Re-queue the sentinel so every pending consumer sees the close
+            self._protocol.queue.put_nowait(None)
+            raise _EndpointClosed("UDP endpoint is closed.")
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    async def receive_until(
+        self,
+        predicate: Callable[[bytes, Tuple[str, int]], bool],
+        timeout: float,
+    ) -> Datagram:
+        """
+        Receive datagrams until one satisfies the predicate.
+
+        Datagrams that do not match are discarded.
+
+        :param predicate: Callable taking (payload, address) and returning True on match.
+        :param timeout: Overall seconds to wait for a matching datagram.
+        :return: The first matching datagram and its sender address.
+        :raises asyncio.TimeoutError: If no matching datagram arrives in time.
+        """
+
+        async def _wait_for_match() -> Datagram:
+            while True:
+                data, addr = await self.receive()
+                if predicate(data, addr):
+                    return data, addr
+
+        with TRACER.span("udp receive_until", "udp"):
+            return await asyncio.wait_for(_wait_for_match(), timeout)
+
+    def __aiter__(self) -> AsyncIterator[Datagram]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[Datagram]:
+        while True:
+            try:
+                yield await self.receive()
+            except _EndpointClosed:
+                return
+
+    async def close(self) -> None:
+        """
+        Close the UDP transport.
+        """
+        if self._transport is not None and not self._closed:
+            self._closed = True
+            self._transport.close()
+            # Let connection_lost run so iterators are released
+            await asyncio.sleep(0)
+
+    def _require_transport(self) -> asyncio.DatagramTransport:
+        if self._transport is None:
+            raise ConnectionError("UDP endpoint is not started.")
+        return self._transport
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class AsyncUDPListener(_AsyncUDPEndpoint):
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        max_queue_size: int = 10000,
+        receive_buffer_size: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize an asyncio UDP listener.
+
+        :param host: The host IP address to listen on.
+        :param port: The port number to listen on (0 picks a free port).
+        :param max_queue_size: Datagrams buffered before new ones are dropped.
+        :param receive_buffer_size: Kernel receive buffer (SO_RCVBUF) in bytes,
+            raise it for bursts of thousands of datagrams.
+        """
+        super().__init__(max_queue_size)
+        self.host = host
+        self.port = port
+        self.receive_buffer_size = receive_buffer_size
+
+    async def start(self) -> None:
+        """
+        Bind the listener on the running event loop.
+        """
+        await self._open(local_addr=(self.host, self.port))
+        if self.receive_buffer_size:
+            sock = self._transport.get_extra_info("socket")
+            sock.setsockopt(
+                socket.SOL_SOCKET, socket.SO_RCVBUF, self.receive_buffer_size
+            )
+        self.host, self.port = self.local_address
+        logger.info(f"Listening for UDP packets on {self.host}:{self.port}")
+
+    async def send_to(self, message: Union[str, bytes], addr: Tuple[str, int]) -> None:
+        """
+        Send a reply datagram from the listening socket.
+
+        :param message: The message to send.
+        :param addr: The (host, port) to send to.
+        """
+        transport = self._require_transport()
+        await self._protocol.can_write.wait()
+        transport.sendto(_to_bytes(message), addr)
+
+
+class AsyncUDPSender(_AsyncUDPEndpoint):
+    def __init__(
+        self,
+        target_host: str,
+        target_port: int,
+        max_queue_size: int = 10000,
+        write_buffer_limit: int = 256 * 1024,
+    ) -> None:
+        """
+        Initialize an asyncio UDP sender.
+
+        :param target_host: The target host IP address to send data to.
+        :param target_port: The target port number to send data to.
+        :param max_queue_size: Reply datagrams buffered before new ones are dropped.
+        :param write_buffer_limit: Bytes queued in the transport before sends pause.
+        """
+        super().__init__(max_queue_size)
+        self.target_host = target_host
+        self.target_port = target_port
+        self.write_buffer_limit = write_buffer_limit
+
+    async def start(self) -> None:
+        """
+        Open a connected UDP endpoint towards the target.
+        """
+        await self._open(remote_addr=(self.target_host, self.target_port))
+        self._transport.set_write_buffer_limits(high=self.write_buffer_limit)
+
+    async def send(self, message: Union[str, bytes]) -> None:
+        """
+        Send a UDP message, waiting while the transport's write buffer is full.
+
+        :param message: The message to send.
+        """
+        transport = self._require_transport()
+        with TRACER.span("udp send", "udp", target=self.target_host):
+            if not self._protocol.can_write.is_set():
+                await self._protocol.can_write.wait()
+            transport.sendto(_to_bytes(message))
+
+    async def drain(self) -> None:
+        """
+        Wait until the transport is below its write buffer limit.
+        """
+        self._require_transport()
+        await self._protocol.can_write.wait()
+
+
+def _to_bytes(message: Union[str, bytes]) -> bytes:
+    return message.encode("utf-8") if isinstance(message, str) else message
+
+
+# Example usage
+# if __name__ == "__main__":
+#     async def main():
+#         async with AsyncUDPListener(host="127.0.0.1", port=0) as listener:
+#             async with AsyncUDPSender("127.0.0.1", listener.port) as sender:
+#                 await asyncio.gather(*(sender.send(f"msg-{i}") for i in range(1000)))
+#                 async for data, addr in listener:
+#                     print(data, addr)
+#                     break
+#
+#     asyncio.run(main())
@@ -1,14 +1,13 @@
 import logging
+import socket
 from typing import Optional
 
 import paramiko
 
+from src.utils.tracing import TRACER
+
 # Set up logger
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 
 
 class SSHClient:
@@ -18,6 +17,7 @@ class SSHClient:
         username: str,
         password: Optional[str] = None,
         key_filepath: Optional[str] = None,
+        port: int = 22,
     ) -> None:
         """
         Initialize SSHClient with hostname, username, and authentication method.
@@ -26,11 +26,13 @@ class SSHClient:
         :param username: SSH username
         :param password: Password for SSH authentication
         :param key_filepath: Filepath to the private key for SSH key-based authentication
+        :param port: SSH server port
         """
         self.hostname = hostname
         self.username = username
         self.password = password
         self.key_filepath = key_filepath
+        self.port = port
         self.client = paramiko.SSHClient()
         self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
 
@@ -46,6 +48,7 @@ class SSHClient:
                 private_key = paramiko.RSAKey.from_private_key_file(self.key_filepath)
                 self.client.connect(
                     hostname=self.hostname,
+                    port=self.port,
                     username=self.username,
                     pkey=private_key,
                 )
@@ -55,6 +58,7 @@ class SSHClient:
                 )
                 self.client.connect(
                     hostname=self.hostname,
+                    port=self.port,
                     username=self.username,
                     password=self.password,
                 )
@@ -63,6 +67,11 @@ class SSHClient:
                     "Password or key_filepath must be provided for authentication."
                 )
 
+            # Each command is a few small request/response packets; Nagle's
+            # algorithm and delayed ACKs otherwise add ~40 ms per command
+            self.client.get_transport().sock.setsockopt(
+                socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+            )
             logger.info(f"Successfully connected to {self.hostname}.")
         except Exception as e:
             logger.error(f"Failed to connect to {self.hostname}: {e}")
@@ -76,26 +85,29 @@ class SSHClient:
         :return: Standard output from command execution
         :raises Exception: If command execution fails
         """
-        try:
-            if not self.client.get_transport().is_active():
-                raise ConnectionError("SSH connection is not active.")
-
-            logger.info(f"Executing command on {self.hostname}: {command}")
-            stdin, stdout, stderr = self.client.exec_command(command)
-            output = stdout.read().decode()
-            error = stderr.read().decode()
-
-            if error:
-                logger.error(f"Command execution failed: {error}")
-                raise RuntimeError(f"Command execution failed with error: {error}")
-
-            logger.info(f"Command executed successfully with output: {output}")
-            return output
-        except Exception as e:
-            logger.error(
-                f"Failed to execute command '{command}' on {self.hostname}: {e}"
-            )
-            raise
+        with TRACER.span(
+            f"ssh {self.hostname}", "ssh", host=self.hostname, command=command
+        ):
+            try:
+                if not self.client.get_transport().is_active():
+                    raise ConnectionError("SSH connection is not active.")
+
+                logger.info(f"Executing command on {self.hostname}: {command}")
+                stdin, stdout, stderr = self.client.exec_command(command)
+                output = stdout.read().decode()
+                error = stderr.read().decode()
+
+                if error:
+                    logger.error(f"Command execution failed: {error}")
+                    raise RuntimeError(f"Command execution failed with error: {error}")
+
+                logger.info(f"Command executed successfully with output: {output}")
+                return output
+            except Exception as e:
+                logger.error(
+                    f"Failed to execute command '{command}' on {self.hostname}: {e}"
+                )
+                raise
 
     def close(self) -> None:
         """
@@ -0,0 +1,235 @@
+import logging
+import mmap
+import os
+import socket
+import struct
+import time
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+from src.utils.network.udp_utils import UDPListener, UDPSender
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+CAPTURE_MAGIC = b"UDPCAP01"
+# timestamp (ns since epoch), source port, packed source address length, payload length
+RECORD_HEADER = struct.Struct("!QHBI")
+
+
+class CapturedDatagram(NamedTuple):
+    timestamp_ns: int
+    source: Tuple[str, int]
+    payload: bytes
+
+
+def _pack_address(host: str) -> bytes:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    return socket.inet_pton(family, host)
+
+
+def _unpack_address(packed: bytes) -> str:
+    family = socket.AF_INET6 if len(packed) == 16 else socket.AF_INET
+    return socket.inet_ntop(family, packed)
+
+
+class UDPCaptureWriter:
+    def __init__(self, file_path: str, buffer_size: int = 1024 * 1024) -> None:
+        """
+        Open a capture file for buffered appends.
+
+        Each record holds the receive timestamp, the source address and the raw
+        payload. Records are appended to an existing capture file.
+
+        :param file_path: Path to the capture file.
+        :param buffer_size: Bytes buffered in memory before hitting the disk.
+        """
+        self.file_path = file_path
+        self.records_written: int = 0
+        self._file = open(file_path, "ab", buffering=buffer_size)
+        if self._file.tell() == 0:
+            self._file.write(CAPTURE_MAGIC)
+
+    def write(
+        self,
+        payload: bytes,
+        source: Tuple[str, int],
+        timestamp_ns: Optional[int] = None,
+    ) -> None:
+        """
+        Append a datagram to the capture.
+
+        :param payload: The raw datagram payload.
+        :param source: The (host, port) the datagram came from.
+        :param timestamp_ns: Receive time in ns since epoch (defaults to now).
+        """
+        address = _pack_address(source[0])
+        self._file.write(
+            RECORD_HEADER.pack(
+                timestamp_ns if timestamp_ns is not None else time.time_ns(),
+                source[1],
+                len(address),
+                len(payload),
+            )
+        )
+        self._file.write(address)
+        self._file.write(payload)
+        self.records_written += 1
+
+    def flush(self) -> None:
+        """
+        Flush buffered records to disk.
+        """
+        self._file.flush()
+
+    def close(self) -> None:
+        """
+        Flush and close the capture file.
+        """
+        if not self._file.closed:
+            self._file.close()
+            logger.info(
+                f"Capture {self.file_path} closed after {self.records_written} records"
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class UDPCaptureReader:
+    def __init__(self, file_path: str) -> None:
+        """
+        Open a capture file for streaming reads.
+
+        The file is memory-mapped, so only the pages of the records being read
+        are loaded, whatever the size of the capture.
+
+        :param file_path: Path to the capture file.
+        :raises FileNotFoundError: If the file does not exist.
+        :raises ValueError: If the file is not a UDP capture.
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"The file {file_path} does not exist.")
+        self.file_path = file_path
+        with open(file_path, "rb") as file:
+            if file.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC:
+                raise ValueError(f"{file_path} is not a UDP capture file.")
+
+    def __iter__(self) -> Iterator[CapturedDatagram]:
+        with open(self.file_path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield from self._iterate(mapped)
+
+    def _iterate(self, mapped: mmap.mmap) -> Iterator[CapturedDatagram]:
+        offset = len(CAPTURE_MAGIC)
+        end = len(mapped)
+        header_size = RECORD_HEADER.size
+        unpack = RECORD_HEADER.unpack_from
+        while offset + header_size <= end:
+            timestamp_ns, port, address_length, payload_length = unpack(mapped, offset)
+            offset += header_size
+            if offset + address_length + payload_length > end:
+                logger.warning(
+                    f"Truncated record at offset {offset} in {self.file_path}, stopping"
+                )
+                return
+            address = _unpack_address(mapped[offset : offset + address_length])
+            offset += address_length
+            payload = mapped[offset : offset + payload_length]
+            offset += payload_length
+            yield CapturedDatagram(timestamp_ns, (address, port), payload)
+
+
+def record_udp_traffic(
+    listener: UDPListener,
+    writer: UDPCaptureWriter,
+    max_packets: Optional[int] = None,
+    duration: Optional[float] = None,
+    idle_timeout: float = 1.0,
+) -> int:
+    """
+    Record datagrams received by a UDPListener into a capture file.
+
+    :param listener: The listener to read from.
+    :param writer: The capture writer to append to.
+    :param max_packets: Stop after this many datagrams.
+    :param duration: Stop after this many seconds.
+    :param idle_timeout: Stop when no datagram arrives for this many seconds.
+    :return: The number of datagrams recorded.
+    """
+    deadline = time.monotonic() + duration if duration is not None else None
+    recorded = 0
+    while max_packets is None or recorded < max_packets:
+        timeout = idle_timeout
+        if deadline is not None:
+            timeout = min(timeout, deadline - time.monotonic())
+            if timeout <= 0:
+                break
+        try:
+            payload, source = listener.receive(timeout=timeout)
+        except TimeoutError:
+            if deadline is None or time.monotonic() >= deadline:
+                break
+            continue
+        writer.write(payload, source)
+        recorded += 1
+    writer.flush()
+    logger.info(f"Recorded {recorded} datagrams to {writer.file_path}")
+    return recorded
+
+
+def replay_udp_capture(
+    file_path: str, sender: UDPSender, speed: float = 1.0, batch_size: int = 64
+) -> int:
+    """
+    Replay a capture file through a UDPSender.
+
+    :param file_path: Path to the capture file.
+    :param sender: The sender used to emit the datagrams.
+    :param speed: Timing multiplier; 1.0 keeps the original timing, 2.0 replays
+        twice as fast and 0 sends as fast as possible.
+    :param batch_size: Maximum datagrams handed to send_many at once.
+    :return: The number of datagrams replayed.
+    """
+    if speed < 0:
+        raise ValueError("speed must not be negative.")
+    replayed = 0
+    batch: List[bytes] = []
+    first_ns: Optional[int] = None
+    start = time.perf_counter()
+    for datagram in UDPCaptureReader(file_path):
+        if first_ns is None:
+            first_ns = datagram.timestamp_ns
+        if speed:
+            due = (datagram.timestamp_ns - first_ns) / 1e9 / speed
+            delay = due - (time.perf_counter() - start)
+            if delay > 0:
+                if batch:
+                    replayed += sender.send_many(batch)
+                    batch = []
+                time.sleep(delay)
+        batch.append(datagram.payload)
+        if len(batch) >= batch_size:
+            replayed += sender.send_many(batch)
+            batch = []
+    if batch:
+        replayed += sender.send_many(batch)
+    logger.info(
+        f"Replayed {replayed} datagrams from {file_path} to "
+        f"{sender.target_host}:{sender.target_port}"
+    )
+    return replayed
+
+
+# Example usage
+# if __name__ == "__main__":
+#     listener = UDPListener(host="0.0.0.0", port=5005)
+#     with UDPCaptureWriter("field_issue.udpcap") as writer:
+#         record_udp_traffic(listener, writer, duration=60)
+#     listener.close()
+#
+#     sender = UDPSender(target_host="127.0.0.1", target_port=5005)
+#     replay_udp_capture("field_issue.udpcap", sender, speed=2.0)
+#     sender.close()
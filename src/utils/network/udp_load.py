@@ -0,0 +1,277 @@
+import logging
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
+
+from src.utils.metrics.histogram import LatencyHistogram
+from src.utils.network.udp_utils import UDPListener, UDPSender
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+# magic, sequence number, send timestamp (ns since epoch)
+LOAD_HEADER = struct.Struct("!4sQQ")
+LOAD_MAGIC = b"UDPL"
+
+
+@dataclass
+class UDPLoadResult:
+    """
+    Outcome of a load generator run on the sending side.
+    """
+
+    sent: int
+    elapsed: float
+    target_pps: float
+
+    @property
+    def achieved_pps(self) -> float:
+        return self.sent / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass
+class UDPLoadReport:
+    """
+    Loss, reordering and latency statistics measured on the receiving side.
+    """
+
+    expected: int
+    received: int = 0
+    duplicates: int = 0
+    reordered: int = 0
+    foreign: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def lost(self) -> int:
+        return max(self.expected - self.received, 0)
+
+    @property
+    def loss_ratio(self) -> float:
+        return self.lost / self.expected if self.expected else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the report into a JSON-compatible dictionary.
+
+        :return: Dictionary with counters and latency percentiles in milliseconds.
+        """
+        return {
+            "expected": self.expected,
+            "received": self.received,
+            "lost": self.lost,
+            "loss_ratio": round(self.loss_ratio, 6),
+            "duplicates": self.duplicates,
+            "reordered": self.reordered,
+            "foreign": self.foreign,
+            "latency": self.latency.summary(),
+        }
+
+
+class UDPLoadGenerator:
+    def __init__(
+        self,
+        sender: UDPSender,
+        rate_pps: float,
+        payload_template: Union[str, bytes] = b"",
+        batch_size: int = 64,
+    ) -> None:
+        """
+        Initialize a paced UDP load generator.
+
+        Every datagram starts with a header carrying a sequence number and the
+        send timestamp, followed by the payload template. A str template may use
+        the ``{seq}`` placeholder, which is formatted per datagram.
+
+        :param sender: The UDPSender used to emit datagrams.
+        :param rate_pps: Target packets per second.
+        :param payload_template: Body appended after the header.
+        :param batch_size: Maximum datagrams handed to send_many per pacing step.
+        """
+        if rate_pps <= 0:
+            raise ValueError("rate_pps must be greater than zero.")
+        self.sender = sender
+        self.rate_pps = rate_pps
+        self.batch_size = batch_size
+        if isinstance(payload_template, str) and "{seq" in payload_template:
+            self._template: Optional[str] = payload_template
+            self._static_body = b""
+        else:
+            self._template = None
+            self._static_body = (
+                payload_template.encode("utf-8")
+                if isinstance(payload_template, str)
+                else payload_template
+            )
+
+    def build_payload(self, sequence: int) -> bytes:
+        """
+        Build the datagram for a sequence number.
+
+        :param sequence: The sequence number to embed.
+        :return: The raw datagram.
+        """
+        body = (
+            self._template.format(seq=sequence).encode("utf-8")
+            if self._template is not None
+            else self._static_body
+        )
+        return LOAD_HEADER.pack(LOAD_MAGIC, sequence, time.time_ns()) + body
+
+    def run(
+        self, count: Optional[int] = None, duration: Optional[float] = None
+    ) -> UDPLoadResult:
+        """
+        Send datagrams at the target rate until the count or duration is reached.
+
+        :param count: Number of datagrams to send.
+        :param duration: Seconds to keep sending.
+        :return: A UDPLoadResult with the number sent and achieved rate.
+        """
+        if count is None and duration is None:
+            raise ValueError("Either count or duration must be provided.")
+        if count is None:
+            count = int(duration * self.rate_pps)
+
+        logger.info(
+            f"Starting UDP load: {count} packets at {self.rate_pps} pps to "
+            f"{self.sender.target_host}:{self.sender.target_port}"
+        )
+        build = self.build_payload
+        interval = 1.0 / self.rate_pps
+        sent = 0
+        start = time.perf_counter()
+        while sent < count:
+            elapsed = time.perf_counter() - start
+            due = min(int(elapsed * self.rate_pps) + 1, count) - sent
+            if due <= 0:
+                time.sleep(max((sent * interval) - elapsed, 0))
+                continue
+            batch = min(due, self.batch_size)
+            sent += self.sender.send_many(
+                [build(sequence) for sequence in range(sent, sent + batch)]
+            )
+        result = UDPLoadResult(
+            sent=sent, elapsed=time.perf_counter() - start, target_pps=self.rate_pps
+        )
+        logger.info(
+            f"UDP load finished: {result.sent} packets in {result.elapsed:.3f}s "
+            f"({result.achieved_pps:.0f} pps)"
+        )
+        return result
+
+
+class UDPLoadReceiver:
+    def __init__(self, listener: UDPListener) -> None:
+        """
+        Initialize a receiver that analyses datagrams from a UDPLoadGenerator.
+
+        :param listener: The UDPListener the generator is sending to.
+        """
+        self.listener = listener
+
+    def collect(self, expected: int, idle_timeout: float = 1.0) -> UDPLoadReport:
+        """
+        Receive datagrams until all are in or the line has been idle too long.
+
+        :param expected: Number of datagrams the generator will send.
+        :param idle_timeout: Seconds without traffic after which collection stops.
+        :return: A UDPLoadReport with loss, reordering and latency figures.
+        """
+        report = UDPLoadReport(expected=expected)
+        seen = bytearray(expected)
+        highest = -1
+        header_size = LOAD_HEADER.size
+        unpack = LOAD_HEADER.unpack_from
+        record_us = report.latency.record_us
+        # Read the socket directly: per-datagram spans would skew high rates
+        sock = self.listener.sock
+        previous_timeout = sock.gettimeout()
+        sock.settimeout(idle_timeout)
+        buffer_size = self.listener.buffer_size
+        try:
+            while report.received < expected:
+                try:
+                    data = sock.recv(buffer_size)
+                except TimeoutError:
+                    break
+                now_ns = time.time_ns()
+                if len(data) < header_size:
+                    report.foreign += 1
+                    continue
+                magic, sequence, sent_ns = unpack(data)
+                if magic != LOAD_MAGIC or sequence >= expected:
+                    report.foreign += 1
+                    continue
+                if seen[sequence]:
+                    report.duplicates += 1
+                    continue
+                seen[sequence] = 1
+                report.received += 1
+                if sequence < highest:
+                    report.reordered += 1
+                else:
+                    highest = sequence
+                record_us((now_ns - sent_ns) // 1000)
+        finally:
+            sock.settimeout(previous_timeout)
+        return report
+
+
+def run_udp_load_test(
+    host: str,
+    port: int,
+    rate_pps: float,
+    count: int,
+    payload_template: Union[str, bytes] = b"",
+    idle_timeout: float = 1.0,
+) -> Dict[str, Any]:
+    """
+    Run a paced load against a local listener and report what arrived.
+
+    :param host: Host to bind the listener on and send to.
+    :param port: Port to bind the listener on (0 picks a free port).
+    :param rate_pps: Target packets per second.
+    :param count: Number of datagrams to send.
+    :param payload_template: Body appended after the sequence header.
+    :param idle_timeout: Seconds without traffic after which the receiver stops.
+    :return: Dictionary combining the sender result and the receiver report.
+    :raises Exception: The error of the receiver thread, if it failed.
+    """
+    listener = UDPListener(host, port, buffer_size=65535)
+    sender = UDPSender(host, listener.sock.getsockname()[1])
+    reports: List[UDPLoadReport] = []
+    errors: List[Exception] = []
+
+    def receive() -> None:
+        try:
+            reports.append(UDPLoadReceiver(listener).collect(count, idle_timeout))
+        except Exception as error:
+            errors.append(error)
+
+    receiver = threading.Thread(target=receive, daemon=True)
+    receiver.start()
+    try:
+        result = UDPLoadGenerator(sender, rate_pps, payload_template).run(count=count)
+        receiver.join()
+    finally:
+        sender.close()
+        listener.close()
+    if errors:
+        raise errors[0]
+    return {
+        "sent": result.sent,
+        "target_pps": result.target_pps,
+        "achieved_pps": round(result.achieved_pps, 1),
+        **reports[0].to_dict(),
+    }
+
+
+# Example usage
+# if __name__ == "__main__":
+#     report = run_udp_load_test(
+#         "127.0.0.1", 0, rate_pps=20000, count=100000, payload_template="seq={seq}"
+#     )
+#     print(report)
@@ -1,5 +1,11 @@
+import logging
 import socket
-from typing import Tuple
+from typing import Iterable, Optional, Tuple, Union
+
+from src.utils.tracing import TRACER
+
+# Set up logger
+logger = logging.getLogger(__name__)
 
 
 class UDPListener:
@@ -23,12 +29,35 @@ class UDPListener:
 
         :return: A tuple containing the received message and the address of the sender.
         """
-        print(f"Listening for UDP packets on {self.host}:{self.port}")
-        data, addr = self.sock.recvfrom(self.buffer_size)
+        logger.debug("Listening for UDP packets on %s:%s", self.host, self.port)
+        with TRACER.span("udp receive", "udp", port=self.port):
+            data, addr = self.sock.recvfrom(self.buffer_size)
         message = data.decode("utf-8")
-        print(f"Received message from {addr}: {message}")
+        logger.debug("Received message from %s: %s", addr, message)
         return message, addr
 
+    def receive(self, timeout: Optional[float] = None) -> Tuple[bytes, Tuple[str, int]]:
+        """
+        Receive a single raw UDP datagram without decoding it.
+
+        :param timeout: Seconds to wait for a datagram (None blocks forever).
+        :return: A tuple containing the raw payload and the address of the sender.
+        :raises TimeoutError: If no datagram arrives within the timeout.
+        """
+        previous_timeout = self.sock.gettimeout()
+        self.sock.settimeout(timeout)
+        try:
+            with TRACER.span("udp receive", "udp", port=self.port):
+                return self.sock.recvfrom(self.buffer_size)
+        except socket.timeout as e:
+            raise TimeoutError(
+                f"No UDP datagram received on {self.host}:{self.port} "
+                f"within {timeout} seconds"
+            ) from e
+        finally:
+            # listen() and other callers keep their own blocking behaviour
+            self.sock.settimeout(previous_timeout)
+
     def close(self) -> None:
         """
         Close the UDP socket.
@@ -47,15 +76,46 @@ class UDPSender:
         self.target_host = target_host
         self.target_port = target_port
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._connected = False
 
-    def send(self, message: str) -> None:
+    def send(self, message: Union[str, bytes]) -> None:
         """
         Send a UDP message to the target host and port.
 
-        :param message: The message to send.
+        :param message: The message to send, str is encoded as UTF-8.
+        """
+        if isinstance(message, str):
+            message = message.encode("utf-8")
+        logger.debug(
+            "Sending message to %s:%s: %r", self.target_host, self.target_port, message
+        )
+        with TRACER.span(
+            "udp send", "udp", target=self.target_host, bytes=len(message)
+        ):
+            self.sock.sendto(message, (self.target_host, self.target_port))
+
+    def send_many(self, messages: Iterable[bytes]) -> int:
+        """
+        Send a batch of raw datagrams to the target host and port.
+
+        The socket is connected once so the kernel skips the per-datagram address
+        lookup, and nothing is logged per datagram.
+
+        :param messages: The raw payloads to send.
+        :return: The number of datagrams sent.
         """
-        print(f"Sending message to {self.target_host}:{self.target_port}: {message}")
-        self.sock.sendto(message.encode("utf-8"), (self.target_host, self.target_port))
+        if not self._connected:
+            self.sock.connect((self.target_host, self.target_port))
+            self._connected = True
+        send = self.sock.send
+        sent = 0
+        with TRACER.span("udp send_many", "udp", target=self.target_host) as span:
+            for message in messages:
+                send(message)
+                sent += 1
+            if span is not None:
+                span.set_attribute("datagrams", sent)
+        return sent
 
     def close(self) -> None:
         """
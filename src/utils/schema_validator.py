@@ -0,0 +1,255 @@
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from jsonschema import Draft7Validator, ValidationError
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+SCHEMA_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "schemas")
+)
+
+# Keywords the compiled fast path understands; anything else falls back to jsonschema
+_OBJECT_KEYWORDS = {
+    "$schema",
+    "$id",
+    "title",
+    "description",
+    "type",
+    "properties",
+    "required",
+    "additionalProperties",
+}
+_PROPERTY_KEYWORDS = {
+    "title",
+    "description",
+    "type",
+    "format",
+    "minimum",
+    "maximum",
+    "exclusiveMinimum",
+    "exclusiveMaximum",
+    "minLength",
+    "maxLength",
+    "enum",
+}
+
+# JSON schema type -> Python types, booleans excluded from numbers as in jsonschema
+_TYPES: Dict[str, Tuple[type, ...]] = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "null": (type(None),),
+}
+
+_TRUE_STRINGS = frozenset({"true", "1", "yes"})
+_FALSE_STRINGS = frozenset({"false", "0", "no"})
+
+
+def _to_bool(value: str) -> bool:
+    text = value.strip().lower()
+    if text in _TRUE_STRINGS:
+        return True
+    if text in _FALSE_STRINGS:
+        return False
+    raise ValueError(f"Not a boolean: {value!r}")
+
+
+_COERCIONS: Dict[str, Callable[[str], Any]] = {
+    "integer": int,
+    "number": float,
+    "boolean": _to_bool,
+}
+
+
+def _compile_property(spec: Dict[str, Any]) -> Optional[Callable[[Any], bool]]:
+    if set(spec) - _PROPERTY_KEYWORDS or not isinstance(spec.get("type", ""), str):
+        return None
+    kind = spec.get("type")
+    if kind is not None and kind not in _TYPES:
+        return None
+    types = _TYPES.get(kind)
+    reject_bool = kind in ("integer", "number")
+    minimum = spec.get("minimum")
+    maximum = spec.get("maximum")
+    exclusive_minimum = spec.get("exclusiveMinimum")
+    exclusive_maximum = spec.get("exclusiveMaximum")
+    min_length = spec.get("minLength")
+    max_length = spec.get("maxLength")
+    enum = spec.get("enum")
+
+    def check(value: Any) -> bool:
+        if types is not None:
+            if not isinstance(value, types) or (
+                reject_bool and isinstance(value, bool)
+            ):
+                # jsonschema treats 1.0 as an integer
+                if not (
+                    kind == "integer"
+                    and isinstance(value, float)
+                    and value.is_integer()
+                ):
+                    return False
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            if minimum is not None and value < minimum:
+                return False
+            if maximum is not None and value > maximum:
+                return False
+            if exclusive_minimum is not None and value <= exclusive_minimum:
+                return False
+            if exclusive_maximum is not None and value >= exclusive_maximum:
+                return False
+        if isinstance(value, str):
+            if min_length is not None and len(value) < min_length:
+                return False
+            if max_length is not None and len(value) > max_length:
+                return False
+        if enum is not None and value not in enum:
+            return False
+        return True
+
+    return check
+
+
+def _compile(schema: Dict[str, Any]) -> Optional[Callable[[Any], bool]]:
+    """
+    Compile a flat object schema into a plain Python check.
+
+    :param schema: JSON schema.
+    :return: The check, or None if the schema uses unsupported keywords.
+    """
+    if set(schema) - _OBJECT_KEYWORDS or schema.get("type", "object") != "object":
+        return None
+    additional = schema.get("additionalProperties", True)
+    if not isinstance(additional, bool):
+        return None
+    checks = []
+    for name, spec in schema.get("properties", {}).items():
+        check = _compile_property(spec)
+        if check is None:
+            return None
+        checks.append((name, check))
+    required = tuple(schema.get("required", ()))
+    allowed = frozenset(schema.get("properties", {}))
+
+    def is_valid(record: Any) -> bool:
+        if not isinstance(record, dict):
+            return False
+        for name in required:
+            if name not in record:
+                return False
+        if not additional and not allowed.issuperset(record):
+            return False
+        for name, check in checks:
+            if name in record and not check(record[name]):
+                return False
+        return True
+
+    return is_valid
+
+
+class SchemaValidator:
+    def __init__(self, schema: Dict[str, Any]) -> None:
+        """
+        Initialize a reusable validator for one JSON schema.
+
+        Flat object schemas, like those in schemas/, are compiled into plain
+        Python checks that are several times faster than jsonschema; other
+        schemas use a compiled jsonschema validator. Error messages always
+        come from jsonschema. Formats are not checked, as with jsonschema's
+        defaults.
+
+        :param schema: JSON schema.
+        """
+        self.schema = schema
+        self._validator = Draft7Validator(schema)
+        self._fast_check = _compile(schema)
+        self._property_types = {
+            name: spec.get("type")
+            for name, spec in schema.get("properties", {}).items()
+            if isinstance(spec, dict)
+        }
+
+    @classmethod
+    def load(cls, name: str, schema_dir: str = SCHEMA_DIR) -> "SchemaValidator":
+        """
+        Load a schema from a file or from schemas/ by name.
+
+        :param name: Path to a schema file, or a name such as "user" for
+            schemas/user_schema.json.
+        :param schema_dir: Directory searched for names.
+        :return: The validator.
+        :raises FileNotFoundError: If no such schema exists.
+        """
+        candidates = [name, os.path.join(schema_dir, name)]
+        candidates.append(os.path.join(schema_dir, f"{name}_schema.json"))
+        for path in candidates:
+            if os.path.isfile(path):
+                with open(path, "r") as file:
+                    return cls(json.load(file))
+        raise FileNotFoundError(f"No schema named {name} in {schema_dir}")
+
+    @property
+    def compiled(self) -> bool:
+        return self._fast_check is not None
+
+    def is_valid(self, record: Any) -> bool:
+        if self._fast_check is not None:
+            return self._fast_check(record)
+        return self._validator.is_valid(record)
+
+    def errors(self, record: Any) -> List[str]:
+        """
+        Describe every schema violation of a record.
+
+        :param record: Record to check.
+        :return: jsonschema error messages, empty if the record is valid.
+        """
+        return [
+            f"{'/'.join(map(str, error.path)) or '<root>'}: {error.message}"
+            for error in self._validator.iter_errors(record)
+        ]
+
+    def validate(self, record: Any) -> None:
+        """
+        Check a record.
+
+        :param record: Record to check.
+        :raises ValidationError: With the first violation, if the record is invalid.
+        """
+        if not self.is_valid(record):
+            raise ValidationError(self.errors(record)[0])
+
+    def coerce(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert the string values of CSV rows to the schema's property types.
+        Empty strings of non-string properties become None; values that cannot
+        be converted are kept as they are, so validation reports them.
+
+        :param record: Row as read from a CSV file.
+        :return: A new record with converted values.
+        """
+        coerced = {}
+        for name, value in record.items():
+            kind = self._property_types.get(name)
+            if isinstance(value, str) and kind != "string":
+                convert = _COERCIONS.get(kind)
+                if value == "":
+                    value = None
+                elif convert is not None:
+                    try:
+                        value = convert(value)
+                    except ValueError:
+                        pass
+            coerced[name] = value
+        return coerced
+
+
+# Example usage
+# validator = SchemaValidator.load("user")
+# validator.is_valid({"id": 1, "name": "Ann", "email": "ann@example.com", "age": 30})
+# validator.errors({"id": "1"})
@@ -0,0 +1,304 @@
+import functools
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Spans kept in memory before new ones are dropped
+DEFAULT_MAX_SPANS: int = 500_000
+
+
+class Span:
+    """
+    A timed operation within a trace.
+    """
+
+    __slots__ = (
+        "name",
+        "category",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "start_ns",
+        "end_ns",
+        "thread_id",
+        "attributes",
+        "error",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        category: str,
+        trace_id: str,
+        parent_id: Optional[str],
+        attributes: Dict[str, Any],
+    ) -> None:
+        self.name = name
+        self.category = category
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.thread_id = threading.get_ident()
+        self.error: Optional[str] = None
+        self.end_ns: Optional[int] = None
+        self.start_ns = time.perf_counter_ns()
+
+    @property
+    def duration(self) -> float:
+        """
+        Span duration in seconds (0 while the span is open).
+        """
+        return ((self.end_ns or self.start_ns) - self.start_ns) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    @property
+    def traceparent(self) -> str:
+        """
+        The W3C trace-context header value identifying this span.
+        """
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """
+    Collects spans in memory and exports them as a Chrome trace.
+
+    The current span lives in a ContextVar, so nesting follows asyncio tasks
+    automatically; use propagate() to carry it into worker threads.
+    """
+
+    def __init__(
+        self, max_spans: int = DEFAULT_MAX_SPANS, enabled: Optional[bool] = None
+    ) -> None:
+        if enabled is None:
+            # Off unless asked for, so plain test runs leave no trace files behind
+            enabled = os.getenv("TRACING_ENABLED", "false").lower() in ("1", "true")
+        self.enabled: bool = enabled
+        self.max_spans = max_spans
+        self.dropped: int = 0
+        self._spans: List[Span] = []
+        # Chrome trace events of other processes, e.g. xdist workers
+        self._imported_events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[Span], None]] = []
+
+    @contextmanager
+    def span(
+        self, name: str, category: str = "function", **attributes: Any
+    ) -> Iterator[Optional[Span]]:
+        """
+        Open a span for the duration of the block.
+
+        :param name: Span name.
+        :param category: Span category (e.g. "http", "ssh", "udp", "test").
+        :param attributes: Extra attributes stored on the span.
+        :yield: The span, or None when tracing is disabled.
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        parent = _current_span.get()
+        span = Span(
+            name,
+            category,
+            parent.trace_id if parent else f"{random.getrandbits(128):032x}",
+            parent.span_id if parent else None,
+            attributes,
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as error:
+            span.error = type(error).__name__
+            raise
+        finally:
+            span.end_ns = time.perf_counter_ns()
+            _current_span.reset(token)
+            self._finish(span)
+
+    def _finish(self, span: Span) -> None:
+        with self._lock:
+            if len(self._spans) < self.max_spans:
+                self._spans.append(span)
+            else:
+                self.dropped += 1
+        for listener in self._listeners:
+            listener(span)
+
+    def add_listener(self, listener: Callable[[Span], None]) -> None:
+        """
+        Register a callback invoked with every finished span.
+
+        :param listener: Callable receiving the finished Span.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Span], None]) -> None:
+        self._listeners.remove(listener)
+
+    @staticmethod
+    def current_span() -> Optional[Span]:
+        return _current_span.get()
+
+    @staticmethod
+    def inject_headers(headers: Dict[str, str]) -> Dict[str, str]:
+        """
+        Add the W3C traceparent header of the current span.
+
+        :param headers: Outgoing headers; not modified.
+        :return: A copy of the headers with traceparent set when a span is active.
+        """
+        span = _current_span.get()
+        if span is None:
+            return headers
+        return {**headers, "traceparent": span.traceparent}
+
+    @staticmethod
+    def propagate(function: Callable) -> Callable:
+        """
+        Bind a callable to the current context so spans it opens in another
+        thread are children of the caller's span.
+
+        :param function: The callable to run elsewhere, e.g. in a thread pool.
+        :return: A wrapper running the callable in a copy of the current context.
+        """
+        context = copy_context()
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            return context.run(function, *args, **kwargs)
+
+        return wrapper
+
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans = []
+            self._imported_events = []
+            self.dropped = 0
+
+    @contextmanager
+    def isolated(self) -> Iterator["Tracer"]:
+        """
+        Collect into an empty tracer for the duration of the block, then put
+        the previous spans back (e.g. benchmarks running inside pytest).
+
+        :yield: This tracer.
+        """
+        with self._lock:
+            saved = (self._spans, self._imported_events, self.dropped)
+            self._spans, self._imported_events, self.dropped = [], [], 0
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._spans, self._imported_events, self.dropped = saved
+
+    def import_chrome_trace(self, trace: Dict[str, Any]) -> None:
+        """
+        Add the events of a trace exported by another process, so one file
+        shows every process (each keeps its own pid row).
+
+        :param trace: Output of to_chrome_trace() in that process.
+        """
+        with self._lock:
+            self._imported_events.extend(trace.get("traceEvents", []))
+            self.dropped += trace.get("otherData", {}).get("dropped_spans", 0)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Convert the finished spans to the Chrome trace event format.
+
+        The result opens in chrome://tracing, Perfetto or speedscope as a
+        flame graph per thread.
+
+        :return: Dictionary with a "traceEvents" list.
+        """
+        pid = os.getpid()
+        events = []
+        for span in self.spans():
+            args = {
+                "trace_id": span.trace_id,
+                "span_id": span.span_id,
+                "parent_id": span.parent_id,
+                **{key: str(value) for key, value in span.attributes.items()},
+            }
+            if span.error:
+                args["error"] = span.error
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": span.start_ns / 1000,
+                    "dur": (span.end_ns - span.start_ns) / 1000,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": args,
+                }
+            )
+        with self._lock:
+            events.extend(self._imported_events)
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped_spans": self.dropped},
+        }
+
+    def export_chrome_trace(self, file_path: str) -> str:
+        """
+        Write the finished spans to a Chrome trace file.
+
+        :param file_path: Destination path; parent directories are created.
+        :return: The path written.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        with open(file_path, "w") as file:
+            json.dump(self.to_chrome_trace(), file)
+        return file_path
+
+
+# Process-wide tracer used by the framework's clients
+TRACER = Tracer()
+
+
+def traced(name: Optional[str] = None, category: str = "function") -> Callable:
+    """
+    Decorator wrapping every call of a function in a span.
+
+    :param name: Span name (defaults to the function's qualified name).
+    :param category: Span category.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        span_name = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with TRACER.span(span_name, category):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# Example usage
+# with TRACER.span("checkout flow", category="test"):
+#     user_service.get_user(1)          # nested "http" span, traceparent header sent
+# TRACER.export_chrome_trace("reports/traces/manual.json")
@@ -0,0 +1,237 @@
+import glob
+import heapq
+import logging
+import os
+import re
+import shutil
+import socket
+import tempfile
+import threading
+import uuid
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+# Shared by the controller and every worker of one test run
+RUN_ID_ENV = "AUTOMATION_RUN_ID"
+
+# First port of worker 0's block and the number of ports per worker
+PORT_BASE: int = int(os.getenv("AUTOMATION_PORT_BASE", "30000"))
+PORT_BLOCK_SIZE: int = int(os.getenv("AUTOMATION_PORT_BLOCK_SIZE", "200"))
+
+# A log record starts with the asctime of the framework's log format
+_RECORD_START = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3} ")
+
+_lock = threading.Lock()
+_allocated_ports: Set[Tuple[int, int]] = set()
+_temp_dir: Optional[str] = None
+_resources: Dict[str, Any] = {}
+
+
+def worker_id() -> str:
+    """
+    Get the pytest-xdist worker id of this process.
+
+    :return: e.g. "gw3", or "master" when not running under xdist
+    """
+    return os.getenv("PYTEST_XDIST_WORKER", "master")
+
+
+def is_worker() -> bool:
+    return worker_id() != "master"
+
+
+def worker_index() -> int:
+    """
+    Get the zero-based index of this worker ("gw3" -> 3, "master" -> 0).
+    """
+    digits = worker_id().lstrip("gw")
+    return int(digits) if digits.isdigit() else 0
+
+
+def worker_count() -> int:
+    return int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+
+
+def run_id() -> str:
+    """
+    Get the id shared by every process of the current run, creating it if
+    this is the first process. Workers inherit it through the environment.
+
+    :return: The run id
+    """
+    value = os.getenv(RUN_ID_ENV)
+    if value is None:
+        with _lock:
+            value = os.environ.setdefault(RUN_ID_ENV, uuid.uuid4().hex[:12])
+    return value
+
+
+def worker_log_file(log_dir: str, base_name: str) -> str:
+    """
+    Get the log file this process should write to.
+
+    The controller (or a serial run) writes to ``<log_dir>/<base_name>.log``;
+    each worker writes to its own file under ``<log_dir>/workers/<run id>/``
+    so that processes never interleave writes in one file.
+
+    :param log_dir: The log directory.
+    :param base_name: Log file name without extension.
+    :return: The log file path.
+    """
+    if not is_worker():
+        return os.path.join(log_dir, f"{base_name}.log")
+    return os.path.join(log_dir, "workers", run_id(), f"{base_name}_{worker_id()}.log")
+
+
+def _read_records(file_path: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (timestamp, record text) pairs; continuation lines such as
+    tracebacks stay attached to their record.
+    """
+    with open(file_path, "r", errors="replace") as file:
+        timestamp, lines = "", []
+        for line in file:
+            if _RECORD_START.match(line):
+                if lines:
+                    yield timestamp, "".join(lines)
+                timestamp, lines = line[:23], [line]
+            else:
+                lines.append(line)
+        if lines:
+            yield timestamp, "".join(lines)
+
+
+def merge_worker_logs(log_dir: str, base_name: str) -> int:
+    """
+    Merge this run's per-worker log files into the main log in timestamp order
+    and remove them.
+
+    :param log_dir: The log directory.
+    :param base_name: Log file name without extension.
+    :return: Number of worker log files merged.
+    """
+    worker_dir = os.path.join(log_dir, "workers", run_id())
+    worker_files = sorted(glob.glob(os.path.join(worker_dir, f"{base_name}_*.log")))
+    if not worker_files:
+        return 0
+
+    target = os.path.join(log_dir, f"{base_name}.log")
+    with open(target, "a") as output:
+        for _, record in heapq.merge(
+            *(_read_records(path) for path in worker_files), key=lambda item: item[0]
+        ):
+            output.write(record)
+    shutil.rmtree(worker_dir, ignore_errors=True)
+    logger.info(f"Merged {len(worker_files)} worker log file(s) into {target}")
+    return len(worker_files)
+
+
+def worker_temp_dir() -> str:
+    """
+    Get a temporary directory private to this worker, created on first use.
+
+    :return: ``<tmp>/automation_<run id>/<worker id>``
+    """
+    global _temp_dir
+    if _temp_dir is None:
+        with _lock:
+            if _temp_dir is None:
+                path = os.path.join(run_temp_root(), worker_id())
+                os.makedirs(path, exist_ok=True)
+                _temp_dir = path
+    return _temp_dir
+
+
+def run_temp_root() -> str:
+    """
+    Get the directory holding every worker's temporary directory for this run.
+    """
+    return os.path.join(tempfile.gettempdir(), f"automation_{run_id()}")
+
+
+def remove_run_temp_dirs() -> None:
+    """
+    Remove the temporary directories of every worker of this run.
+    """
+    global _temp_dir
+    shutil.rmtree(run_temp_root(), ignore_errors=True)
+    _temp_dir = None
+
+
+def allocate_port(socket_type: int = socket.SOCK_DGRAM, host: str = "127.0.0.1") -> int:
+    """
+    Allocate a free port from the block reserved for this worker.
+
+    Worker N uses ports ``PORT_BASE + N * PORT_BLOCK_SIZE`` onwards, so
+    workers never race each other for the same port. A port is handed out
+    at most once per process.
+
+    :param socket_type: socket.SOCK_DGRAM for UDP or socket.SOCK_STREAM for TCP.
+    :param host: The address the port will be bound on.
+    :return: A port that could be bound at allocation time.
+    :raises RuntimeError: If every port of the block is taken.
+    """
+    start = PORT_BASE + worker_index() * PORT_BLOCK_SIZE
+    with _lock:
+        for port in range(start, start + PORT_BLOCK_SIZE):
+            if (socket_type, port) in _allocated_ports:
+                continue
+            with socket.socket(socket.AF_INET, socket_type) as probe:
+                try:
+                    probe.bind((host, port))
+                except OSError:
+                    continue
+            _allocated_ports.add((socket_type, port))
+            return port
+    raise RuntimeError(
+        f"No free port left in {start}-{start + PORT_BLOCK_SIZE - 1} "
+        f"for worker {worker_id()}."
+    )
+
+
+def release_port(port: int, socket_type: int = socket.SOCK_DGRAM) -> None:
+    with _lock:
+        _allocated_ports.discard((socket_type, port))
+
+
+def shared_resource(name: str, factory: Callable[[], Any]) -> Any:
+    """
+    Get a resource created once per worker process, e.g. an APIClient whose
+    connection pool is reused by every test of the worker.
+
+    :param name: Resource name.
+    :param factory: Callable creating the resource on first use.
+    :return: The shared resource.
+    """
+    resource = _resources.get(name)
+    if resource is None:
+        with _lock:
+            resource = _resources.get(name)
+            if resource is None:
+                resource = _resources[name] = factory()
+                logger.debug(f"Created shared resource '{name}' on {worker_id()}")
+    return resource
+
+
+def close_shared_resources() -> None:
+    """
+    Close every shared resource that has a close() method and forget them all.
+    """
+    with _lock:
+        resources: List[Any] = list(_resources.values())
+        _resources.clear()
+    for resource in resources:
+        close = getattr(resource, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception as e:
+                logger.warning(f"Failed to close shared resource {resource!r}: {e}")
+
+
+# Example usage
+# listener = UDPListener("127.0.0.1", allocate_port())
+# path = TemporaryFileManager.create_temp_file(dir=worker_temp_dir())
+# client = shared_resource("api_client", lambda: APIClient("http://localhost:5000"))